@@ -0,0 +1,682 @@
+from flask import current_app, render_template, request, redirect, url_for, flash, session, jsonify
+from datetime import date, datetime, timedelta
+import io
+import csv
+import hmac
+import json
+from functools import wraps
+from werkzeug.local import LocalProxy
+
+from storage import FEATURES, NEARBY, FEEDBACK, BOOKINGS
+from media import UploadError
+from users import LoginThrottled
+from events import STREAMED, format_poll
+from availability import FullyBooked
+
+# Shared services from create_app(); users and media are added by
+# admin.load_admin_services() before the first admin view runs
+storage = LocalProxy(lambda: current_app.extensions['storage'])
+availability = LocalProxy(lambda: current_app.extensions['availability'])
+users = LocalProxy(lambda: current_app.extensions['users'])
+media = LocalProxy(lambda: current_app.extensions['media'])
+analytics_index = LocalProxy(lambda: current_app.extensions['analytics'])
+search_index = LocalProxy(lambda: current_app.extensions['search'])
+archive_store = LocalProxy(lambda: current_app.extensions['archive'])
+event_log = LocalProxy(lambda: current_app.extensions['events'])
+
+ROLE_NAMES = {'admin': 'administrators', 'front_office': 'front office staff'}
+
+def login_required(role=None, api=False):
+    # @login_required for any logged-in staff member, @login_required('admin')
+    # for one role. The session comes from the server-side store and holds
+    # the user's current role, so this is a dict lookup with no user reads.
+    # Pages redirect; api=True views answer 401/403 as JSON.
+    if callable(role):
+        return login_required()(role)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if 'admin_logged_in' not in session:
+                if api:
+                    return jsonify(error='Login required'), 401
+                return redirect(url_for('admin.login'))
+            if role is not None and session.get('user_role') != role:
+                message = 'Only {} can do that!'.format(ROLE_NAMES.get(role, role))
+                if api:
+                    return jsonify(error=message), 403
+                flash(message, 'error')
+                return redirect(request.referrer or url_for('admin.dashboard'))
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+ROOM_TYPE_NAMES = {
+    'deluxe_a': 'Deluxe Room A',
+    'deluxe_b': 'Deluxe Room B',
+    'suite': 'Executive Suite',
+    'family': 'Family Room',
+}
+
+@login_required
+def dashboard():
+    return render_template('admin/dashboard.html', stats=analytics_index.dashboard(),
+                           room_type_names=ROOM_TYPE_NAMES)
+
+@login_required(api=True)
+def analytics():
+    # JSON report: ?from=&to= (inclusive, default the last and next 30 days)
+    # and optionally ?room_type= (repeatable)
+    today = datetime.now().date()
+    start = _date_arg('from') or (today - timedelta(days=30)).isoformat()
+    end = _date_arg('to') or (today + timedelta(days=30)).isoformat()
+    room_types = request.args.getlist('room_type')
+    unknown = [room_type for room_type in room_types if room_type not in analytics_index.inventory]
+    if unknown:
+        return jsonify(error='Unknown room type: ' + ', '.join(unknown)), 400
+    try:
+        report = analytics_index.report(date.fromisoformat(start), date.fromisoformat(end), room_types or None)
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+    return jsonify(report)
+
+def login():
+    if request.method == 'POST':
+        username = request.form.get('username')
+        password = request.form.get('password')
+        
+        try:
+            user = users.authenticate(username, password, request.remote_addr)
+        except LoginThrottled as e:
+            flash(f'Too many failed login attempts. Please try again in {(e.retry_after + 59) // 60} minute(s).', 'error')
+            return render_template('admin/login.html'), 429, {'Retry-After': str(e.retry_after)}
+        
+        if user:
+            # Fresh session id at login, so one planted beforehand is useless
+            session.clear()
+            session.rotate()
+            session['admin_logged_in'] = True
+            session['user_role'] = user['role']
+            session['user_name'] = user['name']
+            session['user_id'] = user['id']
+            flash(f'Login successful! Welcome, {user["name"]}', 'success')
+            return redirect(url_for('admin.dashboard'))
+        else:
+            flash('Invalid credentials!', 'error')
+    return render_template('admin/login.html')
+
+def logout():
+    # Ends the session in the store; the flash below goes into a new one
+    session.clear()
+    session.rotate()
+    flash('Logged out successfully!', 'info')
+    return redirect(url_for('admin.login'))
+
+# Image for a feature/nearby form: an uploaded file wins over the filename field
+def submitted_image(current=None):
+    upload = request.files.get('image_file')
+    if upload and upload.filename:
+        return media.save(upload)
+    image = request.form.get('image', '').strip() or current
+    if not image:
+        raise UploadError('Upload an image or enter the filename of one in static/images.')
+    return image
+
+@login_required
+def features():
+    features = storage.all(FEATURES)
+    return render_template('admin/features.html', features=features)
+
+@login_required
+def add_feature():
+    if request.method == 'POST':
+        try:
+            image = submitted_image()
+        except UploadError as e:
+            flash(str(e), 'error')
+            return render_template('admin/add_feature.html')
+        
+        new_feature = {
+            "icon": request.form.get('icon'),
+            "title": request.form.get('title'),
+            "description": request.form.get('description'),
+            "image": image
+        }
+        
+        storage.insert(FEATURES, new_feature)
+        flash('Feature added successfully!', 'success')
+        return redirect(url_for('admin.features'))
+    
+    return render_template('admin/add_feature.html')
+
+@login_required
+def edit_feature(feature_id):
+    feature = storage.get(FEATURES, feature_id)
+    
+    if not feature:
+        flash('Feature not found!', 'error')
+        return redirect(url_for('admin.features'))
+    
+    if request.method == 'POST':
+        try:
+            image = submitted_image(feature['image'])
+        except UploadError as e:
+            flash(str(e), 'error')
+            return render_template('admin/edit_feature.html', feature=feature)
+        
+        storage.update(FEATURES, feature_id, {
+            "icon": request.form.get('icon'),
+            "title": request.form.get('title'),
+            "description": request.form.get('description'),
+            "image": image
+        })
+        flash('Feature updated successfully!', 'success')
+        return redirect(url_for('admin.features'))
+    
+    return render_template('admin/edit_feature.html', feature=feature)
+
+@login_required
+def delete_feature(feature_id):
+    storage.delete(FEATURES, feature_id)
+    flash('Feature deleted successfully!', 'success')
+    return redirect(url_for('admin.features'))
+
+@login_required
+def nearby():
+    nearby = storage.all(NEARBY)
+    return render_template('admin/nearby.html', nearby=nearby)
+
+@login_required
+def add_nearby():
+    if request.method == 'POST':
+        try:
+            image = submitted_image()
+        except UploadError as e:
+            flash(str(e), 'error')
+            return render_template('admin/add_nearby.html')
+        
+        new_place = {
+            "title": request.form.get('title'),
+            "description": request.form.get('description'),
+            "image": image,
+            "distance": request.form.get('distance')
+        }
+        
+        storage.insert(NEARBY, new_place)
+        flash('Nearby place added successfully!', 'success')
+        return redirect(url_for('admin.nearby'))
+    
+    return render_template('admin/add_nearby.html')
+
+@login_required
+def edit_nearby(place_id):
+    place = storage.get(NEARBY, place_id)
+    
+    if not place:
+        flash('Place not found!', 'error')
+        return redirect(url_for('admin.nearby'))
+    
+    if request.method == 'POST':
+        try:
+            image = submitted_image(place['image'])
+        except UploadError as e:
+            flash(str(e), 'error')
+            return render_template('admin/edit_nearby.html', place=place)
+        
+        storage.update(NEARBY, place_id, {
+            "title": request.form.get('title'),
+            "description": request.form.get('description'),
+            "image": image,
+            "distance": request.form.get('distance')
+        })
+        flash('Place updated successfully!', 'success')
+        return redirect(url_for('admin.nearby'))
+    
+    return render_template('admin/edit_nearby.html', place=place)
+
+@login_required
+def delete_nearby(place_id):
+    storage.delete(NEARBY, place_id)
+    flash('Place deleted successfully!', 'success')
+    return redirect(url_for('admin.nearby'))
+
+FEEDBACK_SEARCH_PAGE_SIZE = 50
+
+def _search_records(name, query, limit, offset=0):
+    # (total, [(record, score)]) from the search index, best first
+    total, matches = search_index.search(name, query, limit=limit, offset=offset)
+    hits = []
+    for record_id, score in matches:
+        record = storage.get(name, record_id)
+        if record is not None:
+            hits.append((record, score))
+    return total, hits
+
+@login_required
+def feedback():
+    # Read before the records, so the page's event stream replays anything
+    # written while it renders
+    last_event_id = event_log.head()
+    search = request.args.get('q', '').strip()
+    page = pages = 1
+    per_page = FEEDBACK_SEARCH_PAGE_SIZE
+    if search:
+        # Matches a page at a time, best first
+        page = max(request.args.get('page', 1, type=int), 1)
+        total, hits = _search_records(FEEDBACK, search, per_page, (page - 1) * per_page)
+        feedback = [record for record, _ in hits]
+        pages = max((total + per_page - 1) // per_page, 1)
+    else:
+        feedback = storage.all(FEEDBACK)
+        total = len(feedback)
+    return render_template('admin/feedback.html', feedback=feedback, search=search, total=total,
+                           page=page, pages=pages, per_page=per_page, last_event_id=last_event_id)
+
+@login_required(api=True)
+def events():
+    # Server-sent events for the admin pages: one per booking/feedback
+    # change, type 'bookings' or 'feedback', data {"action", "record"}
+    # where record is the id plus, for updates, the fields that changed.
+    # ?dataset= (repeatable) narrows it; ?last_event_id= (or the
+    # Last-Event-ID header the browser sends when reconnecting) resumes
+    # after that event instead of starting from now. Each request returns
+    # what is new and ends; EventSource polls again after the retry delay.
+    datasets = request.args.getlist('dataset') or list(STREAMED)
+    if any(name not in STREAMED for name in datasets):
+        return jsonify(error='dataset must be bookings or feedback'), 400
+    last_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        last_id = max(int(last_id), 0) if last_id else None
+    except ValueError:
+        return jsonify(error='last_event_id must be an integer'), 400
+    events, resume_id = event_log.poll(last_id, datasets)
+    return current_app.response_class(format_poll(events, resume_id), mimetype='text/event-stream',
+                                      headers={'Cache-Control': 'no-store'})
+
+@login_required(api=True)
+def search():
+    # JSON: ?q= (every word matched as a prefix), ?type=bookings|feedback
+    # (default both), ?limit=, ?offset=; best matches first, or newest first
+    # for very broad queries (score null)
+    query = request.args.get('q', '').strip()
+    types = [request.args['type']] if request.args.get('type') else [BOOKINGS, FEEDBACK]
+    if any(name not in (BOOKINGS, FEEDBACK) for name in types):
+        return jsonify(error='type must be bookings or feedback'), 400
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    results = {}
+    for name in types:
+        total, hits = _search_records(name, query, limit, offset)
+        results[name] = {
+            'total': total,
+            'results': [{'id': record['id'], 'score': round(-score, 4) if score is not None else None,
+                         'record': record} for record, score in hits],
+        }
+    return jsonify(query=query, **results)
+
+@login_required
+def mark_read(feedback_id):
+    storage.update(FEEDBACK, feedback_id, {'read': True})
+    return redirect(url_for('admin.feedback'))
+
+@login_required
+def delete_feedback(feedback_id):
+    storage.delete(FEEDBACK, feedback_id)
+    flash('Feedback deleted successfully!', 'success')
+    return redirect(url_for('admin.feedback'))
+
+# Booking management routes
+BOOKING_SORT_FIELDS = ('id', 'name', 'email', 'room_type', 'check_in', 'check_out', 'status', 'created_at')
+BOOKING_PAGE_SIZES = (25, 50, 100, 200)
+
+def _date_arg(name):
+    # ISO date from the query string, or '' when missing or malformed
+    value = request.args.get(name, '')
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').strftime('%Y-%m-%d')
+    except ValueError:
+        return ''
+
+def _booking_filters():
+    # Query-string filters shared by the bookings list and its export:
+    # (status, date_from, date_to, search, storage query arguments)
+    status = request.args.get('status', '')
+    date_from = _date_arg('from')
+    date_to = _date_arg('to')
+    search = request.args.get('q', '').strip()
+    ranges = {}
+    if date_from:
+        ranges['check_in'] = (date_from, None)
+    if date_to:
+        ranges['check_out'] = (None, date_to)
+    query = {
+        'filters': {'status': status} if status else None,
+        'ranges': ranges,
+        'search': search or None,
+        'search_fields': ('name', 'email'),
+    }
+    return status, date_from, date_to, search, query
+
+@login_required
+def bookings():
+    last_event_id = event_log.head()
+    status, date_from, date_to, search, query = _booking_filters()
+    sort = request.args.get('sort', 'id')
+    if sort not in BOOKING_SORT_FIELDS:
+        sort = 'id'
+    order = 'asc' if request.args.get('order') == 'asc' else 'desc'
+    per_page = request.args.get('per_page', BOOKING_PAGE_SIZES[0], type=int)
+    if per_page not in BOOKING_PAGE_SIZES:
+        per_page = BOOKING_PAGE_SIZES[0]
+    page = max(request.args.get('page', 1, type=int), 1)
+
+    bookings, total = storage.query(
+        BOOKINGS,
+        sort=sort,
+        descending=(order == 'desc'),
+        offset=(page - 1) * per_page,
+        limit=per_page,
+        **query
+    )
+    counts = storage.count_by(BOOKINGS, 'status')
+    pages = max((total + per_page - 1) // per_page, 1)
+
+    # Current filters, reused by the pagination links and row actions
+    params = {key: value for key, value in request.args.items() if value and key != 'page'}
+
+    user_role = session.get('user_role', 'admin')
+    return render_template('admin/bookings.html', bookings=bookings, user_role=user_role,
+                           counts=counts, total_bookings=sum(counts.values()), total=total,
+                           page=page, pages=pages, per_page=per_page, page_sizes=BOOKING_PAGE_SIZES,
+                           status=status, date_from=date_from, date_to=date_to, search=search,
+                           sort=sort, order=order, sort_fields=BOOKING_SORT_FIELDS, params=params,
+                           last_event_id=last_event_id)
+
+@login_required
+def update_booking_status(booking_id):
+    new_status = request.form.get('status')
+    if new_status not in BOOKING_STATUSES:
+        flash('Unknown booking status.', 'error')
+        return redirect(url_for('admin.bookings', **request.args))
+
+    # Through the availability check: a cancelled booking set back to
+    # pending or confirmed takes its room again
+    try:
+        booking = availability.book({
+            'status': new_status,
+            'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }, booking_id)
+    except FullyBooked:
+        flash('That room type is fully booked for the booking\'s dates; the status was not changed.', 'error')
+        return redirect(url_for('admin.bookings', **request.args))
+    if booking is None:
+        flash('Booking not found.', 'error')
+    else:
+        flash(f'Booking status updated to {new_status}!', 'success')
+    return redirect(url_for('admin.bookings', **request.args))
+
+# Only admin can delete bookings, not front office
+@login_required('admin')
+def delete_booking(booking_id):
+    storage.delete(BOOKINGS, booking_id)
+    flash('Booking deleted successfully!', 'success')
+    return redirect(url_for('admin.bookings', **request.args))
+
+# Exports stream straight from storage.iter_query(): rows are written out as
+# they are read, in batches of about EXPORT_BATCH_BYTES, so memory use stays
+# flat however many records match
+EXPORT_FIELDS = {
+    BOOKINGS: ('id', 'name', 'email', 'phone', 'room_type', 'check_in', 'check_out', 'guests',
+               'total_price', 'currency', 'special_requests', 'status', 'created_at', 'updated_at'),
+    FEEDBACK: ('id', 'name', 'email', 'message', 'date', 'read'),
+}
+EXPORT_MIMETYPES = {'csv': 'text/csv', 'jsonl': 'application/x-ndjson'}
+EXPORT_BATCH_BYTES = 32 * 1024
+
+def _csv_cell(value):
+    # Keep spreadsheet apps from evaluating guest-entered text as a formula
+    if isinstance(value, str) and value[:1] in ('=', '+', '-', '@', '\t', '\r'):
+        return "'" + value
+    return value
+
+def _export_lines(records, fields, fmt):
+    if fmt == 'jsonl':
+        for record in records:
+            yield json.dumps(record) + '\n'
+        return
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    for record in records:
+        writer.writerow([_csv_cell(record.get(field)) for field in fields])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+def _export_response(name, records, fmt):
+    def generate():
+        lines = _export_lines(records, EXPORT_FIELDS[name], fmt)
+        # The first line (the CSV header) goes out at once so the download starts
+        yield next(lines, '')
+        batch, size = [], 0
+        for line in lines:
+            batch.append(line)
+            size += len(line)
+            if size >= EXPORT_BATCH_BYTES:
+                yield ''.join(batch)
+                batch, size = [], 0
+        if batch:
+            yield ''.join(batch)
+
+    filename = '{}-{}.{}'.format(name, datetime.now().strftime('%Y%m%d-%H%M%S'), fmt)
+    return current_app.response_class(generate(), mimetype=EXPORT_MIMETYPES[fmt], headers={
+        'Content-Disposition': f'attachment; filename="{filename}"',
+        'Cache-Control': 'no-store',
+        'X-Accel-Buffering': 'no'
+    })
+
+@login_required
+def export_bookings(fmt):
+    query = _booking_filters()[-1]
+    return _export_response(BOOKINGS, storage.iter_query(BOOKINGS, **query), fmt)
+
+@login_required
+def export_feedback(fmt):
+    # ?from=/?to= select by submission date, ?read=0|1 by read state
+    date_from = _date_arg('from')
+    date_to = _date_arg('to')
+    filters = {}
+    if request.args.get('read') in ('0', '1'):
+        filters['read'] = request.args.get('read') == '1'
+    ranges = {}
+    if date_from or date_to:
+        ranges['date'] = (date_from or None, date_to + ' 23:59:59' if date_to else None)
+    records = storage.iter_query(FEEDBACK, filters=filters or None, ranges=ranges)
+    return _export_response(FEEDBACK, records, fmt)
+
+# Bulk actions: the selection is checked item by item, then written in one
+# storage transaction. JSON callers get a result per id, forms a summary.
+BOOKING_STATUSES = ('pending', 'confirmed', 'cancelled')
+BULK_LIMIT = 500
+BULK_RESULT_LABELS = (('updated', 'updated'), ('deleted', 'deleted'), ('unchanged', 'unchanged'),
+                      ('fully_booked', 'fully booked'), ('not_found', 'not found'), ('forbidden', 'not allowed'),
+                      ('invalid', 'invalid'))
+
+def _bulk_request():
+    # (action, ids) from a JSON body or the form's "ids" checkboxes
+    if request.is_json:
+        body = request.get_json(silent=True) or {}
+        action, ids = body.get('action'), body.get('ids') or []
+    else:
+        action, ids = request.form.get('action'), request.form.getlist('ids')
+    if not isinstance(ids, list):
+        ids = []
+    parsed = []
+    for value in ids:
+        try:
+            parsed.append(int(value))
+        except (TypeError, ValueError):
+            parsed.append(value)
+    return action, list(dict.fromkeys(parsed))
+
+def _bulk_response(action, ids, results, endpoint):
+    items = [{'id': item_id, 'result': results[item_id]} for item_id in ids]
+    summary = {}
+    for item in items:
+        summary[item['result']] = summary.get(item['result'], 0) + 1
+    if request.is_json:
+        return jsonify(action=action, results=items, summary=summary)
+    parts = [f'{summary[key]} {label}' for key, label in BULK_RESULT_LABELS if key in summary]
+    flash(f'{action.replace("_", " ").capitalize()}: ' + ', '.join(parts) + '.',
+          'error' if set(summary) <= {'not_found', 'forbidden', 'invalid', 'fully_booked'} else 'success')
+    return redirect(url_for(endpoint, **request.args))
+
+def _bulk_error(message, endpoint):
+    if request.is_json:
+        return jsonify(error=message), 400
+    flash(message, 'error')
+    return redirect(url_for(endpoint, **request.args))
+
+def _bulk_update(name, ids, results, unchanged, changes):
+    # Writes changes to every id not already resolved; unchanged(record) skips ones that need no write
+    updates = {}
+    for item_id in ids:
+        if item_id in results:
+            continue
+        record = storage.get(name, item_id)
+        if record is None:
+            results[item_id] = 'not_found'
+        elif unchanged(record):
+            results[item_id] = 'unchanged'
+        else:
+            updates[item_id] = changes
+    if updates:
+        for item_id, record in storage.update_many(name, updates).items():
+            results[item_id] = 'updated' if record is not None else 'not_found'
+
+def _bulk_booking_status(ids, results, status):
+    # Like _bulk_update, but a booking leaving 'cancelled' takes its room again,
+    # so those go through the availability check one at a time, all under one lock
+    changes = {'status': status, 'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+    with storage.lock(BOOKINGS):
+        reopened = [item_id for item_id in ids if item_id not in results
+                    and status != 'cancelled' and (storage.get(BOOKINGS, item_id) or {}).get('status') == 'cancelled']
+        for item_id in reopened:
+            try:
+                booking = availability.book(dict(changes), item_id)
+            except FullyBooked:
+                results[item_id] = 'fully_booked'
+            else:
+                results[item_id] = 'updated' if booking is not None else 'not_found'
+        _bulk_update(BOOKINGS, ids, results, lambda booking: booking.get('status') == status, changes)
+
+def _bulk_delete(name, ids, results):
+    remaining = [item_id for item_id in ids if item_id not in results]
+    if remaining:
+        for item_id, deleted in storage.delete_many(name, remaining).items():
+            results[item_id] = 'deleted' if deleted else 'not_found'
+
+def _bulk_selection(endpoint):
+    # (action, ids, results) with malformed ids already marked invalid, or an error response
+    action, ids = _bulk_request()
+    if not ids:
+        return None, _bulk_error('Select at least one item first.', endpoint)
+    if len(ids) > BULK_LIMIT:
+        return None, _bulk_error(f'Select at most {BULK_LIMIT} items at a time.', endpoint)
+    results = {item_id: 'invalid' for item_id in ids if not isinstance(item_id, int)}
+    return (action, ids, results), None
+
+@login_required
+def bulk_bookings():
+    selection, error = _bulk_selection('admin.bookings')
+    if error:
+        return error
+    action, ids, results = selection
+    if action == 'delete':
+        # Same rule as delete_booking: only admin, not front office
+        if session.get('user_role') != 'admin':
+            results.update({item_id: 'forbidden' for item_id in ids if item_id not in results})
+        else:
+            _bulk_delete(BOOKINGS, ids, results)
+    elif action in BOOKING_STATUSES:
+        _bulk_booking_status(ids, results, action)
+    else:
+        return _bulk_error('Unknown bulk action.', 'admin.bookings')
+    return _bulk_response(action, ids, results, 'admin.bookings')
+
+@login_required
+def bulk_feedback():
+    selection, error = _bulk_selection('admin.feedback')
+    if error:
+        return error
+    action, ids, results = selection
+    if action == 'delete':
+        _bulk_delete(FEEDBACK, ids, results)
+    elif action == 'mark_read':
+        _bulk_update(FEEDBACK, ids, results, lambda item: item.get('read'), {'read': True})
+    else:
+        return _bulk_error('Unknown bulk action.', 'admin.feedback')
+    return _bulk_response(action, ids, results, 'admin.feedback')
+
+# Archived bookings and feedback, read from the archive segments on demand
+ARCHIVE_PAGE_SIZE = 50
+
+@login_required
+def archive():
+    dataset = request.args.get('dataset', BOOKINGS)
+    if dataset not in (BOOKINGS, FEEDBACK):
+        dataset = BOOKINGS
+    segments = archive_store.segments(dataset)
+    month = request.args.get('month', '')
+    if month not in dict(segments):
+        month = ''
+    status = request.args.get('status', '') if dataset == BOOKINGS else ''
+    search = request.args.get('q', '').strip()
+    page = max(request.args.get('page', 1, type=int), 1)
+
+    records, total = archive_store.query(
+        dataset,
+        months={month} if month else None,
+        filters={'status': status} if status else None,
+        search=search or None,
+        search_fields=('name', 'email'),
+        offset=(page - 1) * ARCHIVE_PAGE_SIZE,
+        limit=ARCHIVE_PAGE_SIZE
+    )
+    pages = max((total + ARCHIVE_PAGE_SIZE - 1) // ARCHIVE_PAGE_SIZE, 1)
+    params = {key: value for key, value in request.args.items() if value and key != 'page'}
+
+    user_role = session.get('user_role', 'admin')
+    return render_template('admin/archive.html', dataset=dataset, segments=segments, records=records,
+                           total=total, archived_total=sum(entry['records'] for _, entry in segments),
+                           page=page, pages=pages, per_page=ARCHIVE_PAGE_SIZE, month=month, status=status,
+                           search=search, params=params, retention=archive_store.retention[dataset],
+                           user_role=user_role)
+
+@login_required('admin')
+def run_archive():
+    counts = archive_store.run()
+    flash('Archived {} booking(s) and {} feedback message(s).'.format(counts[BOOKINGS], counts[FEEDBACK]), 'success')
+    return redirect(url_for('admin.archive', dataset=request.args.get('dataset', BOOKINGS)))
+
+# Metrics for Prometheus: an admin session or the METRICS_TOKEN bearer token
+def _metrics_allowed():
+    token = current_app.config.get('METRICS_TOKEN')
+    if token and hmac.compare_digest(request.headers.get('Authorization', ''), 'Bearer ' + token):
+        return True
+    return 'admin_logged_in' in session
+
+def metrics():
+    if not _metrics_allowed():
+        return 'Unauthorized\n', 401, {'WWW-Authenticate': 'Bearer', 'Content-Type': 'text/plain'}
+    body = current_app.extensions['metrics'].render()
+    return body, 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8', 'Cache-Control': 'no-store'}
+
+def metrics_profile():
+    if not _metrics_allowed():
+        return 'Unauthorized\n', 401, {'WWW-Authenticate': 'Bearer', 'Content-Type': 'text/plain'}
+    sort = request.args.get('sort', 'cumulative')
+    if sort not in ('cumulative', 'tottime', 'ncalls'):
+        sort = 'cumulative'
+    report = current_app.extensions['metrics'].profile_report(sort=sort, limit=request.args.get('limit', 40, type=int))
+    return report, 200, {'Content-Type': 'text/plain; charset=utf-8', 'Cache-Control': 'no-store'}
@@ -0,0 +1,147 @@
+from datetime import date, datetime, timedelta
+
+from availability import DEFAULT_INVENTORY, HOLDING_STATUSES, IncrementalIndex, parse_date
+
+# Longest range report() will walk, in days
+MAX_REPORT_DAYS = 3 * 366
+
+
+def _created_day(booking):
+    # created_at is 'YYYY-MM-DD HH:MM:SS'
+    return parse_date(str(booking.get('created_at') or '')[:10])
+
+
+def _price(booking):
+    # total_price as quoted at booking time; bookings made before pricing
+    # (or added without one) count as 0
+    price = booking.get('total_price')
+    return price if isinstance(price, (int, float)) and not isinstance(price, bool) else 0
+
+
+class BookingAnalytics(IncrementalIndex):
+    # Daily aggregates per room type, kept in two tables:
+    #   stays:   room_type -> {night ordinal: [nights held, nights confirmed]}
+    #   created: room_type -> {booking day ordinal: [bookings, cancelled, lead days, revenue]}
+    # Like the availability index, a booking write only adjusts the days
+    # that booking touches (old copy out, new copy in). Bookings another
+    # worker added are applied the same way; the tables are only rebuilt
+    # from storage after another worker updated or deleted bookings.
+    # Reports then cost O(days x room types), not O(bookings).
+
+    def __init__(self, storage, inventory=None):
+        self.inventory = dict(inventory or DEFAULT_INVENTORY)
+        self._stays = None
+        self._created = None
+        super().__init__(storage)
+
+    def _reset(self):
+        self._stays, self._created = {}, {}
+
+    def _apply(self, booking, delta):
+        if booking is None or booking.get('room_type') not in self.inventory:
+            return
+        room_type = booking['room_type']
+        status = booking.get('status')
+        check_in = parse_date(booking.get('check_in'))
+        check_out = parse_date(booking.get('check_out'))
+
+        if status in HOLDING_STATUSES and check_in and check_out and check_out > check_in:
+            days = self._stays.setdefault(room_type, {})
+            confirmed = delta if status == 'confirmed' else 0
+            for day in range(check_in.toordinal(), check_out.toordinal()):
+                counts = days.setdefault(day, [0, 0])
+                counts[0] += delta
+                counts[1] += confirmed
+                if not counts[0]:
+                    del days[day]
+
+        created = _created_day(booking)
+        if created:
+            days = self._created.setdefault(room_type, {})
+            counts = days.setdefault(created.toordinal(), [0, 0, 0, 0])
+            counts[0] += delta
+            if status == 'cancelled':
+                counts[1] += delta
+            else:
+                counts[3] += delta * _price(booking)
+            if check_in:
+                counts[2] += delta * max((check_in - created).days, 0)
+            if not counts[0]:
+                del days[created.toordinal()]
+
+    def report(self, start, end, room_types=None):
+        # Stay metrics for the nights in [start, end] and booking metrics for
+        # bookings made in [start, end], per room type and in total
+        if end < start:
+            raise ValueError('End date must not be before start date')
+        if (end - start).days >= MAX_REPORT_DAYS:
+            raise ValueError('Date range is limited to {} days'.format(MAX_REPORT_DAYS))
+        room_types = [room_type for room_type in (room_types or self.inventory) if room_type in self.inventory]
+        first, last = start.toordinal(), end.toordinal()
+        n_days = last - first + 1
+
+        daily = [{'date': date.fromordinal(day).isoformat(), 'nights': 0, 'confirmed_nights': 0}
+                 for day in range(first, last + 1)]
+        by_room = {}
+        with self._lock:
+            self._ensure_current()
+            for room_type in room_types:
+                stays = self._stays.get(room_type, {})
+                created = self._created.get(room_type, {})
+                nights = confirmed = bookings = cancelled = lead_days = revenue = 0
+                for offset, day in enumerate(range(first, last + 1)):
+                    held = stays.get(day)
+                    if held:
+                        nights += held[0]
+                        confirmed += held[1]
+                        daily[offset]['nights'] += held[0]
+                        daily[offset]['confirmed_nights'] += held[1]
+                    made = created.get(day)
+                    if made:
+                        bookings += made[0]
+                        cancelled += made[1]
+                        lead_days += made[2]
+                        revenue += made[3]
+                by_room[room_type] = {
+                    'rooms': self.inventory[room_type],
+                    'nights': nights,
+                    'confirmed_nights': confirmed,
+                    'bookings': bookings,
+                    'cancelled': cancelled,
+                    'lead_days': lead_days,
+                    'revenue': revenue,
+                }
+
+        rooms = sum(self.inventory[room_type] for room_type in room_types)
+        for day in daily:
+            day['occupancy'] = round(day['nights'] / rooms, 4) if rooms else 0.0
+        totals = {key: sum(stats[key] for stats in by_room.values())
+                  for key in ('rooms', 'nights', 'confirmed_nights', 'bookings', 'cancelled', 'lead_days', 'revenue')}
+        for stats in list(by_room.values()) + [totals]:
+            capacity = stats['rooms'] * n_days
+            stats['occupancy'] = round(stats['nights'] / capacity, 4) if capacity else 0.0
+            stats['cancellation_rate'] = round(stats['cancelled'] / stats['bookings'], 4) if stats['bookings'] else 0.0
+            stats['avg_lead_days'] = round(stats.pop('lead_days') / stats['bookings'], 1) if stats['bookings'] else None
+        return {
+            'from': start.isoformat(),
+            'to': end.isoformat(),
+            'days': n_days,
+            'totals': totals,
+            'room_types': by_room,
+            'daily': daily,
+        }
+
+    def dashboard(self, today=None, days=30):
+        # The next ``days`` nights (occupancy) and the bookings made in the
+        # last ``days`` days (volume, cancellations, lead time, revenue)
+        today = today or datetime.now().date()
+        return {
+            'upcoming': self.report(today, today + timedelta(days=days - 1)),
+            'recent': self.report(today - timedelta(days=days - 1), today),
+        }
+
+
+def init_analytics(app, storage):
+    index = BookingAnalytics(storage, app.config.get('ROOM_INVENTORY'))
+    app.extensions['analytics'] = index
+    return index
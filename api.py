@@ -0,0 +1,323 @@
+import hmac
+import json
+import base64
+import hashlib
+import binascii
+from datetime import date, datetime
+
+from flask import Blueprint, current_app, request, session, jsonify, url_for
+from werkzeug.local import LocalProxy
+
+from storage import FEATURES, NEARBY, FEEDBACK, BOOKINGS
+from availability import FullyBooked, parse_date
+from validation import ValidationError
+from admin import init_admin_services, check_staff_session
+
+bp = Blueprint('api', __name__, url_prefix='/api/v1')
+
+storage = LocalProxy(lambda: current_app.extensions['storage'])
+availability = LocalProxy(lambda: current_app.extensions['availability'])
+pricing = LocalProxy(lambda: current_app.extensions['pricing'])
+booking_validator = LocalProxy(lambda: current_app.extensions['booking_validator'])
+
+BOOKING_STATUSES = ('pending', 'confirmed', 'cancelled')
+
+# Resource name -> what the API allows on it. ``public`` resources can be
+# read without logging in; ``filters`` are exact-match query parameters.
+RESOURCES = {
+    FEATURES: {
+        'public': True,
+        'writable': ('icon', 'title', 'description', 'image'),
+        'required': ('title',),
+        'filters': (),
+    },
+    NEARBY: {
+        'public': True,
+        'writable': ('title', 'description', 'image', 'distance'),
+        'required': ('title',),
+        'filters': (),
+    },
+    BOOKINGS: {
+        'public': False,
+        'writable': ('name', 'email', 'phone', 'room_type', 'check_in', 'check_out', 'guests',
+                     'special_requests', 'status'),
+        'required': ('name', 'email', 'room_type', 'check_in', 'check_out'),
+        'filters': ('status', 'room_type', 'email'),
+    },
+    FEEDBACK: {
+        'public': False,
+        'writable': ('name', 'email', 'message', 'read'),
+        'required': ('name', 'email', 'message'),
+        'filters': ('read', 'email'),
+    },
+}
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+@bp.before_request
+def load_admin_services():
+    # Writes are admin work: with the admin services loaded, the search
+    # index and the live-update log take them in as they are made instead
+    # of catching up later
+    app = current_app._get_current_object()
+    if request.method not in ('GET', 'HEAD', 'OPTIONS'):
+        init_admin_services(app)
+    check_staff_session(app)
+
+
+@bp.errorhandler(ApiError)
+def handle_api_error(error):
+    return jsonify(error=error.message), error.status
+
+
+def _role():
+    # 'admin' or 'front_office' for a logged-in session; API_TOKEN callers
+    # (integrations) get front office rights. None when unauthenticated.
+    if 'admin_logged_in' in session:
+        return session.get('user_role', 'admin')
+    token = current_app.config.get('API_TOKEN')
+    if token and hmac.compare_digest(request.headers.get('Authorization', ''), 'Bearer ' + token):
+        return 'front_office'
+    return None
+
+
+def _resource(name, write=False):
+    spec = RESOURCES.get(name)
+    if spec is None:
+        raise ApiError(404, f'Unknown resource: {name}')
+    if (write or not spec['public']) and _role() is None:
+        raise ApiError(401, 'Authentication required')
+    return spec
+
+
+def _fields():
+    value = request.args.get('fields', '').strip()
+    if not value:
+        return None
+    fields = [field.strip() for field in value.split(',') if field.strip()]
+    if not all(field.isidentifier() for field in fields):
+        raise ApiError(400, 'fields must be a comma-separated list of field names')
+    return fields
+
+
+def _select(record, fields):
+    if fields is None:
+        return record
+    return {field: record[field] for field in fields if field in record}
+
+
+def _etag(*parts):
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def _json_response(body, etag):
+    response = jsonify(body)
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def _not_modified(etag):
+    # 304 straight from the ETag, before any records are loaded
+    if etag in request.if_none_match:
+        response = current_app.response_class(status=304)
+        response.set_etag(etag)
+        return response
+    return None
+
+
+def _encode_cursor(last_id):
+    return base64.urlsafe_b64encode(json.dumps({'after': last_id}).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _decode_cursor(cursor):
+    try:
+        value = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        return int(value['after'])
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise ApiError(400, 'Invalid cursor')
+
+
+def _filter_value(value):
+    # Query strings are text; booleans are stored as JSON true/false
+    return {'true': True, 'false': False}.get(value, value)
+
+
+def _body(spec, partial):
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        raise ApiError(400, 'Expected a JSON object with Content-Type: application/json')
+    unknown = sorted(set(data) - set(spec['writable']))
+    if unknown:
+        raise ApiError(400, 'Fields cannot be set: ' + ', '.join(unknown))
+    if not partial:
+        missing = [field for field in spec['required'] if not data.get(field)]
+        if missing:
+            raise ApiError(400, 'Missing required fields: ' + ', '.join(missing))
+    if 'status' in data and data['status'] not in BOOKING_STATUSES:
+        raise ApiError(400, 'status must be one of: ' + ', '.join(BOOKING_STATUSES))
+    if 'read' in data and not isinstance(data['read'], bool):
+        raise ApiError(400, 'read must be true or false')
+    return data
+
+
+def _now():
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _clean_booking(data, current=None):
+    # The booking fields of data checked and normalized by the booking
+    # form's rules (applied over the stored booking on update), priced
+    # again when the stay changes. A stay whose dates aren't being changed
+    # keeps them even once check-in has passed.
+    fields = [field for field in data if field != 'status']
+    if current is not None and not fields:
+        return {}
+    today = date.today()
+    check_in = None
+    if current is not None and 'check_in' not in data and 'check_out' not in data:
+        check_in = parse_date(current.get('check_in'))
+    merged = {field: str(value) for field, value in dict(current or {}, **data).items() if value is not None}
+    try:
+        cleaned = booking_validator.clean(merged, min(today, check_in) if check_in else today)
+    except ValidationError as e:
+        raise ApiError(422, str(e))
+    booking = {field: cleaned[field] for field in (fields if current is not None else cleaned)}
+    stay = ('room_type', 'check_in', 'check_out')
+    if current is None or any(cleaned[field] != current.get(field) for field in stay):
+        quote = pricing.quote(cleaned['room_type'], parse_date(cleaned['check_in']),
+                              parse_date(cleaned['check_out']), today)
+        booking.update(total_price=quote['total'], currency=quote['currency'])
+    return booking
+
+
+def _book(booking, record_id=None):
+    try:
+        record = availability.book(booking, record_id)
+    except FullyBooked:
+        raise ApiError(409, 'That room type is fully booked for the selected dates')
+    if record is None:
+        raise ApiError(404, f'{BOOKINGS} {record_id} not found')
+    return record
+
+
+@bp.route('/<name>')
+def list_records(name):
+    # Keyset pagination over ids: ?limit=&cursor= with the cursor taken
+    # from the previous page's next_cursor
+    spec = _resource(name)
+    fields = _fields()
+    limit = request.args.get('limit', DEFAULT_LIMIT, type=int)
+    if not 1 <= limit <= MAX_LIMIT:
+        raise ApiError(400, f'limit must be between 1 and {MAX_LIMIT}')
+    cursor = request.args.get('cursor')
+    after = _decode_cursor(cursor) if cursor else 0
+    filters = {field: _filter_value(request.args[field]) for field in spec['filters'] if field in request.args}
+
+    etag = _etag(name, storage.version(name), request.full_path)
+    not_modified = _not_modified(etag)
+    if not_modified is not None:
+        return not_modified
+
+    records, _ = storage.query(name, filters=filters or None, ranges={'id': (after + 1, None)},
+                               sort='id', limit=limit + 1)
+    has_more = len(records) > limit
+    records = records[:limit]
+    body = {'data': [_select(record, fields) for record in records], 'has_more': has_more, 'next_cursor': None}
+    next_url = None
+    if has_more:
+        body['next_cursor'] = _encode_cursor(records[-1]['id'])
+        next_url = url_for('api.list_records', name=name, _external=True,
+                           **dict(request.args, cursor=body['next_cursor']))
+    response = _json_response(body, etag)
+    if next_url:
+        response.headers['Link'] = f'<{next_url}>; rel="next"'
+    return response
+
+
+@bp.route('/<name>/<int:record_id>')
+def get_record(name, record_id):
+    _resource(name)
+    fields = _fields()
+    record = storage.get(name, record_id)
+    if record is None:
+        raise ApiError(404, f'{name} {record_id} not found')
+    etag = _etag(record, fields)
+    not_modified = _not_modified(etag)
+    if not_modified is not None:
+        return not_modified
+    return _json_response(_select(record, fields), etag)
+
+
+@bp.route('/<name>', methods=['POST'])
+def create_record(name):
+    spec = _resource(name, write=True)
+    record = _body(spec, partial=False)
+    if name == BOOKINGS:
+        record = dict(_clean_booking(record), status=record.get('status', 'pending'),
+                      created_at=_now(), updated_at=_now())
+        record = _book(record)
+    else:
+        if name == FEEDBACK:
+            record = {'read': False, **record, 'date': _now()}
+        record = storage.insert(name, record)
+    response = _json_response(record, _etag(record, None))
+    response.status_code = 201
+    response.headers['Location'] = url_for('api.get_record', name=name, record_id=record['id'])
+    return response
+
+
+def _check_precondition(record):
+    # Optional optimistic locking: If-Match with the ETag from a plain GET
+    if request.if_match and not request.if_match.contains(_etag(record, None)):
+        raise ApiError(412, 'Record has changed since it was read')
+
+
+@bp.route('/<name>/<int:record_id>', methods=['PATCH'])
+def update_record(name, record_id):
+    spec = _resource(name, write=True)
+    changes = _body(spec, partial=True)
+    # Read, precondition and write under one lock, so If-Match can't pass
+    # against a version another request replaces before this one writes
+    with storage.lock(name):
+        record = storage.get(name, record_id)
+        if record is None:
+            raise ApiError(404, f'{name} {record_id} not found')
+        _check_precondition(record)
+        if name == BOOKINGS and changes:
+            status = changes.get('status')
+            changes = _clean_booking(changes, record)
+            if status:
+                changes['status'] = status
+            changes['updated_at'] = _now()
+            record = _book(changes, record_id)
+        elif changes:
+            record = storage.update(name, record_id, changes)
+            if record is None:
+                raise ApiError(404, f'{name} {record_id} not found')
+    return _json_response(record, _etag(record, None))
+
+
+@bp.route('/<name>/<int:record_id>', methods=['DELETE'])
+def delete_record(name, record_id):
+    _resource(name, write=True)
+    # Same rule as the admin pages: only admin, not front office, deletes bookings
+    if name == BOOKINGS and _role() != 'admin':
+        raise ApiError(403, 'Only administrators can delete bookings')
+    with storage.lock(name):
+        record = storage.get(name, record_id)
+        if record is None:
+            raise ApiError(404, f'{name} {record_id} not found')
+        _check_precondition(record)
+        storage.delete(name, record_id)
+    return '', 204
@@ -1,24 +1,31 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, session, send_from_directory
-import os
-import json
-from datetime import datetime
-
-app = Flask(__name__, static_folder='static', static_url_path='/static')
-app.secret_key = 'your-secret-key-here'
+import time
+_import_started = time.perf_counter()
 
-# Data storage files
-FEATURES_FILE = 'data/features.json'
-NEARBY_FILE = 'data/nearby.json'
-FEEDBACK_FILE = 'data/feedback.json'
-BOOKINGS_FILE = 'data/bookings.json'
-USERS_FILE = 'data/users.json'
-
-# Ensure data directory exists
-os.makedirs('data', exist_ok=True)
+from flask import Flask
+from werkzeug.middleware.proxy_fix import ProxyFix
+import click
+import os
 
-# Initialize data files if they don't exist
-def initialize_data():
-    if not os.path.exists(FEATURES_FILE):
+from storage import init_storage, migrate_json_to_sqlite, FEATURES, NEARBY, FEEDBACK, BOOKINGS, USERS
+from availability import init_availability
+from pricing import init_pricing
+from validation import init_validation
+from page_cache import init_page_cache
+from assets import init_assets
+from images import init_images
+from public import bp as public_bp
+from admin import bp as admin_bp, init_admin_services
+from api import bp as api_bp
+from startup import init_startup, seed_data, precompile
+from metrics import init_metrics
+from notifications import init_notifications
+from ratelimit import init_form_guard
+from sessions import init_sessions
+
+# Initialize data if it doesn't exist
+def initialize_data(app):
+    storage = app.extensions['storage']
+    if not storage.exists(FEATURES):
         default_features = [
             {
                 "id": 1,
@@ -49,10 +56,9 @@ def initialize_data():
                 "image": "pool.jpg"
             }
         ]
-        with open(FEATURES_FILE, 'w') as f:
-            json.dump(default_features, f, indent=2)
+        storage.replace_all(FEATURES, default_features)
 
-    if not os.path.exists(NEARBY_FILE):
+    if not storage.exists(NEARBY):
         default_nearby = [
             {
                 "id": 1,
@@ -125,377 +131,234 @@ def initialize_data():
                 "distance": "2.5 km • 8 min walk"
             }
         ]
-        with open(NEARBY_FILE, 'w') as f:
-            json.dump(default_nearby, f, indent=2)
-
-    if not os.path.exists(FEEDBACK_FILE):
-        with open(FEEDBACK_FILE, 'w') as f:
-            json.dump([], f)
-
-    if not os.path.exists(BOOKINGS_FILE):
-        with open(BOOKINGS_FILE, 'w') as f:
-            json.dump([], f)
-
-    if not os.path.exists(USERS_FILE):
-        default_users = [
-            {
-                "id": 1,
-                "username": "admin",
-                "password": "admin123",
-                "role": "admin",
-                "name": "System Administrator"
-            },
-            {
-                "id": 2,
-                "username": "frontdesk",
-                "password": "front123",
-                "role": "front_office",
-                "name": "Front Office Staff"
-            }
-        ]
-        with open(USERS_FILE, 'w') as f:
-            json.dump(default_users, f, indent=2)
-
-def load_data(filename):
-    if os.path.exists(filename):
-        with open(filename, 'r') as f:
-            return json.load(f)
-    return []
-
-def save_data(filename, data):
-    with open(filename, 'w') as f:
-        json.dump(data, f, indent=2)
-
-# Main routes
-@app.route('/')
-def index():
-    features = load_data(FEATURES_FILE)
-    nearby = load_data(NEARBY_FILE)
-    testimonials = load_data(FEEDBACK_FILE)
-    return render_template('index.html', features=features, nearby=nearby, testimonials=testimonials)
-
-@app.route('/about')
-def about():
-    return render_template('about.html')
-
-@app.route('/rooms')
-def rooms():
-    return render_template('rooms.html')
-
-@app.route('/gallery')
-def gallery():
-    return render_template('gallery.html')
-
-@app.route('/contact', methods=['GET', 'POST'])
-def contact():
-    if request.method == 'GET':
-        return render_template('contact.html')
-    elif request.method == 'POST':
-        return submit_feedback()
-
-@app.route('/booking', methods=['GET', 'POST'])
-def booking():
-    if request.method == 'GET':
-        return render_template('booking.html')
-    elif request.method == 'POST':
-        return submit_booking()
-
-# Admin routes
-@app.route('/admin')
-def admin_dashboard():
-    if 'admin_logged_in' not in session:
-        return redirect(url_for('admin_login'))
-    return render_template('admin/dashboard.html')
-
-@app.route('/admin/login', methods=['GET', 'POST'])
-def admin_login():
-    if request.method == 'POST':
-        username = request.form.get('username')
-        password = request.form.get('password')
-        
-        users = load_data(USERS_FILE)
-        user = next((u for u in users if u['username'] == username and u['password'] == password), None)
-        
-        if user:
-            session['admin_logged_in'] = True
-            session['user_role'] = user['role']
-            session['user_name'] = user['name']
-            session['user_id'] = user['id']
-            flash(f'Login successful! Welcome, {user["name"]}', 'success')
-            return redirect(url_for('admin_dashboard'))
-        else:
-            flash('Invalid credentials!', 'error')
-    return render_template('admin/login.html')
-
-@app.route('/admin/logout')
-def admin_logout():
-    session.pop('admin_logged_in', None)
-    session.pop('user_role', None)
-    session.pop('user_name', None)
-    session.pop('user_id', None)
-    flash('Logged out successfully!', 'info')
-    return redirect(url_for('admin_login'))
-
-@app.route('/admin/features')
-def admin_features():
-    if 'admin_logged_in' not in session:
-        return redirect(url_for('admin_login'))
-    features = load_data(FEATURES_FILE)
-    return render_template('admin/features.html', features=features)
-
-@app.route('/admin/features/add', methods=['GET', 'POST'])
-def admin_add_feature():
-    if 'admin_logged_in' not in session:
-        return redirect(url_for('admin_login'))
-    
-    if request.method == 'POST':
-        features = load_data(FEATURES_FILE)
-        new_id = max([f['id'] for f in features], default=0) + 1
-        
-        new_feature = {
-            "id": new_id,
-            "icon": request.form.get('icon'),
-            "title": request.form.get('title'),
-            "description": request.form.get('description'),
-            "image": request.form.get('image')
-        }
-        
-        features.append(new_feature)
-        save_data(FEATURES_FILE, features)
-        flash('Feature added successfully!', 'success')
-        return redirect(url_for('admin_features'))
-    
-    return render_template('admin/add_feature.html')
-
-@app.route('/admin/features/edit/<int:feature_id>', methods=['GET', 'POST'])
-def admin_edit_feature(feature_id):
-    if 'admin_logged_in' not in session:
-        return redirect(url_for('admin_login'))
-    
-    features = load_data(FEATURES_FILE)
-    feature = next((f for f in features if f['id'] == feature_id), None)
-    
-    if not feature:
-        flash('Feature not found!', 'error')
-        return redirect(url_for('admin_features'))
-    
-    if request.method == 'POST':
-        feature['icon'] = request.form.get('icon')
-        feature['title'] = request.form.get('title')
-        feature['description'] = request.form.get('description')
-        feature['image'] = request.form.get('image')
-        
-        save_data(FEATURES_FILE, features)
-        flash('Feature updated successfully!', 'success')
-        return redirect(url_for('admin_features'))
-    
-    return render_template('admin/edit_feature.html', feature=feature)
-
-@app.route('/admin/features/delete/<int:feature_id>')
-def admin_delete_feature(feature_id):
-    if 'admin_logged_in' not in session:
-        return redirect(url_for('admin_login'))
-    
-    features = load_data(FEATURES_FILE)
-    features = [f for f in features if f['id'] != feature_id]
-    save_data(FEATURES_FILE, features)
-    flash('Feature deleted successfully!', 'success')
-    return redirect(url_for('admin_features'))
-
-@app.route('/admin/nearby')
-def admin_nearby():
-    if 'admin_logged_in' not in session:
-        return redirect(url_for('admin_login'))
-    nearby = load_data(NEARBY_FILE)
-    return render_template('admin/nearby.html', nearby=nearby)
-
-@app.route('/admin/nearby/add', methods=['GET', 'POST'])
-def admin_add_nearby():
-    if 'admin_logged_in' not in session:
-        return redirect(url_for('admin_login'))
-    
-    if request.method == 'POST':
-        nearby = load_data(NEARBY_FILE)
-        new_id = max([n['id'] for n in nearby], default=0) + 1
-        
-        new_place = {
-            "id": new_id,
-            "title": request.form.get('title'),
-            "description": request.form.get('description'),
-            "image": request.form.get('image'),
-            "distance": request.form.get('distance')
-        }
-        
-        nearby.append(new_place)
-        save_data(NEARBY_FILE, nearby)
-        flash('Nearby place added successfully!', 'success')
-        return redirect(url_for('admin_nearby'))
-    
-    return render_template('admin/add_nearby.html')
-
-@app.route('/admin/nearby/edit/<int:place_id>', methods=['GET', 'POST'])
-def admin_edit_nearby(place_id):
-    if 'admin_logged_in' not in session:
-        return redirect(url_for('admin_login'))
-    
-    nearby = load_data(NEARBY_FILE)
-    place = next((n for n in nearby if n['id'] == place_id), None)
-    
-    if not place:
-        flash('Place not found!', 'error')
-        return redirect(url_for('admin_nearby'))
-    
-    if request.method == 'POST':
-        place['title'] = request.form.get('title')
-        place['description'] = request.form.get('description')
-        place['image'] = request.form.get('image')
-        place['distance'] = request.form.get('distance')
-        
-        save_data(NEARBY_FILE, nearby)
-        flash('Place updated successfully!', 'success')
-        return redirect(url_for('admin_nearby'))
-    
-    return render_template('admin/edit_nearby.html', place=place)
-
-@app.route('/admin/nearby/delete/<int:place_id>')
-def admin_delete_nearby(place_id):
-    if 'admin_logged_in' not in session:
-        return redirect(url_for('admin_login'))
-    
-    nearby = load_data(NEARBY_FILE)
-    nearby = [n for n in nearby if n['id'] != place_id]
-    save_data(NEARBY_FILE, nearby)
-    flash('Place deleted successfully!', 'success')
-    return redirect(url_for('admin_nearby'))
-
-# Feedback submission
-def submit_feedback():
-    if request.method == 'POST':
-        feedback_list = load_data(FEEDBACK_FILE)
-        new_id = max([f.get('id', 0) for f in feedback_list], default=0) + 1
-        
-        feedback = {
-            "id": new_id,
-            "name": request.form.get('name'),
-            "email": request.form.get('email'),
-            "message": request.form.get('message'),
-            "date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            "read": False
-        }
-        
-        feedback_list.append(feedback)
-        save_data(FEEDBACK_FILE, feedback_list)
-        flash('Thank you for your feedback! We will get back to you soon.', 'success')
-        
-    return redirect(url_for('contact'))
-
-# Booking submission
-def submit_booking():
-    if request.method == 'POST':
-        bookings = load_data(BOOKINGS_FILE)
-        new_id = max([b.get('id', 0) for b in bookings], default=0) + 1
-        
-        booking = {
-            "id": new_id,
-            "name": request.form.get('name'),
-            "email": request.form.get('email'),
-            "phone": request.form.get('phone'),
-            "room_type": request.form.get('room_type'),
-            "check_in": request.form.get('check_in'),
-            "check_out": request.form.get('check_out'),
-            "guests": request.form.get('guests'),
-            "special_requests": request.form.get('special_requests', ''),
-            "status": "pending",
-            "created_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            "updated_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-        
-        bookings.append(booking)
-        save_data(BOOKINGS_FILE, bookings)
-        flash('Booking request submitted successfully! We will confirm your reservation shortly.', 'success')
-        
-    return redirect(url_for('booking'))
-
-@app.route('/admin/feedback')
-def admin_feedback():
-    if 'admin_logged_in' not in session:
-        return redirect(url_for('admin_login'))
-    feedback = load_data(FEEDBACK_FILE)
-    return render_template('admin/feedback.html', feedback=feedback)
-
-@app.route('/admin/feedback/mark_read/<int:feedback_id>')
-def admin_mark_read(feedback_id):
-    if 'admin_logged_in' not in session:
-        return redirect(url_for('admin_login'))
-    
-    feedback_list = load_data(FEEDBACK_FILE)
-    for item in feedback_list:
-        if item['id'] == feedback_id:
-            item['read'] = True
-            break
-    save_data(FEEDBACK_FILE, feedback_list)
-    return redirect(url_for('admin_feedback'))
-
-@app.route('/admin/feedback/delete/<int:feedback_id>')
-def admin_delete_feedback(feedback_id):
-    if 'admin_logged_in' not in session:
-        return redirect(url_for('admin_login'))
-    
-    feedback_list = load_data(FEEDBACK_FILE)
-    feedback_list = [f for f in feedback_list if f['id'] != feedback_id]
-    save_data(FEEDBACK_FILE, feedback_list)
-    flash('Feedback deleted successfully!', 'success')
-    return redirect(url_for('admin_feedback'))
-
-# Booking management routes
-@app.route('/admin/bookings')
-def admin_bookings():
-    if 'admin_logged_in' not in session:
-        return redirect(url_for('admin_login'))
-    
-    bookings = load_data(BOOKINGS_FILE)
-    user_role = session.get('user_role', 'admin')
-    return render_template('admin/bookings.html', bookings=bookings, user_role=user_role)
-
-@app.route('/admin/bookings/update_status/<int:booking_id>', methods=['POST'])
-def admin_update_booking_status(booking_id):
-    if 'admin_logged_in' not in session:
-        return redirect(url_for('admin_login'))
-    
-    bookings = load_data(BOOKINGS_FILE)
-    new_status = request.form.get('status')
-    
-    for booking in bookings:
-        if booking['id'] == booking_id:
-            booking['status'] = new_status
-            booking['updated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            break
-    
-    save_data(BOOKINGS_FILE, bookings)
-    flash(f'Booking status updated to {new_status}!', 'success')
-    return redirect(url_for('admin_bookings'))
-
-@app.route('/admin/bookings/delete/<int:booking_id>')
-def admin_delete_booking(booking_id):
-    if 'admin_logged_in' not in session:
-        return redirect(url_for('admin_login'))
-    
-    # Only admin can delete bookings, not front office
-    if session.get('user_role') != 'admin':
-        flash('Only administrators can delete bookings!', 'error')
-        return redirect(url_for('admin_bookings'))
-    
-    bookings = load_data(BOOKINGS_FILE)
-    bookings = [b for b in bookings if b['id'] != booking_id]
-    save_data(BOOKINGS_FILE, bookings)
-    flash('Booking deleted successfully!', 'success')
-    return redirect(url_for('admin_bookings'))
-
-# Static file serving
-@app.route('/static/<path:filename>')
-def serve_static(filename):
-    return send_from_directory('static', filename)
+        storage.replace_all(NEARBY, default_nearby)
+
+    if not storage.exists(FEEDBACK):
+        storage.replace_all(FEEDBACK, [])
+
+    if not storage.exists(BOOKINGS):
+        storage.replace_all(BOOKINGS, [])
+
+    if not storage.exists(USERS):
+        # Only the user store; the other admin services wait for an admin request
+        from users import init_users
+        init_users(app, storage).ensure_defaults()
+
+def create_app(config=None):
+    app_started = time.perf_counter()
+    app = Flask(__name__, static_folder='static', static_url_path='/static')
+    app.secret_key = 'your-secret-key-here'
+
+    # Serverless (Vercel) instances can only write to /tmp; they start from
+    # the data/ snapshot bundled with the deployment
+    app.config['SERVERLESS'] = bool(os.environ.get('VERCEL'))
+    bundled_data = os.path.join(app.root_path, 'data')
+
+    # Data storage: 'json' (files under DATA_DIR) or 'sqlite' (SQLITE_PATH)
+    app.config['STORAGE_BACKEND'] = os.environ.get('STORAGE_BACKEND', 'json')
+    app.config['DATA_DIR'] = os.environ.get('DATA_DIR', '/tmp/extremeli-data' if app.config['SERVERLESS'] else 'data')
+    app.config['SEED_DIR'] = os.environ.get('SEED_DIR', bundled_data if app.config['SERVERLESS'] else None)
+    app.config['SQLITE_PATH'] = os.environ.get('SQLITE_PATH', os.path.join(app.config['DATA_DIR'], 'extremeli.db'))
+
+    # Rendered public pages: in-memory LRU, shared on disk when PAGE_CACHE_DIR is set
+    app.config['PAGE_CACHE_TTL'] = int(os.environ.get('PAGE_CACHE_TTL', 300))
+    app.config['PAGE_CACHE_DIR'] = os.environ.get('PAGE_CACHE_DIR')
+
+    # Public booking/contact forms: token buckets per IP and email, kept in
+    # memory per worker or shared through a SQLite file (RATE_LIMIT_PATH)
+    app.config['RATE_LIMIT_BACKEND'] = os.environ.get('RATE_LIMIT_BACKEND', 'memory')
+    app.config['RATE_LIMIT_PATH'] = os.environ.get('RATE_LIMIT_PATH')
+
+    # Reverse proxies in front of the app whose X-Forwarded-For/-Proto
+    # headers are trusted. The per-IP form limits and the admin login
+    # throttle key on the client address, so behind a proxy this has to
+    # match the number of hops, or every client shares the proxy's buckets.
+    # Vercel's edge is one hop; leave it at 0 when clients connect directly,
+    # since they could otherwise pick their own address.
+    app.config['TRUSTED_PROXIES'] = int(os.environ.get('TRUSTED_PROXIES', 1 if app.config['SERVERLESS'] else 0))
+
+    # Admin search index, created on the first admin request; defaults to
+    # search.db in DATA_DIR
+    app.config['SEARCH_INDEX_PATH'] = os.environ.get('SEARCH_INDEX_PATH')
+
+    # Retention: `flask archive` moves checked-out/cancelled bookings and read
+    # feedback older than this many days into ARCHIVE_DIR (default DATA_DIR/archive)
+    app.config['ARCHIVE_DIR'] = os.environ.get('ARCHIVE_DIR')
+    app.config['RETENTION_DAYS'] = {
+        BOOKINGS: int(os.environ.get('BOOKING_RETENTION_DAYS', 365)),
+        FEEDBACK: int(os.environ.get('FEEDBACK_RETENTION_DAYS', 180)),
+    }
+
+    # Live admin updates: booking/feedback changes are appended to a SQLite
+    # change log (EVENT_LOG_PATH, default DATA_DIR/events.db) that the pages
+    # poll through /admin/events. Polls return at once; no worker class
+    # needs to hold connections open. Created on the first admin request.
+    app.config['EVENT_LOG_PATH'] = os.environ.get('EVENT_LOG_PATH')
+
+    # Server-side sessions: the cookie only carries a random id. 'memory' is
+    # per worker; 'sqlite' (SESSION_STORE_PATH, default DATA_DIR/sessions.db)
+    # shares sessions, logouts and revocations across workers. Sessions end
+    # after SESSION_IDLE_TIMEOUT seconds without a request.
+    app.config['SESSION_BACKEND'] = os.environ.get('SESSION_BACKEND', 'memory')
+    app.config['SESSION_STORE_PATH'] = os.environ.get('SESSION_STORE_PATH')
+    app.config['SESSION_IDLE_TIMEOUT'] = int(os.environ.get('SESSION_IDLE_TIMEOUT', 2 * 3600))
+
+    # Public bookings: check-out at most BOOKING_HORIZON_DAYS ahead and stays
+    # of at most MAX_NIGHTS. Rates, seasons and room capacities default to
+    # pricing.DEFAULT_RATES/DEFAULT_SEASONS and validation.DEFAULT_CAPACITY;
+    # set ROOM_RATES, ROOM_SEASONS or ROOM_CAPACITY through `config` to override.
+    app.config['BOOKING_HORIZON_DAYS'] = int(os.environ.get('BOOKING_HORIZON_DAYS', 730))
+    app.config['MAX_NIGHTS'] = int(os.environ.get('MAX_NIGHTS', 30))
+
+    # Admin image uploads, stored by content hash under static/images/uploads
+    app.config['MAX_UPLOAD_BYTES'] = 8 * 1024 * 1024
+    app.config['MAX_CONTENT_LENGTH'] = app.config['MAX_UPLOAD_BYTES'] + 64 * 1024
+
+    # /admin/metrics: scrapers authenticate with "Authorization: Bearer <METRICS_TOKEN>";
+    # METRICS_PROFILE_RATE is the fraction of requests run under cProfile
+    app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN')
+    app.config['METRICS_PROFILE_RATE'] = float(os.environ.get('METRICS_PROFILE_RATE', 0))
+
+    # /api/v1: admin sessions, or integrations with "Authorization: Bearer <API_TOKEN>"
+    app.config['API_TOKEN'] = os.environ.get('API_TOKEN')
+
+    # Booking/feedback notifications, queued in NOTIFY_QUEUE_PATH and sent by
+    # background workers. Set NOTIFY_SMTP_HOST (guest emails, plus staff
+    # alerts to NOTIFY_STAFF_EMAILS) and/or NOTIFY_WEBHOOK_URL to enable.
+    app.config['NOTIFY_SMTP_HOST'] = os.environ.get('NOTIFY_SMTP_HOST')
+    app.config['NOTIFY_SMTP_PORT'] = int(os.environ.get('NOTIFY_SMTP_PORT', 25))
+    app.config['NOTIFY_SMTP_USER'] = os.environ.get('NOTIFY_SMTP_USER')
+    app.config['NOTIFY_SMTP_PASSWORD'] = os.environ.get('NOTIFY_SMTP_PASSWORD')
+    app.config['NOTIFY_SMTP_STARTTLS'] = os.environ.get('NOTIFY_SMTP_STARTTLS') == '1'
+    app.config['NOTIFY_FROM'] = os.environ.get('NOTIFY_FROM', 'Extreme Li <no-reply@localhost>')
+    app.config['NOTIFY_STAFF_EMAILS'] = [email.strip() for email in os.environ.get('NOTIFY_STAFF_EMAILS', '').split(',')
+                                         if email.strip()]
+    app.config['NOTIFY_WEBHOOK_URL'] = os.environ.get('NOTIFY_WEBHOOK_URL')
+    app.config['NOTIFY_WEBHOOK_SECRET'] = os.environ.get('NOTIFY_WEBHOOK_SECRET')
+    app.config['NOTIFY_WORKERS'] = int(os.environ.get('NOTIFY_WORKERS', 2))
+
+    # Output of `flask precompile`: template modules and compressed assets
+    app.config['PRECOMPILED_DIR'] = os.environ.get('PRECOMPILED_DIR', os.path.join(app.root_path, 'precompiled'))
+
+    if config:
+        app.config.update(config)
+    app.config.setdefault('PRECOMPRESSED_DIR', os.path.join(app.config['PRECOMPILED_DIR'], 'assets'))
+    app.config.setdefault('NOTIFY_QUEUE_PATH', os.path.join(app.config['DATA_DIR'], 'notifications.db'))
+
+    if app.config['TRUSTED_PROXIES']:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['TRUSTED_PROXIES'],
+                                x_proto=app.config['TRUSTED_PROXIES'])
+
+    storage = init_storage(app)
+
+    # Request latency by endpoint and phase, datastore I/O counters
+    storage = init_metrics(app, storage)
+
+    init_availability(app, storage)
+    init_page_cache(app)
+
+    # Booking form validation, and nightly rates compiled once a day so a
+    # quote for any stay is two lookups
+    init_validation(app)
+    init_pricing(app)
+
+    # Sessions looked up by id in the session store; deleting a user or
+    # changing their role updates their sessions
+    init_sessions(app)
+
+    # Confirmation emails, staff alerts and webhooks, off the request path
+    init_notifications(app)
+
+    # Honeypot, rate limits and duplicate detection for the public forms
+    init_form_guard(app)
+
+    # Fingerprinted /assets/ URLs for everything under static/ (asset_url() in templates)
+    assets = init_assets(app)
+
+    # Resized AVIF/WebP copies of static/images (responsive_image() in templates)
+    init_images(app, assets)
+
+    # Fill in missing datasets from SEED_DIR, then from the defaults
+    seed_data(app)
+    initialize_data(app)
+
+    # The admin blueprint imports its views, the user store and uploads on
+    # first use; public pages never load them
+    app.register_blueprint(public_bp)
+    app.register_blueprint(admin_bp)
+
+    # JSON API over the same datasets (/api/v1/<features|nearby|bookings|feedback>)
+    app.register_blueprint(api_bp)
+
+    register_commands(app)
+
+    # Precompiled templates when up to date, plus cold-start timing
+    init_startup(app, _import_started, app_started)
+    return app
+
+def register_commands(app):
+    @app.cli.command('migrate-storage')
+    def migrate_storage():
+        # Copy data/*.json into the SQLite database at SQLITE_PATH
+        counts = migrate_json_to_sqlite(app.config['DATA_DIR'], app.config['SQLITE_PATH'])
+        for name, count in counts.items():
+            print(f'{name}: {count} records')
+
+    @app.cli.command('build-images')
+    def build_images():
+        # Generate resized AVIF/WebP derivatives for static/images
+        images = app.extensions['images']
+        written = images.build()
+        print(f'{written} image derivatives written to {images.derived_path}')
+
+    @app.cli.command('precompile')
+    def precompile_command():
+        # Build step for deployments: template modules and compressed assets
+        templates, compressed = precompile(app, app.config['PRECOMPILED_DIR'])
+        print(f'{templates} templates and {compressed} compressed assets written to {app.config["PRECOMPILED_DIR"]}')
+
+    @app.cli.command('send-notifications')
+    def send_notifications():
+        # Deliver due notification jobs once (for hosts without long-lived workers)
+        notifier = app.extensions.get('notifications')
+        if notifier is None:
+            print('No notification transport configured')
+            return
+        sent, failed = notifier.run_pending()
+        print(f'{sent} sent, {failed} failed; queue: {notifier.queue.counts()}')
+
+    @app.cli.command('archive')
+    @click.option('--dataset', type=click.Choice([BOOKINGS, FEEDBACK]), help='Only archive this dataset')
+    @click.option('--dry-run', is_flag=True, help='Only count the records that would be archived')
+    def archive_command(dataset, dry_run):
+        # Retention job: run from cron (or by hand) to keep the live datasets small
+        init_admin_services(app)
+        counts = app.extensions['archive'].run([dataset] if dataset else None, dry_run=dry_run)
+        for name, count in counts.items():
+            print(f'{name}: {count} record(s) {"to archive" if dry_run else "archived"}')
+
+    @app.cli.command('revoke-sessions')
+    @click.option('--username', help="Only end this user's sessions")
+    def revoke_sessions(username):
+        # Log staff out everywhere, e.g. after editing users.json by hand
+        user_id = None
+        if username:
+            init_admin_services(app)
+            user = app.extensions['users'].get(username)
+            if user is None:
+                raise click.ClickException(f'No such user: {username}')
+            user_id = user['id']
+        count = app.extensions['sessions'].revoke(user_id)
+        print(f'{count} session(s) revoked')
+
+    @app.cli.command('hash-passwords')
+    def hash_passwords():
+        # Hash any user passwords still stored in plaintext
+        init_admin_services(app)
+        changed = app.extensions['users'].hash_all()
+        print(f'{changed} password(s) hashed')
+
+app = create_app()
 
 if __name__ == '__main__':
-    initialize_data()
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,218 @@
+import os
+import gzip
+import json
+import tempfile
+from datetime import datetime, timedelta
+
+from datastore import file_lock
+from storage import BOOKINGS, FEEDBACK
+from availability import parse_date
+
+# Days a closed record stays in the live dataset before it is archived.
+# Analytics only sees live bookings, so keep bookings at least as long as
+# the reports you run look back.
+DEFAULT_RETENTION_DAYS = {BOOKINGS: 365, FEEDBACK: 180}
+
+# Field whose month names the segment a record is filed under
+PARTITION_FIELDS = {BOOKINGS: 'check_in', FEEDBACK: 'date'}
+UNDATED = 'undated'
+
+SEGMENT_SUFFIX = '.jsonl.gz'
+# Level 9 is several times slower for a few percent smaller segments
+COMPRESS_LEVEL = 6
+
+
+def _day(value):
+    # Date part of 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS'
+    return parse_date(str(value or '')[:10])
+
+
+def closed_on(name, record):
+    # The day a record stopped changing, or None while it still needs
+    # attention: bookings are closed once checked out (confirmed, from the
+    # check-out date) or cancelled, feedback once read
+    if name == BOOKINGS:
+        status = record.get('status')
+        if status == 'confirmed':
+            return _day(record.get('check_out'))
+        if status == 'cancelled':
+            return _day(record.get('updated_at')) or _day(record.get('created_at'))
+        return None
+    if name == FEEDBACK and record.get('read') is True:
+        return _day(record.get('date'))
+    return None
+
+
+def partition(name, record):
+    day = _day(record.get(PARTITION_FIELDS[name]))
+    return day.strftime('%Y-%m') if day else UNDATED
+
+
+class Archive:
+    # Closed bookings and read feedback moved out of the live datasets into
+    # gzipped JSON-lines segments, one per dataset and month:
+    #   <path>/<dataset>/<YYYY-MM>.jsonl.gz
+    # next to a manifest.json with each segment's size. Segments are only
+    # read when someone queries them. A segment is rewritten whole (temp
+    # file, then rename), so an interrupted run leaves the old copy, and a
+    # record already in it is replaced rather than duplicated.
+
+    def __init__(self, path, storage, retention=None):
+        self.path = path
+        self.storage = storage
+        self.retention = dict(DEFAULT_RETENTION_DAYS, **(retention or {}))
+
+    def _dir(self, name):
+        if name not in PARTITION_FIELDS:
+            raise ValueError('Dataset is not archived: {}'.format(name))
+        return os.path.join(self.path, name)
+
+    def _segment_path(self, name, month):
+        return os.path.join(self._dir(name), month + SEGMENT_SUFFIX)
+
+    def _manifest_path(self, name):
+        return os.path.join(self._dir(name), 'manifest.json')
+
+    def manifest(self, name):
+        # {month: {'records': n, 'bytes': compressed size}}
+        try:
+            with open(self._manifest_path(name)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _write_manifest(self, name, manifest):
+        content = json.dumps(manifest, indent=2, sort_keys=True).encode()
+        self._replace(self._manifest_path(name), lambda f: f.write(content))
+
+    def _replace(self, filename, write):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(filename), prefix=os.path.basename(filename) + '.',
+                                        suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+                f.flush()
+                os.fsync(f.fileno())
+                nbytes = f.tell()
+            os.replace(tmp_path, filename)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return nbytes
+
+    def _read_segment(self, name, month):
+        # {id: record} in id order
+        try:
+            with gzip.open(self._segment_path(name, month), 'rt', encoding='utf-8') as f:
+                records = (json.loads(line) for line in f if line.strip())
+                return {record['id']: record for record in records}
+        except FileNotFoundError:
+            return {}
+
+    def _write_segment(self, name, month, records):
+        def write(f):
+            with gzip.GzipFile(fileobj=f, mode='wb', compresslevel=COMPRESS_LEVEL, mtime=0) as out:
+                out.write(''.join(json.dumps(records[record_id]) + '\n' for record_id in sorted(records)).encode('utf-8'))
+        return self._replace(self._segment_path(name, month), write)
+
+    def _store(self, name, batches, drop=()):
+        # Merges {month: {id: record}} into the segments; ids in ``drop``
+        # are taken out again
+        with file_lock(self._manifest_path(name)):
+            manifest = self.manifest(name)
+            for month, records in batches.items():
+                segment = self._read_segment(name, month)
+                segment.update(records)
+                for record_id in drop:
+                    segment.pop(record_id, None)
+                if segment:
+                    manifest[month] = {'records': len(segment), 'bytes': self._write_segment(name, month, segment)}
+                else:
+                    if os.path.exists(self._segment_path(name, month)):
+                        os.remove(self._segment_path(name, month))
+                    manifest.pop(month, None)
+            self._write_manifest(name, manifest)
+
+    def candidates(self, name, today=None):
+        # {month: {id: record}} for the records past their retention period
+        today = today or datetime.now().date()
+        cutoff = today - timedelta(days=self.retention[name])
+        batches = {}
+        last_id = None
+        for record in self.storage.iter_query(name):
+            last_id = record['id']
+            closed = closed_on(name, record)
+            if closed is not None and closed < cutoff:
+                batches.setdefault(partition(name, record), {})[record['id']] = record
+        # The newest record always stays: new ids are counted up from the
+        # highest one left in the dataset, and must not reuse archived ones
+        for month, records in list(batches.items()):
+            records.pop(last_id, None)
+            if not records:
+                del batches[month]
+        return batches
+
+    def archive(self, name, today=None, dry_run=False):
+        # Moves one dataset's expired records into the archive; returns how
+        # many were (or, with dry_run, would be) moved. Segments are written
+        # before anything is deleted, and the delete is a single
+        # delete_many(), so the live file is rewritten once per run.
+        os.makedirs(self._dir(name), exist_ok=True)
+        version = self.storage.version(name)
+        batches = self.candidates(name, today)
+        if dry_run or not batches:
+            return sum(len(records) for records in batches.values())
+
+        self._store(name, batches)
+        archived = {record_id: record for records in batches.values() for record_id, record in records.items()}
+        if self.storage.version(name) != version:
+            # Written to since the scan: a record edited meanwhile keeps its
+            # live copy, and the outdated one comes back out of the archive
+            changed = [record_id for record_id, record in archived.items()
+                       if self.storage.get(name, record_id) != record]
+            if changed:
+                self._store(name, {month: {} for month, records in batches.items()
+                                   if any(record_id in records for record_id in changed)}, drop=changed)
+                for record_id in changed:
+                    del archived[record_id]
+        self.storage.delete_many(name, list(archived))
+        return len(archived)
+
+    def run(self, names=None, today=None, dry_run=False):
+        return {name: self.archive(name, today, dry_run) for name in (names or PARTITION_FIELDS)}
+
+    def segments(self, name):
+        # [(month, manifest entry)], newest first; undated records last
+        manifest = self.manifest(name)
+        return sorted(manifest.items(), key=lambda item: (item[0] != UNDATED, item[0]), reverse=True)
+
+    def query(self, name, months=None, filters=None, search=None, search_fields=(), offset=0, limit=50):
+        # (page, total) over the segments for ``months`` (all by default),
+        # newest month first and highest id first within a month. Segments
+        # are decompressed one at a time, so memory is bounded by the
+        # largest month rather than the whole archive.
+        needle = search.lower() if search else None
+        page = []
+        total = 0
+        for month, _ in self.segments(name):
+            if months and month not in months:
+                continue
+            segment = self._read_segment(name, month)
+            for record_id in sorted(segment, reverse=True):
+                record = segment[record_id]
+                if filters and not all(record.get(key) == value for key, value in filters.items()):
+                    continue
+                if needle and not any(needle in str(record.get(field) or '').lower() for field in search_fields):
+                    continue
+                if offset <= total < offset + limit:
+                    page.append(record)
+                total += 1
+        return page, total
+
+
+def init_archive(app, storage):
+    archive = Archive(app.config.get('ARCHIVE_DIR') or os.path.join(app.config['DATA_DIR'], 'archive'), storage,
+                      app.config.get('RETENTION_DAYS'))
+    app.extensions['archive'] = archive
+    return archive
@@ -0,0 +1,159 @@
+import os
+import gzip
+import hashlib
+import mimetypes
+
+from flask import current_app, request, send_from_directory, url_for, abort
+
+try:
+    import brotli
+except ImportError:  # needed by `flask precompile`; at runtime the .br files are read from precompiled/
+    brotli = None
+
+# Text assets worth serving precompressed
+COMPRESSIBLE_TYPES = ('text/css', 'text/javascript', 'application/javascript',
+                      'image/svg+xml', 'application/json', 'text/plain')
+
+# File extension for each precompressed encoding
+ENCODING_EXTENSIONS = {'gzip': 'gz', 'br': 'br'}
+
+# One year; fingerprinted URLs change whenever the content does
+IMMUTABLE_MAX_AGE = 31536000
+
+
+class AssetManifest:
+    # Content hashes for everything under static/, computed once at
+    # startup. 'css/styles.css' is published as 'css/styles.<hash>.css'
+    # so the URL changes exactly when the file does. Compressed copies are
+    # read from precompressed_dir (see save_compressed) when it has them
+    # for the same content, instead of being made at startup.
+
+    def __init__(self, static_folder, hash_length=12, precompressed_dir=None):
+        self.static_folder = static_folder
+        self.hash_length = hash_length
+        self.precompressed_dir = precompressed_dir
+        self.fingerprinted = {}
+        self.sources = {}
+        self.compressed = {}
+        self.build()
+
+    def build(self):
+        self.fingerprinted.clear()
+        self.sources.clear()
+        self.compressed.clear()
+        for root, dirs, files in os.walk(self.static_folder):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            for filename in files:
+                if filename.startswith('.'):
+                    continue
+                full_path = os.path.join(root, filename)
+                path = os.path.relpath(full_path, self.static_folder).replace(os.sep, '/')
+                self.add(path, full_path)
+
+    def add(self, path, full_path):
+        with open(full_path, 'rb') as f:
+            content = f.read()
+        digest = hashlib.sha256(content).hexdigest()[:self.hash_length]
+        stem, ext = os.path.splitext(path)
+        name = '{}.{}{}'.format(stem, digest, ext)
+        self.fingerprinted[path] = name
+        self.sources[name] = (path, digest)
+
+        mimetype = mimetypes.guess_type(path)[0]
+        if mimetype in COMPRESSIBLE_TYPES and len(content) > 1024:
+            variants = self._load_compressed(digest)
+            if 'gzip' not in variants:
+                variants['gzip'] = gzip.compress(content, compresslevel=9, mtime=0)
+            if 'br' not in variants and brotli is not None:
+                variants['br'] = brotli.compress(content, quality=11)
+            self.compressed[path] = variants
+
+    def _load_compressed(self, digest):
+        variants = {}
+        if self.precompressed_dir:
+            for encoding, ext in ENCODING_EXTENSIONS.items():
+                try:
+                    with open(os.path.join(self.precompressed_dir, '{}.{}'.format(digest, ext)), 'rb') as f:
+                        variants[encoding] = f.read()
+                except FileNotFoundError:
+                    pass
+        return variants
+
+    def save_compressed(self, target_dir):
+        # Write every compressed variant as <digest>.<gz|br>; returns how
+        # many files were written. Stale files are removed.
+        os.makedirs(target_dir, exist_ok=True)
+        wanted = {}
+        for path, variants in self.compressed.items():
+            digest = self.digest(path)
+            for encoding, content in variants.items():
+                wanted['{}.{}'.format(digest, ENCODING_EXTENSIONS[encoding])] = content
+        for filename in os.listdir(target_dir):
+            if filename not in wanted:
+                os.remove(os.path.join(target_dir, filename))
+        for filename, content in wanted.items():
+            with open(os.path.join(target_dir, filename), 'wb') as f:
+                f.write(content)
+        return len(wanted)
+
+    def url_name(self, path):
+        return self.fingerprinted.get(path)
+
+    def digest(self, path):
+        name = self.fingerprinted.get(path)
+        return self.sources[name][1] if name else None
+
+    def url(self, path):
+        name = self.fingerprinted.get(path)
+        if name is None:
+            return url_for('static', filename=path)
+        return url_for('static_asset', filename=name)
+
+
+def _pick_encoding(variants):
+    for encoding in ('br', 'gzip'):
+        if encoding in variants and request.accept_encodings[encoding]:
+            return encoding
+    return None
+
+
+def serve_asset(filename):
+    manifest = current_app.extensions['assets']
+    source = manifest.sources.get(filename)
+    if source is None:
+        abort(404)
+    path, digest = source
+
+    variants = manifest.compressed.get(path, {})
+    encoding = _pick_encoding(variants)
+    if encoding is not None:
+        response = current_app.response_class(variants[encoding], mimetype=mimetypes.guess_type(path)[0])
+        response.headers['Content-Encoding'] = encoding
+        response.set_etag('{}-{}'.format(digest, encoding))
+        response = response.make_conditional(request)
+    else:
+        response = send_from_directory(manifest.static_folder, path, etag=digest, max_age=IMMUTABLE_MAX_AGE)
+
+    if variants:
+        response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.max_age = IMMUTABLE_MAX_AGE
+    # Lets a CDN in front of the app (Vercel's edge) keep it too, so each
+    # asset costs one function invocation per region, not one per visitor
+    response.cache_control.s_maxage = IMMUTABLE_MAX_AGE
+    response.cache_control.immutable = True
+    return response
+
+
+def asset_url(path):
+    # Fingerprinted URL for a file under static/, falling back to the plain
+    # static URL for files the manifest doesn't know about.
+    return current_app.extensions['assets'].url(path)
+
+
+def init_assets(app):
+    manifest = AssetManifest(app.static_folder, precompressed_dir=app.config.get('PRECOMPRESSED_DIR'))
+    app.extensions['assets'] = manifest
+    app.add_url_rule('/assets/<path:filename>', 'static_asset', serve_asset)
+    app.jinja_env.globals['asset_url'] = asset_url
+    return manifest
@@ -0,0 +1,189 @@
+import threading
+from datetime import date
+
+from signals import record_changed
+from storage import BOOKINGS
+
+# Rooms of each type the hotel can sell per night (room_type values from
+# booking.html). Override with app.config['ROOM_INVENTORY'].
+DEFAULT_INVENTORY = {
+    'deluxe_a': 10,
+    'deluxe_b': 10,
+    'suite': 4,
+    'family': 6,
+}
+
+# Bookings in these states hold a room
+HOLDING_STATUSES = ('pending', 'confirmed')
+
+
+class FullyBooked(Exception):
+    pass
+
+
+def parse_date(value):
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class IncrementalIndex:
+    # In-memory aggregates over the bookings, built once from storage and
+    # then kept current write by write from record_changed. ``_version`` is
+    # the storage version the aggregates match. A write is only applied
+    # when it started from that version; otherwise another worker wrote in
+    # between, and the next read catches up. When those writes were all
+    # inserts (storage.appended_since), only the bookings past the last id
+    # applied are read; after an update or delete elsewhere it rebuilds from
+    # storage. Subclasses provide _reset() and _apply(booking, delta) and
+    # read under self._lock after _ensure_current().
+
+    def __init__(self, storage):
+        self.storage = storage
+        self._lock = threading.Lock()
+        self._built = False
+        self._version = None
+        self._last_id = 0
+        # The (before, after) pair of the batch write being applied
+        self._batch = None
+        record_changed.connect(self._on_change, sender=BOOKINGS, weak=False)
+
+    def _reset(self):
+        raise NotImplementedError
+
+    def _apply(self, booking, delta):
+        raise NotImplementedError
+
+    def _rebuild(self):
+        self._version = self.storage.version(BOOKINGS)
+        self._batch = None
+        self._reset()
+        self._last_id = 0
+        for booking in self.storage.all(BOOKINGS):
+            self._apply(booking, 1)
+            self._last_id = max(self._last_id, booking.get('id') or 0)
+        self._built = True
+
+    def _catch_up(self, version):
+        # Inserts made meanwhile are applied now or on the next read; a
+        # rewrite makes appended_since() fail then, and that read rebuilds
+        added, _ = self.storage.query(BOOKINGS, ranges={'id': (self._last_id + 1, None)})
+        for booking in added:
+            self._apply(booking, 1)
+            self._last_id = max(self._last_id, booking['id'])
+        self._version = version
+        self._batch = None
+
+    def _ensure_current(self):
+        if self._built:
+            version = self.storage.version(BOOKINGS)
+            if version == self._version:
+                return
+            if self.storage.appended_since(BOOKINGS, self._version):
+                return self._catch_up(version)
+        self._rebuild()
+
+    def _on_change(self, sender, storage=None, old=None, new=None, version=None):
+        with self._lock:
+            if not self._built:
+                return
+            before, after = version or (None, None)
+            if before == self._version or (after == self._version and version == self._batch):
+                # Next write after ours, or another record of the same batch
+                self._apply(old, -1)
+                self._apply(new, 1)
+                if new is not None:
+                    self._last_id = max(self._last_id, new.get('id') or 0)
+                self._version = after
+                self._batch = version
+            # Otherwise a write from elsewhere was missed, and the next read
+            # catches up on it and this one (or already read this one)
+
+
+class AvailabilityIndex(IncrementalIndex):
+    # Per-date occupancy: room_type -> {date ordinal: rooms held}. A range
+    # query only touches the nights being asked about, so it costs
+    # O(nights) regardless of how many bookings exist.
+
+    def __init__(self, storage, inventory=None):
+        self.inventory = dict(inventory or DEFAULT_INVENTORY)
+        self._occupancy = None
+        super().__init__(storage)
+
+    def _reset(self):
+        self._occupancy = {}
+
+    def _nights(self, booking):
+        if booking is None or booking.get('status') not in HOLDING_STATUSES:
+            return None
+        if booking.get('room_type') not in self.inventory:
+            return None
+        start = parse_date(booking.get('check_in'))
+        end = parse_date(booking.get('check_out'))
+        if start is None or end is None or end <= start:
+            return None
+        return booking['room_type'], start.toordinal(), end.toordinal()
+
+    def _apply(self, booking, delta):
+        nights = self._nights(booking)
+        if nights is None:
+            return
+        room_type, start, end = nights
+        days = self._occupancy.setdefault(room_type, {})
+        for day in range(start, end):
+            count = days.get(day, 0) + delta
+            if count:
+                days[day] = count
+            else:
+                days.pop(day, None)
+
+    def rooms_available(self, room_type, check_in, check_out, ignore=None):
+        # Rooms of room_type free on every night in [check_in, check_out),
+        # not counting the room held by booking ``ignore`` (one being moved)
+        if room_type not in self.inventory:
+            raise ValueError('Unknown room type: {}'.format(room_type))
+        if check_out <= check_in:
+            raise ValueError('Check-out must be after check-in')
+        ignored = self._nights(ignore)
+        with self._lock:
+            self._ensure_current()
+            days = self._occupancy.get(room_type, {})
+            held = 0
+            for day in range(check_in.toordinal(), check_out.toordinal()):
+                count = days.get(day, 0)
+                if ignored and ignored[0] == room_type and ignored[1] <= day < ignored[2]:
+                    count -= 1
+                held = max(held, count)
+        return max(self.inventory[room_type] - held, 0)
+
+    def book(self, booking, record_id=None):
+        # Inserts booking, or applies it as changes to booking record_id
+        # (None if that booking is gone). When the write makes the booking
+        # hold nights it didn't hold before, a room must be free on each of
+        # them; the check and the write happen under the bookings lock so
+        # two requests can't both take the last room. Raises FullyBooked.
+        with self.storage.lock(BOOKINGS):
+            current = None
+            if record_id is not None:
+                current = self.storage.get(BOOKINGS, record_id)
+                if current is None:
+                    return None
+            nights = self._nights(dict(current or {}, **booking))
+            if nights is not None and nights != self._nights(current):
+                room_type, start, end = nights
+                if self.rooms_available(room_type, date.fromordinal(start), date.fromordinal(end), current) < 1:
+                    raise FullyBooked(room_type)
+            if record_id is None:
+                return self.storage.insert(BOOKINGS, booking)
+            return self.storage.update(BOOKINGS, record_id, booking)
+
+    def summary(self, check_in, check_out):
+        return {room_type: self.rooms_available(room_type, check_in, check_out)
+                for room_type in self.inventory}
+
+
+def init_availability(app, storage):
+    index = AvailabilityIndex(storage, app.config.get('ROOM_INVENTORY'))
+    app.extensions['availability'] = index
+    return index
@@ -0,0 +1,435 @@
+# Benchmark harness for the public and admin hot paths.
+#
+#   python bench/run.py --rows 1000 10000 100000
+#   python bench/run.py --backend sqlite --mode server --workers 4 --concurrency 8
+#   python bench/run.py --compare bench/results/baseline.json
+#
+# Each dataset size runs in a fresh process against synthetic
+# bookings/feedback in a temporary DATA_DIR, so runs don't share caches or
+# leave anything behind in data/. The JSON report records latency
+# percentiles and throughput per scenario; --compare prints the change
+# against an earlier report and exits with status 1 on a regression. A run
+# also exits with status 1 when a scenario got unexpected responses, or
+# booking_post did not store one booking per accepted request.
+import os
+import sys
+import json
+import math
+import time
+import socket
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import threading
+import subprocess
+import http.client
+import importlib.util
+import multiprocessing
+import urllib.parse
+import ipaddress
+from datetime import date, datetime, timedelta, timezone
+from concurrent.futures import ProcessPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path[:0] = [ROOT, BENCH_DIR]
+
+from synthetic import ROOM_TYPES, SYNTHETIC_END, write_dataset
+
+SCENARIOS = ('index', 'booking_post', 'admin_bookings', 'admin_feedback', 'status_update')
+ADMIN_SCENARIOS = ('admin_bookings', 'admin_feedback', 'status_update')
+ADMIN_LOGIN = {'username': 'admin', 'password': 'admin123'}
+
+# Public form posts come from a different client address each (sent as
+# X-Forwarded-For, with the app trusting one proxy), as they would on the
+# live site; from one address they would all be rate limited after the
+# first few
+FORM_SCENARIOS = ('booking_post',)
+
+# Variations of the admin bookings list, cycled through
+BOOKING_LIST_QUERIES = (
+    '/admin/bookings',
+    '/admin/bookings?status=confirmed',
+    '/admin/bookings?q=santos',
+    '/admin/bookings?sort=check_in&order=asc&page=3',
+    '/admin/bookings?from=2025-06-01&to=2025-09-30&per_page=100',
+)
+
+# Compared between reports; a rise (or drop, for throughput) beyond the
+# threshold is a regression
+COMPARED = (('p50_ms', 1), ('p95_ms', 1), ('p99_ms', 1), ('throughput', -1))
+
+
+def build_request(scenario, rng, rows, n):
+    # (method, path, form, expected status)
+    if scenario == 'index':
+        return 'GET', '/', None, 200
+    if scenario == 'booking_post':
+        # Within the booking horizon and after the synthetic bookings, so
+        # the room types are not already full
+        check_in = max(date.today(), SYNTHETIC_END) + timedelta(days=rng.randrange(1, 600))
+        return 'POST', '/booking', {
+            'name': 'Bench Guest {}'.format(n),
+            'email': 'bench{}@example.com'.format(n),
+            'phone': '09170000000',
+            'room_type': rng.choice(ROOM_TYPES),
+            'check_in': check_in.isoformat(),
+            'check_out': (check_in + timedelta(days=rng.randint(1, 5))).isoformat(),
+            'guests': '2',
+        }, 302
+    if scenario == 'admin_bookings':
+        return 'GET', BOOKING_LIST_QUERIES[n % len(BOOKING_LIST_QUERIES)], None, 200
+    if scenario == 'admin_feedback':
+        return 'GET', '/admin/feedback', None, 200
+    if scenario == 'status_update':
+        booking_id = rng.randint(1, rows)
+        return 'POST', '/admin/bookings/update_status/{}'.format(booking_id), {
+            'status': rng.choice(('pending', 'confirmed', 'cancelled'))
+        }, 302
+    raise ValueError('Unknown scenario: {}'.format(scenario))
+
+
+def client_address(scenario, n):
+    if scenario in FORM_SCENARIOS:
+        return str(ipaddress.IPv4Address(0x0A000000 + n))
+    return None
+
+
+class ClientSession:
+    # Flask test client: no network, measures the app itself
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def request(self, method, path, form=None, remote_addr=None):
+        headers = {'X-Forwarded-For': remote_addr} if remote_addr else {}
+        response = self.client.open(path, method=method, data=form, headers=headers)
+        response.get_data()
+        response.close()
+        return response.status_code
+
+
+class HttpSession:
+    # Plain HTTP/1.1 with a session cookie, against the local server
+    def __init__(self, host, port):
+        self.connection = http.client.HTTPConnection(host, port, timeout=120)
+        self.cookie = None
+
+    def request(self, method, path, form=None, remote_addr=None):
+        body = urllib.parse.urlencode(form) if form else None
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'} if form else {}
+        if remote_addr:
+            headers['X-Forwarded-For'] = remote_addr
+        if self.cookie:
+            headers['Cookie'] = self.cookie
+        for attempt in (1, 2):
+            try:
+                self.connection.request(method, path, body, headers)
+                response = self.connection.getresponse()
+                response.read()
+                break
+            except (http.client.HTTPException, ConnectionError):
+                self.connection.close()
+                if attempt == 2:
+                    raise
+        cookie = response.getheader('Set-Cookie')
+        if cookie:
+            self.cookie = cookie.split(';', 1)[0]
+        if response.will_close:
+            self.connection.close()
+        return response.status
+
+
+def percentile(ordered, pct):
+    # Nearest-rank percentile of an already sorted list
+    if not ordered:
+        return None
+    return ordered[max(math.ceil(pct / 100.0 * len(ordered)), 1) - 1]
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 3) if seconds is not None else None
+
+
+def run_scenario(new_session, scenario, rows, requests, duration, concurrency, warmup, seed):
+    sessions = []
+    for _ in range(concurrency):
+        session = new_session()
+        if scenario in ADMIN_SCENARIOS:
+            session.request('POST', '/admin/login', ADMIN_LOGIN)
+        sessions.append(session)
+
+    warm_rng = random.Random(seed)
+    warm_errors = []
+    for n in range(requests, requests + warmup):
+        method, path, form, expected = build_request(scenario, warm_rng, rows, n)
+        status = sessions[0].request(method, path, form, client_address(scenario, n))
+        if status != expected:
+            warm_errors.append(status)
+
+    lock = threading.Lock()
+    tickets = iter(range(requests))
+    latencies = []
+    errors = []
+    deadline = time.perf_counter() + duration
+
+    def worker(index, session):
+        rng = random.Random(seed * 1000 + index)
+        local = []
+        while time.perf_counter() < deadline:
+            with lock:
+                n = next(tickets, None)
+            if n is None:
+                break
+            method, path, form, expected = build_request(scenario, rng, rows, n)
+            started = time.perf_counter()
+            try:
+                status = session.request(method, path, form, client_address(scenario, n))
+            except Exception as e:
+                status = repr(e)
+            local.append(time.perf_counter() - started)
+            if status != expected:
+                with lock:
+                    errors.append(status)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=worker, args=(i, session)) for i, session in enumerate(sessions)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        'requests': len(ordered),
+        'errors': len(errors),
+        'error_samples': sorted(set(map(str, errors)))[:5],
+        'warmup_errors': len(warm_errors),
+        'elapsed_s': round(elapsed, 3),
+        'throughput': round(len(ordered) / elapsed, 2) if elapsed else None,
+        'mean_ms': _ms(sum(ordered) / len(ordered)) if ordered else None,
+        'p50_ms': _ms(percentile(ordered, 50)),
+        'p90_ms': _ms(percentile(ordered, 90)),
+        'p95_ms': _ms(percentile(ordered, 95)),
+        'p99_ms': _ms(percentile(ordered, 99)),
+        'max_ms': _ms(ordered[-1]) if ordered else None,
+    }
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(env, workers):
+    # gunicorn with N sync workers when installed, otherwise the threaded
+    # werkzeug server in one process
+    port = _free_port()
+    if importlib.util.find_spec('gunicorn') is not None:
+        command = [sys.executable, '-m', 'gunicorn', '-w', str(workers), '-b', '127.0.0.1:{}'.format(port),
+                   '--log-level', 'warning', 'app:app']
+        server = 'gunicorn/{}'.format(workers)
+    else:
+        command = [sys.executable, '-c',
+                   'import sys; from werkzeug.serving import run_simple; from app import app; '
+                   'run_simple("127.0.0.1", int(sys.argv[1]), app, threaded=True)', str(port)]
+        server = 'werkzeug-threaded'
+    process = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError('Server exited: ' + process.stderr.read().decode(errors='replace'))
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return process, port, server
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError('Server did not start within 60s')
+
+
+def run_suite(spec):
+    # One dataset size, in its own process (see main)
+    workdir = tempfile.mkdtemp(prefix='extremeli-bench-')
+    try:
+        data_dir = os.path.join(workdir, 'data')
+        started = time.perf_counter()
+        write_dataset(data_dir, spec['rows'], seed=spec['seed'])
+        generated = time.perf_counter() - started
+
+        env = dict(os.environ, DATA_DIR=data_dir, STORAGE_BACKEND=spec['backend'],
+                   SQLITE_PATH=os.path.join(workdir, 'bench.db'), TRUSTED_PROXIES='1')
+        env.pop('PAGE_CACHE_DIR', None)
+        env.pop('VERCEL', None)
+        if spec['backend'] == 'sqlite':
+            from storage import migrate_json_to_sqlite
+            migrate_json_to_sqlite(data_dir, env['SQLITE_PATH'])
+
+        server = None
+        started = time.perf_counter()
+        if spec['mode'] == 'server':
+            process, port, server = start_server(env, spec['workers'])
+            new_session = lambda: HttpSession('127.0.0.1', port)
+        else:
+            os.environ.update(env)
+            from app import app
+            new_session = lambda: ClientSession(app)
+        setup = time.perf_counter() - started
+
+        from storage import BOOKINGS, create_storage
+        storage = create_storage(env)
+        results = {}
+        failures = []
+        try:
+            for scenario in spec['scenarios']:
+                before = storage.query(BOOKINGS, limit=1)[1]
+                stats = run_scenario(new_session, scenario, spec['rows'], spec['requests'],
+                                     spec['duration'], spec['concurrency'], spec['warmup'], spec['seed'])
+                results[scenario] = stats
+                if stats['errors'] or stats['warmup_errors']:
+                    failures.append('{}: {} unexpected response(s), e.g. {}'.format(
+                        scenario, stats['errors'] + stats['warmup_errors'], ', '.join(stats['error_samples'])))
+                if scenario == 'booking_post':
+                    stats['inserted'] = storage.query(BOOKINGS, limit=1)[1] - before
+                    accepted = stats['requests'] + spec['warmup'] - stats['errors'] - stats['warmup_errors']
+                    if stats['inserted'] != accepted:
+                        failures.append('booking_post: {} bookings stored for {} accepted requests'.format(
+                            stats['inserted'], accepted))
+        finally:
+            if server is not None:
+                process.terminate()
+                process.wait(timeout=30)
+        return {'rows': spec['rows'], 'server': server, 'generate_s': round(generated, 3),
+                'setup_s': round(setup, 3), 'scenarios': results, 'failures': failures}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _git(*args):
+    try:
+        return subprocess.run(['git'] + list(args), cwd=ROOT, capture_output=True, text=True,
+                              timeout=30).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def compare(baseline, current, threshold):
+    # Print the change for every (rows, scenario) in both reports; returns
+    # the regressions beyond threshold percent.
+    regressions = []
+    previous = {(run['rows'], name): stats for run in baseline['runs'] for name, stats in run['scenarios'].items()}
+    print('\nCompared with {} ({})'.format(baseline['meta'].get('commit'), baseline['meta'].get('timestamp')))
+    for key in ('backend', 'mode', 'workers', 'concurrency'):
+        if baseline['meta'].get(key) != current['meta'].get(key):
+            print('warning: {} differs ({} vs {}); the numbers are not like for like'.format(
+                key, baseline['meta'].get(key), current['meta'].get(key)))
+    print('{:>8} {:<16} {:>22} {:>22} {:>22} {:>24}'.format('rows', 'scenario', 'p50 ms', 'p95 ms', 'p99 ms', 'req/s'))
+    for run in current['runs']:
+        for name, stats in run['scenarios'].items():
+            old = previous.get((run['rows'], name))
+            if old is None:
+                continue
+            cells = []
+            for field, direction in COMPARED:
+                before, after = old.get(field), stats.get(field)
+                if not before or after is None:
+                    cells.append('{:>22}'.format('n/a'))
+                    continue
+                change = (after - before) / before * 100
+                flag = ' !' if change * direction > threshold else ''
+                if flag:
+                    regressions.append((run['rows'], name, field, before, after, change))
+                cells.append('{:>22}'.format('{} -> {} ({:+.1f}%){}'.format(before, after, change, flag)))
+            print('{:>8} {:<16} {}'.format(run['rows'], name, ' '.join(cells)))
+    return regressions
+
+
+def print_summary(report):
+    print('{:>8} {:<16} {:>8} {:>7} {:>10} {:>10} {:>10} {:>10} {:>10}'.format(
+        'rows', 'scenario', 'reqs', 'errors', 'req/s', 'p50 ms', 'p95 ms', 'p99 ms', 'max ms'))
+    for run in report['runs']:
+        for name, stats in run['scenarios'].items():
+            print('{:>8} {:<16} {:>8} {:>7} {:>10} {:>10} {:>10} {:>10} {:>10}'.format(
+                run['rows'], name, stats['requests'], stats['errors'], stats['throughput'],
+                stats['p50_ms'], stats['p95_ms'], stats['p99_ms'], stats['max_ms']))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark public pages, bookings and admin views.')
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000],
+                        help='bookings/feedback rows per run (default: 1000 10000)')
+    parser.add_argument('--backend', choices=('json', 'sqlite'), default='json')
+    parser.add_argument('--mode', choices=('client', 'server'), default='client',
+                        help='Flask test client, or HTTP against a local server')
+    parser.add_argument('--workers', type=int, default=4, help='server worker processes (gunicorn)')
+    parser.add_argument('--concurrency', type=int, default=1, help='concurrent client threads')
+    parser.add_argument('--requests', type=int, default=200, help='requests per scenario')
+    parser.add_argument('--duration', type=float, default=30, help='max seconds per scenario')
+    parser.add_argument('--warmup', type=int, default=5, help='untimed requests per scenario')
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='report path (default: bench/results/<time>-<backend>-<mode>.json)')
+    parser.add_argument('--compare', metavar='REPORT', help='earlier report to compare against')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='percent change that counts as a regression (default: 10)')
+    args = parser.parse_args(argv)
+
+    now = datetime.now(timezone.utc)
+    report = {
+        'meta': {
+            'timestamp': now.isoformat(timespec='seconds'),
+            'commit': _git('rev-parse', '--short', 'HEAD'),
+            'dirty': bool(_git('status', '--porcelain', '--untracked-files=no')),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'backend': args.backend,
+            'mode': args.mode,
+            'workers': args.workers if args.mode == 'server' else None,
+            'concurrency': args.concurrency,
+            'requests': args.requests,
+            'warmup': args.warmup,
+            'seed': args.seed,
+        },
+        'runs': [],
+    }
+
+    context = multiprocessing.get_context('spawn')
+    for rows in args.rows:
+        spec = dict(rows=rows, backend=args.backend, mode=args.mode, workers=args.workers,
+                    concurrency=args.concurrency, requests=args.requests, duration=args.duration,
+                    warmup=args.warmup, scenarios=args.scenarios, seed=args.seed)
+        print('Running {} rows ({}, {})...'.format(rows, args.backend, args.mode), file=sys.stderr, flush=True)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            report['runs'].append(pool.submit(run_suite, spec).result())
+
+    output = args.output or os.path.join(BENCH_DIR, 'results', '{}-{}-{}.json'.format(
+        now.strftime('%Y%m%dT%H%M%S'), args.backend, args.mode))
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print_summary(report)
+    print('\nReport written to {}'.format(output))
+
+    failures = ['{} rows, {}'.format(run['rows'], failure) for run in report['runs'] for failure in run['failures']]
+    if failures:
+        print('\nFailed checks:\n  ' + '\n  '.join(failures))
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold)
+        if regressions:
+            print('\n{} regression(s) beyond {}%'.format(len(regressions), args.threshold))
+            return 1
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+import json
+import os
+import random
+from datetime import date, datetime, timedelta
+
+ROOM_TYPES = ('deluxe_a', 'deluxe_b', 'suite', 'family')
+
+# Roughly what a live site accumulates: most requests end up confirmed
+STATUS_WEIGHTS = (('pending', 3), ('confirmed', 6), ('cancelled', 1))
+
+FIRST_NAMES = ('Ana', 'Ben', 'Carla', 'Dan', 'Elena', 'Felix', 'Grace', 'Hugo', 'Iris', 'Jose',
+               'Kim', 'Luis', 'Maya', 'Noel', 'Olga', 'Paolo', 'Rosa', 'Sam', 'Tina', 'Victor')
+LAST_NAMES = ('Reyes', 'Santos', 'Cruz', 'Garcia', 'Lim', 'Tan', 'Bautista', 'Ocampo', 'Mendoza', 'Flores')
+
+MESSAGES = (
+    'Lovely stay, the staff were very helpful.',
+    'Room was clean and the pool area was great.',
+    'Breakfast could have more options.',
+    'Great location near the mall and the airport.',
+    'Check-in took a while but everything else was perfect.',
+)
+
+
+def _timestamp(rng, start):
+    moment = start + timedelta(seconds=rng.randrange(365 * 24 * 3600))
+    return moment.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _person(rng, n):
+    first = rng.choice(FIRST_NAMES)
+    last = rng.choice(LAST_NAMES)
+    return '{} {}'.format(first, last), '{}.{}{}@example.com'.format(first.lower(), last.lower(), n)
+
+
+# Synthetic stays check in during the two years from this date
+SYNTHETIC_START = date(2025, 1, 1)
+SYNTHETIC_END = SYNTHETIC_START + timedelta(days=730 + 7)
+
+
+def make_bookings(rows, seed=1, start=SYNTHETIC_START):
+    # Bookings shaped like the ones submit_booking() writes
+    rng = random.Random(seed)
+    statuses = [status for status, weight in STATUS_WEIGHTS for _ in range(weight)]
+    created_from = datetime.combine(start, datetime.min.time()) - timedelta(days=60)
+    bookings = []
+    for n in range(1, rows + 1):
+        name, email = _person(rng, n)
+        check_in = start + timedelta(days=rng.randrange(730))
+        created = _timestamp(rng, created_from)
+        bookings.append({
+            'id': n,
+            'name': name,
+            'email': email,
+            'phone': '09{:09d}'.format(rng.randrange(10 ** 9)),
+            'room_type': rng.choice(ROOM_TYPES),
+            'check_in': check_in.isoformat(),
+            'check_out': (check_in + timedelta(days=rng.randint(1, 7))).isoformat(),
+            'guests': str(rng.randint(1, 5)),
+            'special_requests': rng.choice(('', '', '', 'Late check-in', 'Extra pillows')),
+            'status': rng.choice(statuses),
+            'created_at': created,
+            'updated_at': created,
+        })
+    return bookings
+
+
+def make_feedback(rows, seed=2, start=datetime(2025, 1, 1)):
+    rng = random.Random(seed)
+    feedback = []
+    for n in range(1, rows + 1):
+        name, email = _person(rng, n)
+        feedback.append({
+            'id': n,
+            'name': name,
+            'email': email,
+            'message': rng.choice(MESSAGES),
+            'date': _timestamp(rng, start),
+            'read': rng.random() < 0.7,
+        })
+    return feedback
+
+
+def write_dataset(data_dir, rows, seed=1):
+    # bookings.json and feedback.json with ``rows`` records each; the other
+    # datasets are left for the app to create from its defaults.
+    os.makedirs(data_dir, exist_ok=True)
+    for name, records in (('bookings', make_bookings(rows, seed)), ('feedback', make_feedback(rows, seed + 1))):
+        with open(os.path.join(data_dir, name + '.json'), 'w') as f:
+            json.dump(records, f, indent=2)
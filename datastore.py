@@ -0,0 +1,410 @@
+import os
+import glob
+import json
+import tempfile
+import uuid
+import threading
+from contextlib import contextmanager
+
+from signals import datastore_io
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+# Parsed JSON datasets kept in memory, keyed by file path. Each entry is
+# revalidated against the file's mtime/size so edits made by another worker
+# (or by hand) are picked up without re-parsing the file on every request.
+_cache = {}
+_cache_lock = threading.Lock()
+
+# Datasets that take new records through an append-only JSONL journal
+# (bookings, feedback). The snapshot file stays the canonical JSON array;
+# journal entries are folded into it by compaction.
+_journaled = set()
+_journal_cache = {}
+_compacting = set()
+_thread_locks = {}
+# Lock files this thread holds: filename -> fd
+_held = threading.local()
+
+# Compact once the journal grows past this many bytes.
+COMPACT_THRESHOLD = 256 * 1024
+
+
+def _file_signature(filename):
+    try:
+        st = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def journal_path(filename):
+    return os.path.splitext(filename)[0] + '.jsonl'
+
+
+def _lock_path(filename):
+    return filename + '.lock'
+
+
+def enable_journal(filename):
+    _journaled.add(filename)
+
+
+@contextmanager
+def file_lock(filename):
+    # Serializes writers across threads and, through flock, across worker
+    # processes. The lock file also holds the last id handed out. A thread
+    # already holding the lock re-enters it, so a caller can hold it around
+    # several operations (check, then write) that each take it too.
+    held = getattr(_held, 'fds', None)
+    if held is None:
+        held = _held.fds = {}
+    if filename in held:
+        yield held[filename]
+        return
+    with _cache_lock:
+        thread_lock = _thread_locks.setdefault(filename, threading.Lock())
+    with thread_lock:
+        fd = os.open(_lock_path(filename), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            held[filename] = fd
+            yield fd
+        finally:
+            held.pop(filename, None)
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+
+def _read_snapshot(filename):
+    signature = _file_signature(filename)
+    if signature is None:
+        return None, []
+
+    with _cache_lock:
+        entry = _cache.get(filename)
+        if entry is not None and entry[0] == signature:
+            return signature, entry[1]
+
+    with open(filename, 'r') as f:
+        data = json.load(f)
+    datastore_io.send(filename, op='read', nbytes=signature[2])
+
+    with _cache_lock:
+        _cache[filename] = (signature, data)
+    return signature, data
+
+
+def _read_journal(filename):
+    # Journal entries are read incrementally: while the file only grows we
+    # parse just the bytes appended since the last call. The first line is
+    # a header with a token that changes whenever the journal is restarted
+    # after compaction, so a stale offset is never applied to new content.
+    # A partial trailing line (writer mid-append) is left for the next read.
+    try:
+        f = open(journal_path(filename), 'rb')
+    except FileNotFoundError:
+        return []
+
+    with f:
+        header = f.readline()
+        if not header.endswith(b'\n'):
+            return []
+        size = os.fstat(f.fileno()).st_size
+
+        with _cache_lock:
+            entry = _journal_cache.get(filename)
+        if entry is not None and entry[0] == header and entry[1] <= size:
+            token, offset, records = entry
+            if offset == size:
+                return records
+            records = list(records)
+        else:
+            token, offset, records = header, len(header), []
+
+        f.seek(offset)
+        chunk = f.read(size - offset)
+    datastore_io.send(filename, op='read', nbytes=len(chunk))
+
+    end = chunk.rfind(b'\n') + 1
+    for line in chunk[:end].splitlines():
+        if line.strip():
+            records.append(json.loads(line))
+    offset += end
+
+    with _cache_lock:
+        _journal_cache[filename] = (token, offset, records)
+    return records
+
+
+def _merge(snapshot, journal):
+    if not journal:
+        return snapshot
+    # A record can be seen in both places when compaction runs between the
+    # two reads (or after a crash before the journal was truncated); the
+    # snapshot copy wins.
+    seen = {item.get('id') for item in snapshot if isinstance(item, dict)}
+    return snapshot + [item for item in journal if item.get('id') not in seen]
+
+
+def read_data(filename):
+    # Shared, read-only view of the dataset. Callers must not mutate it;
+    # use load_data() when the records are going to be modified.
+    datastore_io.send(filename, op='load', nbytes=0)
+    if filename not in _journaled:
+        return _read_snapshot(filename)[1]
+
+    # Journal first, snapshot second: a concurrent compaction can then only
+    # produce duplicates (which _merge drops), never lose records.
+    journal = _read_journal(filename)
+    snap_sig, snapshot = _read_snapshot(filename)
+    if not journal:
+        return snapshot
+
+    key = filename + '#merged'
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] == snap_sig and entry[1] is journal:
+            return entry[2]
+    merged = _merge(snapshot, journal)
+    with _cache_lock:
+        _cache[key] = (snap_sig, journal, merged)
+    return merged
+
+
+# Read size for iter_data() when streaming a snapshot from disk
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_array(f, chunk_size=STREAM_CHUNK_SIZE):
+    # Items of a top-level JSON array of objects, parsed a chunk at a time
+    decoder = json.JSONDecoder()
+    buf, pos, started, eof = '', 0, False, False
+    while True:
+        while pos < len(buf) and (buf[pos].isspace() or (started and buf[pos] == ',')):
+            pos += 1
+        if pos < len(buf):
+            if not started:
+                if buf[pos] != '[':
+                    raise ValueError('{} is not a JSON array'.format(f.name))
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == ']':
+                return
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                yield item
+                pos = end
+                continue
+        elif eof:
+            if started:
+                raise ValueError('{} ends inside the array'.format(f.name))
+            return
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buf, pos = buf[pos:] + chunk, 0
+
+
+def iter_data(filename):
+    # Records one at a time in file order, for exports of datasets too big
+    # to hold in memory. A snapshot already in the cache is iterated as is;
+    # otherwise it is parsed incrementally from disk and not cached. Reads
+    # the journal first, like read_data(), and skips journal records the
+    # snapshot already has.
+    datastore_io.send(filename, op='load', nbytes=0)
+    journal = _read_journal(filename) if filename in _journaled else []
+    pending = {item.get('id'): item for item in journal}
+
+    signature = _file_signature(filename)
+    with _cache_lock:
+        entry = _cache.get(filename)
+    if entry is not None and entry[0] == signature:
+        records = iter(entry[1])
+        f = None
+    else:
+        try:
+            f = open(filename, 'r')
+        except FileNotFoundError:
+            f, records = None, iter(())
+        else:
+            datastore_io.send(filename, op='read', nbytes=os.fstat(f.fileno()).st_size)
+            records = _iter_array(f)
+    try:
+        for item in records:
+            if pending and isinstance(item, dict):
+                pending.pop(item.get('id'), None)
+            yield item
+    finally:
+        if f is not None:
+            f.close()
+    yield from pending.values()
+
+
+def data_version(filename):
+    # Cheap change token for caches built on top of a dataset.
+    return (_file_signature(filename), _file_signature(journal_path(filename)))
+
+
+def load_data(filename):
+    # Records are flat dicts, so a per-record copy is enough to keep the
+    # cached snapshot safe from callers that edit and save the list.
+    data = read_data(filename)
+    if isinstance(data, list):
+        return [dict(item) if isinstance(item, dict) else item for item in data]
+    return json.loads(json.dumps(data))
+
+
+def _write_atomic(filename, data):
+    directory = os.path.dirname(filename) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(filename) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+            nbytes = f.tell()
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    datastore_io.send(filename, op='save', nbytes=nbytes)
+
+
+def _write_locked(filename, data):
+    _write_atomic(filename, data)
+    if filename in _journaled:
+        if os.path.exists(journal_path(filename)):
+            # Everything in the journal is now part of the snapshot.
+            os.truncate(journal_path(filename), 0)
+        # A snapshot written whole (seeding, replace_all) can bring ids the
+        # sequence hasn't reached; they must not be handed out again
+        fd = _held.fds[filename]
+        last_id = max((item.get('id', 0) for item in data if isinstance(item, dict)), default=0)
+        if last_id > (_read_seq(fd) or 0):
+            _write_seq(fd, last_id)
+    invalidate(filename)
+
+
+def save_data(filename, data):
+    with file_lock(filename):
+        _write_locked(filename, data)
+
+
+@contextmanager
+def transaction(filename):
+    # Read-modify-write under the dataset lock so concurrent appends to the
+    # journal are not lost when the snapshot is rewritten. Mutate the
+    # yielded list in place; it is written back when the block exits.
+    with file_lock(filename):
+        data = load_data(filename)
+        yield data
+        _write_locked(filename, data)
+
+
+def _read_seq(fd):
+    os.lseek(fd, 0, os.SEEK_SET)
+    raw = os.read(fd, 64).strip()
+    return int(raw) if raw else None
+
+
+def _write_seq(fd, value):
+    os.lseek(fd, 0, os.SEEK_SET)
+    os.ftruncate(fd, 0)
+    os.write(fd, str(value).encode())
+
+
+def _journal_header():
+    return (json.dumps({'journal': uuid.uuid4().hex}) + '\n').encode()
+
+
+def append_record(filename, record):
+    # O(1) insert: take the next id from the lock file and append a single
+    # line to the journal. The snapshot is not touched.
+    with file_lock(filename) as fd:
+        last_id = _read_seq(fd)
+        if last_id is None:
+            last_id = max((item.get('id', 0) for item in read_data(filename)), default=0)
+        record = {'id': last_id + 1, **record}
+
+        line = (json.dumps(record) + '\n').encode()
+        jfd = os.open(journal_path(filename), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(jfd).st_size == 0:
+                line = _journal_header() + line
+            os.write(jfd, line)
+            os.fsync(jfd)
+            size = os.fstat(jfd).st_size
+        finally:
+            os.close(jfd)
+        _write_seq(fd, record['id'])
+    datastore_io.send(filename, op='save', nbytes=len(line))
+
+    if size > COMPACT_THRESHOLD:
+        compact_async(filename)
+    return record
+
+
+def compact(filename, resync=False):
+    with file_lock(filename) as fd:
+        data = read_data(filename)
+        if os.path.exists(journal_path(filename)) and os.path.getsize(journal_path(filename)):
+            _write_locked(filename, list(data))
+        last_id = max((item.get('id', 0) for item in data), default=0)
+        if not resync:
+            last_id = max(last_id, _read_seq(fd) or 0)
+        _write_seq(fd, last_id)
+
+
+def compact_async(filename):
+    with _cache_lock:
+        if filename in _compacting:
+            return
+        _compacting.add(filename)
+
+    def run():
+        try:
+            compact(filename)
+        finally:
+            with _cache_lock:
+                _compacting.discard(filename)
+
+    threading.Thread(target=run, name='compact-' + os.path.basename(filename), daemon=True).start()
+
+
+def recover(filename):
+    # Startup crash recovery: drop temp files from an interrupted snapshot
+    # write, cut off a torn last journal line, then fold the journal into
+    # the snapshot and resync the id sequence.
+    path = journal_path(filename)
+    with file_lock(filename):
+        for tmp_path in glob.glob(glob.escape(filename) + '.*.tmp'):
+            os.remove(tmp_path)
+        if os.path.exists(path):
+            with open(path, 'rb+') as f:
+                content = f.read()
+                end = content.rfind(b'\n') + 1
+                if end != len(content):
+                    f.truncate(end)
+    compact(filename, resync=True)
+
+
+def invalidate(filename=None):
+    with _cache_lock:
+        if filename is None:
+            _cache.clear()
+            _journal_cache.clear()
+        else:
+            _cache.pop(filename, None)
+            _cache.pop(filename + '#merged', None)
+            _journal_cache.pop(filename, None)
@@ -0,0 +1,195 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+
+from signals import record_changed
+from storage import BOOKINGS, FEEDBACK
+
+# Datasets whose changes are streamed to the admin pages
+STREAMED = (BOOKINGS, FEEDBACK)
+
+# Events stay in the log this long, for pages resuming with Last-Event-ID
+RETENTION_SECONDS = 24 * 3600
+
+# /admin/events answers with whatever is new and ends at once; the browser
+# reconnects after this long (the SSE retry field), sending Last-Event-ID.
+# No request stays open, so this works with plain sync workers and on
+# serverless hosts (Vercel) that cut off long responses.
+POLL_SECONDS = 5
+
+# Most events sent in one response; a page further behind gets the rest on
+# its next poll
+MAX_EVENTS = 500
+
+
+def _action(old, new):
+    if old is None:
+        return 'created'
+    if new is None:
+        return 'deleted'
+    return 'updated'
+
+
+def _payload(old, new):
+    # What an event carries: the record id, plus the fields that changed
+    # for an update. Pages fetch anything else they show, so the log holds
+    # no guest details beyond what was edited.
+    if old is None or new is None:
+        return {'id': (new or old)['id']}
+    changed = {field: new.get(field) for field in set(old) | set(new) if old.get(field) != new.get(field)}
+    return dict(changed, id=new['id'])
+
+
+class EventLog:
+    # Record changes appended to a SQLite table shared by every worker:
+    # the change log the admin pages poll. Ids only ever increase
+    # (AUTOINCREMENT), so a client's last event id stays meaningful after
+    # old events are pruned.
+    #
+    # Only workers that have served an admin request have a log, and each
+    # logs its own writes. Records created elsewhere (the public booking
+    # and contact forms) are found when the dataset's version has moved:
+    # ``marks`` keeps, per dataset, the highest record id already logged
+    # as created and the version last checked, and anything newer gets a
+    # 'created' event. Updates and deletes are logged by the worker making
+    # them; the admin pages and the API load the log before any write, so
+    # only changes made outside the app are not streamed.
+
+    PRUNE_EVERY = 500
+
+    def __init__(self, path, storage):
+        self.path = path
+        self.storage = storage
+        self._local = threading.local()
+        self._writes = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS events (id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                     'dataset TEXT NOT NULL, action TEXT NOT NULL, data TEXT NOT NULL, created REAL NOT NULL)')
+        conn.execute('CREATE TABLE IF NOT EXISTS marks (dataset TEXT PRIMARY KEY, last_id INTEGER NOT NULL, '
+                     'version TEXT)')
+        for name in STREAMED:
+            # A new log starts from the records there are now
+            records, _ = self.storage.query(name, sort='id', descending=True, limit=1)
+            conn.execute('INSERT OR IGNORE INTO marks (dataset, last_id, version) VALUES (?, ?, ?)',
+                         (name, records[0]['id'] if records else 0, self._version(name)))
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _transaction(self, fn):
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            result = fn(conn)
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return result
+
+    def _version(self, name):
+        return json.dumps(self.storage.version(name))
+
+    def _append(self, conn, dataset, action, payload):
+        now = time.time()
+        conn.execute('INSERT INTO events (dataset, action, data, created) VALUES (?, ?, ?, ?)',
+                     (dataset, action, json.dumps(payload), now))
+        self._writes += 1
+        if self._writes % self.PRUNE_EVERY == 0:
+            conn.execute('DELETE FROM events WHERE created < ?', (now - RETENTION_SECONDS,))
+
+    def _log_created(self, conn, name):
+        # 'created' for every record above the dataset's mark, in id order
+        last_id = conn.execute('SELECT last_id FROM marks WHERE dataset = ?', (name,)).fetchone()[0]
+        records, _ = self.storage.query(name, ranges={'id': (last_id + 1, None)}, sort='id')
+        for record in records:
+            self._append(conn, name, 'created', _payload(None, record))
+        if records:
+            conn.execute('UPDATE marks SET last_id = ? WHERE dataset = ?', (records[-1]['id'], name))
+
+    def publish(self, dataset, old, new):
+        def do_publish(conn):
+            if old is None:
+                # Along with any records other workers created before it
+                # (nothing, if catch_up() already logged this one)
+                self._log_created(conn, dataset)
+            else:
+                self._append(conn, dataset, _action(old, new), _payload(old, new))
+        self._transaction(do_publish)
+
+    def catch_up(self):
+        # Logs 'created' for records other workers added since the last check
+        for name in STREAMED:
+            version = self._version(name)
+            row = self._conn().execute('SELECT version FROM marks WHERE dataset = ?', (name,)).fetchone()
+            if row is None or row[0] == version:
+                continue
+
+            def do_catch_up(conn):
+                self._log_created(conn, name)
+                conn.execute('UPDATE marks SET version = ? WHERE dataset = ?', (version, name))
+            self._transaction(do_catch_up)
+
+    def last_id(self):
+        row = self._conn().execute('SELECT MAX(id) FROM events').fetchone()
+        return row[0] or 0
+
+    def head(self):
+        # Id of the newest event, once other workers' new records are
+        # logged; pages pass it to their poll so nothing written between
+        # rendering and polling is missed
+        self.catch_up()
+        return self.last_id()
+
+    def poll(self, last_id=None, datasets=STREAMED, limit=MAX_EVENTS):
+        # (events in datasets after last_id, oldest first, id to resume
+        # after). With no last_id, nothing yet: just where to start.
+        head = self.head()
+        if last_id is None:
+            return [], head
+        # An id from before the log was reset would skip everything new
+        last_id = min(last_id, head)
+        rows = self._conn().execute(
+            'SELECT id, dataset, action, data FROM events WHERE id > ? AND id <= ? AND dataset IN ({}) '
+            'ORDER BY id LIMIT ?'.format(', '.join('?' * len(datasets))),
+            [last_id, head] + list(datasets) + [limit]).fetchall()
+        events = [{'id': row[0], 'dataset': row[1], 'action': row[2], 'record': json.loads(row[3])} for row in rows]
+        return events, events[-1]['id'] if len(events) == limit else head
+
+
+def format_event(event):
+    # One server-sent event; the event type is the dataset name
+    data = json.dumps({'action': event['action'], 'record': event['record']}, separators=(',', ':'))
+    return 'id: {}\nevent: {}\ndata: {}\n\n'.format(event['id'], event['dataset'], data)
+
+
+def format_poll(events, resume_id):
+    # One poll's response: the reconnect delay, the events, then an id-only
+    # block (not dispatched as an event) so the browser resumes after
+    # resume_id even when none of the events were for it
+    return 'retry: {}\n\n{}id: {}\n\n'.format(POLL_SECONDS * 1000, ''.join(format_event(event) for event in events),
+                                              resume_id)
+
+
+def init_events(app, storage):
+    # Admin only: created with the other admin services on first use
+    log = EventLog(app.config.get('EVENT_LOG_PATH') or os.path.join(app.config['DATA_DIR'], 'events.db'), storage)
+
+    def on_change(sender, storage=None, old=None, new=None, version=None):
+        log.publish(sender, old, new)
+
+    for name in STREAMED:
+        record_changed.connect(on_change, sender=name, weak=False)
+    app.extensions['events'] = log
+    return log
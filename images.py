@@ -0,0 +1,147 @@
+import os
+import tempfile
+import threading
+
+from flask import current_app
+from markupsafe import Markup, escape
+
+
+# Widths generated for every source image (never upscaled)
+DEFAULT_WIDTHS = (320, 640, 960, 1280)
+
+# Preferred first; each becomes a <source> in the <picture>
+FORMAT_TYPES = (('avif', 'image/avif'), ('webp', 'image/webp'))
+FORMAT_QUALITY = {'avif': 55, 'webp': 78}
+
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+
+def _pillow():
+    # Pillow is only needed to build derivatives, so it isn't imported at
+    # startup; pages fall back to the original images without it.
+    try:
+        from PIL import Image, features
+    except ImportError:
+        return None, None
+    return Image, features
+
+
+def available_formats():
+    Image, features = _pillow()
+    if Image is None:
+        return ()
+    return tuple(fmt for fmt, _ in FORMAT_TYPES if features.check(fmt))
+
+
+class ImageDerivatives:
+    # Resized copies of static/images in modern formats, stored in
+    # static/<derived_dir> as <source hash>-<width>.<format>. Keying on the
+    # source hash means a derivative is generated once per image content
+    # and is never stale: editing the source simply yields new names.
+
+    def __init__(self, manifest, derived_dir='derived', widths=DEFAULT_WIDTHS):
+        self.manifest = manifest
+        self.derived_prefix = derived_dir.strip('/') + '/'
+        self.derived_path = os.path.join(manifest.static_folder, derived_dir)
+        self.widths = tuple(sorted(widths))
+        self._lock = threading.Lock()
+        self._variants = {}
+        self.scan()
+
+    def scan(self):
+        # digest -> {format: [(width, static path), ...]}
+        variants = {}
+        if os.path.isdir(self.derived_path):
+            for filename in os.listdir(self.derived_path):
+                stem, ext = os.path.splitext(filename)
+                digest, _, width = stem.rpartition('-')
+                if not digest or not width.isdigit() or ext[1:] not in FORMAT_QUALITY:
+                    continue
+                path = self.derived_prefix + filename
+                if path not in self.manifest.fingerprinted:
+                    self.manifest.add(path, os.path.join(self.derived_path, filename))
+                variants.setdefault(digest, {}).setdefault(ext[1:], []).append((int(width), path))
+        for formats in variants.values():
+            for entries in formats.values():
+                entries.sort()
+        with self._lock:
+            self._variants = variants
+
+    def sources(self):
+        for path in list(self.manifest.fingerprinted):
+            if path.startswith('images/') and path.lower().endswith(SOURCE_EXTENSIONS):
+                yield path
+
+    def build(self, paths=None):
+        # Generate any missing derivatives; returns how many were written.
+        Image, _ = _pillow()
+        if Image is None:
+            raise RuntimeError('Pillow is required to build image derivatives')
+        os.makedirs(self.derived_path, exist_ok=True)
+        formats = available_formats()
+        written = 0
+        for path in paths or list(self.sources()):
+            digest = self.manifest.digest(path)
+            if digest is None:
+                continue
+            with Image.open(os.path.join(self.manifest.static_folder, path)) as source:
+                source.load()
+                if source.mode not in ('RGB', 'RGBA'):
+                    source = source.convert('RGBA' if 'transparency' in source.info else 'RGB')
+                for width in self.widths:
+                    if width >= source.width:
+                        break
+                    height = max(round(source.height * width / source.width), 1)
+                    resized = None
+                    for fmt in formats:
+                        target = os.path.join(self.derived_path, '{}-{}.{}'.format(digest, width, fmt))
+                        if os.path.exists(target):
+                            continue
+                        if resized is None:
+                            resized = source.resize((width, height), Image.LANCZOS)
+                        fd, tmp_path = tempfile.mkstemp(dir=self.derived_path, suffix='.tmp')
+                        with os.fdopen(fd, 'wb') as f:
+                            resized.save(f, format=fmt.upper(), quality=FORMAT_QUALITY[fmt])
+                        os.replace(tmp_path, target)
+                        written += 1
+        self.scan()
+        return written
+
+    def srcset(self, path, fmt):
+        digest = self.manifest.digest(path)
+        with self._lock:
+            entries = self._variants.get(digest, {}).get(fmt)
+        if not entries:
+            return None
+        return ', '.join('{} {}w'.format(self.manifest.url(derived), width) for width, derived in entries)
+
+    def picture(self, path, alt='', sizes='100vw', **attrs):
+        # <picture> with AVIF/WebP srcsets in front of the original image.
+        # Without derivatives this is just the plain <img>.
+        img_attrs = ''.join(' {}="{}"'.format(escape(name.replace('_', '-')), escape(value))
+                            for name, value in attrs.items() if value is not None)
+        img = '<img src="{}" alt="{}"{}>'.format(escape(self.manifest.url(path)), escape(alt), img_attrs)
+
+        sources = []
+        for fmt, mimetype in FORMAT_TYPES:
+            srcset = self.srcset(path, fmt)
+            if srcset:
+                sources.append('<source type="{}" srcset="{}" sizes="{}">'.format(mimetype, escape(srcset), escape(sizes)))
+        if not sources:
+            return Markup(img)
+        return Markup('<picture>{}{}</picture>'.format(''.join(sources), img))
+
+
+def responsive_image(path, alt='', sizes='100vw', **attrs):
+    return current_app.extensions['images'].picture(path, alt, sizes, **attrs)
+
+
+def init_images(app, manifest):
+    derivatives = ImageDerivatives(
+        manifest,
+        derived_dir=app.config.get('IMAGE_DERIVED_DIR', 'derived'),
+        widths=app.config.get('IMAGE_WIDTHS', DEFAULT_WIDTHS)
+    )
+    app.extensions['images'] = derivatives
+    app.jinja_env.globals['responsive_image'] = responsive_image
+    return derivatives
@@ -0,0 +1,107 @@
+import os
+import hashlib
+import tempfile
+
+try:
+    from PIL import Image
+except ImportError:  # optional: uploads are checked by signature only
+    Image = None
+
+CHUNK_SIZE = 64 * 1024
+MAX_UPLOAD_BYTES = 8 * 1024 * 1024
+
+
+class UploadError(ValueError):
+    pass
+
+
+def sniff_image_type(head):
+    # File type from the leading bytes; the client's filename and
+    # Content-Type are not trusted.
+    if head.startswith(b'\xff\xd8\xff'):
+        return 'jpg'
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'png'
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return 'gif'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+
+class MediaStore:
+    # Content-addressed storage for admin uploads under
+    # static/images/<subdir>/<sha256[:2]>/<sha256>.<ext>. Uploads are
+    # streamed to a temp file in fixed-size chunks while being hashed, so
+    # memory use doesn't depend on file size, and identical files end up
+    # sharing one copy on disk (and one URL at the CDN).
+
+    def __init__(self, images_folder, subdir='uploads', max_bytes=MAX_UPLOAD_BYTES, manifest=None):
+        self.images_folder = images_folder
+        self.subdir = subdir
+        self.root = os.path.join(images_folder, subdir)
+        self.max_bytes = max_bytes
+        self.manifest = manifest
+
+    def save(self, file_storage):
+        # Returns the image name relative to static/images, ready to be
+        # stored in a feature's or nearby place's "image" field.
+        os.makedirs(self.root, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        kind = None
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                while True:
+                    chunk = file_storage.stream.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if kind is None:
+                        kind = sniff_image_type(chunk[:16])
+                        if kind is None:
+                            raise UploadError('Only JPEG, PNG, GIF or WebP images can be uploaded.')
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise UploadError(f'Images must be smaller than {self.max_bytes // (1024 * 1024)} MB.')
+                    digest.update(chunk)
+                    out.write(chunk)
+            if size == 0:
+                raise UploadError('The uploaded file is empty.')
+            self._verify(tmp_path)
+
+            name = digest.hexdigest()
+            relative = '/'.join((self.subdir, name[:2], f'{name}.{kind}'))
+            target = os.path.join(self.images_folder, *relative.split('/'))
+            if os.path.exists(target):
+                os.remove(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        if self.manifest is not None:
+            self.manifest.add('images/' + relative, target)
+        return relative
+
+    def _verify(self, path):
+        if Image is None:
+            return
+        try:
+            with Image.open(path) as image:
+                image.verify()
+        except Exception:
+            raise UploadError('The uploaded file is not a valid image.')
+
+
+def init_media(app, manifest=None):
+    store = MediaStore(
+        os.path.join(app.static_folder, 'images'),
+        max_bytes=app.config.get('MAX_UPLOAD_BYTES', MAX_UPLOAD_BYTES),
+        manifest=manifest
+    )
+    app.extensions['media'] = store
+    return store
@@ -0,0 +1,274 @@
+import io
+import os
+import time
+import random
+import pstats
+import cProfile
+import threading
+from bisect import bisect_left
+
+from flask import request, has_request_context, before_render_template, template_rendered
+from werkzeug.wsgi import ClosingIterator
+
+from signals import datastore_io
+
+# Latency buckets in seconds (upper bounds, Prometheus "le")
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# name -> (type, help) for everything Metrics.render() can print
+METRICS = {
+    'extremeli_request_duration_seconds': ('histogram', 'Time from receiving a request to the last byte written'),
+    'extremeli_request_phase_seconds': ('histogram', 'Request time by phase: data load, template render, response write'),
+    'extremeli_requests_total': ('counter', 'Requests by endpoint and status code'),
+    'extremeli_datastore_loads_total': ('counter', 'read_data/load_data calls by dataset'),
+    'extremeli_datastore_read_bytes_total': ('counter', 'Bytes parsed from dataset files (cache misses)'),
+    'extremeli_datastore_saves_total': ('counter', 'Snapshot writes and journal appends by dataset'),
+    'extremeli_datastore_written_bytes_total': ('counter', 'Bytes written to dataset files'),
+}
+
+DATASTORE_COUNTERS = {
+    'load': ('extremeli_datastore_loads_total', None),
+    'read': (None, 'extremeli_datastore_read_bytes_total'),
+    'save': ('extremeli_datastore_saves_total', 'extremeli_datastore_written_bytes_total'),
+}
+
+ENVIRON_KEY = 'extremeli.timings'
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class RequestTimings:
+    # Per-request accumulators, kept in the WSGI environ
+    __slots__ = ('endpoint', 'status', 'data', 'render', 'render_started')
+
+    def __init__(self):
+        self.endpoint = None
+        self.status = None
+        self.data = 0.0
+        self.render = 0.0
+        self.render_started = None
+
+
+def _labels(labels):
+    return ','.join('{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+                    for name, value in labels)
+
+
+class Metrics:
+    # In-process counters and histograms in Prometheus text format. Each
+    # worker process keeps its own; scrape every worker (or sum them).
+    # With profile_rate > 0 that fraction of requests also runs under
+    # cProfile and the results are merged into one report.
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, profile_rate=0.0):
+        self.buckets = tuple(buckets)
+        self.profile_rate = profile_rate
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+        self._sampling = threading.Lock()
+        self._profile_lock = threading.Lock()
+        self._profile_stats = None
+        self.profiled_requests = 0
+
+    def observe(self, name, labels, value):
+        key = (name, tuple(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    def inc(self, name, labels, amount=1):
+        key = (name, tuple(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def record_request(self, timings, total, write):
+        endpoint = timings.endpoint or 'unmatched'
+        label = (('endpoint', endpoint),)
+        self.observe('extremeli_request_duration_seconds', label, total)
+        for phase, value in (('data', timings.data), ('render', timings.render), ('write', write)):
+            self.observe('extremeli_request_phase_seconds', label + (('phase', phase),), value)
+        status = (timings.status or '').split(' ', 1)[0]
+        self.inc('extremeli_requests_total', label + (('status', status),))
+
+    def render(self):
+        with self._lock:
+            histograms = {key: (list(h.counts), h.sum, h.count) for key, h in self._histograms.items()}
+            counters = dict(self._counters)
+
+        lines = []
+        for name, (kind, help_text) in METRICS.items():
+            if kind == 'histogram':
+                series = sorted((labels, value) for (metric, labels), value in histograms.items() if metric == name)
+            else:
+                series = sorted((labels, value) for (metric, labels), value in counters.items() if metric == name)
+            if not series:
+                continue
+            lines.append('# HELP {} {}'.format(name, help_text))
+            lines.append('# TYPE {} {}'.format(name, kind))
+            for labels, value in series:
+                if kind == 'counter':
+                    lines.append('{}{{{}}} {}'.format(name, _labels(labels), value))
+                    continue
+                counts, total, count = value
+                cumulative = 0
+                for bound, bucket in zip(self.buckets + ('+Inf',), counts):
+                    cumulative += bucket
+                    lines.append('{}_bucket{{{}}} {}'.format(name, _labels(labels + (('le', bound),)), cumulative))
+                lines.append('{}_sum{{{}}} {}'.format(name, _labels(labels), repr(total)))
+                lines.append('{}_count{{{}}} {}'.format(name, _labels(labels), count))
+        return '\n'.join(lines) + '\n'
+
+    def start_profile(self):
+        # A profiler for this request if it was sampled, else None. Only one
+        # request is profiled at a time.
+        if self.profile_rate <= 0 or random.random() >= self.profile_rate:
+            return None
+        if not self._sampling.acquire(blocking=False):
+            return None
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def finish_profile(self, profiler):
+        profiler.disable()
+        self._sampling.release()
+        with self._profile_lock:
+            if self._profile_stats is None:
+                self._profile_stats = pstats.Stats(profiler)
+            else:
+                self._profile_stats.add(profiler)
+            self.profiled_requests += 1
+
+    def profile_report(self, sort='cumulative', limit=40):
+        with self._profile_lock:
+            if self._profile_stats is None:
+                return 'No requests profiled yet (profile rate {}).\n'.format(self.profile_rate)
+            out = io.StringIO()
+            self._profile_stats.stream = out
+            out.write('{} profiled requests\n'.format(self.profiled_requests))
+            self._profile_stats.sort_stats(sort).print_stats(limit)
+            return out.getvalue()
+
+
+class MetricsMiddleware:
+    # Times the whole WSGI call. The time from the Flask app returning until
+    # the server has written the last chunk is the "write" phase; the data
+    # and render phases are filled in while the app runs.
+
+    def __init__(self, wsgi_app, metrics):
+        self.wsgi_app = wsgi_app
+        self.metrics = metrics
+
+    def __call__(self, environ, start_response):
+        started = time.perf_counter()
+        profiler = self.metrics.start_profile()
+        timings = environ[ENVIRON_KEY] = RequestTimings()
+
+        def record_status(status, headers, exc_info=None):
+            timings.status = status
+            return start_response(status, headers, exc_info)
+
+        try:
+            app_iter = self.wsgi_app(environ, record_status)
+        except BaseException:
+            if profiler is not None:
+                self.metrics.finish_profile(profiler)
+            raise
+        returned = time.perf_counter()
+
+        def finish():
+            finished = time.perf_counter()
+            if profiler is not None:
+                self.metrics.finish_profile(profiler)
+            self.metrics.record_request(timings, finished - started, finished - returned)
+
+        return ClosingIterator(app_iter, [finish])
+
+
+def current_timings():
+    if not has_request_context():
+        return None
+    return request.environ.get(ENVIRON_KEY)
+
+
+class TimedStorage:
+    # Wraps the storage backend so time spent in it is charged to the
+    # current request's "data" phase. Everything else passes through.
+
+    def __init__(self, storage):
+        self._storage = storage
+
+    def __getattr__(self, name):
+        attr = getattr(self._storage, name)
+        if not callable(attr):
+            return attr
+
+        def timed(*args, **kwargs):
+            timings = current_timings()
+            if timings is None:
+                return attr(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                timings.data += time.perf_counter() - started
+
+        setattr(self, name, timed)
+        return timed
+
+
+def init_metrics(app, storage):
+    # Returns the storage to hand to everything else (wrapped for timing)
+    metrics = Metrics(
+        buckets=app.config.get('METRICS_BUCKETS', DEFAULT_BUCKETS),
+        profile_rate=app.config.get('METRICS_PROFILE_RATE', 0.0)
+    )
+    app.extensions['metrics'] = metrics
+    app.wsgi_app = MetricsMiddleware(app.wsgi_app, metrics)
+
+    @app.before_request
+    def record_endpoint():
+        timings = current_timings()
+        if timings is not None:
+            timings.endpoint = request.endpoint
+
+    def on_render_start(sender, template, context, **extra):
+        timings = current_timings()
+        if timings is not None:
+            timings.render_started = time.perf_counter()
+
+    def on_rendered(sender, template, context, **extra):
+        timings = current_timings()
+        if timings is not None and timings.render_started is not None:
+            timings.render += time.perf_counter() - timings.render_started
+            timings.render_started = None
+
+    def on_datastore_io(sender, op, nbytes):
+        dataset = os.path.splitext(os.path.basename(sender))[0]
+        calls, size = DATASTORE_COUNTERS[op]
+        if calls:
+            metrics.inc(calls, (('dataset', dataset),))
+        if size and nbytes:
+            metrics.inc(size, (('dataset', dataset),), nbytes)
+
+    before_render_template.connect(on_render_start, app, weak=False)
+    template_rendered.connect(on_rendered, app, weak=False)
+    datastore_io.connect(on_datastore_io, weak=False)
+
+    storage = TimedStorage(storage)
+    app.extensions['storage'] = storage
+    return storage
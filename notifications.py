@@ -0,0 +1,389 @@
+import os
+import hmac
+import json
+import time
+import random
+import atexit
+import hashlib
+import logging
+import smtplib
+import sqlite3
+import threading
+import urllib.error
+import urllib.request
+from email.message import EmailMessage
+
+from signals import record_changed
+from storage import BOOKINGS, FEEDBACK
+
+log = logging.getLogger(__name__)
+
+# A claimed job is handed to another worker if not finished within this
+# many seconds (the process running it died)
+LEASE_SECONDS = 300
+
+# Retry delays: BACKOFF_BASE * 2**attempt seconds, capped, with jitter
+BACKOFF_BASE = 5
+BACKOFF_MAX = 3600
+
+GUEST_MESSAGES = {
+    'booking.created': (
+        'We received your booking request #{id}',
+        'Hi {name},\n\n'
+        'Thank you for booking with Extreme Li. We received your request for a {room_type} room '
+        'from {check_in} to {check_out} for {guests} guest(s).\n\n'
+        'We will confirm your reservation shortly.\n'
+    ),
+    'booking.confirmed': (
+        'Your booking #{id} is confirmed',
+        'Hi {name},\n\n'
+        'Your {room_type} room from {check_in} to {check_out} is confirmed. We look forward to your stay.\n'
+    ),
+    'booking.cancelled': (
+        'Your booking #{id} has been cancelled',
+        'Hi {name},\n\n'
+        'Your booking for a {room_type} room from {check_in} to {check_out} has been cancelled. '
+        'Reply to this email if you have any questions.\n'
+    ),
+}
+
+STAFF_MESSAGES = {
+    'booking.created': (
+        'New booking #{id}: {name}, {room_type} {check_in} to {check_out}',
+        'Name: {name}\nEmail: {email}\nPhone: {phone}\nRoom: {room_type}\n'
+        'Check-in: {check_in}\nCheck-out: {check_out}\nGuests: {guests}\n'
+        'Special requests: {special_requests}\n'
+    ),
+    'feedback.created': (
+        'New feedback from {name}',
+        'From: {name} <{email}>\nDate: {date}\n\n{message}\n'
+    ),
+}
+
+
+class DeliveryError(Exception):
+    # Raised by a transport. Permanent errors are not retried.
+
+    def __init__(self, message, permanent=False):
+        super().__init__(message)
+        self.permanent = permanent
+
+
+class _Fields(dict):
+    # Missing or empty record fields print as '-' instead of failing the job
+    def __missing__(self, key):
+        return '-'
+
+
+def _render(template, record):
+    fields = _Fields({key: value for key, value in record.items() if value not in (None, '')})
+    return template.format_map(fields)
+
+
+class SmtpTransport:
+    # Plain SMTP. For development point it at a local stand-in such as
+    # `python -m aiosmtpd -n -l localhost:1025`.
+    name = 'smtp'
+
+    def __init__(self, host, port=25, sender='no-reply@localhost', staff=(),
+                 username=None, password=None, starttls=False, timeout=10):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.staff = tuple(staff)
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+
+    def messages(self, event, record):
+        # Payloads for one event: a guest email and/or a staff alert
+        payloads = []
+        guest = GUEST_MESSAGES.get(event)
+        if guest and record.get('email'):
+            payloads.append({'to': [record['email']], 'subject': _render(guest[0], record),
+                             'body': _render(guest[1], record)})
+        alert = STAFF_MESSAGES.get(event)
+        if alert and self.staff:
+            payloads.append({'to': list(self.staff), 'subject': _render(alert[0], record),
+                             'body': _render(alert[1], record), 'reply_to': record.get('email')})
+        return payloads
+
+    def send(self, payload):
+        message = EmailMessage()
+        message['From'] = self.sender
+        message['To'] = ', '.join(payload['to'])
+        message['Subject'] = payload['subject']
+        if payload.get('reply_to'):
+            message['Reply-To'] = payload['reply_to']
+        message.set_content(payload['body'])
+        try:
+            with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+                if self.starttls:
+                    smtp.starttls()
+                if self.username:
+                    smtp.login(self.username, self.password or '')
+                smtp.send_message(message)
+        except smtplib.SMTPRecipientsRefused as e:
+            raise DeliveryError('Recipients refused: {}'.format(', '.join(e.recipients)), permanent=True)
+        except (smtplib.SMTPException, OSError) as e:
+            raise DeliveryError('SMTP {}:{}: {}'.format(self.host, self.port, e))
+
+
+class WebhookTransport:
+    # POSTs {"event": ..., "data": record} as JSON. With a secret the body is
+    # signed in an X-Extremeli-Signature: sha256=<hmac> header.
+    name = 'webhook'
+
+    def __init__(self, url, secret=None, timeout=10):
+        self.url = url
+        self.secret = secret
+        self.timeout = timeout
+
+    def messages(self, event, record):
+        return [{'event': event, 'data': record}]
+
+    def send(self, payload):
+        body = json.dumps(payload).encode('utf-8')
+        headers = {'Content-Type': 'application/json', 'User-Agent': 'extremeli-notifications'}
+        if self.secret:
+            signature = hmac.new(self.secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+            headers['X-Extremeli-Signature'] = 'sha256=' + signature
+        req = urllib.request.Request(self.url, data=body, headers=headers, method='POST')
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                response.read()
+        except urllib.error.HTTPError as e:
+            # Client errors other than throttling won't succeed on retry
+            raise DeliveryError('Webhook returned {}'.format(e.code),
+                                permanent=400 <= e.code < 500 and e.code not in (408, 429))
+        except (urllib.error.URLError, OSError) as e:
+            raise DeliveryError('Webhook {}: {}'.format(self.url, e))
+
+
+class JobQueue:
+    # Jobs in a small SQLite database so they survive restarts and can be
+    # shared by every worker process. A job is claimed by moving its run_at
+    # forward by the lease; sent jobs are deleted, jobs out of attempts are
+    # kept with status 'failed' for inspection.
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS jobs (id INTEGER PRIMARY KEY, transport TEXT NOT NULL, '
+                     'event TEXT NOT NULL, payload TEXT NOT NULL, status TEXT NOT NULL, '
+                     'attempts INTEGER NOT NULL DEFAULT 0, run_at REAL NOT NULL, '
+                     'created_at REAL NOT NULL, last_error TEXT)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_due ON jobs (status, run_at)')
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def put(self, transport, event, payload):
+        now = time.time()
+        cursor = self._conn().execute(
+            "INSERT INTO jobs (transport, event, payload, status, run_at, created_at) VALUES (?, ?, ?, 'queued', ?, ?)",
+            (transport, event, json.dumps(payload), now, now))
+        return cursor.lastrowid
+
+    def claim(self):
+        # The next due job as a dict, or None
+        conn = self._conn()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute("SELECT id, transport, event, payload, attempts FROM jobs "
+                               "WHERE status IN ('queued', 'running') AND run_at <= ? "
+                               "ORDER BY run_at LIMIT 1", (now,)).fetchone()
+            if row is not None:
+                conn.execute("UPDATE jobs SET status = 'running', run_at = ? WHERE id = ?",
+                             (now + LEASE_SECONDS, row[0]))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        if row is None:
+            return None
+        return {'id': row[0], 'transport': row[1], 'event': row[2], 'payload': json.loads(row[3]),
+                'attempts': row[4]}
+
+    def done(self, job_id):
+        self._conn().execute('DELETE FROM jobs WHERE id = ?', (job_id,))
+
+    def retry(self, job_id, delay, error):
+        self._conn().execute("UPDATE jobs SET status = 'queued', attempts = attempts + 1, run_at = ?, "
+                             "last_error = ? WHERE id = ?", (time.time() + delay, error, job_id))
+
+    def fail(self, job_id, error):
+        self._conn().execute("UPDATE jobs SET status = 'failed', attempts = attempts + 1, last_error = ? "
+                             "WHERE id = ?", (error, job_id))
+
+    def next_run_at(self):
+        row = self._conn().execute("SELECT MIN(run_at) FROM jobs WHERE status IN ('queued', 'running')").fetchone()
+        return row[0]
+
+    def counts(self):
+        return dict(self._conn().execute('SELECT status, COUNT(*) FROM jobs GROUP BY status'))
+
+
+class Notifier:
+    # Turns booking/feedback changes into queued jobs, one per transport
+    # message, and runs worker threads that deliver them. Enqueueing is a
+    # single local insert, so the request that triggered it doesn't wait on
+    # SMTP or HTTP. Workers start with the first job (or start()); on
+    # serverless hosts, where threads freeze between requests, run
+    # `flask send-notifications` from a scheduler instead.
+
+    def __init__(self, queue, transports, workers=2, max_attempts=8, poll_interval=30):
+        self.queue = queue
+        self.transports = {transport.name: transport for transport in transports}
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def notify(self, event, record):
+        queued = 0
+        for name, transport in self.transports.items():
+            for payload in transport.messages(event, record):
+                self.queue.put(name, event, payload)
+                queued += 1
+        if queued and self.workers:
+            self.start()
+            self._wake.set()
+        return queued
+
+    def on_change(self, sender, storage=None, old=None, new=None, version=None):
+        if new is None:
+            return
+        if old is None:
+            event = 'booking.created' if sender == BOOKINGS else 'feedback.created'
+        elif sender == BOOKINGS and new.get('status') != old.get('status'):
+            event = 'booking.' + str(new.get('status'))
+        else:
+            return
+        try:
+            self.notify(event, new)
+        except sqlite3.Error:
+            # The record is already saved; losing the email beats failing the request
+            log.exception('Could not queue %s notification for %s #%s', event, sender, new.get('id'))
+
+    def _backoff(self, attempts):
+        delay = min(BACKOFF_BASE * 2 ** attempts, BACKOFF_MAX)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def run_job(self, job):
+        transport = self.transports.get(job['transport'])
+        if transport is None:
+            self.queue.fail(job['id'], 'Transport {} is not configured'.format(job['transport']))
+            return False
+        try:
+            transport.send(job['payload'])
+        except DeliveryError as e:
+            if e.permanent or job['attempts'] + 1 >= self.max_attempts:
+                log.error('Giving up on %s job %s (%s): %s', job['transport'], job['id'], job['event'], e)
+                self.queue.fail(job['id'], str(e))
+            else:
+                self.queue.retry(job['id'], self._backoff(job['attempts']), str(e))
+            return False
+        except Exception as e:
+            log.exception('%s job %s (%s) crashed', job['transport'], job['id'], job['event'])
+            self.queue.fail(job['id'], repr(e))
+            return False
+        self.queue.done(job['id'])
+        return True
+
+    def run_pending(self):
+        # Deliver every job that is due now; returns (sent, failed attempts)
+        sent = failed = 0
+        while True:
+            job = self.queue.claim()
+            if job is None:
+                return sent, failed
+            if self.run_job(job):
+                sent += 1
+            else:
+                failed += 1
+
+    def _worker(self):
+        while not self._stopping.is_set():
+            try:
+                self.run_pending()
+                next_run = self.queue.next_run_at()
+            except sqlite3.Error:
+                log.exception('Notification queue unavailable')
+                next_run = None
+            timeout = self.poll_interval
+            if next_run is not None:
+                timeout = min(max(next_run - time.time(), 0.05), timeout)
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+    def start(self):
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for n in range(self.workers):
+                thread = threading.Thread(target=self._worker, name='notifications-{}'.format(n), daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        atexit.register(self.stop)
+
+    def stop(self, timeout=5):
+        self._stopping.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+
+
+def create_transports(config):
+    transports = []
+    if config.get('NOTIFY_SMTP_HOST'):
+        transports.append(SmtpTransport(
+            config['NOTIFY_SMTP_HOST'],
+            port=config.get('NOTIFY_SMTP_PORT', 25),
+            sender=config.get('NOTIFY_FROM', 'no-reply@localhost'),
+            staff=config.get('NOTIFY_STAFF_EMAILS', ()),
+            username=config.get('NOTIFY_SMTP_USER'),
+            password=config.get('NOTIFY_SMTP_PASSWORD'),
+            starttls=config.get('NOTIFY_SMTP_STARTTLS', False)
+        ))
+    if config.get('NOTIFY_WEBHOOK_URL'):
+        transports.append(WebhookTransport(config['NOTIFY_WEBHOOK_URL'], secret=config.get('NOTIFY_WEBHOOK_SECRET')))
+    return transports
+
+
+def init_notifications(app):
+    # Nothing is queued unless a transport is configured
+    transports = create_transports(app.config)
+    if not transports:
+        return None
+    notifier = Notifier(
+        JobQueue(app.config['NOTIFY_QUEUE_PATH']),
+        transports,
+        workers=app.config.get('NOTIFY_WORKERS', 2),
+        max_attempts=app.config.get('NOTIFY_MAX_ATTEMPTS', 8)
+    )
+    app.extensions['notifications'] = notifier
+    if notifier.workers and notifier.queue.next_run_at() is not None:
+        # Jobs queued or mid-retry when the last process stopped; nothing
+        # new has to be written for them to go out
+        notifier.start()
+    record_changed.connect(notifier.on_change, sender=BOOKINGS, weak=False)
+    record_changed.connect(notifier.on_change, sender=FEEDBACK, weak=False)
+    return notifier
@@ -0,0 +1,163 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, request
+
+from signals import record_changed
+
+# Route key -> datasets its page is rendered from, filled in by cached_page
+PAGE_DEPENDENCIES = {}
+
+
+class PageCache:
+    # Rendered HTML keyed by route name. Entries live in an in-memory LRU
+    # with a TTL; with store_dir set they are also written to disk so every
+    # worker shares them and a purge in one worker is seen by the others.
+    # Each entry remembers the versions of the datasets it was rendered
+    # from and is treated as a miss once any of them changes.
+
+    def __init__(self, max_entries=128, ttl=300, store_dir=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.store_dir = store_dir
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if store_dir:
+            os.makedirs(store_dir, exist_ok=True)
+
+    def _paths(self, key):
+        base = os.path.join(self.store_dir, key)
+        return base + '.html', base + '.json'
+
+    def _load_disk(self, key):
+        body_path, meta_path = self._paths(key)
+        try:
+            stamp = os.stat(meta_path).st_mtime_ns
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if hashlib.sha1(body).hexdigest() != meta['etag']:
+            # Body and metadata from different writes; treat as a miss
+            return None
+        return {'body': body, 'etag': meta['etag'], 'versions': meta['versions'],
+                'expires': meta['expires'], 'stamp': stamp}
+
+    def _write_disk(self, key, entry):
+        body_path, meta_path = self._paths(key)
+        for path, content in ((body_path, entry['body']),
+                              (meta_path, json.dumps({k: entry[k] for k in ('etag', 'versions', 'expires')}).encode())):
+            fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        entry['stamp'] = os.stat(meta_path).st_mtime_ns
+
+    def get(self, key, versions):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None and self.store_dir:
+            # The disk copy is authoritative: another worker may have purged
+            # or replaced it since we cached it.
+            try:
+                stamp = os.stat(self._paths(key)[1]).st_mtime_ns
+            except OSError:
+                stamp = None
+            if stamp != entry['stamp']:
+                entry = None
+        if entry is None and self.store_dir:
+            entry = self._load_disk(key)
+            if entry is not None:
+                self._remember(key, entry)
+
+        if entry is None or entry['expires'] < now or entry['versions'] != versions:
+            return None
+        return entry
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def set(self, key, body, versions):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        entry = {'body': body, 'etag': hashlib.sha1(body).hexdigest(), 'versions': versions,
+                 'expires': time.time() + self.ttl, 'stamp': None}
+        if self.store_dir:
+            self._write_disk(key, entry)
+        self._remember(key, entry)
+        return entry
+
+    def purge(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+        if self.store_dir:
+            for key in keys:
+                for path in self._paths(key):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+
+    def purge_dataset(self, name):
+        # Drop exactly the pages rendered from dataset ``name``
+        self.purge(*[key for key, names in PAGE_DEPENDENCIES.items() if name in names])
+
+    def clear(self):
+        self.purge(*list(PAGE_DEPENDENCIES))
+
+
+def cached_page(key, depends_on=()):
+    # Serve the view's rendered HTML from the page cache with a strong ETag
+    # and answer matching If-None-Match requests with 304.
+    PAGE_DEPENDENCIES[key] = tuple(depends_on)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            cache = current_app.extensions['page_cache']
+            storage = current_app.extensions['storage']
+            versions = json.dumps([storage.version(name) for name in depends_on])
+
+            entry = cache.get(key, versions)
+            if entry is None:
+                entry = cache.set(key, view(*args, **kwargs), versions)
+
+            response = current_app.response_class(entry['body'], mimetype='text/html')
+            response.set_etag(entry['etag'])
+            response.cache_control.public = True
+            response.cache_control.no_cache = True
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
+
+
+def init_page_cache(app):
+    cache = PageCache(
+        max_entries=app.config.get('PAGE_CACHE_SIZE', 128),
+        ttl=app.config.get('PAGE_CACHE_TTL', 300),
+        store_dir=app.config.get('PAGE_CACHE_DIR')
+    )
+    app.extensions['page_cache'] = cache
+
+    def on_change(sender, **kwargs):
+        cache.purge_dataset(sender)
+
+    record_changed.connect(on_change, weak=False)
+    return cache
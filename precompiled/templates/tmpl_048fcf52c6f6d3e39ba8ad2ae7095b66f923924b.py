@@ -0,0 +1,37 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/login.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_asset_url = resolve('asset_url')
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n<meta name="viewport" content="width=device-width, initial-scale=1.0">\n<title>Admin Login - EXTREMELI SUITES</title>\n\n<!-- Google Fonts -->\n<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@500;600&family=Inter:wght@300;400;500&display=swap" rel="stylesheet">\n\n<!-- Font Awesome -->\n<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css" rel="stylesheet">\n\n<!-- Custom CSS -->\n<link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'css/styles.css'))
+    yield '">\n<style>\n.admin-login-container {\n  min-height: 100vh;\n  display: flex;\n  align-items: center;\n  justify-content: center;\n  background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);\n}\n\n.admin-login-card {\n  background: white;\n  padding: 40px;\n  border-radius: 20px;\n  box-shadow: 0 20px 60px rgba(0,0,0,0.1);\n  width: 100%;\n  max-width: 400px;\n}\n\n.admin-login-card h1 {\n  font-family: \'Playfair Display\', serif;\n  color: var(--blue);\n  margin-bottom: 30px;\n  text-align: center;\n}\n\n.form-group {\n  margin-bottom: 20px;\n}\n\n.form-group label {\n  display: block;\n  margin-bottom: 8px;\n  font-weight: 500;\n  color: var(--text);\n}\n\n.form-group input {\n  width: 100%;\n  padding: 12px;\n  border: 1px solid #ddd;\n  border-radius: 8px;\n  font-size: 1rem;\n}\n\n.form-group input:focus {\n  outline: none;\n  border-color: var(--blue);\n  box-shadow: 0 0 0 3px rgba(54, 116, 181, 0.1);\n}\n\n.btn-login {\n  width: 100%;\n  padding: 14px;\n  background: var(--blue);\n  color: white;\n  border: none;\n  border-radius: 8px;\n  font-size: 1rem;\n  font-weight: 500;\n  cursor: pointer;\n  transition: all 0.3s ease;\n}\n\n.btn-login:hover {\n  background: var(--accent-dark);\n  transform: translateY(-2px);\n  box-shadow: 0 8px 25px rgba(0,0,0,0.15);\n}\n\n.alert {\n  padding: 12px;\n  border-radius: 8px;\n  margin-bottom: 20px;\n}\n\n.alert-success {\n  background: #d4edda;\n  color: #155724;\n  border: 1px solid #c3e6cb;\n}\n\n.alert-error {\n  background: #f8d7da;\n  color: #721c24;\n  border: 1px solid #f5c6cb;\n}\n\n.alert-info {\n  background: #d1ecf1;\n  color: #0c5460;\n  border: 1px solid #bee5eb;\n}\n</style>\n</head>\n<body>\n\n<div class="admin-login-container">\n  <div class="admin-login-card">\n    <h1>Admin Login</h1>\n    \n    '
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True)
+    pass
+    yield '\n      '
+    if l_1_messages:
+        pass
+        yield '\n        '
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n          <div class="alert alert-'
+            yield escape(l_2_category)
+            yield '">'
+            yield escape(l_2_message)
+            yield '</div>\n        '
+        l_2_category = l_2_message = missing
+        yield '\n      '
+    yield '\n    '
+    l_1_messages = missing
+    yield '\n    \n    <form method="POST">\n      <div class="form-group">\n        <label for="username">Username</label>\n        <input type="text" id="username" name="username" required>\n      </div>\n      \n      <div class="form-group">\n        <label for="password">Password</label>\n        <input type="password" id="password" name="password" required>\n      </div>\n      \n      <button type="submit" class="btn-login">Login</button>\n    </form>\n    \n    <p style="text-align: center; margin-top: 20px; color: var(--muted); font-size: 0.9rem;">\n      Default: admin / admin123\n    </p>\n  </div>\n</div>\n\n</body>\n</html>'
+
+blocks = {}
+debug_info = '15=14&117=19&118=22&119=26'
\ No newline at end of file
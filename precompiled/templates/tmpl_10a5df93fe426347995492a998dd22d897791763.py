@@ -0,0 +1,304 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/bookings.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_asset_url = resolve('asset_url')
+    l_0_session = resolve('session')
+    l_0_user_role = resolve('user_role')
+    l_0_url_for = resolve('url_for')
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    l_0_counts = resolve('counts')
+    l_0_total_bookings = resolve('total_bookings')
+    l_0_params = resolve('params')
+    l_0_search = resolve('search')
+    l_0_date_from = resolve('date_from')
+    l_0_date_to = resolve('date_to')
+    l_0_sort_fields = resolve('sort_fields')
+    l_0_order = resolve('order')
+    l_0_page_sizes = resolve('page_sizes')
+    l_0_bookings = resolve('bookings')
+    l_0_page = resolve('page')
+    l_0_per_page = resolve('per_page')
+    l_0_total = resolve('total')
+    l_0_range = resolve('range')
+    l_0_pages = resolve('pages')
+    l_0_last_event_id = resolve('last_event_id')
+    try:
+        t_1 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    try:
+        t_2 = environment.filters['max']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'max' found.")
+    try:
+        t_3 = environment.filters['min']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'min' found.")
+    try:
+        t_4 = environment.filters['safe']
+    except KeyError:
+        @internalcode
+        def t_4(*unused):
+            raise TemplateRuntimeError("No filter named 'safe' found.")
+    try:
+        t_5 = environment.tests['number']
+    except KeyError:
+        @internalcode
+        def t_5(*unused):
+            raise TemplateRuntimeError("No test named 'number' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n<meta name="viewport" content="width=device-width, initial-scale=1.0">\n<title>Bookings Management - EXTREMELI SUITES Admin</title>\n<link rel="icon" type="image/jpeg" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/minlogo.jpg'))
+    yield '">\n\n<!-- Google Fonts -->\n<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@500;600&family=Inter:wght@300;400;500&display=swap" rel="stylesheet">\n\n<!-- Font Awesome -->\n<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css" rel="stylesheet">\n\n<!-- Custom CSS -->\n<link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'css/styles.css'))
+    yield '">\n</head>\n<body>\n\n<header class="admin-header">\n  <div class="admin-nav">\n    <div class="admin-logo">\n      <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/mainlogo.png'))
+    yield '" alt="EXTREMELI SUITES">\n      <span>Admin Panel</span>\n    </div>\n    <div class="admin-user">\n      <i class="fas fa-user-circle"></i>\n      <span>'
+    yield escape(context.call(environment.getattr((undefined(name='session') if l_0_session is missing else l_0_session), 'get'), 'user_name', 'Admin'))
+    yield '</span>\n      <span class="user-role">('
+    yield escape(context.call(environment.getattr(context.call(environment.getattr((undefined(name='user_role') if l_0_user_role is missing else l_0_user_role), 'replace'), '_', ' '), 'title')))
+    yield ')</span>\n      <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.logout'))
+    yield '" class="logout-btn">\n        <i class="fas fa-sign-out-alt"></i> Logout\n      </a>\n    </div>\n  </div>\n</header>\n\n<nav class="admin-sidebar">\n  <ul>\n    <li><a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.dashboard'))
+    yield '"><i class="fas fa-tachometer-alt"></i> Dashboard</a></li>\n    <li><a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.features'))
+    yield '"><i class="fas fa-star"></i> Features</a></li>\n    <li><a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.nearby'))
+    yield '"><i class="fas fa-map-marker-alt"></i> Nearby Places</a></li>\n    <li><a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.feedback'))
+    yield '"><i class="fas fa-comments"></i> Feedback</a></li>\n    <li><a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.bookings'))
+    yield '" class="active"><i class="fas fa-calendar-check"></i> Bookings</a></li>\n  </ul>\n</nav>\n\n<main class="admin-main">\n  <div class="admin-content">\n    <div class="page-header">\n      <h1><i class="fas fa-calendar-check"></i> Booking Management</h1>\n      <p>Manage and track all booking requests</p>\n    </div>\n\n    '
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True)
+    pass
+    yield '\n      '
+    if l_1_messages:
+        pass
+        yield '\n        <div class="flash-messages">\n          '
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n            <div class="flash-message flash-'
+            yield escape(l_2_category)
+            yield '">\n              '
+            yield escape(l_2_message)
+            yield '\n            </div>\n          '
+        l_2_category = l_2_message = missing
+        yield '\n        </div>\n      '
+    yield '\n    '
+    l_1_messages = missing
+    yield '\n\n    <div class="bookings-stats">\n      <div class="stat-card">\n        <div class="stat-icon pending">\n          <i class="fas fa-clock"></i>\n        </div>\n        <div class="stat-info">\n          <h3>'
+    yield escape(context.call(environment.getattr((undefined(name='counts') if l_0_counts is missing else l_0_counts), 'get'), 'pending', 0))
+    yield '</h3>\n          <p>Pending</p>\n        </div>\n      </div>\n      <div class="stat-card">\n        <div class="stat-icon confirmed">\n          <i class="fas fa-check-circle"></i>\n        </div>\n        <div class="stat-info">\n          <h3>'
+    yield escape(context.call(environment.getattr((undefined(name='counts') if l_0_counts is missing else l_0_counts), 'get'), 'confirmed', 0))
+    yield '</h3>\n          <p>Confirmed</p>\n        </div>\n      </div>\n      <div class="stat-card">\n        <div class="stat-icon cancelled">\n          <i class="fas fa-times-circle"></i>\n        </div>\n        <div class="stat-info">\n          <h3>'
+    yield escape(context.call(environment.getattr((undefined(name='counts') if l_0_counts is missing else l_0_counts), 'get'), 'cancelled', 0))
+    yield '</h3>\n          <p>Cancelled</p>\n        </div>\n      </div>\n      <div class="stat-card">\n        <div class="stat-icon total">\n          <i class="fas fa-list"></i>\n        </div>\n        <div class="stat-info">\n          <h3>'
+    yield escape((undefined(name='total_bookings') if l_0_total_bookings is missing else l_0_total_bookings))
+    yield '</h3>\n          <p>Total Bookings</p>\n        </div>\n      </div>\n    </div>\n\n    <div class="live-notice" id="liveNotice" hidden>\n      <i class="fas fa-bell"></i> <span></span>\n      <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.bookings', **(undefined(name='params') if l_0_params is missing else l_0_params)))
+    yield '">Show</a>\n    </div>\n\n    <div class="bookings-table-container">\n      <div class="table-header">\n        <h2>All Bookings</h2>\n        <form method="GET" action="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.bookings'))
+    yield '" class="filter-controls">\n          <input type="search" name="q" value="'
+    yield escape((undefined(name='search') if l_0_search is missing else l_0_search))
+    yield '" placeholder="Search name or email">\n          <select name="status">\n            <option value="">All Status</option>\n            '
+    for l_1_value in ['pending', 'confirmed', 'cancelled']:
+        l_1_status = resolve('status')
+        _loop_vars = {}
+        pass
+        yield '\n            <option value="'
+        yield escape(l_1_value)
+        yield '" '
+        if ((undefined(name='status') if l_1_status is missing else l_1_status) == l_1_value):
+            pass
+            yield 'selected'
+        yield '>'
+        yield escape(context.call(environment.getattr(l_1_value, 'title'), _loop_vars=_loop_vars))
+        yield '</option>\n            '
+    l_1_value = l_1_status = missing
+    yield '\n          </select>\n          <label>Check-in from <input type="date" name="from" value="'
+    yield escape((undefined(name='date_from') if l_0_date_from is missing else l_0_date_from))
+    yield '"></label>\n          <label>Check-out by <input type="date" name="to" value="'
+    yield escape((undefined(name='date_to') if l_0_date_to is missing else l_0_date_to))
+    yield '"></label>\n          <select name="sort">\n            '
+    for l_1_field in (undefined(name='sort_fields') if l_0_sort_fields is missing else l_0_sort_fields):
+        l_1_sort = resolve('sort')
+        _loop_vars = {}
+        pass
+        yield '\n            <option value="'
+        yield escape(l_1_field)
+        yield '" '
+        if ((undefined(name='sort') if l_1_sort is missing else l_1_sort) == l_1_field):
+            pass
+            yield 'selected'
+        yield '>Sort: '
+        yield escape(context.call(environment.getattr(context.call(environment.getattr(l_1_field, 'replace'), '_', ' ', _loop_vars=_loop_vars), 'title'), _loop_vars=_loop_vars))
+        yield '</option>\n            '
+    l_1_field = l_1_sort = missing
+    yield '\n          </select>\n          <select name="order">\n            <option value="desc" '
+    if ((undefined(name='order') if l_0_order is missing else l_0_order) == 'desc'):
+        pass
+        yield 'selected'
+    yield '>Descending</option>\n            <option value="asc" '
+    if ((undefined(name='order') if l_0_order is missing else l_0_order) == 'asc'):
+        pass
+        yield 'selected'
+    yield '>Ascending</option>\n          </select>\n          <select name="per_page">\n            '
+    for l_1_size in (undefined(name='page_sizes') if l_0_page_sizes is missing else l_0_page_sizes):
+        _loop_vars = {}
+        pass
+        yield '\n            <option value="'
+        yield escape(l_1_size)
+        yield '" '
+        if ((undefined(name='per_page') if l_0_per_page is missing else l_0_per_page) == l_1_size):
+            pass
+            yield 'selected'
+        yield '>'
+        yield escape(l_1_size)
+        yield ' / page</option>\n            '
+    l_1_size = missing
+    yield '\n          </select>\n          <button type="submit" class="btn-filter"><i class="fas fa-filter"></i> Apply</button>\n          '
+    if (undefined(name='params') if l_0_params is missing else l_0_params):
+        pass
+        yield '\n          <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.bookings'))
+        yield '" class="btn-clear">Clear</a>\n          '
+    yield '\n          <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.export_bookings', fmt='csv', **(undefined(name='params') if l_0_params is missing else l_0_params)))
+    yield '" class="btn-clear" title="Export the filtered bookings"><i class="fas fa-file-csv"></i> CSV</a>\n          <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.export_bookings', fmt='jsonl', **(undefined(name='params') if l_0_params is missing else l_0_params)))
+    yield '" class="btn-clear" title="Export the filtered bookings"><i class="fas fa-file-code"></i> JSONL</a>\n          <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.archive', dataset='bookings'))
+    yield '" class="btn-clear" title="Archived bookings"><i class="fas fa-archive"></i> Archive</a>\n        </form>\n      </div>\n\n      '
+    if (undefined(name='bookings') if l_0_bookings is missing else l_0_bookings):
+        pass
+        yield '\n      <form method="POST" action="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.bulk_bookings', page=(undefined(name='page') if l_0_page is missing else l_0_page), **(undefined(name='params') if l_0_params is missing else l_0_params)))
+        yield '" id="bulkForm" class="bulk-actions"\n            onsubmit="return this.action.value !== \'delete\' || confirm(\'Delete the selected bookings?\')">\n        <span class="bulk-count">0 selected</span>\n        <select name="action">\n          <option value="confirmed">Confirm</option>\n          <option value="cancelled">Cancel</option>\n          <option value="pending">Mark pending</option>\n          '
+        if ((undefined(name='user_role') if l_0_user_role is missing else l_0_user_role) == 'admin'):
+            pass
+            yield '\n          <option value="delete">Delete</option>\n          '
+        yield '\n        </select>\n        <button type="submit" class="btn-filter" disabled><i class="fas fa-check-double"></i> Apply to selected</button>\n      </form>\n      <div class="table-responsive">\n        <table class="bookings-table" id="bookingsTable">\n          <thead>\n            <tr>\n              <th><input type="checkbox" class="select-all" title="Select all on this page"></th>\n              <th>ID</th>\n              <th>Guest Name</th>\n              <th>Email</th>\n              <th>Phone</th>\n              <th>Room Type</th>\n              <th>Check-in</th>\n              <th>Check-out</th>\n              <th>Guests</th>\n              <th>Total</th>\n              <th>Status</th>\n              <th>Created</th>\n              <th>Actions</th>\n            </tr>\n          </thead>\n          <tbody>\n            '
+        for l_1_booking in (undefined(name='bookings') if l_0_bookings is missing else l_0_bookings):
+            _loop_vars = {}
+            pass
+            yield '\n            <tr data-id="'
+            yield escape(environment.getattr(l_1_booking, 'id'))
+            yield '" data-status="'
+            yield escape(environment.getattr(l_1_booking, 'status'))
+            yield '">\n              <td><input type="checkbox" name="ids" value="'
+            yield escape(environment.getattr(l_1_booking, 'id'))
+            yield '" form="bulkForm" class="select-item"></td>\n              <td>#'
+            yield escape(environment.getattr(l_1_booking, 'id'))
+            yield '</td>\n              <td>'
+            yield escape(environment.getattr(l_1_booking, 'name'))
+            yield '</td>\n              <td>'
+            yield escape(environment.getattr(l_1_booking, 'email'))
+            yield '</td>\n              <td>'
+            yield escape(environment.getattr(l_1_booking, 'phone'))
+            yield '</td>\n              <td>'
+            yield escape(context.call(environment.getattr(context.call(environment.getattr(environment.getattr(l_1_booking, 'room_type'), 'replace'), '_', ' ', _loop_vars=_loop_vars), 'title'), _loop_vars=_loop_vars))
+            yield '</td>\n              <td>'
+            yield escape(environment.getattr(l_1_booking, 'check_in'))
+            yield '</td>\n              <td>'
+            yield escape(environment.getattr(l_1_booking, 'check_out'))
+            yield '</td>\n              <td>'
+            yield escape(environment.getattr(l_1_booking, 'guests'))
+            yield '</td>\n              <td>'
+            yield escape((t_4(context.call(environment.getattr('&#8369;{:,.0f}', 'format'), environment.getattr(l_1_booking, 'total_price'), _loop_vars=_loop_vars)) if t_5(environment.getattr(l_1_booking, 'total_price')) else Markup('&ndash;')))
+            yield '</td>\n              <td>\n                <span class="status-badge status-'
+            yield escape(environment.getattr(l_1_booking, 'status'))
+            yield '">\n                  '
+            yield escape(context.call(environment.getattr(environment.getattr(l_1_booking, 'status'), 'title'), _loop_vars=_loop_vars))
+            yield '\n                </span>\n              </td>\n              <td>'
+            yield escape(environment.getattr(l_1_booking, 'created_at'))
+            yield '</td>\n              <td>\n                <div class="action-buttons">\n                  <form method="POST" action="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.update_booking_status', booking_id=environment.getattr(l_1_booking, 'id'), page=(undefined(name='page') if l_0_page is missing else l_0_page), _loop_vars=_loop_vars, **(undefined(name='params') if l_0_params is missing else l_0_params)))
+            yield '" class="status-form">\n                    <select name="status" class="status-select" onchange="this.form.submit()">\n                      <option value="pending" '
+            if (environment.getattr(l_1_booking, 'status') == 'pending'):
+                pass
+                yield 'selected'
+            yield '>Pending</option>\n                      <option value="confirmed" '
+            if (environment.getattr(l_1_booking, 'status') == 'confirmed'):
+                pass
+                yield 'selected'
+            yield '>Confirmed</option>\n                      <option value="cancelled" '
+            if (environment.getattr(l_1_booking, 'status') == 'cancelled'):
+                pass
+                yield 'selected'
+            yield '>Cancelled</option>\n                    </select>\n                  </form>\n                  '
+            if ((undefined(name='user_role') if l_0_user_role is missing else l_0_user_role) == 'admin'):
+                pass
+                yield '\n                  <a href="'
+                yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.delete_booking', booking_id=environment.getattr(l_1_booking, 'id'), page=(undefined(name='page') if l_0_page is missing else l_0_page), _loop_vars=_loop_vars, **(undefined(name='params') if l_0_params is missing else l_0_params)))
+                yield '" \n                     class="btn-delete" \n                     onclick="return confirm(\'Are you sure you want to delete this booking?\')">\n                    <i class="fas fa-trash"></i>\n                  </a>\n                  '
+            yield '\n                </div>\n              </td>\n            </tr>\n            '
+            if environment.getattr(l_1_booking, 'special_requests'):
+                pass
+                yield '\n            <tr class="special-requests-row" data-id="'
+                yield escape(environment.getattr(l_1_booking, 'id'))
+                yield '">\n              <td colspan="13">\n                <div class="special-requests">\n                  <strong>Special Requests:</strong> '
+                yield escape(environment.getattr(l_1_booking, 'special_requests'))
+                yield '\n                </div>\n              </td>\n            </tr>\n            '
+            yield '\n            '
+        l_1_booking = missing
+        yield '\n          </tbody>\n        </table>\n      </div>\n      <div class="pagination">\n        <span class="pagination-info">\n          Showing '
+        yield escape(((((undefined(name='page') if l_0_page is missing else l_0_page) - 1) * (undefined(name='per_page') if l_0_per_page is missing else l_0_per_page)) + 1))
+        yield '&ndash;'
+        yield escape(((((undefined(name='page') if l_0_page is missing else l_0_page) - 1) * (undefined(name='per_page') if l_0_per_page is missing else l_0_per_page)) + t_1((undefined(name='bookings') if l_0_bookings is missing else l_0_bookings))))
+        yield ' of '
+        yield escape((undefined(name='total') if l_0_total is missing else l_0_total))
+        yield '\n        </span>\n        <div class="pagination-links">\n          '
+        if ((undefined(name='page') if l_0_page is missing else l_0_page) > 1):
+            pass
+            yield '\n          <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.bookings', page=((undefined(name='page') if l_0_page is missing else l_0_page) - 1), **(undefined(name='params') if l_0_params is missing else l_0_params)))
+            yield '"><i class="fas fa-chevron-left"></i> Prev</a>\n          '
+        yield '\n          '
+        for l_1_number in context.call((undefined(name='range') if l_0_range is missing else l_0_range), t_2(environment, [((undefined(name='page') if l_0_page is missing else l_0_page) - 2), 1]), (t_3(environment, [((undefined(name='page') if l_0_page is missing else l_0_page) + 2), (undefined(name='pages') if l_0_pages is missing else l_0_pages)]) + 1)):
+            _loop_vars = {}
+            pass
+            yield '\n          <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.bookings', page=l_1_number, _loop_vars=_loop_vars, **(undefined(name='params') if l_0_params is missing else l_0_params)))
+            yield '" '
+            if (l_1_number == (undefined(name='page') if l_0_page is missing else l_0_page)):
+                pass
+                yield 'class="active"'
+            yield '>'
+            yield escape(l_1_number)
+            yield '</a>\n          '
+        l_1_number = missing
+        yield '\n          '
+        if ((undefined(name='page') if l_0_page is missing else l_0_page) < (undefined(name='pages') if l_0_pages is missing else l_0_pages)):
+            pass
+            yield '\n          <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.bookings', page=((undefined(name='page') if l_0_page is missing else l_0_page) + 1), **(undefined(name='params') if l_0_params is missing else l_0_params)))
+            yield '">Next <i class="fas fa-chevron-right"></i></a>\n          '
+        yield '\n        </div>\n      </div>\n      '
+    elif (undefined(name='params') if l_0_params is missing else l_0_params):
+        pass
+        yield '\n      <div class="no-bookings">\n        <i class="fas fa-search"></i>\n        <h3>No Matching Bookings</h3>\n        <p>Try different filters or <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.bookings'))
+        yield '">clear them</a>.</p>\n      </div>\n      '
+    else:
+        pass
+        yield '\n      <div class="no-bookings">\n        <i class="fas fa-calendar-times"></i>\n        <h3>No Bookings Yet</h3>\n        <p>When guests make booking requests, they will appear here.</p>\n      </div>\n      '
+    yield "\n    </div>\n  </div>\n</main>\n\n<script>\n// Bulk selection: the row checkboxes belong to #bulkForm via their form attribute\nconst bulkForm = document.getElementById('bulkForm');\nif (bulkForm) {\n  const items = Array.from(document.querySelectorAll('.select-item'));\n  const selectAll = document.querySelector('.select-all');\n  const updateBulk = () => {\n    const selected = items.filter(item => item.checked).length;\n    bulkForm.querySelector('.bulk-count').textContent = selected + ' selected';\n    bulkForm.querySelector('button').disabled = selected === 0;\n    selectAll.checked = selected === items.length;\n  };\n  items.forEach(item => item.addEventListener('change', updateBulk));\n  selectAll.addEventListener('change', () => {\n    items.forEach(item => { item.checked = selectAll.checked; });\n    updateBulk();\n  });\n}\n\n// Live updates from /admin/events: status changes and deletions are applied\n// to the rows on this page; new bookings are announced instead of inserted,\n// since where they belong depends on the filters and sort. The browser\n// polls again every few seconds, resuming after the last event it received.\nconst liveNotice = document.getElementById('liveNotice');\nlet newBookings = 0;\nconst events = new EventSource('"
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.events', dataset='bookings', last_event_id=(undefined(name='last_event_id') if l_0_last_event_id is missing else l_0_last_event_id)))
+    yield '\');\nevents.addEventListener(\'bookings\', message => {\n  const change = JSON.parse(message.data);\n  const booking = change.record;\n  const rows = document.querySelectorAll(`tr[data-id="${booking.id}"]`);\n  if (change.action === \'created\') {\n    if (rows.length) return;\n    newBookings += 1;\n    liveNotice.querySelector(\'span\').textContent =\n      `${newBookings} new booking${newBookings === 1 ? \'\' : \'s\'} since this page was loaded.`;\n    liveNotice.hidden = false;\n  } else if (change.action === \'deleted\') {\n    rows.forEach(row => {\n      const item = row.querySelector(\'.select-item\');\n      if (item && item.checked) {\n        item.checked = false;\n        item.dispatchEvent(new Event(\'change\'));\n      }\n      row.remove();\n    });\n  } else if (rows.length && booking.status) {\n    const row = rows[0];\n    row.dataset.status = booking.status;\n    const badge = row.querySelector(\'.status-badge\');\n    badge.className = `status-badge status-${booking.status}`;\n    badge.textContent = booking.status.charAt(0).toUpperCase() + booking.status.slice(1);\n    row.querySelector(\'.status-select\').value = booking.status;\n  }\n});\n</script>\n\n<style>\n.live-notice {\n  background: #fff3cd;\n  color: #856404;\n  border: 1px solid #ffeeba;\n  border-radius: 10px;\n  padding: 12px 20px;\n  margin-bottom: 20px;\n  display: flex;\n  align-items: center;\n  gap: 10px;\n}\n\n.live-notice[hidden] {\n  display: none;\n}\n\n.live-notice a {\n  margin-left: auto;\n  color: #856404;\n  font-weight: 600;\n}\n\n.admin-header {\n  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n  color: white;\n  padding: 15px 30px;\n  box-shadow: 0 2px 10px rgba(0,0,0,0.1);\n}\n\n.admin-nav {\n  display: flex;\n  justify-content: space-between;\n  align-items: center;\n}\n\n.admin-logo {\n  display: flex;\n  align-items: center;\n  gap: 15px;\n}\n\n.admin-logo img {\n  height: 40px;\n}\n\n.admin-logo span {\n  font-size: 1.2rem;\n  font-weight: 600;\n}\n\n.admin-user {\n  display: flex;\n  align-items: center;\n  gap: 15px;\n}\n\n.user-role {\n  opacity: 0.8;\n  font-size: 0.9rem;\n}\n\n.logout-btn {\n  color: white;\n  text-decoration: none;\n  padding: 8px 15px;\n  border-radius: 5px;\n  background: rgba(255,255,255,0.1);\n  transition: all 0.3s ease;\n}\n\n.logout-btn:hover {\n  background: rgba(255,255,255,0.2);\n}\n\n.admin-sidebar {\n  position: fixed;\n  left: 0;\n  top: 70px;\n  width: 250px;\n  height: calc(100vh - 70px);\n  background: #2c3e50;\n  padding: 20px 0;\n  overflow-y: auto;\n}\n\n.admin-sidebar ul {\n  list-style: none;\n  padding: 0;\n  margin: 0;\n}\n\n.admin-sidebar li a {\n  display: flex;\n  align-items: center;\n  gap: 12px;\n  padding: 15px 25px;\n  color: #ecf0f1;\n  text-decoration: none;\n  transition: all 0.3s ease;\n}\n\n.admin-sidebar li a:hover,\n.admin-sidebar li a.active {\n  background: #34495e;\n  border-left: 4px solid #3498db;\n}\n\n.admin-main {\n  margin-left: 250px;\n  padding: 30px;\n  background: #f8f9fa;\n  min-height: calc(100vh - 70px);\n}\n\n.admin-content {\n  max-width: 1400px;\n  margin: 0 auto;\n}\n\n.page-header {\n  margin-bottom: 30px;\n}\n\n.page-header h1 {\n  font-size: 2.5rem;\n  color: #2c3e50;\n  margin-bottom: 10px;\n}\n\n.page-header p {\n  color: #7f8c8d;\n  font-size: 1.1rem;\n}\n\n.flash-messages {\n  margin-bottom: 25px;\n}\n\n.flash-message {\n  padding: 15px 20px;\n  border-radius: 8px;\n  margin-bottom: 15px;\n  font-weight: 500;\n}\n\n.flash-success {\n  background: #d4edda;\n  color: #155724;\n  border: 1px solid #c3e6cb;\n}\n\n.flash-error {\n  background: #f8d7da;\n  color: #721c24;\n  border: 1px solid #f5c6cb;\n}\n\n.bookings-stats {\n  display: grid;\n  grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));\n  gap: 20px;\n  margin-bottom: 30px;\n}\n\n.stat-card {\n  background: white;\n  padding: 25px;\n  border-radius: 12px;\n  box-shadow: 0 2px 10px rgba(0,0,0,0.08);\n  display: flex;\n  align-items: center;\n  gap: 20px;\n}\n\n.stat-icon {\n  width: 60px;\n  height: 60px;\n  border-radius: 12px;\n  display: flex;\n  align-items: center;\n  justify-content: center;\n  font-size: 1.5rem;\n}\n\n.stat-icon.pending {\n  background: #fff3cd;\n  color: #856404;\n}\n\n.stat-icon.confirmed {\n  background: #d4edda;\n  color: #155724;\n}\n\n.stat-icon.cancelled {\n  background: #f8d7da;\n  color: #721c24;\n}\n\n.stat-icon.total {\n  background: #d1ecf1;\n  color: #0c5460;\n}\n\n.stat-info h3 {\n  font-size: 2rem;\n  margin: 0;\n  color: #2c3e50;\n}\n\n.stat-info p {\n  margin: 5px 0 0 0;\n  color: #7f8c8d;\n  font-weight: 500;\n}\n\n.bookings-table-container {\n  background: white;\n  border-radius: 12px;\n  box-shadow: 0 2px 10px rgba(0,0,0,0.08);\n  overflow: hidden;\n}\n\n.table-header {\n  padding: 25px 30px;\n  border-bottom: 1px solid #e9ecef;\n  display: flex;\n  justify-content: space-between;\n  align-items: center;\n}\n\n.table-header h2 {\n  margin: 0;\n  color: #2c3e50;\n}\n\n.filter-controls {\n  display: flex;\n  flex-wrap: wrap;\n  gap: 10px;\n  align-items: center;\n}\n\n.filter-controls select,\n.filter-controls input {\n  padding: 8px 15px;\n  border: 2px solid #e9ecef;\n  border-radius: 6px;\n  font-size: 0.95rem;\n}\n\n.filter-controls label {\n  display: flex;\n  align-items: center;\n  gap: 6px;\n  color: #7f8c8d;\n  font-size: 0.9rem;\n}\n\n.btn-filter {\n  padding: 8px 15px;\n  border: none;\n  border-radius: 6px;\n  background: #3498db;\n  color: white;\n  cursor: pointer;\n}\n\n.btn-clear {\n  color: #7f8c8d;\n  text-decoration: none;\n}\n\n.pagination {\n  display: flex;\n  justify-content: space-between;\n  align-items: center;\n  padding: 20px 30px;\n  border-top: 1px solid #e9ecef;\n}\n\n.pagination-info {\n  color: #7f8c8d;\n}\n\n.pagination-links {\n  display: flex;\n  gap: 6px;\n}\n\n.pagination-links a {\n  padding: 6px 12px;\n  border: 2px solid #e9ecef;\n  border-radius: 6px;\n  color: #2c3e50;\n  text-decoration: none;\n}\n\n.pagination-links a.active,\n.pagination-links a:hover {\n  background: #3498db;\n  border-color: #3498db;\n  color: white;\n}\n\n.bulk-actions {\n  display: flex;\n  gap: 10px;\n  align-items: center;\n  padding: 15px 30px;\n  border-bottom: 1px solid #e9ecef;\n}\n\n.bulk-actions select {\n  padding: 8px 15px;\n  border: 2px solid #e9ecef;\n  border-radius: 6px;\n}\n\n.bulk-actions button:disabled {\n  opacity: 0.5;\n  cursor: default;\n}\n\n.bulk-count {\n  color: #7f8c8d;\n}\n\n.table-responsive {\n  overflow-x: auto;\n}\n\n.bookings-table {\n  width: 100%;\n  border-collapse: collapse;\n}\n\n.bookings-table th {\n  background: #f8f9fa;\n  padding: 15px;\n  text-align: left;\n  font-weight: 600;\n  color: #2c3e50;\n  border-bottom: 2px solid #e9ecef;\n}\n\n.bookings-table td {\n  padding: 15px;\n  border-bottom: 1px solid #e9ecef;\n  vertical-align: top;\n}\n\n.status-badge {\n  padding: 5px 12px;\n  border-radius: 20px;\n  font-size: 0.85rem;\n  font-weight: 500;\n  text-transform: uppercase;\n}\n\n.status-pending {\n  background: #fff3cd;\n  color: #856404;\n}\n\n.status-confirmed {\n  background: #d4edda;\n  color: #155724;\n}\n\n.status-cancelled {\n  background: #f8d7da;\n  color: #721c24;\n}\n\n.action-buttons {\n  display: flex;\n  gap: 10px;\n  align-items: center;\n}\n\n.status-form {\n  margin: 0;\n}\n\n.status-select {\n  padding: 6px 10px;\n  border: 2px solid #e9ecef;\n  border-radius: 6px;\n  font-size: 0.85rem;\n  cursor: pointer;\n}\n\n.btn-delete {\n  color: #dc3545;\n  text-decoration: none;\n  padding: 6px 8px;\n  border-radius: 4px;\n  transition: all 0.3s ease;\n}\n\n.btn-delete:hover {\n  background: #dc3545;\n  color: white;\n}\n\n.special-requests-row {\n  background: #f8f9fa;\n}\n\n.special-requests {\n  padding: 15px;\n  font-style: italic;\n  color: #6c757d;\n}\n\n.no-bookings {\n  text-align: center;\n  padding: 60px 30px;\n  color: #6c757d;\n}\n\n.no-bookings i {\n  font-size: 4rem;\n  margin-bottom: 20px;\n  opacity: 0.5;\n}\n\n.no-bookings h3 {\n  margin-bottom: 10px;\n  color: #495057;\n}\n\n@media (max-width: 768px) {\n  .admin-sidebar {\n    transform: translateX(-100%);\n    transition: transform 0.3s ease;\n  }\n  \n  .admin-main {\n    margin-left: 0;\n    padding: 20px;\n  }\n  \n  .admin-nav {\n    flex-direction: column;\n    gap: 10px;\n  }\n  \n  .bookings-stats {\n    grid-template-columns: 1fr;\n  }\n  \n  .table-header {\n    flex-direction: column;\n    gap: 15px;\n    align-items: flex-start;\n  }\n  \n  .action-buttons {\n    flex-direction: column;\n    align-items: flex-start;\n  }\n}\n</style>\n\n</body>\n</html>'
+
+blocks = {}
+debug_info = '7=63&16=65&23=67&28=69&29=71&30=73&39=75&40=77&41=79&42=81&43=83&55=88&57=91&58=95&59=97&72=104&81=106&90=108&99=110&107=112&113=114&114=116&117=118&118=123&121=133&122=135&124=137&125=142&129=152&130=156&133=160&134=164&138=174&139=177&141=180&142=182&143=184&147=186&148=189&155=191&181=195&182=199&183=203&184=205&185=207&186=209&187=211&188=213&189=215&190=217&191=219&192=221&194=223&195=225&198=227&201=229&203=231&204=235&205=239&208=243&209=246&218=249&219=252&222=254&233=259&236=265&237=268&239=271&240=275&242=285&243=288&247=291&251=294&289=300'
\ No newline at end of file
@@ -0,0 +1,60 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'contact.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_asset_url = resolve('asset_url')
+    l_0_url_for = resolve('url_for')
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n<meta name="viewport" content="width=device-width, initial-scale=1.0">\n<title>EXTREMELI SUITES - Contact</title>\n<link rel="icon" type="image/png" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/minlogo.jpg'))
+    yield '">\n\n<!-- Google Fonts -->\n<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@500;600&family=Inter:wght@300;400;500&display=swap" rel="stylesheet">\n\n<!-- Font Awesome -->\n<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css" rel="stylesheet">\n\n<!-- Custom CSS -->\n<link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'css/styles.css'))
+    yield '">\n</head>\n<body>\n\n<header>\n  <div class="logo-container">\n    <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/mainlogo.png'))
+    yield '" alt="EXTREMELI SUITES">\n  </div>\n  <nav class="nav-desktop">\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.index'))
+    yield '">Home</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.about'))
+    yield '">About</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.rooms'))
+    yield '">Rooms</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.booking'))
+    yield '">Booking</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.contact'))
+    yield '" class="active">Contact</a>\n  </nav>\n  <div class="hamburger" id="hamburger">\n    <span></span>\n    <span></span>\n    <span></span>\n  </div>\n  <nav class="nav-mobile" id="navMobile">\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.index'))
+    yield '">Home</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.about'))
+    yield '">About</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.rooms'))
+    yield '">Rooms</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.booking'))
+    yield '">Booking</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.contact'))
+    yield '" class="active">Contact</a>\n  </nav>\n</header>\n\n<section id="contact">\n  <h2 class="section-title">Contact</h2>\n  <form class="contact" method="POST" action="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.contact'))
+    yield '">\n    '
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True)
+    pass
+    yield '\n      '
+    for (l_2_category, l_2_message) in l_1_messages:
+        _loop_vars = {}
+        pass
+        yield '\n        <div class="flash-message flash-'
+        yield escape(l_2_category)
+        yield '">'
+        yield escape(l_2_message)
+        yield '</div>\n      '
+    l_2_category = l_2_message = missing
+    yield '\n    '
+    l_1_messages = missing
+    yield '\n    <input name="name" placeholder="Name" type="text" required>\n    <input name="email" placeholder="Email" type="email" required>\n    <textarea name="message" rows="4" placeholder="Message" required></textarea>\n    <!-- Left empty by people; bots that fill every field are ignored -->\n    <input name="website" type="text" class="form-trap" tabindex="-1" autocomplete="off" aria-hidden="true">\n    <button type="submit" style="padding:12px 25px; background:var(--blue); color:#fff; border:none; cursor:pointer;">Send</button>\n  </form>\n</section>\n\n<footer>\n  &copy; 2026 EXTREMELI SUITES. All Rights Reserved.\n</footer>\n\n<!-- Floating Social + Chat -->\n<div class="social-float">\n  <a class="social-btn" href="https://www.facebook.com/ExtremeliSuites.Inc" target="_blank" title="Facebook"><i class="fab fa-facebook-f"></i></a>\n  <a class="social-btn" href="https://www.instagram.com/extremelisuites/" target="_blank" title="Instagram"><i class="fab fa-instagram"></i></a>\n  <a class="social-btn" href="https://m.me/ExtremeliSuites.Inc/" target="_blank" title="Messenger"><i class="fab fa-facebook-messenger"></i></a>\n  <a class="social-btn" href="https://www.tiktok.com/@extremelisuites" target="_blank" title="TikTok"><i class="fab fa-tiktok"></i></a>\n</div>\n\n<script>\n// Mobile menu toggle\nconst hamburger = document.getElementById(\'hamburger\');\nconst navMobile = document.getElementById(\'navMobile\');\n\nhamburger.addEventListener(\'click\', function() {\n  hamburger.classList.toggle(\'active\');\n  navMobile.classList.toggle(\'active\');\n});\n\n// Close mobile menu when clicking on a link\nnavMobile.querySelectorAll(\'a\').forEach(link => {\n  link.addEventListener(\'click\', () => {\n    hamburger.classList.remove(\'active\');\n    navMobile.classList.remove(\'active\');\n  });\n});\n</script>\n\n</body>\n</html>'
+
+blocks = {}
+debug_info = '7=15&16=17&22=19&25=21&26=23&27=25&28=27&29=29&37=31&38=33&39=35&40=37&41=39&47=41&49=46&50=50'
\ No newline at end of file
@@ -0,0 +1,211 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/feedback.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_asset_url = resolve('asset_url')
+    l_0_url_for = resolve('url_for')
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    l_0_search = resolve('search')
+    l_0_total = resolve('total')
+    l_0_feedback = resolve('feedback')
+    l_0_pages = resolve('pages')
+    l_0_page = resolve('page')
+    l_0_per_page = resolve('per_page')
+    l_0_range = resolve('range')
+    l_0_last_event_id = resolve('last_event_id')
+    try:
+        t_1 = environment.filters['datetime']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'datetime' found.")
+    try:
+        t_2 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    try:
+        t_3 = environment.filters['list']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'list' found.")
+    try:
+        t_4 = environment.filters['max']
+    except KeyError:
+        @internalcode
+        def t_4(*unused):
+            raise TemplateRuntimeError("No filter named 'max' found.")
+    try:
+        t_5 = environment.filters['min']
+    except KeyError:
+        @internalcode
+        def t_5(*unused):
+            raise TemplateRuntimeError("No filter named 'min' found.")
+    try:
+        t_6 = environment.filters['selectattr']
+    except KeyError:
+        @internalcode
+        def t_6(*unused):
+            raise TemplateRuntimeError("No filter named 'selectattr' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n<meta name="viewport" content="width=device-width, initial-scale=1.0">\n<title>Feedback Management - EXTREMELI SUITES Admin</title>\n\n<!-- Google Fonts -->\n<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@500;600&family=Inter:wght@300;400;500&display=swap" rel="stylesheet">\n\n<!-- Font Awesome -->\n<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css" rel="stylesheet">\n\n<!-- Custom CSS -->\n<link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'css/styles.css'))
+    yield '">\n<style>\n.admin-dashboard {\n  min-height: 100vh;\n  background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);\n  padding: 20px;\n}\n\n.admin-header {\n  background: white;\n  padding: 20px;\n  border-radius: 15px;\n  box-shadow: 0 10px 30px rgba(0,0,0,0.1);\n  margin-bottom: 30px;\n  display: flex;\n  justify-content: space-between;\n  align-items: center;\n}\n\n.admin-header h1 {\n  font-family: \'Playfair Display\', serif;\n  color: var(--blue);\n  margin: 0;\n}\n\n.breadcrumb {\n  display: flex;\n  align-items: center;\n  gap: 10px;\n  margin-bottom: 20px;\n  color: var(--muted);\n}\n\n.breadcrumb a {\n  color: var(--blue);\n  text-decoration: none;\n}\n\n.breadcrumb a:hover {\n  text-decoration: underline;\n}\n\n.feedback-container {\n  background: white;\n  border-radius: 15px;\n  box-shadow: 0 10px 30px rgba(0,0,0,0.1);\n  overflow: hidden;\n}\n\n.feedback-header {\n  background: var(--blue);\n  color: white;\n  padding: 20px;\n  display: flex;\n  justify-content: space-between;\n  align-items: center;\n}\n\n.feedback-header h2 {\n  margin: 0;\n  font-family: \'Playfair Display\', serif;\n}\n\n.feedback-search {\n  margin: 10px 0 5px 0;\n  display: flex;\n  gap: 10px;\n  align-items: center;\n}\n\n.feedback-search input {\n  padding: 8px 12px;\n  border: none;\n  border-radius: 6px;\n  min-width: 260px;\n}\n\n.feedback-search a {\n  color: white;\n  font-size: 0.85rem;\n}\n\n.feedback-export {\n  font-size: 0.85rem;\n  opacity: 0.9;\n}\n\n.feedback-export a {\n  color: white;\n}\n\n.feedback-stats {\n  display: flex;\n  gap: 20px;\n}\n\n.stat-item {\n  text-align: center;\n}\n\n.stat-number {\n  font-size: 1.5rem;\n  font-weight: 600;\n}\n\n.stat-label {\n  font-size: 0.85rem;\n  opacity: 0.9;\n}\n\n.feedback-list {\n  max-height: 600px;\n  overflow-y: auto;\n}\n\n.feedback-item {\n  padding: 20px;\n  border-bottom: 1px solid #e9ecef;\n  transition: background 0.3s ease;\n}\n\n.feedback-item:hover {\n  background: #f8f9fa;\n}\n\n.feedback-item:last-child {\n  border-bottom: none;\n}\n\n.feedback-meta {\n  display: flex;\n  justify-content: space-between;\n  align-items: center;\n  margin-bottom: 10px;\n}\n\n.feedback-name {\n  font-weight: 600;\n  color: var(--text);\n}\n\n.feedback-date {\n  color: var(--muted);\n  font-size: 0.9rem;\n}\n\n.feedback-email {\n  color: var(--blue);\n  font-size: 0.9rem;\n  margin-bottom: 10px;\n}\n\n.feedback-message {\n  color: var(--text);\n  line-height: 1.6;\n  margin-bottom: 15px;\n}\n\n.feedback-actions {\n  display: flex;\n  gap: 10px;\n}\n\n.btn-action {\n  padding: 8px 16px;\n  border: none;\n  border-radius: 6px;\n  cursor: pointer;\n  font-size: 0.85rem;\n  transition: all 0.3s ease;\n}\n\n.btn-mark-read {\n  background: #28a745;\n  color: white;\n}\n\n.btn-mark-read:hover {\n  background: #218838;\n}\n\n.btn-delete {\n  background: #dc3545;\n  color: white;\n}\n\n.btn-delete:hover {\n  background: #c82333;\n}\n\n.btn-reply {\n  background: var(--blue);\n  color: white;\n}\n\n.btn-reply:hover {\n  background: var(--accent-dark);\n}\n\n.bulk-actions {\n  display: flex;\n  gap: 10px;\n  align-items: center;\n  padding: 15px 20px;\n  border-bottom: 1px solid #e9ecef;\n}\n\n.bulk-actions select {\n  padding: 8px 12px;\n  border: 1px solid #e9ecef;\n  border-radius: 6px;\n}\n\n.bulk-actions button:disabled {\n  opacity: 0.5;\n  cursor: default;\n}\n\n.pagination {\n  display: flex;\n  justify-content: space-between;\n  align-items: center;\n  padding: 20px;\n  border-top: 1px solid #e9ecef;\n}\n\n.pagination-info {\n  color: var(--muted);\n}\n\n.pagination-links {\n  display: flex;\n  gap: 6px;\n}\n\n.pagination-links a {\n  padding: 6px 12px;\n  border: 2px solid #e9ecef;\n  border-radius: 6px;\n  color: var(--text);\n  text-decoration: none;\n}\n\n.pagination-links a.active,\n.pagination-links a:hover {\n  background: var(--blue);\n  border-color: var(--blue);\n  color: white;\n}\n\n.empty-feedback {\n  text-align: center;\n  padding: 60px 20px;\n  color: var(--muted);\n}\n\n.empty-feedback i {\n  font-size: 4rem;\n  margin-bottom: 20px;\n  opacity: 0.5;\n}\n\n.btn-back {\n  background: var(--blue);\n  color: white;\n  border: none;\n  padding: 10px 20px;\n  border-radius: 8px;\n  cursor: pointer;\n  text-decoration: none;\n  transition: all 0.3s ease;\n  display: inline-flex;\n  align-items: center;\n  gap: 8px;\n}\n\n.btn-back:hover {\n  background: var(--accent-dark);\n  transform: translateY(-2px);\n}\n\n.read {\n  opacity: 0.7;\n  background: #f8f9fa;\n}\n\n.unread {\n  background: #fff3cd;\n  border-left: 4px solid #ffc107;\n}\n\n@media (max-width: 768px) {\n  .feedback-header {\n    flex-direction: column;\n    gap: 15px;\n    text-align: center;\n  }\n  \n  .feedback-stats {\n    justify-content: center;\n  }\n  \n  .feedback-meta {\n    flex-direction: column;\n    align-items: flex-start;\n    gap: 5px;\n  }\n  \n  .feedback-actions {\n    flex-wrap: wrap;\n  }\n}\n.live-notice {\n  background: #fff3cd;\n  color: #856404;\n  border: 1px solid #ffeeba;\n  border-radius: 10px;\n  padding: 12px 20px;\n  margin-bottom: 20px;\n  display: flex;\n  align-items: center;\n  gap: 10px;\n}\n\n.live-notice[hidden] {\n  display: none;\n}\n\n.live-notice a {\n  margin-left: auto;\n  color: #856404;\n  font-weight: 600;\n}\n</style>\n</head>\n<body>\n\n<div class="admin-dashboard">\n  <div class="admin-header">\n    <div>\n      <div class="breadcrumb">\n        <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.dashboard'))
+    yield '">Admin Dashboard</a>\n        <i class="fas fa-chevron-right"></i>\n        <span>Feedback Management</span>\n      </div>\n      <h1>Feedback Management</h1>\n    </div>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.dashboard'))
+    yield '" class="btn-back">\n      <i class="fas fa-arrow-left"></i>\n      Back to Dashboard\n    </a>\n  </div>\n  \n  '
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True)
+    pass
+    yield '\n    '
+    if l_1_messages:
+        pass
+        yield '\n      '
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n        <div class="alert alert-'
+            yield escape(l_2_category)
+            yield '">'
+            yield escape(l_2_message)
+            yield '</div>\n      '
+        l_2_category = l_2_message = missing
+        yield '\n    '
+    yield '\n  '
+    l_1_messages = missing
+    yield '\n  \n  <div class="live-notice" id="liveNotice" hidden>\n    <i class="fas fa-bell"></i> <span></span>\n    <a href="'
+    yield escape((context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.feedback', q=(undefined(name='search') if l_0_search is missing else l_0_search)) if (undefined(name='search') if l_0_search is missing else l_0_search) else context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.feedback')))
+    yield '">Show</a>\n  </div>\n\n  <div class="feedback-container">\n    <div class="feedback-header">\n      <div>\n        <h2>Customer Feedback</h2>\n        <form method="GET" action="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.feedback'))
+    yield '" class="feedback-search">\n          <input type="search" name="q" value="'
+    yield escape((undefined(name='search') if l_0_search is missing else l_0_search))
+    yield '" placeholder="Search name, email or message">\n          '
+    if (undefined(name='search') if l_0_search is missing else l_0_search):
+        pass
+        yield '<a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.feedback'))
+        yield '">Clear</a>'
+    yield '\n        </form>\n        <div class="feedback-export">\n          Export: <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.export_feedback', fmt='csv'))
+    yield '">CSV</a> &middot;\n          <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.export_feedback', fmt='jsonl'))
+    yield '">JSONL</a> &middot;\n          <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.archive', dataset='feedback'))
+    yield '">Archived feedback</a>\n        </div>\n      </div>\n      <div class="feedback-stats">\n        <div class="stat-item">\n          <div class="stat-number">'
+    yield escape((undefined(name='total') if l_0_total is missing else l_0_total))
+    yield '</div>\n          <div class="stat-label">'
+    yield escape(('Matches' if (undefined(name='search') if l_0_search is missing else l_0_search) else 'Total'))
+    yield '</div>\n        </div>\n        <div class="stat-item">\n          <div class="stat-number">'
+    yield escape(t_2(t_3(context.eval_ctx, t_6(context, (undefined(name='feedback') if l_0_feedback is missing else l_0_feedback), 'read', 'equalto', False))))
+    yield '</div>\n          <div class="stat-label">Unread</div>\n        </div>\n        <div class="stat-item">\n          <div class="stat-number">'
+    yield escape(t_2(t_3(context.eval_ctx, t_6(context, (undefined(name='feedback') if l_0_feedback is missing else l_0_feedback), 'read', 'equalto', True))))
+    yield '</div>\n          <div class="stat-label">Read</div>\n        </div>\n      </div>\n    </div>\n    \n    '
+    if (undefined(name='feedback') if l_0_feedback is missing else l_0_feedback):
+        pass
+        yield '\n    <form method="POST" action="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.bulk_feedback'))
+        yield '" id="bulkForm" class="bulk-actions"\n          onsubmit="return this.action.value !== \'delete\' || confirm(\'Delete the selected feedback?\')">\n      <label><input type="checkbox" class="select-all"> Select all</label>\n      <select name="action">\n        <option value="mark_read">Mark as read</option>\n        <option value="delete">Delete</option>\n      </select>\n      <button type="submit" class="btn-action btn-mark-read" disabled>Apply to <span class="bulk-count">0</span> selected</button>\n    </form>\n    '
+    yield '\n\n    <div class="feedback-list">\n      '
+    if (undefined(name='feedback') if l_0_feedback is missing else l_0_feedback):
+        pass
+        yield '\n        '
+        for l_1_item in (undefined(name='feedback') if l_0_feedback is missing else l_0_feedback):
+            _loop_vars = {}
+            pass
+            yield '\n          <div class="feedback-item '
+            if environment.getattr(l_1_item, 'read'):
+                pass
+                yield 'read'
+            else:
+                pass
+                yield 'unread'
+            yield '" data-id="'
+            yield escape(environment.getattr(l_1_item, 'id'))
+            yield '">\n            <div class="feedback-meta">\n              <div>\n                <label class="feedback-name"><input type="checkbox" name="ids" value="'
+            yield escape(environment.getattr(l_1_item, 'id'))
+            yield '" form="bulkForm" class="select-item"> '
+            yield escape(environment.getattr(l_1_item, 'name'))
+            yield '</label>\n                <div class="feedback-email">'
+            yield escape(environment.getattr(l_1_item, 'email'))
+            yield '</div>\n              </div>\n              <div class="feedback-date">'
+            yield escape(t_1(environment.getattr(l_1_item, 'date'), '%B %d, %Y at %I:%M %p'))
+            yield '</div>\n            </div>\n            <div class="feedback-message">'
+            yield escape(environment.getattr(l_1_item, 'message'))
+            yield '</div>\n            <div class="feedback-actions">\n              '
+            if (not environment.getattr(l_1_item, 'read')):
+                pass
+                yield '\n                <form method="POST" action="'
+                yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.mark_read', feedback_id=environment.getattr(l_1_item, 'id'), _loop_vars=_loop_vars))
+                yield '" class="mark-read-form" style="display: inline;">\n                  <button type="submit" class="btn-action btn-mark-read">\n                    <i class="fas fa-check"></i> Mark as Read\n                  </button>\n                </form>\n              '
+            yield '\n              <button class="btn-action btn-reply" onclick="window.location.href=\'mailto:'
+            yield escape(environment.getattr(l_1_item, 'email'))
+            yield '?subject=Re: Your Feedback to EXTREMELI SUITES&body=Dear '
+            yield escape(environment.getattr(l_1_item, 'name'))
+            yield ',%0D%0A%0D%0AThank you for your feedback. We appreciate your input.\'">\n                <i class="fas fa-reply"></i> Reply\n              </button>\n              <form method="POST" action="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.delete_feedback', feedback_id=environment.getattr(l_1_item, 'id'), _loop_vars=_loop_vars))
+            yield '" style="display: inline;" onsubmit="return confirm(\'Are you sure you want to delete this feedback?\')">\n                <button type="submit" class="btn-action btn-delete">\n                  <i class="fas fa-trash"></i> Delete\n                </button>\n              </form>\n            </div>\n          </div>\n        '
+        l_1_item = missing
+        yield '\n        '
+        if ((undefined(name='search') if l_0_search is missing else l_0_search) and ((undefined(name='pages') if l_0_pages is missing else l_0_pages) > 1)):
+            pass
+            yield '\n        <div class="pagination">\n          <span class="pagination-info">\n            Showing '
+            yield escape(((((undefined(name='page') if l_0_page is missing else l_0_page) - 1) * (undefined(name='per_page') if l_0_per_page is missing else l_0_per_page)) + 1))
+            yield '&ndash;'
+            yield escape(((((undefined(name='page') if l_0_page is missing else l_0_page) - 1) * (undefined(name='per_page') if l_0_per_page is missing else l_0_per_page)) + t_2((undefined(name='feedback') if l_0_feedback is missing else l_0_feedback))))
+            yield ' of '
+            yield escape((undefined(name='total') if l_0_total is missing else l_0_total))
+            yield '\n          </span>\n          <div class="pagination-links">\n            '
+            if ((undefined(name='page') if l_0_page is missing else l_0_page) > 1):
+                pass
+                yield '\n            <a href="'
+                yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.feedback', q=(undefined(name='search') if l_0_search is missing else l_0_search), page=((undefined(name='page') if l_0_page is missing else l_0_page) - 1)))
+                yield '"><i class="fas fa-chevron-left"></i> Prev</a>\n            '
+            yield '\n            '
+            for l_1_number in context.call((undefined(name='range') if l_0_range is missing else l_0_range), t_4(environment, [((undefined(name='page') if l_0_page is missing else l_0_page) - 2), 1]), (t_5(environment, [((undefined(name='page') if l_0_page is missing else l_0_page) + 2), (undefined(name='pages') if l_0_pages is missing else l_0_pages)]) + 1)):
+                _loop_vars = {}
+                pass
+                yield '\n            <a href="'
+                yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.feedback', q=(undefined(name='search') if l_0_search is missing else l_0_search), page=l_1_number, _loop_vars=_loop_vars))
+                yield '" '
+                if (l_1_number == (undefined(name='page') if l_0_page is missing else l_0_page)):
+                    pass
+                    yield 'class="active"'
+                yield '>'
+                yield escape(l_1_number)
+                yield '</a>\n            '
+            l_1_number = missing
+            yield '\n            '
+            if ((undefined(name='page') if l_0_page is missing else l_0_page) < (undefined(name='pages') if l_0_pages is missing else l_0_pages)):
+                pass
+                yield '\n            <a href="'
+                yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.feedback', q=(undefined(name='search') if l_0_search is missing else l_0_search), page=((undefined(name='page') if l_0_page is missing else l_0_page) + 1)))
+                yield '">Next <i class="fas fa-chevron-right"></i></a>\n            '
+            yield '\n          </div>\n        </div>\n        '
+        yield '\n      '
+    else:
+        pass
+        yield '\n        '
+        if (undefined(name='search') if l_0_search is missing else l_0_search):
+            pass
+            yield '\n        <div class="empty-feedback">\n          <i class="fas fa-search"></i>\n          <h3>No Matching Feedback</h3>\n          <p>Nothing matches &ldquo;'
+            yield escape((undefined(name='search') if l_0_search is missing else l_0_search))
+            yield '&rdquo;. <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.feedback'))
+            yield '">Show all feedback</a>.</p>\n        </div>\n        '
+        else:
+            pass
+            yield '\n        <div class="empty-feedback">\n          <i class="fas fa-inbox"></i>\n          <h3>No Feedback Yet</h3>\n          <p>Customer feedback will appear here once submitted through the contact form.</p>\n        </div>\n        '
+        yield '\n      '
+    yield "\n    </div>\n  </div>\n</div>\n\n<script>\n// Bulk selection: the checkboxes belong to #bulkForm via their form attribute\nconst bulkForm = document.getElementById('bulkForm');\nif (bulkForm) {\n  const items = Array.from(document.querySelectorAll('.select-item'));\n  const selectAll = bulkForm.querySelector('.select-all');\n  const updateBulk = () => {\n    const selected = items.filter(item => item.checked).length;\n    bulkForm.querySelector('.bulk-count').textContent = selected;\n    bulkForm.querySelector('button').disabled = selected === 0;\n    selectAll.checked = selected === items.length;\n  };\n  items.forEach(item => item.addEventListener('change', updateBulk));\n  selectAll.addEventListener('change', () => {\n    items.forEach(item => { item.checked = selectAll.checked; });\n    updateBulk();\n  });\n}\n\n// Live updates from /admin/events: feedback read or deleted elsewhere\n// changes here too, and new messages are announced. The browser\n// polls again every few seconds, resuming after the last event it received.\nconst liveNotice = document.getElementById('liveNotice');\nlet newFeedback = 0;\nconst events = new EventSource('"
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.events', dataset='feedback', last_event_id=(undefined(name='last_event_id') if l_0_last_event_id is missing else l_0_last_event_id)))
+    yield '\');\nevents.addEventListener(\'feedback\', message => {\n  const change = JSON.parse(message.data);\n  const item = document.querySelector(`.feedback-item[data-id="${change.record.id}"]`);\n  if (change.action === \'created\') {\n    if (item) return;\n    newFeedback += 1;\n    liveNotice.querySelector(\'span\').textContent =\n      `${newFeedback} new message${newFeedback === 1 ? \'\' : \'s\'} since this page was loaded.`;\n    liveNotice.hidden = false;\n  } else if (item && change.action === \'deleted\') {\n    const checkbox = item.querySelector(\'.select-item\');\n    if (checkbox.checked) {\n      checkbox.checked = false;\n      checkbox.dispatchEvent(new Event(\'change\'));\n    }\n    item.remove();\n  } else if (item && change.record.read) {\n    item.classList.replace(\'unread\', \'read\');\n    const form = item.querySelector(\'.mark-read-form\');\n    if (form) form.remove();\n  }\n});\n</script>\n\n</body>\n</html>'
+
+blocks = {}
+debug_info = '15=59&356=61&362=63&369=68&370=71&371=75&378=84&385=86&386=88&387=90&390=96&391=98&392=100&397=102&398=104&401=106&405=108&411=110&412=113&424=116&425=119&426=123&429=132&430=136&432=138&434=140&436=142&437=145&443=148&446=152&454=156&457=159&460=165&461=168&463=171&464=175&466=185&467=188&473=195&477=198&515=207'
\ No newline at end of file
@@ -0,0 +1,264 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/archive.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_asset_url = resolve('asset_url')
+    l_0_session = resolve('session')
+    l_0_user_role = resolve('user_role')
+    l_0_url_for = resolve('url_for')
+    l_0_retention = resolve('retention')
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    l_0_dataset = resolve('dataset')
+    l_0_archived_total = resolve('archived_total')
+    l_0_search = resolve('search')
+    l_0_segments = resolve('segments')
+    l_0_params = resolve('params')
+    l_0_records = resolve('records')
+    l_0_page = resolve('page')
+    l_0_per_page = resolve('per_page')
+    l_0_total = resolve('total')
+    l_0_range = resolve('range')
+    l_0_pages = resolve('pages')
+    try:
+        t_1 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    try:
+        t_2 = environment.filters['max']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'max' found.")
+    try:
+        t_3 = environment.filters['min']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'min' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n<meta name="viewport" content="width=device-width, initial-scale=1.0">\n<title>Archive - EXTREMELI SUITES Admin</title>\n<link rel="icon" type="image/jpeg" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/minlogo.jpg'))
+    yield '">\n\n<!-- Google Fonts -->\n<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@500;600&family=Inter:wght@300;400;500&display=swap" rel="stylesheet">\n\n<!-- Font Awesome -->\n<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css" rel="stylesheet">\n\n<!-- Custom CSS -->\n<link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'css/styles.css'))
+    yield '">\n</head>\n<body>\n\n<header class="admin-header">\n  <div class="admin-nav">\n    <div class="admin-logo">\n      <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/mainlogo.png'))
+    yield '" alt="EXTREMELI SUITES">\n      <span>Admin Panel</span>\n    </div>\n    <div class="admin-user">\n      <i class="fas fa-user-circle"></i>\n      <span>'
+    yield escape(context.call(environment.getattr((undefined(name='session') if l_0_session is missing else l_0_session), 'get'), 'user_name', 'Admin'))
+    yield '</span>\n      <span class="user-role">('
+    yield escape(context.call(environment.getattr(context.call(environment.getattr((undefined(name='user_role') if l_0_user_role is missing else l_0_user_role), 'replace'), '_', ' '), 'title')))
+    yield ')</span>\n      <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.logout'))
+    yield '" class="logout-btn">\n        <i class="fas fa-sign-out-alt"></i> Logout\n      </a>\n    </div>\n  </div>\n</header>\n\n<nav class="admin-sidebar">\n  <ul>\n    <li><a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.dashboard'))
+    yield '"><i class="fas fa-tachometer-alt"></i> Dashboard</a></li>\n    <li><a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.features'))
+    yield '"><i class="fas fa-star"></i> Features</a></li>\n    <li><a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.nearby'))
+    yield '"><i class="fas fa-map-marker-alt"></i> Nearby Places</a></li>\n    <li><a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.feedback'))
+    yield '"><i class="fas fa-comments"></i> Feedback</a></li>\n    <li><a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.bookings'))
+    yield '"><i class="fas fa-calendar-check"></i> Bookings</a></li>\n    <li><a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.archive'))
+    yield '" class="active"><i class="fas fa-archive"></i> Archive</a></li>\n  </ul>\n</nav>\n\n<main class="admin-main">\n  <div class="admin-content">\n    <div class="page-header">\n      <h1><i class="fas fa-archive"></i> Archive</h1>\n      <p>Checked-out and cancelled bookings and read feedback, moved out of the live lists after '
+    yield escape((undefined(name='retention') if l_0_retention is missing else l_0_retention))
+    yield ' days</p>\n    </div>\n\n    '
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True)
+    pass
+    yield '\n      '
+    if l_1_messages:
+        pass
+        yield '\n        <div class="flash-messages">\n          '
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n            <div class="flash-message flash-'
+            yield escape(l_2_category)
+            yield '">\n              '
+            yield escape(l_2_message)
+            yield '\n            </div>\n          '
+        l_2_category = l_2_message = missing
+        yield '\n        </div>\n      '
+    yield '\n    '
+    l_1_messages = missing
+    yield '\n\n    <div class="archive-tabs">\n      <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.archive', dataset='bookings'))
+    yield '" '
+    if ((undefined(name='dataset') if l_0_dataset is missing else l_0_dataset) == 'bookings'):
+        pass
+        yield 'class="active"'
+    yield '><i class="fas fa-calendar-check"></i> Bookings</a>\n      <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.archive', dataset='feedback'))
+    yield '" '
+    if ((undefined(name='dataset') if l_0_dataset is missing else l_0_dataset) == 'feedback'):
+        pass
+        yield 'class="active"'
+    yield '><i class="fas fa-comments"></i> Feedback</a>\n      '
+    if ((undefined(name='user_role') if l_0_user_role is missing else l_0_user_role) == 'admin'):
+        pass
+        yield '\n      <form method="POST" action="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.run_archive', dataset=(undefined(name='dataset') if l_0_dataset is missing else l_0_dataset)))
+        yield '"\n            onsubmit="return confirm(\'Move all records past their retention period into the archive now?\')">\n        <button type="submit" class="btn-filter"><i class="fas fa-box-archive"></i> Archive now</button>\n      </form>\n      '
+    yield '\n    </div>\n\n    <div class="bookings-table-container">\n      <div class="table-header">\n        <h2>'
+    yield escape((undefined(name='archived_total') if l_0_archived_total is missing else l_0_archived_total))
+    yield ' Archived '
+    yield escape(('Bookings' if ((undefined(name='dataset') if l_0_dataset is missing else l_0_dataset) == 'bookings') else 'Messages'))
+    yield '</h2>\n        <form method="GET" action="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.archive'))
+    yield '" class="filter-controls">\n          <input type="hidden" name="dataset" value="'
+    yield escape((undefined(name='dataset') if l_0_dataset is missing else l_0_dataset))
+    yield '">\n          <input type="search" name="q" value="'
+    yield escape((undefined(name='search') if l_0_search is missing else l_0_search))
+    yield '" placeholder="Search name or email">\n          <select name="month">\n            <option value="">All months</option>\n            '
+    for (l_1_value, l_1_entry) in (undefined(name='segments') if l_0_segments is missing else l_0_segments):
+        l_1_month = resolve('month')
+        _loop_vars = {}
+        pass
+        yield '\n            <option value="'
+        yield escape(l_1_value)
+        yield '" '
+        if ((undefined(name='month') if l_1_month is missing else l_1_month) == l_1_value):
+            pass
+            yield 'selected'
+        yield '>'
+        yield escape(l_1_value)
+        yield ' ('
+        yield escape(environment.getattr(l_1_entry, 'records'))
+        yield ')</option>\n            '
+    l_1_value = l_1_entry = l_1_month = missing
+    yield '\n          </select>\n          '
+    if ((undefined(name='dataset') if l_0_dataset is missing else l_0_dataset) == 'bookings'):
+        pass
+        yield '\n          <select name="status">\n            <option value="">All Status</option>\n            '
+        for l_1_value in ['confirmed', 'cancelled']:
+            l_1_status = resolve('status')
+            _loop_vars = {}
+            pass
+            yield '\n            <option value="'
+            yield escape(l_1_value)
+            yield '" '
+            if ((undefined(name='status') if l_1_status is missing else l_1_status) == l_1_value):
+                pass
+                yield 'selected'
+            yield '>'
+            yield escape(context.call(environment.getattr(l_1_value, 'title'), _loop_vars=_loop_vars))
+            yield '</option>\n            '
+        l_1_value = l_1_status = missing
+        yield '\n          </select>\n          '
+    yield '\n          <button type="submit" class="btn-filter"><i class="fas fa-filter"></i> Apply</button>\n          '
+    if (t_1((undefined(name='params') if l_0_params is missing else l_0_params)) > 1):
+        pass
+        yield '\n          <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.archive', dataset=(undefined(name='dataset') if l_0_dataset is missing else l_0_dataset)))
+        yield '" class="btn-clear">Clear</a>\n          '
+    yield '\n        </form>\n      </div>\n\n      '
+    if (undefined(name='records') if l_0_records is missing else l_0_records):
+        pass
+        yield '\n      <div class="table-responsive">\n        <table class="bookings-table">\n          <thead>\n            <tr>\n              <th>ID</th>\n              <th>'
+        yield escape(('Guest Name' if ((undefined(name='dataset') if l_0_dataset is missing else l_0_dataset) == 'bookings') else 'Name'))
+        yield '</th>\n              <th>Email</th>\n              '
+        if ((undefined(name='dataset') if l_0_dataset is missing else l_0_dataset) == 'bookings'):
+            pass
+            yield '\n              <th>Phone</th>\n              <th>Room Type</th>\n              <th>Check-in</th>\n              <th>Check-out</th>\n              <th>Guests</th>\n              <th>Status</th>\n              <th>Created</th>\n              '
+        else:
+            pass
+            yield '\n              <th>Message</th>\n              <th>Date</th>\n              '
+        yield '\n            </tr>\n          </thead>\n          <tbody>\n            '
+        for l_1_record in (undefined(name='records') if l_0_records is missing else l_0_records):
+            _loop_vars = {}
+            pass
+            yield '\n            <tr>\n              <td>#'
+            yield escape(environment.getattr(l_1_record, 'id'))
+            yield '</td>\n              <td>'
+            yield escape(environment.getattr(l_1_record, 'name'))
+            yield '</td>\n              <td>'
+            yield escape(environment.getattr(l_1_record, 'email'))
+            yield '</td>\n              '
+            if ((undefined(name='dataset') if l_0_dataset is missing else l_0_dataset) == 'bookings'):
+                pass
+                yield '\n              <td>'
+                yield escape(environment.getattr(l_1_record, 'phone'))
+                yield '</td>\n              <td>'
+                yield escape(context.call(environment.getattr(context.call(environment.getattr((environment.getattr(l_1_record, 'room_type') or ''), 'replace'), '_', ' ', _loop_vars=_loop_vars), 'title'), _loop_vars=_loop_vars))
+                yield '</td>\n              <td>'
+                yield escape(environment.getattr(l_1_record, 'check_in'))
+                yield '</td>\n              <td>'
+                yield escape(environment.getattr(l_1_record, 'check_out'))
+                yield '</td>\n              <td>'
+                yield escape(environment.getattr(l_1_record, 'guests'))
+                yield '</td>\n              <td>\n                <span class="status-badge status-'
+                yield escape(environment.getattr(l_1_record, 'status'))
+                yield '">\n                  '
+                yield escape(context.call(environment.getattr(environment.getattr(l_1_record, 'status'), 'title'), _loop_vars=_loop_vars))
+                yield '\n                </span>\n              </td>\n              <td>'
+                yield escape(environment.getattr(l_1_record, 'created_at'))
+                yield '</td>\n              '
+            else:
+                pass
+                yield '\n              <td>'
+                yield escape(environment.getattr(l_1_record, 'message'))
+                yield '</td>\n              <td>'
+                yield escape(environment.getattr(l_1_record, 'date'))
+                yield '</td>\n              '
+            yield '\n            </tr>\n            '
+            if (((undefined(name='dataset') if l_0_dataset is missing else l_0_dataset) == 'bookings') and environment.getattr(l_1_record, 'special_requests')):
+                pass
+                yield '\n            <tr class="special-requests-row">\n              <td colspan="10">\n                <div class="special-requests">\n                  <strong>Special Requests:</strong> '
+                yield escape(environment.getattr(l_1_record, 'special_requests'))
+                yield '\n                </div>\n              </td>\n            </tr>\n            '
+            yield '\n            '
+        l_1_record = missing
+        yield '\n          </tbody>\n        </table>\n      </div>\n      <div class="pagination">\n        <span class="pagination-info">\n          Showing '
+        yield escape(((((undefined(name='page') if l_0_page is missing else l_0_page) - 1) * (undefined(name='per_page') if l_0_per_page is missing else l_0_per_page)) + 1))
+        yield '&ndash;'
+        yield escape(((((undefined(name='page') if l_0_page is missing else l_0_page) - 1) * (undefined(name='per_page') if l_0_per_page is missing else l_0_per_page)) + t_1((undefined(name='records') if l_0_records is missing else l_0_records))))
+        yield ' of '
+        yield escape((undefined(name='total') if l_0_total is missing else l_0_total))
+        yield '\n        </span>\n        <div class="pagination-links">\n          '
+        if ((undefined(name='page') if l_0_page is missing else l_0_page) > 1):
+            pass
+            yield '\n          <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.archive', page=((undefined(name='page') if l_0_page is missing else l_0_page) - 1), **(undefined(name='params') if l_0_params is missing else l_0_params)))
+            yield '"><i class="fas fa-chevron-left"></i> Prev</a>\n          '
+        yield '\n          '
+        for l_1_number in context.call((undefined(name='range') if l_0_range is missing else l_0_range), t_2(environment, [((undefined(name='page') if l_0_page is missing else l_0_page) - 2), 1]), (t_3(environment, [((undefined(name='page') if l_0_page is missing else l_0_page) + 2), (undefined(name='pages') if l_0_pages is missing else l_0_pages)]) + 1)):
+            _loop_vars = {}
+            pass
+            yield '\n          <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.archive', page=l_1_number, _loop_vars=_loop_vars, **(undefined(name='params') if l_0_params is missing else l_0_params)))
+            yield '" '
+            if (l_1_number == (undefined(name='page') if l_0_page is missing else l_0_page)):
+                pass
+                yield 'class="active"'
+            yield '>'
+            yield escape(l_1_number)
+            yield '</a>\n          '
+        l_1_number = missing
+        yield '\n          '
+        if ((undefined(name='page') if l_0_page is missing else l_0_page) < (undefined(name='pages') if l_0_pages is missing else l_0_pages)):
+            pass
+            yield '\n          <a href="'
+            yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.archive', page=((undefined(name='page') if l_0_page is missing else l_0_page) + 1), **(undefined(name='params') if l_0_params is missing else l_0_params)))
+            yield '">Next <i class="fas fa-chevron-right"></i></a>\n          '
+        yield '\n        </div>\n      </div>\n      '
+    elif (undefined(name='segments') if l_0_segments is missing else l_0_segments):
+        pass
+        yield '\n      <div class="no-bookings">\n        <i class="fas fa-search"></i>\n        <h3>No Matching Records</h3>\n        <p>Try different filters or <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.archive', dataset=(undefined(name='dataset') if l_0_dataset is missing else l_0_dataset)))
+        yield '">clear them</a>.</p>\n      </div>\n      '
+    else:
+        pass
+        yield '\n      <div class="no-bookings">\n        <i class="fas fa-archive"></i>\n        <h3>Nothing Archived Yet</h3>\n        <p>Records are moved here by <code>flask archive</code> once they are '
+        yield escape((undefined(name='retention') if l_0_retention is missing else l_0_retention))
+        yield ' days past check-out, cancellation or reading.</p>\n      </div>\n      '
+    yield '\n    </div>\n  </div>\n</main>\n\n<style>\n.admin-header {\n  background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);\n  color: white;\n  padding: 15px 30px;\n  box-shadow: 0 2px 10px rgba(0,0,0,0.1);\n}\n\n.admin-nav {\n  display: flex;\n  justify-content: space-between;\n  align-items: center;\n}\n\n.admin-logo {\n  display: flex;\n  align-items: center;\n  gap: 15px;\n}\n\n.admin-logo img {\n  height: 40px;\n}\n\n.admin-logo span {\n  font-size: 1.2rem;\n  font-weight: 600;\n}\n\n.admin-user {\n  display: flex;\n  align-items: center;\n  gap: 15px;\n}\n\n.user-role {\n  opacity: 0.8;\n  font-size: 0.9rem;\n}\n\n.logout-btn {\n  color: white;\n  text-decoration: none;\n  padding: 8px 15px;\n  border-radius: 5px;\n  background: rgba(255,255,255,0.1);\n  transition: all 0.3s ease;\n}\n\n.logout-btn:hover {\n  background: rgba(255,255,255,0.2);\n}\n\n.admin-sidebar {\n  position: fixed;\n  left: 0;\n  top: 70px;\n  width: 250px;\n  height: calc(100vh - 70px);\n  background: #2c3e50;\n  padding: 20px 0;\n  overflow-y: auto;\n}\n\n.admin-sidebar ul {\n  list-style: none;\n  padding: 0;\n  margin: 0;\n}\n\n.admin-sidebar li a {\n  display: flex;\n  align-items: center;\n  gap: 12px;\n  padding: 15px 25px;\n  color: #ecf0f1;\n  text-decoration: none;\n  transition: all 0.3s ease;\n}\n\n.admin-sidebar li a:hover,\n.admin-sidebar li a.active {\n  background: #34495e;\n  border-left: 4px solid #3498db;\n}\n\n.admin-main {\n  margin-left: 250px;\n  padding: 30px;\n  background: #f8f9fa;\n  min-height: calc(100vh - 70px);\n}\n\n.admin-content {\n  max-width: 1400px;\n  margin: 0 auto;\n}\n\n.page-header {\n  margin-bottom: 30px;\n}\n\n.page-header h1 {\n  font-size: 2.5rem;\n  color: #2c3e50;\n  margin-bottom: 10px;\n}\n\n.page-header p {\n  color: #7f8c8d;\n  font-size: 1.1rem;\n}\n\n.flash-messages {\n  margin-bottom: 25px;\n}\n\n.flash-message {\n  padding: 15px 20px;\n  border-radius: 8px;\n  margin-bottom: 15px;\n  font-weight: 500;\n}\n\n.flash-success {\n  background: #d4edda;\n  color: #155724;\n  border: 1px solid #c3e6cb;\n}\n\n.flash-error {\n  background: #f8d7da;\n  color: #721c24;\n  border: 1px solid #f5c6cb;\n}\n\n.bookings-stats {\n  display: grid;\n  grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));\n  gap: 20px;\n  margin-bottom: 30px;\n}\n\n.stat-card {\n  background: white;\n  padding: 25px;\n  border-radius: 12px;\n  box-shadow: 0 2px 10px rgba(0,0,0,0.08);\n  display: flex;\n  align-items: center;\n  gap: 20px;\n}\n\n.stat-icon {\n  width: 60px;\n  height: 60px;\n  border-radius: 12px;\n  display: flex;\n  align-items: center;\n  justify-content: center;\n  font-size: 1.5rem;\n}\n\n.stat-icon.pending {\n  background: #fff3cd;\n  color: #856404;\n}\n\n.stat-icon.confirmed {\n  background: #d4edda;\n  color: #155724;\n}\n\n.stat-icon.cancelled {\n  background: #f8d7da;\n  color: #721c24;\n}\n\n.stat-icon.total {\n  background: #d1ecf1;\n  color: #0c5460;\n}\n\n.stat-info h3 {\n  font-size: 2rem;\n  margin: 0;\n  color: #2c3e50;\n}\n\n.stat-info p {\n  margin: 5px 0 0 0;\n  color: #7f8c8d;\n  font-weight: 500;\n}\n\n.bookings-table-container {\n  background: white;\n  border-radius: 12px;\n  box-shadow: 0 2px 10px rgba(0,0,0,0.08);\n  overflow: hidden;\n}\n\n.table-header {\n  padding: 25px 30px;\n  border-bottom: 1px solid #e9ecef;\n  display: flex;\n  justify-content: space-between;\n  align-items: center;\n}\n\n.table-header h2 {\n  margin: 0;\n  color: #2c3e50;\n}\n\n.filter-controls {\n  display: flex;\n  flex-wrap: wrap;\n  gap: 10px;\n  align-items: center;\n}\n\n.filter-controls select,\n.filter-controls input {\n  padding: 8px 15px;\n  border: 2px solid #e9ecef;\n  border-radius: 6px;\n  font-size: 0.95rem;\n}\n\n.filter-controls label {\n  display: flex;\n  align-items: center;\n  gap: 6px;\n  color: #7f8c8d;\n  font-size: 0.9rem;\n}\n\n.btn-filter {\n  padding: 8px 15px;\n  border: none;\n  border-radius: 6px;\n  background: #3498db;\n  color: white;\n  cursor: pointer;\n}\n\n.btn-clear {\n  color: #7f8c8d;\n  text-decoration: none;\n}\n\n.pagination {\n  display: flex;\n  justify-content: space-between;\n  align-items: center;\n  padding: 20px 30px;\n  border-top: 1px solid #e9ecef;\n}\n\n.pagination-info {\n  color: #7f8c8d;\n}\n\n.pagination-links {\n  display: flex;\n  gap: 6px;\n}\n\n.pagination-links a {\n  padding: 6px 12px;\n  border: 2px solid #e9ecef;\n  border-radius: 6px;\n  color: #2c3e50;\n  text-decoration: none;\n}\n\n.pagination-links a.active,\n.pagination-links a:hover {\n  background: #3498db;\n  border-color: #3498db;\n  color: white;\n}\n\n.bulk-actions {\n  display: flex;\n  gap: 10px;\n  align-items: center;\n  padding: 15px 30px;\n  border-bottom: 1px solid #e9ecef;\n}\n\n.bulk-actions select {\n  padding: 8px 15px;\n  border: 2px solid #e9ecef;\n  border-radius: 6px;\n}\n\n.bulk-actions button:disabled {\n  opacity: 0.5;\n  cursor: default;\n}\n\n.bulk-count {\n  color: #7f8c8d;\n}\n\n.table-responsive {\n  overflow-x: auto;\n}\n\n.bookings-table {\n  width: 100%;\n  border-collapse: collapse;\n}\n\n.bookings-table th {\n  background: #f8f9fa;\n  padding: 15px;\n  text-align: left;\n  font-weight: 600;\n  color: #2c3e50;\n  border-bottom: 2px solid #e9ecef;\n}\n\n.bookings-table td {\n  padding: 15px;\n  border-bottom: 1px solid #e9ecef;\n  vertical-align: top;\n}\n\n.status-badge {\n  padding: 5px 12px;\n  border-radius: 20px;\n  font-size: 0.85rem;\n  font-weight: 500;\n  text-transform: uppercase;\n}\n\n.status-pending {\n  background: #fff3cd;\n  color: #856404;\n}\n\n.status-confirmed {\n  background: #d4edda;\n  color: #155724;\n}\n\n.status-cancelled {\n  background: #f8d7da;\n  color: #721c24;\n}\n\n.action-buttons {\n  display: flex;\n  gap: 10px;\n  align-items: center;\n}\n\n.status-form {\n  margin: 0;\n}\n\n.status-select {\n  padding: 6px 10px;\n  border: 2px solid #e9ecef;\n  border-radius: 6px;\n  font-size: 0.85rem;\n  cursor: pointer;\n}\n\n.btn-delete {\n  color: #dc3545;\n  text-decoration: none;\n  padding: 6px 8px;\n  border-radius: 4px;\n  transition: all 0.3s ease;\n}\n\n.btn-delete:hover {\n  background: #dc3545;\n  color: white;\n}\n\n.special-requests-row {\n  background: #f8f9fa;\n}\n\n.special-requests {\n  padding: 15px;\n  font-style: italic;\n  color: #6c757d;\n}\n\n.no-bookings {\n  text-align: center;\n  padding: 60px 30px;\n  color: #6c757d;\n}\n\n.no-bookings i {\n  font-size: 4rem;\n  margin-bottom: 20px;\n  opacity: 0.5;\n}\n\n.no-bookings h3 {\n  margin-bottom: 10px;\n  color: #495057;\n}\n\n.archive-tabs {\n  display: flex;\n  gap: 10px;\n  align-items: center;\n  margin-bottom: 20px;\n}\n\n.archive-tabs a {\n  padding: 8px 15px;\n  border: 2px solid #e9ecef;\n  border-radius: 6px;\n  background: white;\n  color: #2c3e50;\n  text-decoration: none;\n}\n\n.archive-tabs a.active {\n  background: #3498db;\n  border-color: #3498db;\n  color: white;\n}\n\n.archive-tabs form {\n  margin: 0 0 0 auto;\n}\n\n@media (max-width: 768px) {\n  .admin-sidebar {\n    transform: translateX(-100%);\n    transition: transform 0.3s ease;\n  }\n  \n  .admin-main {\n    margin-left: 0;\n    padding: 20px;\n  }\n  \n  .admin-nav {\n    flex-direction: column;\n    gap: 10px;\n  }\n  \n  .bookings-stats {\n    grid-template-columns: 1fr;\n  }\n  \n  .table-header {\n    flex-direction: column;\n    gap: 15px;\n    align-items: flex-start;\n  }\n  \n  .action-buttons {\n    flex-direction: column;\n    align-items: flex-start;\n  }\n}\n</style>\n\n</body>\n</html>'
+
+blocks = {}
+debug_info = '7=47&16=49&23=51&28=53&29=55&30=57&39=59&40=61&41=63&42=65&43=67&44=69&52=71&56=76&58=79&59=83&60=85&68=92&69=98&70=104&71=107&80=110&81=114&82=116&83=118&86=120&87=125&90=137&93=140&94=145&99=156&100=159&105=162&111=165&113=167&128=174&130=178&131=180&132=182&133=184&134=187&135=189&136=191&137=193&138=195&140=197&141=199&144=201&146=206&147=208&150=211&154=214&165=219&168=225&169=228&171=231&172=235&174=245&175=248&179=251&183=254&189=259'
\ No newline at end of file
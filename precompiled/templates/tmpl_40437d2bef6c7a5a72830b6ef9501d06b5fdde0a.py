@@ -0,0 +1,158 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/dashboard.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_asset_url = resolve('asset_url')
+    l_0_session = resolve('session')
+    l_0_url_for = resolve('url_for')
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    l_0_stats = resolve('stats')
+    l_0_upcoming = l_0_recent = missing
+    try:
+        t_1 = environment.filters['format']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'format' found.")
+    try:
+        t_2 = environment.filters['min']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'min' found.")
+    try:
+        t_3 = environment.filters['safe']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'safe' found.")
+    try:
+        t_4 = environment.tests['none']
+    except KeyError:
+        @internalcode
+        def t_4(*unused):
+            raise TemplateRuntimeError("No test named 'none' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n<meta name="viewport" content="width=device-width, initial-scale=1.0">\n<title>Admin Dashboard - EXTREMELI SUITES</title>\n\n<!-- Google Fonts -->\n<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@500;600&family=Inter:wght@300;400;500&display=swap" rel="stylesheet">\n\n<!-- Font Awesome -->\n<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css" rel="stylesheet">\n\n<!-- Custom CSS -->\n<link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'css/styles.css'))
+    yield '">\n<style>\n.admin-dashboard {\n  min-height: 100vh;\n  background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);\n  padding: 20px;\n}\n\n.admin-header {\n  background: white;\n  padding: 20px;\n  border-radius: 15px;\n  box-shadow: 0 10px 30px rgba(0,0,0,0.1);\n  margin-bottom: 30px;\n  display: flex;\n  justify-content: space-between;\n  align-items: center;\n}\n\n.admin-header h1 {\n  font-family: \'Playfair Display\', serif;\n  color: var(--blue);\n  margin: 0;\n}\n\n.admin-nav {\n  display: grid;\n  grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));\n  gap: 20px;\n  margin-bottom: 30px;\n}\n\n.admin-card {\n  background: white;\n  padding: 30px;\n  border-radius: 15px;\n  box-shadow: 0 10px 30px rgba(0,0,0,0.1);\n  text-align: center;\n  transition: all 0.3s ease;\n  cursor: pointer;\n  text-decoration: none;\n  color: inherit;\n}\n\n.admin-card:hover {\n  transform: translateY(-5px);\n  box-shadow: 0 20px 40px rgba(0,0,0,0.15);\n}\n\n.admin-card i {\n  font-size: 3rem;\n  color: var(--blue);\n  margin-bottom: 15px;\n}\n\n.admin-card h3 {\n  font-family: \'Playfair Display\', serif;\n  color: var(--text);\n  margin-bottom: 10px;\n}\n\n.admin-card p {\n  color: var(--muted);\n  margin: 0;\n}\n\n.analytics-panel {\n  background: white;\n  padding: 25px;\n  border-radius: 15px;\n  box-shadow: 0 10px 30px rgba(0,0,0,0.1);\n  margin-bottom: 30px;\n}\n\n.analytics-panel h2 {\n  font-family: \'Playfair Display\', serif;\n  color: var(--blue);\n  margin: 0 0 20px 0;\n}\n\n.analytics-stats {\n  display: grid;\n  grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));\n  gap: 15px;\n  margin-bottom: 25px;\n}\n\n.analytics-stat {\n  background: #f8f9fa;\n  border-radius: 10px;\n  padding: 15px;\n}\n\n.analytics-stat strong {\n  display: block;\n  font-size: 1.8rem;\n  color: var(--text);\n}\n\n.analytics-stat span {\n  color: var(--muted);\n  font-size: 0.9rem;\n}\n\n.occupancy-chart {\n  display: flex;\n  align-items: flex-end;\n  gap: 3px;\n  height: 100px;\n  margin-bottom: 25px;\n  border-bottom: 1px solid #e9ecef;\n}\n\n.occupancy-chart div {\n  flex: 1;\n  background: var(--blue);\n  border-radius: 3px 3px 0 0;\n  min-height: 2px;\n}\n\n.analytics-table {\n  width: 100%;\n  border-collapse: collapse;\n}\n\n.analytics-table th,\n.analytics-table td {\n  padding: 10px;\n  text-align: left;\n  border-bottom: 1px solid #e9ecef;\n}\n\n.analytics-table th {\n  color: var(--muted);\n  font-weight: 500;\n}\n\n.btn-logout {\n  background: var(--blue);\n  color: white;\n  border: none;\n  padding: 10px 20px;\n  border-radius: 8px;\n  cursor: pointer;\n  text-decoration: none;\n  transition: all 0.3s ease;\n}\n\n.btn-logout:hover {\n  background: var(--accent-dark);\n  transform: translateY(-2px);\n}\n\n.alert {\n  padding: 12px;\n  border-radius: 8px;\n  margin-bottom: 20px;\n}\n\n.alert-success {\n  background: #d4edda;\n  color: #155724;\n  border: 1px solid #c3e6cb;\n}\n\n.alert-error {\n  background: #f8d7da;\n  color: #721c24;\n  border: 1px solid #f5c6cb;\n}\n\n.alert-info {\n  background: #d1ecf1;\n  color: #0c5460;\n  border: 1px solid #bee5eb;\n}\n</style>\n</head>\n<body>\n\n<div class="admin-dashboard">\n  <div class="admin-header">\n    <div>\n      <h1>Admin Dashboard</h1>\n      <p style="margin: 5px 0 0 0; color: #6c757d;">Welcome back, '
+    yield escape(context.call(environment.getattr((undefined(name='session') if l_0_session is missing else l_0_session), 'get'), 'user_name', 'Admin'))
+    yield ' ('
+    yield escape(context.call(environment.getattr(context.call(environment.getattr(context.call(environment.getattr((undefined(name='session') if l_0_session is missing else l_0_session), 'get'), 'user_role', 'admin'), 'replace'), '_', ' '), 'title')))
+    yield ')</p>\n    </div>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.logout'))
+    yield '" class="btn-logout">Logout</a>\n  </div>\n  \n  '
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True)
+    pass
+    yield '\n    '
+    if l_1_messages:
+        pass
+        yield '\n      '
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n        <div class="alert alert-'
+            yield escape(l_2_category)
+            yield '">'
+            yield escape(l_2_message)
+            yield '</div>\n      '
+        l_2_category = l_2_message = missing
+        yield '\n    '
+    yield '\n  '
+    l_1_messages = missing
+    yield '\n  \n  '
+    l_0_upcoming = environment.getattr((undefined(name='stats') if l_0_stats is missing else l_0_stats), 'upcoming')
+    context.vars['upcoming'] = l_0_upcoming
+    context.exported_vars.add('upcoming')
+    yield '\n  '
+    l_0_recent = environment.getattr((undefined(name='stats') if l_0_stats is missing else l_0_stats), 'recent')
+    context.vars['recent'] = l_0_recent
+    context.exported_vars.add('recent')
+    yield '\n  <div class="analytics-panel">\n    <h2>Occupancy &amp; Bookings</h2>\n    <div class="analytics-stats">\n      <div class="analytics-stat">\n        <strong>'
+    yield escape(t_1('%.0f', (environment.getattr(environment.getattr((undefined(name='upcoming') if l_0_upcoming is missing else l_0_upcoming), 'totals'), 'occupancy') * 100)))
+    yield '%</strong>\n        <span>Occupancy, next '
+    yield escape(environment.getattr((undefined(name='upcoming') if l_0_upcoming is missing else l_0_upcoming), 'days'))
+    yield ' days</span>\n      </div>\n      <div class="analytics-stat">\n        <strong>'
+    yield escape(environment.getattr(environment.getattr((undefined(name='upcoming') if l_0_upcoming is missing else l_0_upcoming), 'totals'), 'nights'))
+    yield '</strong>\n        <span>Room nights booked ('
+    yield escape(environment.getattr(environment.getattr((undefined(name='upcoming') if l_0_upcoming is missing else l_0_upcoming), 'totals'), 'confirmed_nights'))
+    yield ' confirmed)</span>\n      </div>\n      <div class="analytics-stat">\n        <strong>'
+    yield escape(environment.getattr(environment.getattr((undefined(name='recent') if l_0_recent is missing else l_0_recent), 'totals'), 'bookings'))
+    yield '</strong>\n        <span>Bookings made, last '
+    yield escape(environment.getattr((undefined(name='recent') if l_0_recent is missing else l_0_recent), 'days'))
+    yield ' days</span>\n      </div>\n      <div class="analytics-stat">\n        <strong>&#8369;'
+    yield escape(context.call(environment.getattr('{:,.0f}', 'format'), environment.getattr(environment.getattr((undefined(name='recent') if l_0_recent is missing else l_0_recent), 'totals'), 'revenue')))
+    yield '</strong>\n        <span>Booked revenue, last '
+    yield escape(environment.getattr((undefined(name='recent') if l_0_recent is missing else l_0_recent), 'days'))
+    yield ' days</span>\n      </div>\n      <div class="analytics-stat">\n        <strong>'
+    yield escape(t_1('%.0f', (environment.getattr(environment.getattr((undefined(name='recent') if l_0_recent is missing else l_0_recent), 'totals'), 'cancellation_rate') * 100)))
+    yield '%</strong>\n        <span>Cancellation rate</span>\n      </div>\n      <div class="analytics-stat">\n        <strong>'
+    yield escape((environment.getattr(environment.getattr((undefined(name='recent') if l_0_recent is missing else l_0_recent), 'totals'), 'avg_lead_days') if (not t_4(environment.getattr(environment.getattr((undefined(name='recent') if l_0_recent is missing else l_0_recent), 'totals'), 'avg_lead_days'))) else Markup('&ndash;')))
+    yield '</strong>\n        <span>Average lead time (days)</span>\n      </div>\n    </div>\n\n    <div class="occupancy-chart" title="Daily occupancy, next '
+    yield escape(environment.getattr((undefined(name='upcoming') if l_0_upcoming is missing else l_0_upcoming), 'days'))
+    yield ' days">\n      '
+    for l_1_day in environment.getattr((undefined(name='upcoming') if l_0_upcoming is missing else l_0_upcoming), 'daily'):
+        _loop_vars = {}
+        pass
+        yield '\n      <div style="height: '
+        yield escape(t_1('%.0f', (t_2(environment, [environment.getattr(l_1_day, 'occupancy'), 1]) * 100)))
+        yield '%" title="'
+        yield escape(environment.getattr(l_1_day, 'date'))
+        yield ': '
+        yield escape(t_1('%.0f', (environment.getattr(l_1_day, 'occupancy') * 100)))
+        yield '%"></div>\n      '
+    l_1_day = missing
+    yield '\n    </div>\n\n    <table class="analytics-table">\n      <thead>\n        <tr>\n          <th>Room type</th>\n          <th>Rooms</th>\n          <th>Occupancy (next '
+    yield escape(environment.getattr((undefined(name='upcoming') if l_0_upcoming is missing else l_0_upcoming), 'days'))
+    yield ' days)</th>\n          <th>Nights booked</th>\n          <th>Bookings (last '
+    yield escape(environment.getattr((undefined(name='recent') if l_0_recent is missing else l_0_recent), 'days'))
+    yield ' days)</th>\n          <th>Revenue</th>\n          <th>Cancelled</th>\n          <th>Avg. lead time</th>\n        </tr>\n      </thead>\n      <tbody>\n        '
+    for (l_1_room_type, l_1_stay) in context.call(environment.getattr(environment.getattr((undefined(name='upcoming') if l_0_upcoming is missing else l_0_upcoming), 'room_types'), 'items')):
+        l_1_room_type_names = resolve('room_type_names')
+        l_1_made = missing
+        _loop_vars = {}
+        pass
+        yield '\n        '
+        l_1_made = environment.getitem(environment.getattr((undefined(name='recent') if l_0_recent is missing else l_0_recent), 'room_types'), l_1_room_type)
+        _loop_vars['made'] = l_1_made
+        yield '\n        <tr>\n          <td>'
+        yield escape(context.call(environment.getattr((undefined(name='room_type_names') if l_1_room_type_names is missing else l_1_room_type_names), 'get'), l_1_room_type, l_1_room_type, _loop_vars=_loop_vars))
+        yield '</td>\n          <td>'
+        yield escape(environment.getattr(l_1_stay, 'rooms'))
+        yield '</td>\n          <td>'
+        yield escape(t_1('%.0f', (environment.getattr(l_1_stay, 'occupancy') * 100)))
+        yield '%</td>\n          <td>'
+        yield escape(environment.getattr(l_1_stay, 'nights'))
+        yield '</td>\n          <td>'
+        yield escape(environment.getattr((undefined(name='made') if l_1_made is missing else l_1_made), 'bookings'))
+        yield '</td>\n          <td>&#8369;'
+        yield escape(context.call(environment.getattr('{:,.0f}', 'format'), environment.getattr((undefined(name='made') if l_1_made is missing else l_1_made), 'revenue'), _loop_vars=_loop_vars))
+        yield '</td>\n          <td>'
+        yield escape(t_1('%.0f', (environment.getattr((undefined(name='made') if l_1_made is missing else l_1_made), 'cancellation_rate') * 100)))
+        yield '%</td>\n          <td>'
+        yield escape((markup_join((environment.getattr((undefined(name='made') if l_1_made is missing else l_1_made), 'avg_lead_days'), ' days', )) if (not t_4(environment.getattr((undefined(name='made') if l_1_made is missing else l_1_made), 'avg_lead_days'))) else Markup('&ndash;')))
+        yield '</td>\n        </tr>\n        '
+    l_1_room_type = l_1_stay = l_1_made = l_1_room_type_names = missing
+    yield '\n      </tbody>\n    </table>\n  </div>\n\n  <div class="admin-nav">\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.features'))
+    yield '" class="admin-card">\n      <i class="fas fa-star"></i>\n      <h3>Manage Features</h3>\n      <p>Add, edit, or delete feature cards</p>\n    </a>\n    \n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.nearby'))
+    yield '" class="admin-card">\n      <i class="fas fa-map-marker-alt"></i>\n      <h3>Manage Nearby Places</h3>\n      <p>Add, edit, or delete nearby attractions</p>\n    </a>\n    \n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.feedback'))
+    yield '" class="admin-card">\n      <i class="fas fa-comments"></i>\n      <h3>View Feedback</h3>\n      <p>Read and manage customer feedback</p>\n    </a>\n    \n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.bookings'))
+    yield '" class="admin-card">\n      <i class="fas fa-calendar-check"></i>\n      <h3>Manage Bookings</h3>\n      <p>View and manage booking requests</p>\n    </a>\n    \n    '
+    if (context.call(environment.getattr((undefined(name='session') if l_0_session is missing else l_0_session), 'get'), 'user_role') == 'admin'):
+        pass
+        yield '\n    <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.index'))
+        yield '" class="admin-card" target="_blank">\n      <i class="fas fa-eye"></i>\n      <h3>View Website</h3>\n      <p>Open the main website in new tab</p>\n    </a>\n    '
+    yield '\n  </div>\n</div>\n\n</body>\n</html>'
+
+blocks = {}
+debug_info = '15=42&199=44&201=48&205=53&206=56&207=60&212=69&213=73&218=77&219=79&222=81&223=83&226=85&227=87&230=89&231=91&234=93&238=95&243=97&244=99&245=103&254=111&256=113&263=115&264=121&266=124&267=126&268=128&269=130&270=132&271=134&272=136&273=138&281=142&287=144&293=146&299=148&305=150&306=153'
\ No newline at end of file
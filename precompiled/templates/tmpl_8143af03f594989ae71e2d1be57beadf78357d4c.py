@@ -0,0 +1,54 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'about.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_asset_url = resolve('asset_url')
+    l_0_url_for = resolve('url_for')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n<meta name="viewport" content="width=device-width, initial-scale=1.0">\n<title>EXTREMELI SUITES - About</title>\n<link rel="icon" type="image/jpeg" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/minlogo.jpg'))
+    yield '">\n\n<!-- Google Fonts -->\n<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@500;600&family=Inter:wght@300;400;500&display=swap" rel="stylesheet">\n\n<!-- Font Awesome -->\n<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css" rel="stylesheet">\n\n<!-- Custom CSS -->\n<link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'css/styles.css'))
+    yield '">\n</head>\n<body>\n\n<header>\n  <div class="logo-container">\n    <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/mainlogo.png'))
+    yield '" alt="EXTREMELI SUITES">\n  </div>\n  <nav class="nav-desktop">\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.index'))
+    yield '">Home</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.about'))
+    yield '" class="active">About</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.rooms'))
+    yield '">Rooms</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.booking'))
+    yield '">Booking</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.contact'))
+    yield '">Contact</a>\n  </nav>\n  <div class="hamburger" id="hamburger">\n    <span></span>\n    <span></span>\n    <span></span>\n  </div>\n  <nav class="nav-mobile" id="navMobile">\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.index'))
+    yield '">Home</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.about'))
+    yield '" class="active">About</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.rooms'))
+    yield '">Rooms</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.booking'))
+    yield '">Booking</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.contact'))
+    yield '">Contact</a>\n  </nav>\n</header>\n\n<section id="about">\n  <div class="container">\n    \n    <h2 class="section-title">Welcome to EXTREMELI SUITES</h2>\n    \n    <div class="about">\n      <div class="about-content">\n        <div class="about-intro">\n          <h3>Your Perfect Urban Retreat</h3>\n          <p>\n            Founded in May 2015, Extremeli Suites began with a vision to redefine hospitality in the heart of the city. What started with 72 carefully designed rooms has blossomed into a premier destination for travelers seeking comfort, convenience, and exceptional service.\n          </p>\n        </div>\n        \n        <div class="about-features">\n          <div class="feature-item">\n            <i class="fas fa-star"></i>\n            <div>\n              <h4>Service Excellence</h4>\n              <p>Our dedicated team goes above and beyond to ensure every stay exceeds your expectations.</p>\n            </div>\n          </div>\n          \n          <div class="feature-item">\n            <i class="fas fa-shield-alt"></i>\n            <div>\n              <h4>Professional Management</h4>\n              <p>Years of expertise in hospitality ensure seamless operations and guest satisfaction.</p>\n            </div>\n          </div>\n          \n          <div class="feature-item">\n            <i class="fas fa-heart"></i>\n            <div>\n              <h4>Guest-Centric Approach</h4>\n              <p>Your comfort and satisfaction are at the heart of everything we do.</p>\n            </div>\n          </div>\n        </div>\n        \n      </div>\n      \n      <div class="about-img slideshow-container">\n        <div class="slide fade">\n          <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/lobby.jpg'))
+    yield '" alt="Hotel Lobby">\n        </div>\n        <div class="slide fade">\n          <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/lobby2.jpg'))
+    yield '" alt="Hotel Lobby">\n        </div>\n        <div class="slide fade">\n          <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/pool.jpg'))
+    yield '" alt="Hotel Pool">\n        </div>\n      </div>\n    </div>\n    \n    <div class="about-cta">\n      <h3>Ready to experience the Extremeli difference?</h3>\n      <p>Discover the perfect blend of luxury, comfort, and exceptional service that sets us apart. Whether you\'re traveling for business or leisure, our dedicated team is committed to making your stay unforgettable.</p>\n      <div class="cta-features">\n        <span><i class="fas fa-check-circle"></i> Premium Amenities</span>\n        <span><i class="fas fa-check-circle"></i> Personalized Service</span>\n        <span><i class="fas fa-check-circle"></i> Prime Location</span>\n        <span><i class="fas fa-check-circle"></i> Exceptional Value</span>\n      </div>\n      <div class="cta-buttons">\n        <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.rooms'))
+    yield '" class="btn-primary">Explore Our Rooms</a>\n        <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.contact'))
+    yield '" class="btn-secondary">Contact Us</a>\n      </div>\n    </div>\n    \n    \n    \n    <div class="about-manager">\n      <div class="manager-card">\n        <div class="manager-image">\n          <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/gm.jpg'))
+    yield '" alt="General Manager Camille Lucena">\n        </div>\n        <div class="manager-info">\n          <h3>Meet Our General Manager</h3>\n          <h4>Camille Lucena</h4>\n          <p>With over 15 years of hospitality excellence, Camille Lucena leads Extremeli Suites with a vision of unparalleled guest service and operational excellence. Her commitment to creating memorable experiences ensures that every guest feels valued and cared for during their stay.</p>\n          <div class="manager-credentials">\n            <span><i class="fas fa-award"></i> Hospitality Management Degree</span>\n            <span><i class="fas fa-certificate"></i> Certified Hotel Administrator</span>\n            <span><i class="fas fa-users"></i> 15+ Years Experience</span>\n          </div>\n        </div>\n      </div>\n    </div>\n    \n  </div>\n</section>\n\n<footer>\n  © 2026 EXTREMELI SUITES. All Rights Reserved.\n</footer>\n\n<!-- Floating Social + Chat -->\n<div class="social-float">\n  <a class="social-btn" href="https://www.facebook.com/ExtremeliSuites.Inc" target="_blank" title="Facebook"><i class="fab fa-facebook-f"></i></a>\n  <a class="social-btn" href="https://www.instagram.com/extremelisuites/" target="_blank" title="Instagram"><i class="fab fa-instagram"></i></a>\n  <a class="social-btn" href="https://m.me/ExtremeliSuites.Inc/" target="_blank" title="Messenger"><i class="fab fa-facebook-messenger"></i></a>\n  <a class="social-btn" href="https://www.tiktok.com/@extremelisuites" target="_blank" title="TikTok"><i class="fab fa-tiktok"></i></a>\n</div>\n\n\n<script>\n// Mobile menu toggle\nconst hamburger = document.getElementById(\'hamburger\');\nconst navMobile = document.getElementById(\'navMobile\');\n\nhamburger.addEventListener(\'click\', function() {\n  hamburger.classList.toggle(\'active\');\n  navMobile.classList.toggle(\'active\');\n});\n\n// Close mobile menu when clicking on a link\nnavMobile.querySelectorAll(\'a\').forEach(link => {\n  link.addEventListener(\'click\', () => {\n    hamburger.classList.remove(\'active\');\n    navMobile.classList.remove(\'active\');\n  });\n});\n\n// Slideshow functionality\nlet slideIndex = 0;\nshowSlides();\n\nfunction showSlides() {\n  let slides = document.getElementsByClassName("slide");\n  for (let i = 0; i < slides.length; i++) {\n    slides[i].style.display = "none";\n  }\n  slideIndex++;\n  if (slideIndex > slides.length) {slideIndex = 1}\n  slides[slideIndex-1].style.display = "block";\n  setTimeout(showSlides, 7000); // Change image every 7 seconds\n}\n</script>\n\n</body>\n</html>'
+
+blocks = {}
+debug_info = '7=14&16=16&22=18&25=20&26=22&27=24&28=26&29=28&37=30&38=32&39=34&40=36&41=38&89=40&92=42&95=44&110=46&111=48&120=50'
\ No newline at end of file
@@ -0,0 +1,14 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'sample website.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n<meta name="viewport" content="width=device-width, initial-scale=1.0">\n<title>EXTREMELI SUITES</title>\n\n<!-- Google Fonts -->\n<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@500;600&family=Inter:wght@300;400;500&display=swap" rel="stylesheet">\n\n<!-- Font Awesome -->\n<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css" rel="stylesheet">\n\n<style>\n:root{\n  --white:#ffffff;\n  --soft:#f6f8fb;\n  --blue:#4a90e2;\n  --yellow:#fdd835;\n  --accent:#d9e8f6;\n  --accent-dark:#a7c6e6;\n  --text:#1c2430;\n  --muted:#6b7280;\n}\n\n/* Reset */\n*{margin:0; padding:0; box-sizing:border-box;}\nbody{font-family:\'Inter\', sans-serif; background:var(--white); color:var(--text);}\n\n/* HEADER */\nheader{\n  position:fixed;\n  top:0;\n  width:100%;\n  padding:20px 60px;\n  display:flex;\n  justify-content:space-between;\n  align-items:center;\n  background:rgba(255,255,255,0.95);\n  backdrop-filter:blur(12px);\n  border-radius:0 0 20px 20px;\n  box-shadow:0 8px 25px rgba(0,0,0,0.08);\n  z-index:1000;\n  transition:background 0.3s ease;\n}\n\n.logo-container{\n  display:flex;\n  align-items:center;\n  gap:12px;\n}\n\n.logo-container img{\n  height:60px;\n  object-fit:contain;\n  border-radius:12px;\n  box-shadow:0 4px 12px rgba(0,0,0,0.1);\n}\n\n.hotel-name{\n  font-family:\'Playfair Display\', serif;\n  font-weight:600;\n  font-size:1.5rem;\n  color:var(--text);\n  letter-spacing:1px;\n}\n\nnav a{\n  margin-left:36px;\n  text-decoration:none;\n  color:var(--text);\n  font-size:1rem;\n  font-weight:500;\n  padding:8px 14px;\n  border-radius:12px;\n  transition:all 0.3s ease;\n}\n\nnav a:hover{\n  background:var(--blue);\n  color:var(--white);\n  transform:translateY(-2px);\n  box-shadow:0 4px 12px rgba(0,0,0,0.1);\n}\n\n/* HERO */\n.hero{\n  height:100vh;\n  display:flex;\n  align-items:center;\n  justify-content:center;\n  text-align:center;\n  background:linear-gradient(to bottom, var(--blue), var(--soft));\n  color:var(--white);\n}\n\n.hero h1{\n  font-family:\'Playfair Display\', serif;\n  font-size:4rem;\n  margin-bottom:10px;\n}\n\n.hero p{\n  letter-spacing:5px;\n  font-size:1rem;\n  color:var(--black);\n}\n\n/* SECTIONS */\nsection{padding:120px 80px;}\n.section-title{\n  font-family:\'Playfair Display\', serif;\n  font-size:2.5rem;\n  text-align:center;\n  margin-bottom:70px;\n  color:var(--blue);\n}\n\n/* ABOUT */\n.about{\n  max-width:1100px;\n  margin:auto;\n  display:grid;\n  grid-template-columns:1fr 1fr;\n  gap:80px;\n  align-items:center;\n}\n\n.about-img{\n  height:360px;\n  border-radius:22px;\n  background:#eaeaea;\n  display:flex;\n  justify-content:center;\n  align-items:center;\n  overflow:hidden;\n}\n\n.about-img img{\n  width:100%;\n  height:100%;\n  object-fit:cover;\n  border-radius:22px;\n}\n\n/* ROOMS */\n.rooms{\n  display:grid;\n  grid-template-columns:repeat(auto-fit,minmax(280px,1fr));\n  gap:40px;\n}\n\n.room{\n  background:#fff;\n  border-radius:24px;\n  overflow:hidden;\n  box-shadow:0 25px 60px rgba(0,0,0,0.06);\n  transition:transform 0.3s;\n}\n\n.room:hover{transform:translateY(-5px);}\n.room img{width:100%; height:230px; object-fit:cover;}\n.room div{padding:26px; font-weight:500; font-family:\'Inter\',sans-serif;}\n\n/* GALLERY */\n.gallery{\n  display:grid;\n  grid-template-columns:repeat(auto-fit,minmax(240px,1fr));\n  gap:24px;\n}\n\n.gallery img{\n  width:100%;\n  height:230px;\n  object-fit:cover;\n  border-radius:22px;\n  transition:transform 0.3s;\n}\n\n.gallery img:hover{transform:scale(1.05);}\n\n/* CONTACT */\n.contact{\n  max-width:700px;\n  margin:auto;\n  background:#fff;\n  padding:55px;\n  border-radius:30px;\n  box-shadow:0 30px 70px rgba(0,0,0,0.08);\n}\n\n.contact input,\n.contact textarea{\n  width:100%;\n  padding:15px;\n  border:1px solid #e5e7eb;\n  margin-bottom:18px;\n  font-size:0.9rem;\n}\n\n/* FOOTER */\nfooter{\n  padding:50px;\n  text-align:center;\n  font-size:0.85rem;\n  color:var(--muted);\n  border-top:1px solid #eee;\n}\n\n/* FLOATING SOCIAL + CHAT */\n.social-float{\n  position:fixed;\n  right:28px;\n  bottom:28px;\n  display:flex;\n  flex-direction:column;\n  gap:14px;\n  z-index:999;\n}\n\n.social-btn, .ai-btn{\n  width:50px;\n  height:50px;\n  border-radius:50%;\n  display:flex;\n  align-items:center;\n  justify-content:center;\n  color:#1f2937;\n  text-decoration:none;\n  font-size:1.2rem;\n  box-shadow:0 12px 30px rgba(0,0,0,0.15);\n  cursor:pointer;\n  transition:all 0.3s ease;\n}\n\n.social-btn{\n  background:var(--white);\n  backdrop-filter:blur(10px);\n}\n\n.social-btn:hover, .ai-btn:hover{\n  transform:translateY(-3px);\n}\n\n.ai-btn{\n  background:var(--yellow);\n}\n\n.ai-btn img{\n  width:28px;\n  height:28px;\n}\n\n/* AI CHAT BOX */\n.chat-box{\n  position:fixed;\n  right:90px;\n  bottom:28px;\n  width:340px;\n  background:#fff;\n  border-radius:26px;\n  box-shadow:0 40px 80px rgba(0,0,0,0.2);\n  display:none;\n  flex-direction:column;\n  z-index:1000;\n}\n\n.chat-header{\n  padding:18px;\n  font-family:\'Playfair Display\', serif;\n  border-bottom:1px solid #eee;\n}\n\n.chat-body{\n  padding:18px;\n  height:240px;\n  overflow:auto;\n  font-size:0.9rem;\n}\n\n.chat-input{\n  display:flex;\n  border-top:1px solid #eee;\n}\n\n.chat-input input{\n  flex:1;\n  padding:14px;\n  border:none;\n}\n\n.chat-input button{\n  padding:14px 20px;\n  border:none;\n  background:var(--blue);\n  color:var(--white);\n  cursor:pointer;\n}\n\n/* RESPONSIVE */\n@media(max-width:900px){\n  header{padding:20px 30px;}\n  section{padding:100px 30px;}\n  .about{grid-template-columns:1fr;}\n}\n</style>\n</head>\n<body>\n\n<header>\n  <div class="logo-container">\n    <img src="logo.png" alt="EXTREMELI SUITES">\n    <span class="hotel-name"></span>\n  </div>\n  <nav>\n    <a href="#home">Home</a>\n    <a href="#about">About</a>\n    <a href="#rooms">Rooms</a>\n    <a href="#gallery">Gallery</a>\n    <a href="#contact">Contact</a>\n  </nav>\n</header>\n\n<section class="hero" id="home">\n  <div>\n    <h1>EXTREMELI SUITES</h1>\n    <p>REFINED • TRANQUIL • TIMELESS</p>\n  </div>\n</section>\n\n<section id="about">\n  <h2 class="section-title">About</h2>\n  <div class="about">\n    <p>\nAbout Extremeli Suites: Founded in May 2015, Extremeli Suites started with 72 rooms and a vision to provide exceptional hospitality. We offer thoughtfully designed rooms, serviced residences, and commercial spaces. Our pillars of Service Excellence, Professional Management, and Guest Satisfaction ensure a seamless experience for every guest.\n    </p>\n    <div class="about-img">\n      <img src="pool.png" alt="Hotel Pool">\n    </div>\n  </div>\n</section>\n\n<section id="rooms">\n  <h2 class="section-title">Rooms & Suites</h2>\n  <div class="rooms">\n    <div class="room">\n      <img src="deluxe a1.png" alt="Deluxe A Room">\n      <div>Deluxe A Room (Without Balcony)</div>\n    </div>\n    <div class="room">\n      <img src="deluxe b1.png" alt="Deluxe B Room">\n      <div>Deluxe B (With Balcony)</div>\n    </div>\n    <div class="room">\n      <img src="jsc.png" alt="junior suites c">\n      <div>junior suites c</div>\n    </div>\n  </div>\n</section>\n\n<section id="gallery">\n  <h2 class="section-title">Gallery</h2>\n  <div class="gallery">\n    <img src="resto.png" alt="Gallery Image 1">\n    <img src="resto1.png" alt="Gallery Image 2">\n    <img src="lobby.png" alt="Gallery Image 3">\n    <img src="lobby2.png" alt="Gallery Image 4">\n  </div>\n</section>\n\n<section id="contact">\n  <h2 class="section-title">Contact</h2>\n  <div class="contact">\n    <input placeholder="Name" type="text">\n    <input placeholder="Email" type="email">\n    <textarea rows="4" placeholder="Message"></textarea>\n    <button style="padding:12px 25px; background:var(--blue); color:#fff; border:none; cursor:pointer;">Send</button>\n  </div>\n</section>\n\n<footer>\n  © 2026 EXTREMELI SUITES. All Rights Reserved.\n</footer>\n\n<!-- Floating Social + Chat -->\n<div class="social-float">\n  <a class="social-btn" href="https://www.facebook.com/ExtremeliSuites.Inc" target="_blank" title="Facebook"><i class="fab fa-facebook-f"></i></a>\n  <a class="social-btn" href="https://instagram.com" target="_blank" title="Instagram"><i class="fab fa-instagram"></i></a>\n  <a class="social-btn" href="https://m.me" target="_blank" title="Messenger"><i class="fab fa-facebook-messenger"></i></a>\n  <div class="ai-btn" onclick="toggleChat()">\n    <img src="chaticon.png" alt="Chat Concierge">\n  </div>\n</div>\n\n<!-- AI Chat Box -->\n<div class="chat-box" id="chatBox">\n  <div class="chat-header">AI Concierge</div>\n  <div class="chat-body" id="chatBody">\n    Welcome to Extremeli Suites! How may I assist you today?\n  </div>\n  <div class="chat-input">\n    <input id="chatInput" placeholder="Type your message...">\n    <button onclick="sendMsg()">Send</button>\n  </div>\n</div>\n\n<script>\nfunction toggleChat(){\n  const box = document.getElementById(\'chatBox\');\n  box.style.display = box.style.display === \'flex\' ? \'none\' : \'flex\';\n}\nfunction sendMsg(){\n  const input = document.getElementById(\'chatInput\');\n  const body = document.getElementById(\'chatBody\');\n  if(!input.value.trim()) return;\n  body.innerHTML += `<br><strong>You:</strong> ${input.value}`;\n  body.innerHTML += `<br><strong>Concierge:</strong> Thank you for your inquiry. Our team will assist you shortly.`;\n  input.value=\'\';\n  body.scrollTop = body.scrollHeight;\n}\n</script>\n\n</body>\n</html>'
+
+blocks = {}
+debug_info = ''
\ No newline at end of file
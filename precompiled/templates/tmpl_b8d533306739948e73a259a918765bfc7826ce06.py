@@ -0,0 +1,57 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/edit_nearby.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_asset_url = resolve('asset_url')
+    l_0_url_for = resolve('url_for')
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    l_0_place = resolve('place')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n<meta name="viewport" content="width=device-width, initial-scale=1.0">\n<title>Edit Nearby Place - EXTREMELI SUITES</title>\n\n<!-- Google Fonts -->\n<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@500;600&family=Inter:wght@300;400;500&display=swap" rel="stylesheet">\n\n<!-- Font Awesome -->\n<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css" rel="stylesheet">\n\n<!-- Custom CSS -->\n<link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'css/styles.css'))
+    yield '">\n<style>\n.admin-container {\n  min-height: 100vh;\n  background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);\n  padding: 20px;\n}\n\n.admin-header {\n  background: white;\n  padding: 20px;\n  border-radius: 15px;\n  box-shadow: 0 10px 30px rgba(0,0,0,0.1);\n  margin-bottom: 30px;\n  display: flex;\n  justify-content: space-between;\n  align-items: center;\n}\n\n.admin-header h1 {\n  font-family: \'Playfair Display\', serif;\n  color: var(--blue);\n  margin: 0;\n}\n\n.admin-nav {\n  display: flex;\n  gap: 15px;\n}\n\n.admin-nav a {\n  background: var(--blue);\n  color: white;\n  padding: 10px 20px;\n  border-radius: 8px;\n  text-decoration: none;\n  transition: all 0.3s ease;\n}\n\n.admin-nav a:hover {\n  background: var(--accent-dark);\n  transform: translateY(-2px);\n}\n\n.form-container {\n  background: white;\n  padding: 40px;\n  border-radius: 15px;\n  box-shadow: 0 10px 30px rgba(0,0,0,0.1);\n  max-width: 600px;\n  margin: 0 auto;\n}\n\n.form-group {\n  margin-bottom: 25px;\n}\n\n.form-group label {\n  display: block;\n  margin-bottom: 8px;\n  font-weight: 500;\n  color: var(--text);\n}\n\n.form-group input,\n.form-group textarea {\n  width: 100%;\n  padding: 12px;\n  border: 1px solid #ddd;\n  border-radius: 8px;\n  font-size: 1rem;\n}\n\n.form-group input:focus,\n.form-group textarea:focus {\n  outline: none;\n  border-color: var(--blue);\n  box-shadow: 0 0 0 3px rgba(54, 116, 181, 0.1);\n}\n\n.form-group textarea {\n  resize: vertical;\n  min-height: 100px;\n}\n\n.btn-submit {\n  background: var(--blue);\n  color: white;\n  padding: 12px 24px;\n  border: none;\n  border-radius: 8px;\n  cursor: pointer;\n  font-size: 1rem;\n  transition: all 0.3s ease;\n}\n\n.btn-submit:hover {\n  background: var(--accent-dark);\n  transform: translateY(-2px);\n}\n\n.btn-cancel {\n  background: #6c757d;\n  color: white;\n  padding: 12px 24px;\n  border: none;\n  border-radius: 8px;\n  cursor: pointer;\n  font-size: 1rem;\n  text-decoration: none;\n  display: inline-block;\n  margin-left: 10px;\n  transition: all 0.3s ease;\n}\n\n.btn-cancel:hover {\n  background: #5a6268;\n  transform: translateY(-2px);\n}\n\n.alert {\n  padding: 12px;\n  border-radius: 8px;\n  margin-bottom: 20px;\n}\n\n.alert-success {\n  background: #d4edda;\n  color: #155724;\n  border: 1px solid #c3e6cb;\n}\n\n.alert-error {\n  background: #f8d7da;\n  color: #721c24;\n  border: 1px solid #f5c6cb;\n}\n</style>\n</head>\n<body>\n\n<div class="admin-container">\n  <div class="admin-header">\n    <h1>Edit Nearby Place</h1>\n    <div class="admin-nav">\n      <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.nearby'))
+    yield '">Back to Nearby Places</a>\n      <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.dashboard'))
+    yield '">Dashboard</a>\n      <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.logout'))
+    yield '">Logout</a>\n    </div>\n  </div>\n  \n  '
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True)
+    pass
+    yield '\n    '
+    if l_1_messages:
+        pass
+        yield '\n      '
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n        <div class="alert alert-'
+            yield escape(l_2_category)
+            yield '">'
+            yield escape(l_2_message)
+            yield '</div>\n      '
+        l_2_category = l_2_message = missing
+        yield '\n    '
+    yield '\n  '
+    l_1_messages = missing
+    yield '\n  \n  <div class="form-container">\n    <form method="POST" enctype="multipart/form-data">\n      <div class="form-group">\n        <label for="title">Place Name</label>\n        <input type="text" id="title" name="title" value="'
+    yield escape(environment.getattr((undefined(name='place') if l_0_place is missing else l_0_place), 'title'))
+    yield '" required>\n      </div>\n      \n      <div class="form-group">\n        <label for="description">Description</label>\n        <textarea id="description" name="description" required>'
+    yield escape(environment.getattr((undefined(name='place') if l_0_place is missing else l_0_place), 'description'))
+    yield '</textarea>\n      </div>\n      \n      <div class="form-group">\n        <label>Current Image</label>\n        <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), ('images/' + environment.getattr((undefined(name='place') if l_0_place is missing else l_0_place), 'image'))))
+    yield '" alt="" style="max-width: 200px; border-radius: 8px; display: block;">\n      </div>\n      \n      <div class="form-group">\n        <label for="image_file">Replace With Upload</label>\n        <input type="file" id="image_file" name="image_file" accept="image/jpeg,image/png,image/gif,image/webp">\n        <small style="color: var(--muted);">JPEG, PNG, GIF or WebP, up to 8 MB</small>\n      </div>\n      \n      <div class="form-group">\n        <label for="image">Image Filename</label>\n        <input type="text" id="image" name="image" value="'
+    yield escape(environment.getattr((undefined(name='place') if l_0_place is missing else l_0_place), 'image'))
+    yield '">\n        <small style="color: var(--muted);">Image should be in static/images/ folder</small>\n      </div>\n      \n      <div class="form-group">\n        <label for="distance">Distance</label>\n        <input type="text" id="distance" name="distance" value="'
+    yield escape(environment.getattr((undefined(name='place') if l_0_place is missing else l_0_place), 'distance'))
+    yield '" required>\n        <small style="color: var(--muted);">Format: X.X km • Y min walk/drive</small>\n      </div>\n      \n      <div>\n        <button type="submit" class="btn-submit">Update Place</button>\n        <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.nearby'))
+    yield '" class="btn-cancel">Cancel</a>\n      </div>\n    </form>\n  </div>\n</div>\n\n</body>\n</html>'
+
+blocks = {}
+debug_info = '15=16&160=18&161=20&162=22&167=27&168=30&169=34&178=43&183=45&188=47&199=49&205=51&211=53'
\ No newline at end of file
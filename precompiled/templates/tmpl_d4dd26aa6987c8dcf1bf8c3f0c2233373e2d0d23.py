@@ -0,0 +1,72 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'booking.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_asset_url = resolve('asset_url')
+    l_0_url_for = resolve('url_for')
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n<meta name="viewport" content="width=device-width, initial-scale=1.0">\n<title>EXTREMELI SUITES - Book Your Stay</title>\n<link rel="icon" type="image/jpeg" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/minlogo.jpg'))
+    yield '">\n\n<!-- Google Fonts -->\n<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@500;600&family=Inter:wght@300;400;500&display=swap" rel="stylesheet">\n\n<!-- Font Awesome -->\n<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css" rel="stylesheet">\n\n<!-- Custom CSS -->\n<link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'css/styles.css'))
+    yield '">\n</head>\n<body>\n\n<header>\n  <div class="logo-container">\n    <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/mainlogo.png'))
+    yield '" alt="EXTREMELI SUITES">\n  </div>\n  <nav class="nav-desktop">\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.index'))
+    yield '">Home</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.about'))
+    yield '">About</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.rooms'))
+    yield '">Rooms</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.booking'))
+    yield '" class="active">Booking</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.contact'))
+    yield '">Contact</a>\n  </nav>\n  <div class="hamburger" id="hamburger">\n    <span></span>\n    <span></span>\n    <span></span>\n  </div>\n  <nav class="nav-mobile" id="navMobile">\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.index'))
+    yield '">Home</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.about'))
+    yield '">About</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.rooms'))
+    yield '">Rooms</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.booking'))
+    yield '" class="active">Booking</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.contact'))
+    yield '">Contact</a>\n  </nav>\n</header>\n\n<section class="booking-section">\n  <div class="container">\n    <div class="booking-header">\n      <h1>Book Your Perfect Stay</h1>\n      <p>Reserve your room at Extremeli Suites for an unforgettable experience</p>\n    </div>\n\n    '
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True)
+    pass
+    yield '\n      '
+    if l_1_messages:
+        pass
+        yield '\n        <div class="flash-messages">\n          '
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n            <div class="flash-message flash-'
+            yield escape(l_2_category)
+            yield '">\n              '
+            yield escape(l_2_message)
+            yield '\n            </div>\n          '
+        l_2_category = l_2_message = missing
+        yield '\n        </div>\n      '
+    yield '\n    '
+    l_1_messages = missing
+    yield '\n\n    <div class="booking-form-container">\n      <form method="POST" action="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.booking'))
+    yield '" class="booking-form">\n        <div class="form-row">\n          <div class="form-group">\n            <label for="name">Full Name *</label>\n            <input type="text" id="name" name="name" required placeholder="John Doe">\n          </div>\n          <div class="form-group">\n            <label for="email">Email Address *</label>\n            <input type="email" id="email" name="email" required placeholder="john@example.com">\n          </div>\n        </div>\n\n        <div class="form-row">\n          <div class="form-group">\n            <label for="phone">Phone Number *</label>\n            <input type="tel" id="phone" name="phone" required placeholder="+63 912 345 6789">\n          </div>\n          <div class="form-group">\n            <label for="room_type">Room Type *</label>\n            <select id="room_type" name="room_type" required>\n              <option value="">Select a room type</option>\n              <option value="deluxe_a">Deluxe Room A</option>\n              <option value="deluxe_b">Deluxe Room B</option>\n              <option value="suite">Executive Suite</option>\n              <option value="family">Family Room</option>\n            </select>\n          </div>\n        </div>\n\n        <div class="form-row">\n          <div class="form-group">\n            <label for="check_in">Check-in Date *</label>\n            <input type="date" id="check_in" name="check_in" required>\n          </div>\n          <div class="form-group">\n            <label for="check_out">Check-out Date *</label>\n            <input type="date" id="check_out" name="check_out" required>\n          </div>\n        </div>\n\n        <div class="availability-status" id="availabilityStatus" hidden></div>\n        <div class="price-quote" id="priceQuote" hidden></div>\n\n        <div class="form-row">\n          <div class="form-group">\n            <label for="guests">Number of Guests *</label>\n            <select id="guests" name="guests" required>\n              <option value="">Select number of guests</option>\n              <option value="1">1 Guest</option>\n              <option value="2">2 Guests</option>\n              <option value="3">3 Guests</option>\n              <option value="4">4 Guests</option>\n              <option value="5">5 Guests</option>\n              <option value="6">6 Guests</option>\n            </select>\n          </div>\n          <div class="form-group">\n            <label for="special_requests">Special Requests</label>\n            <textarea id="special_requests" name="special_requests" rows="4" placeholder="Any special requests or preferences? (e.g., late check-in, dietary requirements, etc.)"></textarea>\n          </div>\n        </div>\n\n        <!-- Left empty by people; bots that fill every field are ignored -->\n        <input name="website" type="text" class="form-trap" tabindex="-1" autocomplete="off" aria-hidden="true">\n\n        <div class="form-actions">\n          <button type="submit" class="btn-primary">\n            <i class="fas fa-calendar-check"></i> Submit Booking Request\n          </button>\n          <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.rooms'))
+    yield '" class="btn-secondary">\n            <i class="fas fa-arrow-left"></i> Back to Rooms\n          </a>\n        </div>\n      </form>\n    </div>\n\n    <div class="booking-info">\n      <div class="info-card">\n        <i class="fas fa-info-circle"></i>\n        <h3>Booking Information</h3>\n        <ul>\n          <li>Check-in time: 2:00 PM</li>\n          <li>Check-out time: 12:00 PM</li>\n          <li>Valid ID required upon check-in</li>\n          <li>Confirmation will be sent via email</li>\n        </ul>\n      </div>\n      \n      <div class="info-card">\n        <i class="fas fa-phone"></i>\n        <h3>Need Assistance?</h3>\n        <p>For immediate booking assistance, call us at:</p>\n        <p class="contact-number">+63 2 1234 5678</p>\n        <p>Or email us at: booking@extremelisuites.com</p>\n      </div>\n    </div>\n  </div>\n</section>\n\n<footer>\n  © 2026 EXTREMELI SUITES. All Rights Reserved.\n</footer>\n\n<!-- Floating Social + Chat -->\n<div class="social-float">\n  <a class="social-btn" href="https://www.facebook.com/ExtremeliSuites.Inc" target="_blank" title="Facebook"><i class="fab fa-facebook-f"></i></a>\n  <a class="social-btn" href="https://www.instagram.com/extremelisuites/" target="_blank" title="Instagram"><i class="fab fa-instagram"></i></a>\n  <a class="social-btn" href="https://m.me/ExtremeliSuites.Inc/" target="_blank" title="Messenger"><i class="fab fa-facebook-messenger"></i></a>\n  <a class="social-btn" href="https://www.tiktok.com/@extremelisuites_" target="_blank" title="TikTok"><i class="fab fa-tiktok"></i></a>\n</div>\n\n<!-- AI Chat Box -->\n<div class="chat-box" id="chatBox">\n  <div class="chat-header">AI Concierge</div>\n  <div class="chat-body" id="chatBody">\n    Welcome to Extremeli Suites! How may I assist you with your booking today?\n  </div>\n  <div class="chat-input">\n    <input id="chatInput" placeholder="Type your message...">\n    <button onclick="sendMsg()">Send</button>\n  </div>\n</div>\n\n<script>\n// Set minimum date to today\ndocument.addEventListener(\'DOMContentLoaded\', function() {\n  const today = new Date().toISOString().split(\'T\')[0];\n  document.getElementById(\'check_in\').setAttribute(\'min\', today);\n  document.getElementById(\'check_out\').setAttribute(\'min\', today);\n  \n  // Ensure check-out is after check-in\n  document.getElementById(\'check_in\').addEventListener(\'change\', function() {\n    const checkInDate = this.value;\n    document.getElementById(\'check_out\').setAttribute(\'min\', checkInDate);\n  });\n\n  [\'room_type\', \'check_in\', \'check_out\'].forEach(function(id) {\n    document.getElementById(id).addEventListener(\'change\', checkAvailability);\n    document.getElementById(id).addEventListener(\'change\', updateQuote);\n  });\n\n  loadRates();\n});\n\n// Nightly rates from /api/rates with running totals, so a stay is priced\n// here as the guest picks dates; /api/quote answers while the table is\n// loading or for dates it doesn\'t cover\nlet rateTable = null;\nlet quoteRequest = 0;\n\nfunction dayNumber(isoDate) {\n  return Math.round(Date.parse(isoDate + \'T00:00:00Z\') / 86400000);\n}\n\nfunction loadRates() {\n  fetch(\''
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.api_rates'))
+    yield "')\n    .then(response => response.json())\n    .then(table => {\n      const prefix = {};\n      Object.keys(table.nightly).forEach(function(roomType) {\n        const totals = [0];\n        table.nightly[roomType].forEach(rate => totals.push(totals[totals.length - 1] + rate));\n        prefix[roomType] = totals;\n      });\n      rateTable = {start: dayNumber(table.start), currency: table.currency, prefix: prefix};\n      updateQuote();\n    })\n    .catch(() => {});\n}\n\nfunction localQuote(roomType, checkIn, checkOut) {\n  const prefix = rateTable && rateTable.prefix[roomType];\n  if (!prefix) return null;\n  const first = dayNumber(checkIn) - rateTable.start;\n  const last = dayNumber(checkOut) - rateTable.start;\n  if (first < 0 || last >= prefix.length) return null;\n  const total = prefix[last] - prefix[first];\n  return {nights: last - first, total: total, average_rate: total / (last - first), currency: rateTable.currency};\n}\n\nfunction showQuote(quote) {\n  const element = document.getElementById('priceQuote');\n  const money = new Intl.NumberFormat('en-PH', {style: 'currency', currency: quote.currency, maximumFractionDigits: 0});\n  element.hidden = false;\n  element.textContent = `${money.format(quote.total)} for ${quote.nights} night${quote.nights === 1 ? '' : 's'}` +\n    (quote.nights > 1 ? ` (avg ${money.format(quote.average_rate)}/night)` : '');\n}\n\nfunction updateQuote() {\n  const roomType = document.getElementById('room_type').value;\n  const checkIn = document.getElementById('check_in').value;\n  const checkOut = document.getElementById('check_out').value;\n  const element = document.getElementById('priceQuote');\n  const requestId = ++quoteRequest;\n\n  if (!roomType || !checkIn || !checkOut || checkOut <= checkIn) {\n    element.hidden = true;\n    return;\n  }\n\n  const quote = localQuote(roomType, checkIn, checkOut);\n  if (quote) {\n    showQuote(quote);\n    return;\n  }\n\n  const params = new URLSearchParams({room_type: roomType, check_in: checkIn, check_out: checkOut});\n  fetch('"
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.api_quote'))
+    yield "?' + params)\n    .then(response => response.json())\n    .then(data => {\n      if (requestId !== quoteRequest) return;\n      if (data.error) {\n        element.hidden = true;\n        return;\n      }\n      showQuote(data);\n    })\n    .catch(() => { element.hidden = true; });\n}\n\n// Live availability for the selected room type and dates\nlet availabilityRequest = 0;\n\nfunction checkAvailability() {\n  const roomType = document.getElementById('room_type').value;\n  const checkIn = document.getElementById('check_in').value;\n  const checkOut = document.getElementById('check_out').value;\n  const status = document.getElementById('availabilityStatus');\n\n  if (!roomType || !checkIn || !checkOut || checkOut <= checkIn) {\n    status.hidden = true;\n    return;\n  }\n\n  const requestId = ++availabilityRequest;\n  const params = new URLSearchParams({room_type: roomType, check_in: checkIn, check_out: checkOut});\n  fetch('"
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.api_availability'))
+    yield "?' + params)\n    .then(response => response.json())\n    .then(data => {\n      if (requestId !== availabilityRequest || data.error) return;\n      const rooms = data.available[roomType];\n      status.hidden = false;\n      status.className = 'availability-status ' + (rooms > 0 ? 'available' : 'unavailable');\n      status.textContent = rooms > 0\n        ? `${rooms} room${rooms === 1 ? '' : 's'} available for ${data.nights} night${data.nights === 1 ? '' : 's'}`\n        : 'Fully booked for these dates. Please try other dates or another room type.';\n    })\n    .catch(() => { status.hidden = true; });\n}\n\nfunction toggleChat(){\n  const box = document.getElementById('chatBox');\n  box.style.display = box.style.display === 'flex' ? 'none' : 'flex';\n}\n\nfunction sendMsg(){\n  const input = document.getElementById('chatInput');\n  const body = document.getElementById('chatBody');\n  if(!input.value.trim()) return;\n  body.innerHTML += `<br><strong>You:</strong> ${input.value}`;\n  body.innerHTML += `<br><strong>Concierge:</strong> Thank you for your booking inquiry. Our team will assist you with your reservation.`;\n  input.value='';\n  body.scrollTop = body.scrollHeight;\n}\n\n// Mobile menu toggle\nconst hamburger = document.getElementById('hamburger');\nconst navMobile = document.getElementById('navMobile');\n\nhamburger.addEventListener('click', function() {\n  hamburger.classList.toggle('active');\n  navMobile.classList.toggle('active');\n});\n\n// Close mobile menu when clicking on a link\nnavMobile.querySelectorAll('a').forEach(link => {\n  link.addEventListener('click', () => {\n    hamburger.classList.remove('active');\n    navMobile.classList.remove('active');\n  });\n});\n</script>\n\n<style>\n.booking-section {\n  padding: 120px 0 80px;\n  background: linear-gradient(135deg, #B3D9FF 0%, #E6F3FF 50%, #FFF9E6 100%);\n  min-height: 100vh;\n}\n\n.booking-header {\n  text-align: center;\n  margin-bottom: 50px;\n  color: #2c3e50;\n}\n\n.booking-header h1 {\n  font-size: 3rem;\n  margin-bottom: 15px;\n  font-weight: 600;\n}\n\n.booking-header p {\n  font-size: 1.2rem;\n  opacity: 0.9;\n}\n\n.booking-form-container {\n  background: white;\n  border-radius: 20px;\n  padding: 40px;\n  box-shadow: 0 20px 40px rgba(0,0,0,0.1);\n  margin-bottom: 40px;\n}\n\n.booking-form {\n  max-width: 800px;\n  margin: 0 auto;\n}\n\n.form-row {\n  display: grid;\n  grid-template-columns: 1fr 1fr;\n  gap: 30px;\n  margin-bottom: 30px;\n}\n\n.form-group {\n  display: flex;\n  flex-direction: column;\n}\n\n.form-group label {\n  font-weight: 500;\n  margin-bottom: 8px;\n  color: #333;\n  font-size: 0.95rem;\n}\n\n.form-group input,\n.form-group select,\n.form-group textarea {\n  padding: 12px 15px;\n  border: 2px solid #e1e5e9;\n  border-radius: 10px;\n  font-size: 1rem;\n  transition: all 0.3s ease;\n  font-family: 'Inter', sans-serif;\n}\n\n.form-group input:focus,\n.form-group select:focus,\n.form-group textarea:focus {\n  outline: none;\n  border-color: #667eea;\n  box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);\n}\n\n.form-group textarea {\n  resize: vertical;\n  min-height: 100px;\n}\n\n.form-actions {\n  display: flex;\n  gap: 20px;\n  justify-content: center;\n  margin-top: 40px;\n}\n\n.form-actions .btn-primary,\n.form-actions .btn-secondary {\n  padding: 15px 30px;\n  border-radius: 10px;\n  text-decoration: none;\n  font-weight: 500;\n  display: inline-flex;\n  align-items: center;\n  gap: 10px;\n  transition: all 0.3s ease;\n  border: none;\n  cursor: pointer;\n  font-size: 1rem;\n}\n\n.form-actions .btn-primary {\n  background: linear-gradient(135deg, #B3D9FF 0%, #E6F3FF 100%);\n  color: #2c3e50;\n  border: 2px solid #B3D9FF;\n}\n\n.form-actions .btn-primary:hover {\n  transform: translateY(-2px);\n  box-shadow: 0 10px 20px rgba(179, 217, 255, 0.6);\n}\n\n.form-actions .btn-secondary {\n  background: #f8f9fa;\n  color: #333;\n  border: 2px solid #e1e5e9;\n}\n\n.form-actions .btn-secondary:hover {\n  background: #e9ecef;\n}\n\n.booking-info {\n  display: grid;\n  grid-template-columns: 1fr 1fr;\n  gap: 30px;\n  max-width: 800px;\n  margin: 0 auto;\n}\n\n.info-card {\n  background: rgba(255, 255, 255, 0.95);\n  padding: 30px;\n  border-radius: 15px;\n  text-align: center;\n  backdrop-filter: blur(10px);\n}\n\n.info-card i {\n  font-size: 2.5rem;\n  color: #3498DB;\n  margin-bottom: 20px;\n}\n\n.info-card h3 {\n  margin-bottom: 15px;\n  color: #333;\n}\n\n.info-card ul {\n  list-style: none;\n  padding: 0;\n  text-align: left;\n}\n\n.info-card ul li {\n  padding: 8px 0;\n  border-bottom: 1px solid #e1e5e9;\n  color: #666;\n}\n\n.info-card ul li:last-child {\n  border-bottom: none;\n}\n\n.contact-number {\n  font-size: 1.3rem;\n  font-weight: 600;\n  color: #3498DB;\n  margin: 10px 0;\n}\n\n.availability-status {\n  padding: 12px 20px;\n  border-radius: 10px;\n  margin-bottom: 25px;\n  font-weight: 500;\n  text-align: center;\n}\n\n.availability-status.available {\n  background: #d4edda;\n  color: #155724;\n}\n\n.availability-status.unavailable {\n  background: #f8d7da;\n  color: #721c24;\n}\n\n.price-quote {\n  padding: 12px 20px;\n  border-radius: 10px;\n  margin-bottom: 25px;\n  font-weight: 500;\n  text-align: center;\n  background: #FFF9E6;\n  color: #2c3e50;\n  border: 1px solid #f3e3b3;\n}\n\n.flash-messages {\n  margin-bottom: 30px;\n}\n\n.flash-message {\n  padding: 15px 20px;\n  border-radius: 10px;\n  margin-bottom: 15px;\n  text-align: center;\n  font-weight: 500;\n}\n\n.flash-success {\n  background: #d4edda;\n  color: #155724;\n  border: 1px solid #c3e6cb;\n}\n\n.flash-error {\n  background: #f8d7da;\n  color: #721c24;\n  border: 1px solid #f5c6cb;\n}\n\n@media (max-width: 768px) {\n  .booking-section {\n    padding: 100px 20px 60px;\n  }\n  \n  .booking-header h1 {\n    font-size: 2rem;\n  }\n  \n  .booking-form-container {\n    padding: 25px;\n  }\n  \n  .form-row {\n    grid-template-columns: 1fr;\n    gap: 20px;\n  }\n  \n  .form-actions {\n    flex-direction: column;\n    align-items: center;\n  }\n  \n  .booking-info {\n    grid-template-columns: 1fr;\n    gap: 20px;\n  }\n}\n</style>\n\n</body>\n</html>"
+
+blocks = {}
+debug_info = '7=15&16=17&22=19&25=21&26=23&27=25&28=27&29=29&37=31&38=33&39=35&40=37&41=39&53=44&55=47&56=51&57=53&65=60&134=62&220=64&272=66&301=68'
\ No newline at end of file
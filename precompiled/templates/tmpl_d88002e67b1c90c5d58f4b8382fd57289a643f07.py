@@ -0,0 +1,52 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'gallery.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_asset_url = resolve('asset_url')
+    l_0_url_for = resolve('url_for')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n<meta name="viewport" content="width=device-width, initial-scale=1.0">\n<title>EXTREMELI SUITES - Gallery</title>\n\n<!-- Google Fonts -->\n<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@500;600&family=Inter:wght@300;400;500&display=swap" rel="stylesheet">\n\n<!-- Font Awesome -->\n<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css" rel="stylesheet">\n\n<!-- Custom CSS -->\n<link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'css/styles.css'))
+    yield '">\n</head>\n<body>\n\n<header>\n  <div class="logo-container">\n    <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/logo.jpg'))
+    yield '" alt="EXTREMELI SUITES">\n  </div>\n  <nav class="nav-desktop">\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.index'))
+    yield '">Home</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.about'))
+    yield '">About</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.rooms'))
+    yield '">Rooms</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.booking'))
+    yield '">Booking</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.gallery'))
+    yield '" class="active">Gallery</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.contact'))
+    yield '">Contact</a>\n  </nav>\n  <div class="hamburger" id="hamburger">\n    <span></span>\n    <span></span>\n    <span></span>\n  </div>\n  <nav class="nav-mobile" id="navMobile">\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.index'))
+    yield '">Home</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.about'))
+    yield '">About</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.rooms'))
+    yield '">Rooms</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.booking'))
+    yield '">Booking</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.gallery'))
+    yield '" class="active">Gallery</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.contact'))
+    yield '">Contact</a>\n  </nav>\n</header>\n\n<section id="gallery">\n  <h2 class="section-title">Gallery</h2>\n  <div class="gallery">\n    <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/resto.jpg'))
+    yield '" alt="Gallery Image 1">\n    <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/resto1.jpg'))
+    yield '" alt="Gallery Image 2">\n    <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/lobby.jpg'))
+    yield '" alt="Gallery Image 3">\n    <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/lobby2.jpg'))
+    yield '" alt="Gallery Image 4">\n  </div>\n</section>\n\n<footer>\n  © 2026 EXTREMELI SUITES. All Rights Reserved.\n</footer>\n\n<!-- Floating Social + Chat -->\n<div class="social-float">\n  <a class="social-btn" href="https://www.facebook.com/ExtremeliSuites.Inc" target="_blank" title="Facebook"><i class="fab fa-facebook-f"></i></a>\n  <a class="social-btn" href="https://www.instagram.com/extremelisuites/" target="_blank" title="Instagram"><i class="fab fa-instagram"></i></a>\n  <a class="social-btn" href="https://m.me/ExtremeliSuites.Inc/" target="_blank" title="Messenger"><i class="fab fa-facebook-messenger"></i></a>\n  <a class="social-btn" href="https://www.tiktok.com/@extremelisuites" target="_blank" title="TikTok"><i class="fab fa-tiktok"></i></a>\n</div>\n\n<!-- AI Chat Box -->\n<div class="chat-box" id="chatBox">\n  <div class="chat-header">AI Concierge</div>\n  <div class="chat-body" id="chatBody">\n    Welcome to Extremeli Suites! How may I assist you today?\n  </div>\n  <div class="chat-input">\n    <input id="chatInput" placeholder="Type your message...">\n    <button onclick="sendMsg()">Send</button>\n  </div>\n</div>\n\n<script>\nfunction toggleChat(){\n  const box = document.getElementById(\'chatBox\');\n  box.style.display = box.style.display === \'flex\' ? \'none\' : \'flex\';\n}\nfunction sendMsg(){\n  const input = document.getElementById(\'chatInput\');\n  const body = document.getElementById(\'chatBody\');\n  if(!input.value.trim()) return;\n  body.innerHTML += `<br><strong>You:</strong> ${input.value}`;\n  body.innerHTML += `<br><strong>Concierge:</strong> Thank you for your inquiry. Our team will assist you shortly.`;\n  input.value=\'\';\n  body.scrollTop = body.scrollHeight;\n}\n\n// Mobile menu toggle\nconst hamburger = document.getElementById(\'hamburger\');\nconst navMobile = document.getElementById(\'navMobile\');\n\nhamburger.addEventListener(\'click\', function() {\n  hamburger.classList.toggle(\'active\');\n  navMobile.classList.toggle(\'active\');\n});\n\n// Close mobile menu when clicking on a link\nnavMobile.querySelectorAll(\'a\').forEach(link => {\n  link.addEventListener(\'click\', () => {\n    hamburger.classList.remove(\'active\');\n    navMobile.classList.remove(\'active\');\n  });\n});\n</script>\n\n</body>\n</html>'
+
+blocks = {}
+debug_info = '15=14&21=16&24=18&25=20&26=22&27=24&28=26&29=28&37=30&38=32&39=34&40=36&41=38&42=40&49=42&50=44&51=46&52=48'
\ No newline at end of file
@@ -0,0 +1,65 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'admin/features.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_asset_url = resolve('asset_url')
+    l_0_url_for = resolve('url_for')
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    l_0_features = resolve('features')
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n<meta name="viewport" content="width=device-width, initial-scale=1.0">\n<title>Manage Features - EXTREMELI SUITES</title>\n\n<!-- Google Fonts -->\n<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@500;600&family=Inter:wght@300;400;500&display=swap" rel="stylesheet">\n\n<!-- Font Awesome -->\n<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css" rel="stylesheet">\n\n<!-- Custom CSS -->\n<link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'css/styles.css'))
+    yield '">\n<style>\n.admin-container {\n  min-height: 100vh;\n  background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);\n  padding: 20px;\n}\n\n.admin-header {\n  background: white;\n  padding: 20px;\n  border-radius: 15px;\n  box-shadow: 0 10px 30px rgba(0,0,0,0.1);\n  margin-bottom: 30px;\n  display: flex;\n  justify-content: space-between;\n  align-items: center;\n}\n\n.admin-header h1 {\n  font-family: \'Playfair Display\', serif;\n  color: var(--blue);\n  margin: 0;\n}\n\n.admin-nav {\n  display: flex;\n  gap: 15px;\n}\n\n.admin-nav a {\n  background: var(--blue);\n  color: white;\n  padding: 10px 20px;\n  border-radius: 8px;\n  text-decoration: none;\n  transition: all 0.3s ease;\n}\n\n.admin-nav a:hover {\n  background: var(--accent-dark);\n  transform: translateY(-2px);\n}\n\n.features-grid {\n  display: grid;\n  grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));\n  gap: 20px;\n  margin-bottom: 30px;\n}\n\n.feature-card-admin {\n  background: white;\n  border-radius: 15px;\n  overflow: hidden;\n  box-shadow: 0 10px 30px rgba(0,0,0,0.1);\n  transition: all 0.3s ease;\n}\n\n.feature-card-admin:hover {\n  transform: translateY(-5px);\n  box-shadow: 0 20px 40px rgba(0,0,0,0.15);\n}\n\n.feature-card-admin img {\n  width: 100%;\n  height: 200px;\n  object-fit: cover;\n}\n\n.feature-card-admin-content {\n  padding: 20px;\n}\n\n.feature-card-admin-content i {\n  font-size: 2rem;\n  color: var(--blue);\n  margin-bottom: 10px;\n}\n\n.feature-card-admin-content h3 {\n  font-family: \'Playfair Display\', serif;\n  color: var(--text);\n  margin-bottom: 10px;\n}\n\n.feature-card-admin-content p {\n  color: var(--muted);\n  margin-bottom: 15px;\n}\n\n.feature-actions {\n  display: flex;\n  gap: 10px;\n}\n\n.btn-edit, .btn-delete {\n  padding: 8px 16px;\n  border: none;\n  border-radius: 6px;\n  cursor: pointer;\n  text-decoration: none;\n  font-size: 0.9rem;\n  transition: all 0.3s ease;\n}\n\n.btn-edit {\n  background: var(--blue);\n  color: white;\n}\n\n.btn-edit:hover {\n  background: var(--accent-dark);\n}\n\n.btn-delete {\n  background: #dc3545;\n  color: white;\n}\n\n.btn-delete:hover {\n  background: #c82333;\n}\n\n.btn-add {\n  background: #28a745;\n  color: white;\n  padding: 12px 24px;\n  border: none;\n  border-radius: 8px;\n  cursor: pointer;\n  text-decoration: none;\n  font-size: 1rem;\n  transition: all 0.3s ease;\n  display: inline-block;\n}\n\n.btn-add:hover {\n  background: #218838;\n  transform: translateY(-2px);\n}\n\n.alert {\n  padding: 12px;\n  border-radius: 8px;\n  margin-bottom: 20px;\n}\n\n.alert-success {\n  background: #d4edda;\n  color: #155724;\n  border: 1px solid #c3e6cb;\n}\n\n.alert-error {\n  background: #f8d7da;\n  color: #721c24;\n  border: 1px solid #f5c6cb;\n}\n\n.alert-info {\n  background: #d1ecf1;\n  color: #0c5460;\n  border: 1px solid #bee5eb;\n}\n</style>\n</head>\n<body>\n\n<div class="admin-container">\n  <div class="admin-header">\n    <h1>Manage Features</h1>\n    <div class="admin-nav">\n      <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.dashboard'))
+    yield '">Dashboard</a>\n      <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.logout'))
+    yield '">Logout</a>\n    </div>\n  </div>\n  \n  '
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True)
+    pass
+    yield '\n    '
+    if l_1_messages:
+        pass
+        yield '\n      '
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n        <div class="alert alert-'
+            yield escape(l_2_category)
+            yield '">'
+            yield escape(l_2_message)
+            yield '</div>\n      '
+        l_2_category = l_2_message = missing
+        yield '\n    '
+    yield '\n  '
+    l_1_messages = missing
+    yield '\n  \n  <div style="margin-bottom: 30px;">\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.add_feature'))
+    yield '" class="btn-add">\n      <i class="fas fa-plus"></i> Add New Feature\n    </a>\n  </div>\n  \n  <div class="features-grid">\n    '
+    for l_1_feature in (undefined(name='features') if l_0_features is missing else l_0_features):
+        _loop_vars = {}
+        pass
+        yield '\n    <div class="feature-card-admin">\n      <img src="'
+        yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), ('images/' + environment.getattr(l_1_feature, 'image')), _loop_vars=_loop_vars))
+        yield '" alt="'
+        yield escape(environment.getattr(l_1_feature, 'title'))
+        yield '">\n      <div class="feature-card-admin-content">\n        <i class="'
+        yield escape(environment.getattr(l_1_feature, 'icon'))
+        yield '"></i>\n        <h3>'
+        yield escape(environment.getattr(l_1_feature, 'title'))
+        yield '</h3>\n        <p>'
+        yield escape(environment.getattr(l_1_feature, 'description'))
+        yield '</p>\n        <div class="feature-actions">\n          <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.edit_feature', feature_id=environment.getattr(l_1_feature, 'id'), _loop_vars=_loop_vars))
+        yield '" class="btn-edit">\n            <i class="fas fa-edit"></i> Edit\n          </a>\n          <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'admin.delete_feature', feature_id=environment.getattr(l_1_feature, 'id'), _loop_vars=_loop_vars))
+        yield '" \n             class="btn-delete" \n             onclick="return confirm(\'Are you sure you want to delete this feature?\')">\n            <i class="fas fa-trash"></i> Delete\n          </a>\n        </div>\n      </div>\n    </div>\n    '
+    l_1_feature = missing
+    yield '\n  </div>\n</div>\n\n</body>\n</html>'
+
+blocks = {}
+debug_info = '15=16&188=18&189=20&194=25&195=28&196=32&202=41&208=43&210=47&212=51&213=53&214=55&216=57&219=59'
\ No newline at end of file
@@ -0,0 +1,112 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'index.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_asset_url = resolve('asset_url')
+    l_0_url_for = resolve('url_for')
+    l_0_features = resolve('features')
+    l_0_nearby = resolve('nearby')
+    l_0_testimonials = resolve('testimonials')
+    try:
+        t_1 = environment.filters['datetime']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'datetime' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n<meta name="viewport" content="width=device-width, initial-scale=1.0">\n<title>EXTREMELI SUITES - Home</title>\n<link rel="icon" type="image/jpeg" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/minlogo.jpg'))
+    yield '">\n\n<!-- Google Fonts -->\n<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@500;600&family=Inter:wght@300;400;500&display=swap" rel="stylesheet">\n\n<!-- Font Awesome -->\n<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.1/css/all.min.css" rel="stylesheet">\n\n<!-- Custom CSS -->\n<link rel="stylesheet" href="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'css/styles.css'))
+    yield '">\n</head>\n<body>\n\n<header>\n  <div class="logo-container">\n    <img src="'
+    yield escape(context.call((undefined(name='asset_url') if l_0_asset_url is missing else l_0_asset_url), 'images/mainlogo.png'))
+    yield '" alt="EXTREMELI SUITES">\n  </div>\n  <nav class="nav-desktop">\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.index'))
+    yield '" class="active">Home</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.about'))
+    yield '">About</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.rooms'))
+    yield '">Rooms</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.booking'))
+    yield '">Booking</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.contact'))
+    yield '">Contact</a>\n  </nav>\n  <div class="hamburger" id="hamburger">\n    <span></span>\n    <span></span>\n    <span></span>\n  </div>\n  <nav class="nav-mobile" id="navMobile">\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.index'))
+    yield '" class="active">Home</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.about'))
+    yield '">About</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.rooms'))
+    yield '">Rooms</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.booking'))
+    yield '">Booking</a>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.contact'))
+    yield '">Contact</a>\n  </nav>\n</header>\n\n<section class="hero" id="home">\n  <div class="hero-content">\n    <h1>Where Elegance and Comfort Meet!</h1>\n    <p>REFINED • TRANQUIL • TIMELESS</p>\n    <div class="hero-buttons">\n      <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.rooms'))
+    yield '" class="btn-primary">Explore Rooms</a>\n      <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.booking'))
+    yield '" class="btn-secondary">Book Now</a>\n    </div>\n  </div>\n  <div class="hero-scroll">\n    <i class="fas fa-chevron-down"></i>\n  </div>\n</section>\n\n<section class="features">\n  <div class="container">\n    <h2 class="section-title">Why Choose Extremeli Suites</h2>\n    <div class="features-grid">\n      '
+    for l_1_feature in (undefined(name='features') if l_0_features is missing else l_0_features):
+        l_1_responsive_image = resolve('responsive_image')
+        _loop_vars = {}
+        pass
+        yield '\n      <div class="feature-card">\n        '
+        yield escape(context.call((undefined(name='responsive_image') if l_1_responsive_image is missing else l_1_responsive_image), ('images/' + environment.getattr(l_1_feature, 'image')), alt=environment.getattr(l_1_feature, 'title'), sizes='(max-width: 768px) 100vw, 25vw', loading='lazy', decoding='async', _loop_vars=_loop_vars))
+        yield '\n        <i class="'
+        yield escape(environment.getattr(l_1_feature, 'icon'))
+        yield '"></i>\n        <h3>'
+        yield escape(environment.getattr(l_1_feature, 'title'))
+        yield '</h3>\n        <p>'
+        yield escape(environment.getattr(l_1_feature, 'description'))
+        yield '</p>\n      </div>\n      '
+    l_1_feature = l_1_responsive_image = missing
+    yield '\n    </div>\n  </div>\n</section>\n\n<section class="attractions-tabs">\n  <div class="container">\n    <h2 class="section-title">Discover Extremeli Suites</h2>\n    \n    <div class="tabs-container">\n      <div class="tabs-nav">\n        <button class="tab-btn active" data-tab="nearby">Explore Nearby Attractions</button>\n        <button class="tab-btn" data-tab="testimonials">What Our Guests Say</button>\n      </div>\n      \n      <div class="tabs-content">\n        <div class="tab-pane active" id="nearby">\n          <div class="nearby-grid">\n            '
+    for l_1_place in (undefined(name='nearby') if l_0_nearby is missing else l_0_nearby):
+        l_1_responsive_image = resolve('responsive_image')
+        _loop_vars = {}
+        pass
+        yield '\n            <div class="nearby-card">\n              '
+        yield escape(context.call((undefined(name='responsive_image') if l_1_responsive_image is missing else l_1_responsive_image), ('images/' + environment.getattr(l_1_place, 'image')), alt=environment.getattr(l_1_place, 'title'), sizes='(max-width: 768px) 100vw, 33vw', loading='lazy', decoding='async', _loop_vars=_loop_vars))
+        yield '\n              <div class="nearby-content">\n                <h3>'
+        yield escape(environment.getattr(l_1_place, 'title'))
+        yield '</h3>\n                <p>'
+        yield escape(environment.getattr(l_1_place, 'description'))
+        yield '</p>\n                <span class="distance">'
+        yield escape(environment.getattr(l_1_place, 'distance'))
+        yield '</span>\n              </div>\n            </div>\n            '
+    l_1_place = l_1_responsive_image = missing
+    yield '\n          </div>\n        </div>\n        \n        <div class="tab-pane" id="testimonials">\n          <div class="testimonials-grid">\n            '
+    for l_1_testimonial in (undefined(name='testimonials') if l_0_testimonials is missing else l_0_testimonials):
+        l_1_range = resolve('range')
+        _loop_vars = {}
+        pass
+        yield '\n            <div class="testimonial-card">\n              <div class="testimonial-content">\n                <div class="testimonial-stars">\n                  '
+        for l_2_i in context.call((undefined(name='range') if l_1_range is missing else l_1_range), 5, _loop_vars=_loop_vars):
+            _loop_vars = {}
+            pass
+            yield '\n                    <i class="fas fa-star"></i>\n                  '
+        l_2_i = missing
+        yield '\n                </div>\n                <p class="testimonial-message">'
+        yield escape(environment.getattr(l_1_testimonial, 'message'))
+        yield '</p>\n              </div>\n              <div class="testimonial-author">\n                <div class="author-info">\n                  <h4>'
+        yield escape(environment.getattr(l_1_testimonial, 'name'))
+        yield '</h4>\n                  <p class="author-date">'
+        yield escape(t_1(environment.getattr(l_1_testimonial, 'date'), '%B %Y'))
+        yield '</p>\n                </div>\n              </div>\n            </div>\n            '
+    l_1_testimonial = l_1_range = missing
+    yield '\n          </div>\n          '
+    if (not (undefined(name='testimonials') if l_0_testimonials is missing else l_0_testimonials)):
+        pass
+        yield '\n          <div class="no-testimonials">\n            <i class="fas fa-comments"></i>\n            <h3>No Reviews Yet</h3>\n            <p>Be the first to share your experience with us!</p>\n            <a href="'
+        yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.contact'))
+        yield '" class="btn-primary">Share Your Feedback</a>\n          </div>\n          '
+    yield '\n        </div>\n      </div>\n    </div>\n  </div>\n</section>\n\n<section class="cta">\n  <div class="container">\n    <h2>Ready for an Unforgettable Stay?</h2>\n    <p>Book your perfect getaway at Extremeli Suites</p>\n    <a href="'
+    yield escape(context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'public.booking'))
+    yield '" class="btn-primary">Reserve Your Room</a>\n  </div>\n</section>\n\n<footer>\n  © 2026 EXTREMELI SUITES. All Rights Reserved.\n</footer>\n\n<!-- Floating Social + Chat -->\n<div class="social-float">\n  <a class="social-btn" href="https://www.facebook.com/ExtremeliSuites.Inc" target="_blank" title="Facebook"><i class="fab fa-facebook-f"></i></a>\n  <a class="social-btn" href="https://www.instagram.com/extremelisuites/" target="_blank" title="Instagram"><i class="fab fa-instagram"></i></a>\n  <a class="social-btn" href="https://m.me/ExtremeliSuites.Inc/" target="_blank" title="Messenger"><i class="fab fa-facebook-messenger"></i></a>\n  <a class="social-btn" href="https://www.tiktok.com/@extremelisuites_" target="_blank" title="TikTok"><i class="fab fa-tiktok"></i></a>\n</div>\n\n<!-- AI Chat Box -->\n<div class="chat-box" id="chatBox">\n  <div class="chat-header">AI Concierge</div>\n  <div class="chat-body" id="chatBody">\n    Welcome to Extremeli Suites! How may I assist you today?\n  </div>\n  <div class="chat-input">\n    <input id="chatInput" placeholder="Type your message...">\n    <button onclick="sendMsg()">Send</button>\n  </div>\n</div>\n\n<script>\n// Tab functionality\ndocument.addEventListener(\'DOMContentLoaded\', function() {\n  const tabBtns = document.querySelectorAll(\'.tab-btn\');\n  const tabPanes = document.querySelectorAll(\'.tab-pane\');\n  \n  tabBtns.forEach(btn => {\n    btn.addEventListener(\'click\', function() {\n      const targetTab = this.getAttribute(\'data-tab\');\n      \n      // Remove active class from all buttons and panes\n      tabBtns.forEach(b => b.classList.remove(\'active\'));\n      tabPanes.forEach(p => p.classList.remove(\'active\'));\n      \n      // Add active class to clicked button and corresponding pane\n      this.classList.add(\'active\');\n      document.getElementById(targetTab).classList.add(\'active\');\n    });\n  });\n});\n\nfunction toggleChat(){\n  const box = document.getElementById(\'chatBox\');\n  box.style.display = box.style.display === \'flex\' ? \'none\' : \'flex\';\n}\nfunction sendMsg(){\n  const input = document.getElementById(\'chatInput\');\n  const body = document.getElementById(\'chatBody\');\n  if(!input.value.trim()) return;\n  body.innerHTML += `<br><strong>You:</strong> ${input.value}`;\n  body.innerHTML += `<br><strong>Concierge:</strong> Thank you for your inquiry. Our team will assist you shortly.`;\n  input.value=\'\';\n  body.scrollTop = body.scrollHeight;\n}\n\n// Mobile menu toggle\nconst hamburger = document.getElementById(\'hamburger\');\nconst navMobile = document.getElementById(\'navMobile\');\n\nhamburger.addEventListener(\'click\', function() {\n  hamburger.classList.toggle(\'active\');\n  navMobile.classList.toggle(\'active\');\n});\n\n// Close mobile menu when clicking on a link\nnavMobile.querySelectorAll(\'a\').forEach(link => {\n  link.addEventListener(\'click\', () => {\n    hamburger.classList.remove(\'active\');\n    navMobile.classList.remove(\'active\');\n  });\n});\n</script>\n\n</body>\n</html>'
+
+blocks = {}
+debug_info = '7=23&16=25&22=27&25=29&26=31&27=33&28=35&29=37&37=39&38=41&39=43&40=45&41=47&50=49&51=51&63=53&65=58&66=60&67=62&68=64&88=68&90=73&92=75&93=77&94=79&103=83&107=88&111=94&115=96&116=98&122=102&127=105&140=108'
\ No newline at end of file
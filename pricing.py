@@ -0,0 +1,121 @@
+import json
+import hashlib
+import threading
+from datetime import date, timedelta
+from itertools import accumulate
+
+# Nightly rates in pesos: 'base' Sunday to Thursday nights, 'weekend' for
+# WEEKEND_NIGHTS. Override with app.config['ROOM_RATES'].
+DEFAULT_RATES = {
+    'deluxe_a': {'base': 2500, 'weekend': 2900},
+    'deluxe_b': {'base': 3000, 'weekend': 3500},
+    'suite': {'base': 4500, 'weekend': 5200},
+    'family': {'base': 5000, 'weekend': 5800},
+}
+
+# Friday and Saturday nights (date.weekday() of the night's date)
+WEEKEND_NIGHTS = (4, 5)
+
+# (name, first night 'MM-DD', last night 'MM-DD', multiplier); the first
+# season a night falls in applies. A range may wrap past New Year.
+# Override with app.config['ROOM_SEASONS'].
+DEFAULT_SEASONS = (
+    ('Holidays', '12-20', '01-05', 1.25),
+    ('Summer', '04-01', '05-31', 1.10),
+)
+
+CURRENCY = 'PHP'
+
+# Bookings (and quotes) open this many days ahead
+BOOKING_HORIZON_DAYS = 730
+
+
+def _in_season(day, first, last):
+    key = day.strftime('%m-%d')
+    if first <= last:
+        return first <= key <= last
+    return key >= first or key <= last
+
+
+class RateTable:
+    # The rate rules evaluated once for every night from today to the end
+    # of the booking horizon: room_type -> [rate per night] plus running
+    # totals, so a quote for any stay is prefix[end] - prefix[start]
+    # whatever its length. Recompiled when the date rolls over.
+
+    def __init__(self, rates=None, seasons=None, horizon_days=BOOKING_HORIZON_DAYS):
+        self.rates = dict(rates or DEFAULT_RATES)
+        self.seasons = tuple(seasons if seasons is not None else DEFAULT_SEASONS)
+        self.horizon_days = horizon_days
+        self._lock = threading.Lock()
+        self._compiled = None
+
+    def nightly_rate(self, room_type, day):
+        # The rules themselves; only used while compiling
+        rates = self.rates[room_type]
+        rate = rates['weekend'] if day.weekday() in WEEKEND_NIGHTS else rates['base']
+        for _, first, last, multiplier in self.seasons:
+            if _in_season(day, first, last):
+                rate *= multiplier
+                break
+        return int(round(rate))
+
+    def _compile(self, today):
+        days = [today + timedelta(days=offset) for offset in range(self.horizon_days + 1)]
+        nightly = {room_type: [self.nightly_rate(room_type, day) for day in days] for room_type in self.rates}
+        prefix = {room_type: [0] + list(accumulate(values)) for room_type, values in nightly.items()}
+        version = hashlib.sha1(json.dumps([today.isoformat(), nightly], sort_keys=True).encode()).hexdigest()[:16]
+        return {'start': today, 'nightly': nightly, 'prefix': prefix, 'version': version}
+
+    def compiled(self, today=None):
+        today = today or date.today()
+        compiled = self._compiled
+        if compiled is None or compiled['start'] != today:
+            with self._lock:
+                compiled = self._compiled
+                if compiled is None or compiled['start'] != today:
+                    compiled = self._compiled = self._compile(today)
+        return compiled
+
+    def quote(self, room_type, check_in, check_out, today=None):
+        if room_type not in self.rates:
+            raise ValueError('Unknown room type: {}'.format(room_type))
+        if check_out <= check_in:
+            raise ValueError('Check-out must be after check-in')
+        compiled = self.compiled(today)
+        first = (check_in - compiled['start']).days
+        last = (check_out - compiled['start']).days
+        if first < 0 or last > self.horizon_days:
+            raise ValueError('Quotes are available from today up to {} days ahead'.format(self.horizon_days))
+        prefix = compiled['prefix'][room_type]
+        total = prefix[last] - prefix[first]
+        nights = last - first
+        return {
+            'room_type': room_type,
+            'check_in': check_in.isoformat(),
+            'check_out': check_out.isoformat(),
+            'nights': nights,
+            'total': total,
+            'average_rate': round(total / nights, 2),
+            'currency': CURRENCY,
+        }
+
+    def table(self, today=None):
+        # Everything the booking page needs to price stays itself
+        compiled = self.compiled(today)
+        return {
+            'version': compiled['version'],
+            'start': compiled['start'].isoformat(),
+            'currency': CURRENCY,
+            'nightly': compiled['nightly'],
+        }
+
+
+def init_pricing(app):
+    table = RateTable(
+        app.config.get('ROOM_RATES'),
+        app.config.get('ROOM_SEASONS'),
+        app.config.get('BOOKING_HORIZON_DAYS', BOOKING_HORIZON_DAYS)
+    )
+    app.extensions['pricing'] = table
+    return table
@@ -0,0 +1,186 @@
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, jsonify
+from datetime import datetime, date
+from werkzeug.local import LocalProxy
+
+from storage import FEATURES, NEARBY, FEEDBACK
+from availability import FullyBooked, parse_date
+from page_cache import cached_page
+from validation import ValidationError
+
+bp = Blueprint('public', __name__)
+
+# Shared services, set up once by create_app()
+storage = LocalProxy(lambda: current_app.extensions['storage'])
+availability = LocalProxy(lambda: current_app.extensions['availability'])
+form_guard = LocalProxy(lambda: current_app.extensions['form_guard'])
+pricing = LocalProxy(lambda: current_app.extensions['pricing'])
+booking_validator = LocalProxy(lambda: current_app.extensions['booking_validator'])
+
+FEEDBACK_RECEIVED = 'Thank you for your feedback! We will get back to you soon.'
+BOOKING_RECEIVED = 'Booking request submitted successfully! We will confirm your reservation shortly.'
+
+# Timestamps are stored as 'YYYY-MM-DD HH:MM:SS' strings
+@bp.app_template_filter('datetime')
+def format_datetime(value, fmt='%B %d, %Y'):
+    if isinstance(value, str):
+        try:
+            value = datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            return value
+    return value.strftime(fmt) if value else ''
+
+# Main routes
+@bp.route('/')
+@cached_page('index', depends_on=(FEATURES, NEARBY, FEEDBACK))
+def index():
+    features = storage.all(FEATURES)
+    nearby = storage.all(NEARBY)
+    testimonials = storage.all(FEEDBACK)
+    return render_template('index.html', features=features, nearby=nearby, testimonials=testimonials)
+
+@bp.route('/about')
+@cached_page('about')
+def about():
+    return render_template('about.html')
+
+@bp.route('/rooms')
+@cached_page('rooms')
+def rooms():
+    return render_template('rooms.html')
+
+@bp.route('/gallery')
+@cached_page('gallery')
+def gallery():
+    return render_template('gallery.html')
+
+@bp.route('/contact', methods=['GET', 'POST'])
+def contact():
+    if request.method == 'GET':
+        return render_template('contact.html')
+    elif request.method == 'POST':
+        return submit_feedback()
+
+@bp.route('/booking', methods=['GET', 'POST'])
+def booking():
+    if request.method == 'GET':
+        return render_template('booking.html')
+    elif request.method == 'POST':
+        return submit_booking()
+
+@bp.route('/api/availability')
+def api_availability():
+    check_in = parse_date(request.args.get('check_in'))
+    check_out = parse_date(request.args.get('check_out'))
+    if not check_in or not check_out:
+        return jsonify(error='check_in and check_out must be dates (YYYY-MM-DD)'), 400
+    if check_out <= check_in:
+        return jsonify(error='check_out must be after check_in'), 400
+
+    room_type = request.args.get('room_type')
+    if room_type:
+        if room_type not in availability.inventory:
+            return jsonify(error=f'Unknown room type: {room_type}'), 400
+        rooms = {room_type: availability.rooms_available(room_type, check_in, check_out)}
+    else:
+        rooms = availability.summary(check_in, check_out)
+
+    return jsonify(
+        check_in=check_in.isoformat(),
+        check_out=check_out.isoformat(),
+        nights=(check_out - check_in).days,
+        available=rooms
+    )
+
+@bp.route('/api/quote')
+def api_quote():
+    # Price of a stay: ?room_type=&check_in=&check_out=
+    room_type = request.args.get('room_type')
+    if room_type not in pricing.rates:
+        return jsonify(error=f'Unknown room type: {room_type}'), 400
+    today = date.today()
+    try:
+        check_in, check_out = booking_validator.stay(request.args.get('check_in'), request.args.get('check_out'), today)
+    except ValidationError as e:
+        return jsonify(error=str(e), errors=e.errors), 400
+    return jsonify(pricing.quote(room_type, check_in, check_out, today))
+
+@bp.route('/api/rates')
+def api_rates():
+    # The compiled nightly rates, so booking.html can price a stay while the
+    # guest picks dates; changes once a day
+    table = pricing.table()
+    response = jsonify(table)
+    response.set_etag(table['version'])
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
+
+# Honeypot, rate limit and duplicate checks, done before any data is read
+# or written. Returns the response to send instead of saving, or None.
+def screen_submission(form_name, template, endpoint, success_message):
+    verdict = form_guard.check(form_name, request.form, request.remote_addr)
+    if verdict is None:
+        return None
+    if verdict in ('honeypot', 'duplicate'):
+        # Answer exactly as if it was saved
+        flash(success_message, 'success')
+        return redirect(url_for(endpoint))
+    flash(f'Too many submissions. Please try again in {(verdict + 59) // 60} minute(s).', 'error')
+    return render_template(template), 429, {'Retry-After': str(verdict)}
+
+# Feedback submission
+def submit_feedback():
+    if request.method == 'POST':
+        rejected = screen_submission('contact', 'contact.html', 'public.contact', FEEDBACK_RECEIVED)
+        if rejected:
+            return rejected
+        
+        feedback = {
+            "name": request.form.get('name'),
+            "email": request.form.get('email'),
+            "message": request.form.get('message'),
+            "date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "read": False
+        }
+        
+        storage.insert(FEEDBACK, feedback)
+        form_guard.remember('contact', request.form)
+        flash(FEEDBACK_RECEIVED, 'success')
+        
+    return redirect(url_for('public.contact'))
+
+# Booking submission
+def submit_booking():
+    if request.method == 'POST':
+        rejected = screen_submission('booking', 'booking.html', 'public.booking', BOOKING_RECEIVED)
+        if rejected:
+            return rejected
+        
+        today = date.today()
+        try:
+            booking = booking_validator.clean(request.form, today)
+        except ValidationError as e:
+            for message in e.errors.values():
+                flash(message, 'error')
+            return redirect(url_for('public.booking'))
+        
+        check_in = parse_date(booking['check_in'])
+        check_out = parse_date(booking['check_out'])
+        # Priced when requested; the rate table may change before it is confirmed
+        quote = pricing.quote(booking['room_type'], check_in, check_out, today)
+        booking.update({
+            "total_price": quote['total'],
+            "currency": quote['currency'],
+            "status": "pending",
+            "created_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "updated_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        })
+        try:
+            availability.book(booking)
+        except FullyBooked:
+            flash('Sorry, that room type is fully booked for the selected dates. Please try different dates or another room.', 'error')
+            return redirect(url_for('public.booking'))
+        form_guard.remember('booking', request.form)
+        flash(BOOKING_RECEIVED, 'success')
+        
+    return redirect(url_for('public.booking'))
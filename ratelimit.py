@@ -0,0 +1,214 @@
+import os
+import time
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+
+# Per form: bucket kind -> (capacity, seconds to refill one token). The
+# defaults allow a short burst, then one submission per 12 minutes per IP
+# and per 20 minutes per email address. Override with app.config['FORM_LIMITS'].
+DEFAULT_FORM_LIMITS = {
+    'booking': {'ip': (5, 720), 'email': (3, 1200)},
+    'contact': {'ip': (5, 720), 'email': (3, 1200)},
+}
+
+# Identical submissions within this many seconds are treated as a resend
+DUPLICATE_WINDOW = 600
+
+# Hidden form field that people leave empty and form-filling bots don't
+HONEYPOT_FIELD = 'website'
+
+# Fields that make up a submission's fingerprint for duplicate detection
+FINGERPRINT_FIELDS = {
+    'booking': ('name', 'email', 'phone', 'room_type', 'check_in', 'check_out', 'guests', 'special_requests'),
+    'contact': ('name', 'email', 'message'),
+}
+
+
+class MemoryBuckets:
+    # Token buckets and recent fingerprints for one process. Fine for a
+    # single worker; with several, each enforces its own limits.
+
+    def __init__(self, max_keys=10000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, buckets, now=None):
+        # buckets: [(key, capacity, refill_seconds)]. Takes a token from
+        # each if all have one; returns seconds until that would be
+        # possible, 0 when allowed.
+        now = now or time.time()
+        with self._lock:
+            levels = []
+            for key, capacity, refill in buckets:
+                tokens, updated = self._buckets.get(key, (capacity, now))
+                levels.append(min(capacity, tokens + (now - updated) / refill))
+            wait = max((refill * (1 - level) for level, (_, _, refill) in zip(levels, buckets) if level < 1),
+                       default=0)
+            if wait:
+                return int(wait) + 1
+            for level, (key, _, _) in zip(levels, buckets):
+                self._buckets[key] = (level - 1, now)
+                self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return 0
+
+    def seen(self, digest, now=None):
+        # True if digest was recorded and hasn't expired yet
+        now = now or time.time()
+        with self._lock:
+            expires = self._seen.get(digest)
+            return expires is not None and expires > now
+
+    def remember(self, digest, ttl, now=None):
+        now = now or time.time()
+        with self._lock:
+            self._seen[digest] = now + ttl
+            self._seen.move_to_end(digest)
+            while len(self._seen) > self.max_keys:
+                self._seen.popitem(last=False)
+
+
+class SqliteBuckets:
+    # The same buckets in a small SQLite file shared by every worker, so
+    # limits hold across processes. Only this file is touched; the
+    # datasets are not.
+
+    PRUNE_EVERY = 500
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._calls = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, '
+                     'updated REAL NOT NULL, idle_after REAL NOT NULL)')
+        conn.execute('CREATE TABLE IF NOT EXISTS seen (digest TEXT PRIMARY KEY, expires REAL NOT NULL)')
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _transaction(self, fn):
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            result = fn(conn)
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        self._calls += 1
+        if self._calls % self.PRUNE_EVERY == 0:
+            # Full buckets and expired fingerprints carry no state
+            now = time.time()
+            conn.execute('DELETE FROM buckets WHERE idle_after < ?', (now,))
+            conn.execute('DELETE FROM seen WHERE expires < ?', (now,))
+        return result
+
+    def take(self, buckets, now=None):
+        now = now or time.time()
+
+        def do_take(conn):
+            levels = []
+            for key, capacity, refill in buckets:
+                row = conn.execute('SELECT tokens, updated FROM buckets WHERE key = ?', (key,)).fetchone()
+                tokens, updated = row if row else (capacity, now)
+                levels.append(min(capacity, tokens + (now - updated) / refill))
+            wait = max((refill * (1 - level) for level, (_, _, refill) in zip(levels, buckets) if level < 1),
+                       default=0)
+            if wait:
+                return int(wait) + 1
+            for level, (key, capacity, refill) in zip(levels, buckets):
+                conn.execute('INSERT OR REPLACE INTO buckets (key, tokens, updated, idle_after) VALUES (?, ?, ?, ?)',
+                             (key, level - 1, now, now + (capacity - level + 1) * refill))
+            return 0
+        return self._transaction(do_take)
+
+    def seen(self, digest, now=None):
+        now = now or time.time()
+        row = self._conn().execute('SELECT expires FROM seen WHERE digest = ?', (digest,)).fetchone()
+        return bool(row) and row[0] > now
+
+    def remember(self, digest, ttl, now=None):
+        now = now or time.time()
+
+        def do_remember(conn):
+            conn.execute('INSERT OR REPLACE INTO seen (digest, expires) VALUES (?, ?)', (digest, now + ttl))
+        self._transaction(do_remember)
+
+
+class FormGuard:
+    # Screens public form posts before anything is read from or written to
+    # the datasets: honeypot first, then the per-IP/per-email token
+    # buckets, then duplicate detection. check() returns None to accept,
+    # 'honeypot' or 'duplicate' (answer as if it worked, store nothing), or
+    # the number of seconds to wait when rate limited. A submission only
+    # counts as seen once remember() is called after it was saved, so one
+    # that failed validation can be corrected and sent again.
+
+    def __init__(self, backend, limits=None, duplicate_window=DUPLICATE_WINDOW):
+        self.backend = backend
+        self.limits = limits or DEFAULT_FORM_LIMITS
+        self.duplicate_window = duplicate_window
+
+    def _buckets(self, form_name, form, remote_addr):
+        limits = self.limits.get(form_name, {})
+        email = (form.get('email') or '').strip().lower()
+        buckets = []
+        if 'ip' in limits and remote_addr:
+            buckets.append(('{}:ip:{}'.format(form_name, remote_addr),) + tuple(limits['ip']))
+        if 'email' in limits and email:
+            buckets.append(('{}:email:{}'.format(form_name, email),) + tuple(limits['email']))
+        return buckets
+
+    def _fingerprint(self, form_name, form):
+        values = [form_name] + [' '.join((form.get(field) or '').lower().split())
+                                for field in FINGERPRINT_FIELDS.get(form_name, sorted(form))]
+        return hashlib.sha256('\x1f'.join(values).encode('utf-8')).hexdigest()
+
+    def check(self, form_name, form, remote_addr):
+        if form.get(HONEYPOT_FIELD):
+            return 'honeypot'
+        buckets = self._buckets(form_name, form, remote_addr)
+        if buckets:
+            wait = self.backend.take(buckets)
+            if wait:
+                return wait
+        if self.backend.seen(self._fingerprint(form_name, form)):
+            return 'duplicate'
+        return None
+
+    def remember(self, form_name, form):
+        self.backend.remember(self._fingerprint(form_name, form), self.duplicate_window)
+
+
+def create_backend(config):
+    backend = config.get('RATE_LIMIT_BACKEND', 'memory')
+    if backend == 'memory':
+        return MemoryBuckets()
+    if backend == 'sqlite':
+        return SqliteBuckets(config.get('RATE_LIMIT_PATH') or os.path.join(config.get('DATA_DIR', 'data'), 'ratelimit.db'))
+    raise ValueError('Unknown rate limit backend: {}'.format(backend))
+
+
+def init_form_guard(app):
+    guard = FormGuard(
+        create_backend(app.config),
+        limits=app.config.get('FORM_LIMITS'),
+        duplicate_window=app.config.get('DUPLICATE_WINDOW', DUPLICATE_WINDOW)
+    )
+    app.extensions['form_guard'] = guard
+    return guard
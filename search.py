@@ -0,0 +1,177 @@
+import os
+import re
+import json
+import sqlite3
+import threading
+
+from signals import record_changed
+from storage import BOOKINGS, FEEDBACK
+
+# Indexed fields per dataset, mapped onto the FTS columns (name, email,
+# phone, body); bm25 weighs a hit in the name highest, free text lowest.
+INDEXED = {
+    BOOKINGS: {'name': 'name', 'email': 'email', 'phone': 'phone', 'body': 'special_requests'},
+    FEEDBACK: {'name': 'name', 'email': 'email', 'phone': None, 'body': 'message'},
+}
+COLUMNS = ('name', 'email', 'phone', 'body')
+WEIGHTS = (10.0, 5.0, 5.0, 1.0)
+
+# Longest query, in terms
+MAX_TERMS = 8
+
+# Queries matching more records than this (a two-letter prefix, a common
+# first name) are returned newest first instead of by bm25: ranking has to
+# score every match, and at that point relevance says little anyway
+RANK_LIMIT = 2000
+
+
+def _fts_query(text):
+    # Every term must match, each as a prefix: "ana rey" -> "ana"* "rey"*
+    terms = re.findall(r'\w+', (text or '').lower())[:MAX_TERMS]
+    return ' '.join('"{}"*'.format(term) for term in terms)
+
+
+def _row(name, record):
+    fields = INDEXED[name]
+    return [str(record.get(fields[column]) or '') if fields[column] else '' for column in COLUMNS]
+
+
+class SearchIndex:
+    # SQLite FTS5 tables (one per dataset, rowid = record id) in their own
+    # file, so they work with either storage backend and survive restarts.
+    # record_changed keeps them current write by write. The storage version
+    # the index matches is saved alongside, and a write is only applied when
+    # it started from that version. When the index falls behind otherwise
+    # (a write from a worker without the index, data changed while no app
+    # was running), it catches up on its next search: if every write since
+    # was an insert (storage.appended_since), only the records past the last
+    # indexed id are added; after an update or delete it is rebuilt.
+
+    def __init__(self, path, storage):
+        self.path = path
+        self.storage = storage
+        self._local = threading.local()
+        self._rebuild_lock = threading.Lock()
+        # Dataset -> the (before, after) pair of the batch write being applied
+        self._batch = {}
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS meta (dataset TEXT PRIMARY KEY, version TEXT, stale INTEGER NOT NULL)')
+        for name in INDEXED:
+            conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS {}_fts USING fts5({}, prefix='2 3', "
+                         "tokenize='unicode61 remove_diacritics 2')".format(name, ', '.join(COLUMNS)))
+        with conn:
+            for name in INDEXED:
+                conn.execute('INSERT OR IGNORE INTO meta (dataset, version, stale) VALUES (?, NULL, 1)', (name,))
+        record_changed.connect(self._on_change, sender=BOOKINGS, weak=False)
+        record_changed.connect(self._on_change, sender=FEEDBACK, weak=False)
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _version(self, name):
+        return json.dumps(self.storage.version(name))
+
+    def _stored_version(self, name):
+        row = self._conn().execute('SELECT version, stale FROM meta WHERE dataset = ?', (name,)).fetchone()
+        return row[0] if row and not row[1] else None
+
+    def _is_stale(self, name):
+        # Read from the file each time: any worker may write to the dataset,
+        # mark the index stale or rebuild it
+        return self._stored_version(name) != self._version(name)
+
+    def _on_change(self, sender, storage=None, old=None, new=None, version=None):
+        stored = self._stored_version(sender)
+        if stored is None:
+            return
+        before, after = (json.dumps(value) for value in version or (None, None))
+        if stored != before and not (stored == after and version == self._batch.get(sender)):
+            # Missed a write from elsewhere: the next search catches up on it
+            # and this one (if stored == after, a rebuild already read this one)
+            return
+        self._batch[sender] = version
+        conn = self._conn()
+        with conn:
+            if old is not None:
+                conn.execute('DELETE FROM {}_fts WHERE rowid = ?'.format(sender), (old['id'],))
+            if new is not None:
+                conn.execute('INSERT OR REPLACE INTO {}_fts (rowid, {}) VALUES (?, ?, ?, ?, ?)'.format(
+                    sender, ', '.join(COLUMNS)), [new['id']] + _row(sender, new))
+            conn.execute('UPDATE meta SET version = ? WHERE dataset = ?', (after, sender))
+
+    def catch_up(self, name):
+        # Indexes the records added since the stored version when nothing
+        # else changed since, and rebuilds otherwise
+        with self._rebuild_lock:
+            if not self._is_stale(name):
+                return
+            stored = self._stored_version(name)
+            if stored is None or not self.storage.appended_since(name, json.loads(stored)):
+                return self._rebuild(name)
+            conn = self._conn()
+            version = self._version(name)
+            last_id = conn.execute('SELECT MAX(rowid) FROM {}_fts'.format(name)).fetchone()[0] or 0
+            added, _ = self.storage.query(name, ranges={'id': (last_id + 1, None)})
+            with conn:
+                conn.executemany('INSERT OR REPLACE INTO {}_fts (rowid, {}) VALUES (?, ?, ?, ?, ?)'.format(
+                    name, ', '.join(COLUMNS)), ([record['id']] + _row(name, record) for record in added))
+                # Writes made meanwhile are caught up on next time
+                conn.execute('UPDATE meta SET version = ? WHERE dataset = ? AND version = ?', (version, name, stored))
+
+    def rebuild(self, name):
+        with self._rebuild_lock:
+            if self._is_stale(name):
+                self._rebuild(name)
+
+    def _rebuild(self, name):
+        # Streams the dataset into a fresh table in one transaction. Writes
+        # made meanwhile were skipped (the index was stale), so if the
+        # dataset changed during the rebuild it is rebuilt again next time.
+        conn = self._conn()
+        version = self._version(name)
+        with conn:
+            conn.execute('DELETE FROM {}_fts'.format(name))
+            conn.executemany('INSERT INTO {}_fts (rowid, {}) VALUES (?, ?, ?, ?, ?)'.format(name, ', '.join(COLUMNS)),
+                             ([record['id']] + _row(name, record) for record in self.storage.iter_query(name)))
+            stale = int(self._version(name) != version)
+            conn.execute('INSERT OR REPLACE INTO meta (dataset, version, stale) VALUES (?, ?, ?)',
+                         (name, version, stale))
+
+    def search(self, name, text, limit=20, offset=0):
+        # (total matches, [(record id, score)]) best first. The score is
+        # bm25 (lower is better), or None when ordered by recency.
+        if name not in INDEXED:
+            raise ValueError('Dataset is not indexed: {}'.format(name))
+        query = _fts_query(text)
+        if not query:
+            return 0, []
+        if self._is_stale(name):
+            self.catch_up(name)
+        conn = self._conn()
+        total = conn.execute('SELECT COUNT(*) FROM {0}_fts WHERE {0}_fts MATCH ?'.format(name), (query,)).fetchone()[0]
+        if not total or offset >= total:
+            return total, []
+        if total > RANK_LIMIT:
+            sql = 'SELECT rowid, NULL FROM {0}_fts WHERE {0}_fts MATCH ? ORDER BY rowid DESC LIMIT ? OFFSET ?'
+        else:
+            sql = ('SELECT rowid, bm25({0}_fts, ' + ', '.join(str(weight) for weight in WEIGHTS) + ') AS score '
+                   'FROM {0}_fts WHERE {0}_fts MATCH ? ORDER BY score LIMIT ? OFFSET ?')
+        rows = conn.execute(sql.format(name), (query, limit, offset))
+        return total, [(row[0], row[1]) for row in rows]
+
+
+def init_search(app, storage):
+    # Admin only: created with the other admin services on first use
+    index = SearchIndex(app.config.get('SEARCH_INDEX_PATH') or os.path.join(app.config['DATA_DIR'], 'search.db'),
+                        storage)
+    app.extensions['search'] = index
+    return index
@@ -0,0 +1,273 @@
+import os
+import json
+import time
+import hashlib
+import secrets
+import sqlite3
+import threading
+
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+
+from signals import record_changed
+from storage import USERS
+
+# Seconds without a request after which a session expires; each request
+# pushes the deadline back (sliding expiry)
+DEFAULT_IDLE_TIMEOUT = 2 * 3600
+
+# The deadline is only written back once it has moved this far, so a
+# busy admin page doesn't cost a store write per request
+TOUCH_INTERVAL = 60
+
+
+def _key(sid):
+    # The store keeps a hash of the cookie value, never the value itself
+    return hashlib.sha256(sid.encode('utf-8')).hexdigest()
+
+
+class ServerSession(CallbackDict, SessionMixin):
+    # The session dict for one request. Only the random id travels in the
+    # cookie; the contents live in the session store.
+
+    def __init__(self, initial=None, sid=None, expires=None):
+        def on_update(self):
+            self.modified = True
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.expires = expires
+        self.modified = False
+        self.rotated = False
+
+    def rotate(self):
+        # Move the contents to a new id (at login and logout), so an id
+        # someone obtained earlier no longer works
+        self.rotated = True
+        self.modified = True
+
+
+class MemorySessions:
+    # Sessions in a dict for one process. Fine for a single worker; with
+    # several, each has its own sessions and revocations don't reach the
+    # others, so use the SQLite store.
+
+    PRUNE_EVERY = 500
+
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def load(self, key, now):
+        # (data, expires), or None if unknown or expired
+        entry = self._sessions.get(key)
+        if entry is None or entry[2] <= now:
+            return None
+        return dict(entry[0]), entry[2]
+
+    def save(self, key, data, user_id, expires):
+        with self._lock:
+            self._sessions[key] = [dict(data), user_id, expires]
+            self._writes += 1
+            if self._writes % self.PRUNE_EVERY == 0:
+                now = time.time()
+                for stale in [k for k, entry in self._sessions.items() if entry[2] <= now]:
+                    del self._sessions[stale]
+
+    def touch(self, key, expires):
+        entry = self._sessions.get(key)
+        if entry is not None:
+            entry[2] = expires
+
+    def delete(self, key):
+        with self._lock:
+            self._sessions.pop(key, None)
+
+    def update_user(self, user_id, changes):
+        with self._lock:
+            for entry in self._sessions.values():
+                if entry[1] == user_id:
+                    entry[0] = dict(entry[0], **changes)
+
+    def revoke(self, user_id=None):
+        # Ends every session of user_id (every logged-in session when None);
+        # returns how many
+        with self._lock:
+            keys = [key for key, entry in self._sessions.items()
+                    if entry[1] is not None and (user_id is None or entry[1] == user_id)]
+            for key in keys:
+                del self._sessions[key]
+        return len(keys)
+
+
+class SqliteSessions:
+    # The same store in a SQLite file shared by every worker, so a logout,
+    # revocation or role change applies everywhere at once.
+
+    PRUNE_EVERY = 500
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS sessions (key TEXT PRIMARY KEY, user_id INTEGER, '
+                     'data TEXT NOT NULL, expires REAL NOT NULL)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions (user_id)')
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def load(self, key, now):
+        row = self._conn().execute('SELECT data, expires FROM sessions WHERE key = ? AND expires > ?',
+                                   (key, now)).fetchone()
+        return (json.loads(row[0]), row[1]) if row else None
+
+    def save(self, key, data, user_id, expires):
+        conn = self._conn()
+        conn.execute('INSERT OR REPLACE INTO sessions (key, user_id, data, expires) VALUES (?, ?, ?, ?)',
+                     (key, user_id, json.dumps(data), expires))
+        self._writes += 1
+        if self._writes % self.PRUNE_EVERY == 0:
+            conn.execute('DELETE FROM sessions WHERE expires <= ?', (time.time(),))
+
+    def touch(self, key, expires):
+        self._conn().execute('UPDATE sessions SET expires = ? WHERE key = ?', (expires, key))
+
+    def delete(self, key):
+        self._conn().execute('DELETE FROM sessions WHERE key = ?', (key,))
+
+    def update_user(self, user_id, changes):
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            rows = conn.execute('SELECT key, data FROM sessions WHERE user_id = ?', (user_id,)).fetchall()
+            for key, data in rows:
+                conn.execute('UPDATE sessions SET data = ? WHERE key = ?',
+                             (json.dumps(dict(json.loads(data), **changes)), key))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+    def revoke(self, user_id=None):
+        if user_id is None:
+            cursor = self._conn().execute('DELETE FROM sessions WHERE user_id IS NOT NULL')
+        else:
+            cursor = self._conn().execute('DELETE FROM sessions WHERE user_id = ?', (user_id,))
+        return cursor.rowcount
+
+
+class ServerSessionInterface(SessionInterface):
+    # Replaces Flask's signed-cookie sessions. Loading a session is one
+    # lookup by id, and nothing is read for requests without a cookie.
+
+    def __init__(self, store, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.store = store
+        self.idle_timeout = idle_timeout
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            loaded = self.store.load(_key(sid), time.time())
+            if loaded is not None:
+                data, expires = loaded
+                return ServerSession(data, sid, expires)
+        return ServerSession()
+
+    def _set_cookie(self, app, session, response):
+        response.set_cookie(
+            self.get_cookie_name(app), session.sid,
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=self.get_cookie_domain(app),
+            path=self.get_cookie_path(app),
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app)
+        )
+
+    def save_session(self, app, session, response):
+        if session.sid is not None or session:
+            response.vary.add('Cookie')
+        if not session:
+            # Emptied (logout) or never used: drop it and its cookie
+            if session.sid is not None and session.modified:
+                self.store.delete(_key(session.sid))
+                response.delete_cookie(
+                    self.get_cookie_name(app),
+                    domain=self.get_cookie_domain(app),
+                    path=self.get_cookie_path(app),
+                    secure=self.get_cookie_secure(app),
+                    samesite=self.get_cookie_samesite(app),
+                    httponly=self.get_cookie_httponly(app)
+                )
+            return
+
+        now = time.time()
+        expires = now + self.idle_timeout
+        if session.modified or session.sid is None:
+            if session.sid is not None and session.rotated:
+                self.store.delete(_key(session.sid))
+            if session.sid is None or session.rotated:
+                session.sid = secrets.token_urlsafe(32)
+            self.store.save(_key(session.sid), dict(session), session.get('user_id'), expires)
+            self._set_cookie(app, session, response)
+        elif expires - session.expires >= TOUCH_INTERVAL:
+            self.store.touch(_key(session.sid), expires)
+            if session.permanent:
+                self._set_cookie(app, session, response)
+
+
+def reconcile_session(session, users, store):
+    # on_user_change only hears about writes made in this process. A user
+    # deleted or given a new role by another worker, or in users.json by
+    # hand, is caught here: each staff request compares its session with
+    # the user store, whose index is re-read only when the users dataset's
+    # version has moved.
+    user_id = session.get('user_id')
+    if user_id is None:
+        return
+    user = users.get_by_id(user_id)
+    if user is None:
+        store.revoke(user_id)
+        session.clear()
+    elif (session.get('user_role'), session.get('user_name')) != (user.get('role'), user.get('name')):
+        session.update(user_role=user.get('role'), user_name=user.get('name'))
+
+
+def create_store(config):
+    backend = config.get('SESSION_BACKEND', 'memory')
+    if backend == 'memory':
+        return MemorySessions()
+    if backend == 'sqlite':
+        return SqliteSessions(config.get('SESSION_STORE_PATH') or
+                              os.path.join(config.get('DATA_DIR', 'data'), 'sessions.db'))
+    raise ValueError('Unknown session backend: {}'.format(backend))
+
+
+def init_sessions(app):
+    store = create_store(app.config)
+    app.session_interface = ServerSessionInterface(store, app.config.get('SESSION_IDLE_TIMEOUT', DEFAULT_IDLE_TIMEOUT))
+
+    def on_user_change(sender, storage=None, old=None, new=None, version=None):
+        # Deleting a user ends their sessions; a new role or name applies
+        # from their next request
+        if old is None:
+            return
+        if new is None:
+            store.revoke(old['id'])
+        elif new.get('role') != old.get('role') or new.get('name') != old.get('name'):
+            store.update_user(old['id'], {'user_role': new.get('role'), 'user_name': new.get('name')})
+
+    record_changed.connect(on_user_change, sender=USERS, weak=False)
+    app.extensions['sessions'] = store
+    return store
@@ -0,0 +1,15 @@
+from blinker import Namespace
+
+_signals = Namespace()
+
+# Sent by the storage backends after a record is written. The sender is the
+# dataset name; ``old`` is None for inserts and ``new`` is None for deletes.
+# ``version`` is (storage version before, after) the write; a batch write
+# (update_many/delete_many) sends the same pair for each of its records.
+# Receivers run in the writing request, so keep them cheap.
+record_changed = _signals.signal('record-changed')
+
+# Sent by datastore for JSON file I/O; the sender is the file path. ``op``
+# is 'load' for each read_data()/load_data() call, 'read' for bytes parsed
+# from disk on a cache miss and 'save' for bytes written.
+datastore_io = _signals.signal('datastore-io')
@@ -0,0 +1,124 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import compileall
+
+from jinja2 import ChoiceLoader, ModuleLoader
+
+from datastore import read_data
+from storage import DATASETS
+
+# Layout of the directory written by `flask precompile`
+TEMPLATES_SUBDIR = 'templates'
+ASSETS_SUBDIR = 'assets'
+MANIFEST_NAME = 'manifest.json'
+
+
+def _template_digests(app):
+    # Digest of each template's source, read through the normal loader
+    # (the precompiled one has no sources)
+    loader = app.create_global_jinja_loader()
+    digests = {}
+    for name in loader.list_templates():
+        if not name.endswith('.html'):
+            continue
+        source, _, _ = loader.get_source(app.jinja_env, name)
+        digests[name] = hashlib.sha1(source.encode('utf-8')).hexdigest()
+    return digests
+
+
+def precompile(app, target):
+    # Build-time step: compile every template to a Python module and store
+    # brotli/gzip copies of the text assets, so a cold start neither parses
+    # templates nor runs the compressors.
+    templates_dir = os.path.join(target, TEMPLATES_SUBDIR)
+    app.jinja_env.loader = app.create_global_jinja_loader()
+    app.jinja_env.compile_templates(templates_dir, extensions=['html'], zip=None, ignore_errors=False)
+    compileall.compile_dir(templates_dir, quiet=1)
+    written = app.extensions['assets'].save_compressed(os.path.join(target, ASSETS_SUBDIR))
+    digests = _template_digests(app)
+    with open(os.path.join(target, MANIFEST_NAME), 'w') as f:
+        json.dump({'templates': digests}, f, indent=2, sort_keys=True)
+    return len(digests), written
+
+
+def use_precompiled_templates(app, target):
+    # Load templates from the precompiled modules, but only if every one of
+    # them was built from the current sources; otherwise keep compiling on
+    # demand as usual.
+    try:
+        with open(os.path.join(target, MANIFEST_NAME)) as f:
+            expected = json.load(f)['templates']
+    except (OSError, ValueError, KeyError):
+        return False
+    if _template_digests(app) != expected:
+        app.logger.warning('Precompiled templates in %s are out of date; run `flask precompile`', target)
+        return False
+    app.jinja_env.loader = ChoiceLoader([ModuleLoader(os.path.join(target, TEMPLATES_SUBDIR)),
+                                         app.jinja_env.loader])
+    return True
+
+
+def seed_data(app):
+    # Copy datasets missing from DATA_DIR out of the bundled snapshot in
+    # SEED_DIR. Serverless instances only get a writable /tmp, so this is
+    # how they start from the deployed data instead of an empty store.
+    seed_dir = app.config.get('SEED_DIR')
+    if not seed_dir or os.path.abspath(seed_dir) == os.path.abspath(app.config['DATA_DIR']):
+        return 0
+    storage = app.extensions['storage']
+    seeded = 0
+    for name in DATASETS:
+        path = os.path.join(seed_dir, name + '.json')
+        if not storage.exists(name) and os.path.exists(path):
+            storage.replace_all(name, read_data(path))
+            seeded += 1
+    return seeded
+
+
+class StartupTimer:
+    # Import, create_app() and first-request timings for this process. They
+    # are printed once and sent as Server-Timing on the first response, so
+    # cold starts can be read straight from the platform logs or devtools.
+
+    def __init__(self, started):
+        self.started = started
+        self.timings = {}
+        self._request_started = None
+        self._reported = False
+
+    def record(self, name, start, end=None):
+        self.timings[name] = ((end or time.perf_counter()) - start) * 1000
+
+    def before_request(self):
+        if self._request_started is None:
+            self._request_started = time.perf_counter()
+
+    def after_request(self, response):
+        if self._reported:
+            return response
+        self._reported = True
+        self.record('first-request', self._request_started)
+        self.record('cold-start', self.started)
+        response.headers.add('Server-Timing', ', '.join(
+            '{};dur={:.1f}'.format(name, ms) for name, ms in self.timings.items()))
+        print('startup: ' + ', '.join('{} {:.1f} ms'.format(name, ms) for name, ms in self.timings.items()),
+              file=sys.stderr, flush=True)
+        return response
+
+
+def init_startup(app, started, app_started):
+    # Called at the end of create_app(). ``started`` is when app.py began
+    # importing, ``app_started`` when create_app() was entered.
+    timer = StartupTimer(started)
+    timer.record('import', started, app_started)
+    precompiled = app.config.get('PRECOMPILED_DIR')
+    if precompiled and os.path.isdir(precompiled):
+        use_precompiled_templates(app, precompiled)
+    timer.record('create-app', app_started)
+    app.extensions['startup'] = timer
+    app.before_request(timer.before_request)
+    app.after_request(timer.after_request)
+    return timer
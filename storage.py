@@ -0,0 +1,562 @@
+import os
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from datastore import (read_data, iter_data, transaction, append_record, enable_journal,
+                       recover, data_version, save_data, file_lock)
+from signals import record_changed
+
+# Dataset names shared by every backend
+FEATURES = 'features'
+NEARBY = 'nearby'
+FEEDBACK = 'feedback'
+BOOKINGS = 'bookings'
+USERS = 'users'
+
+DATASETS = (FEATURES, NEARBY, FEEDBACK, BOOKINGS, USERS)
+
+# Datasets whose new records are appended through the journal (JSON backend)
+JOURNALED = (BOOKINGS, FEEDBACK)
+
+# Fields pulled out of the record into their own indexed columns (SQLite)
+INDEXED_FIELDS = {
+    BOOKINGS: ('status', 'check_in', 'email'),
+    FEEDBACK: ('email',),
+    USERS: ('username',),
+}
+
+
+def _matches(record, criteria):
+    return all(record.get(key) == value for key, value in criteria.items())
+
+
+def _in_range(value, low, high):
+    if value is None:
+        return False
+    if low is not None and value < low:
+        return False
+    if high is not None and value > high:
+        return False
+    return True
+
+
+def _search_match(record, needle, search_fields):
+    return any(needle in str(record.get(field) or '').lower() for field in search_fields)
+
+
+def _sort_key(value):
+    # Orders numbers, then strings, then missing values without comparing
+    # across types.
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value, '')
+    if value is None:
+        return (2, 0, '')
+    return (1, 0, str(value).lower())
+
+
+def _check_field(field):
+    if not field.isidentifier():
+        raise ValueError('Invalid field name: {}'.format(field))
+    return field
+
+
+class JsonStorage:
+    # The original flat-file layout: one JSON array per dataset under
+    # data_dir, with bookings/feedback inserts going through the journal.
+
+    def __init__(self, data_dir='data'):
+        self.data_dir = data_dir
+        self._indexes = {}
+        os.makedirs(data_dir, exist_ok=True)
+        for name in JOURNALED:
+            enable_journal(self.path(name))
+            recover(self.path(name))
+
+    def path(self, name):
+        return os.path.join(self.data_dir, name + '.json')
+
+    def exists(self, name):
+        return os.path.exists(self.path(name))
+
+    def version(self, name):
+        return data_version(self.path(name))
+
+    def appended_since(self, name, version):
+        # True when every write since ``version`` was an insert, so the
+        # records added since are exactly those past the highest id then.
+        # Journaled inserts only grow the journal; anything else (updates,
+        # deletes, the journal folded in) replaces the snapshot file.
+        if version is None or name not in JOURNALED:
+            return False
+        snapshot = self.version(name)[0]
+        return version[0] is not None and snapshot is not None and tuple(version[0]) == snapshot
+
+    def all(self, name):
+        # Shared read-only list; do not mutate
+        return read_data(self.path(name))
+
+    def _index(self, name):
+        data = self.all(name)
+        entry = self._indexes.get(name)
+        if entry is None or entry[0] is not data:
+            entry = (data, {item.get('id'): item for item in data})
+            self._indexes[name] = entry
+        return entry[1]
+
+    def get(self, name, record_id):
+        record = self._index(name).get(record_id)
+        return dict(record) if record is not None else None
+
+    def find(self, name, **criteria):
+        return [dict(item) for item in self.all(name) if _matches(item, criteria)]
+
+    def query(self, name, filters=None, ranges=None, search=None, search_fields=(),
+              sort='id', descending=False, offset=0, limit=None):
+        # Returns (page, total). filters are exact matches, ranges map a
+        # field to an inclusive (low, high) pair with None for an open end,
+        # search is a case-insensitive substring over search_fields.
+        records = self.all(name)
+        if filters:
+            records = [item for item in records if _matches(item, filters)]
+        for field, (low, high) in (ranges or {}).items():
+            records = [item for item in records if _in_range(item.get(field), low, high)]
+        if search:
+            needle = search.lower()
+            records = [item for item in records if _search_match(item, needle, search_fields)]
+        records = sorted(records, key=lambda item: _sort_key(item.get(sort)), reverse=descending)
+        end = offset + limit if limit is not None else None
+        return [dict(item) for item in records[offset:end]], len(records)
+
+    def iter_query(self, name, filters=None, ranges=None, search=None, search_fields=()):
+        # Same filters as query(), but yields matching records in id order
+        # without loading the dataset (see datastore.iter_data)
+        needle = search.lower() if search else None
+        for item in iter_data(self.path(name)):
+            if filters and not _matches(item, filters):
+                continue
+            if ranges and not all(_in_range(item.get(field), low, high) for field, (low, high) in ranges.items()):
+                continue
+            if needle and not _search_match(item, needle, search_fields):
+                continue
+            yield item
+
+    def count_by(self, name, field):
+        data = self.all(name)
+        key = (name, field)
+        entry = self._indexes.get(key)
+        if entry is None or entry[0] is not data:
+            counts = {}
+            for item in data:
+                value = item.get(field)
+                counts[value] = counts.get(value, 0) + 1
+            entry = (data, counts)
+            self._indexes[key] = entry
+        return dict(entry[1])
+
+    def lock(self, name):
+        # Holds off other writers to the dataset, in any worker, for a
+        # check-then-write sequence; writes inside the block re-enter it
+        return file_lock(self.path(name))
+
+    @contextmanager
+    def _writing(self, name):
+        # The dataset lock around one write, collecting the version before
+        # and after it for record_changed
+        versions = []
+        with file_lock(self.path(name)):
+            versions.append(self.version(name))
+            yield versions
+            versions.append(self.version(name))
+
+    def insert(self, name, record):
+        with self._writing(name) as version:
+            if name in JOURNALED:
+                record = append_record(self.path(name), record)
+            else:
+                with transaction(self.path(name)) as data:
+                    record = {'id': max((item.get('id', 0) for item in data), default=0) + 1, **record}
+                    data.append(record)
+        record_changed.send(name, storage=self, old=None, new=dict(record), version=tuple(version))
+        return record
+
+    def update(self, name, record_id, changes):
+        old = new = None
+        with self._writing(name) as version:
+            with transaction(self.path(name)) as data:
+                for item in data:
+                    if item.get('id') == record_id:
+                        old = dict(item)
+                        item.update(changes)
+                        new = dict(item)
+                        break
+        if new is not None:
+            record_changed.send(name, storage=self, old=old, new=dict(new), version=tuple(version))
+        return new
+
+    def delete(self, name, record_id):
+        with self._writing(name) as version:
+            with transaction(self.path(name)) as data:
+                old = next((item for item in data if item.get('id') == record_id), None)
+                if old is not None:
+                    data[:] = [item for item in data if item.get('id') != record_id]
+        if old is not None:
+            record_changed.send(name, storage=self, old=old, new=None, version=tuple(version))
+        return old is not None
+
+    def update_many(self, name, updates):
+        # updates maps record id -> changes; all are applied in one rewrite.
+        # Returns record id -> updated record, or None if it doesn't exist.
+        results = dict.fromkeys(updates)
+        changed = []
+        with self._writing(name) as version:
+            with transaction(self.path(name)) as data:
+                for item in data:
+                    changes = updates.get(item.get('id'))
+                    if changes is not None:
+                        old = dict(item)
+                        item.update(changes)
+                        results[item['id']] = dict(item)
+                        changed.append((old, dict(item)))
+        for old, new in changed:
+            record_changed.send(name, storage=self, old=old, new=new, version=tuple(version))
+        return results
+
+    def delete_many(self, name, record_ids):
+        # Returns record id -> whether it existed and was deleted
+        wanted = set(record_ids)
+        with self._writing(name) as version:
+            with transaction(self.path(name)) as data:
+                removed = [item for item in data if item.get('id') in wanted]
+                if removed:
+                    data[:] = [item for item in data if item.get('id') not in wanted]
+        for old in removed:
+            record_changed.send(name, storage=self, old=old, new=None, version=tuple(version))
+        deleted = {item['id'] for item in removed}
+        return {record_id: record_id in deleted for record_id in record_ids}
+
+    def replace_all(self, name, records):
+        save_data(self.path(name), list(records))
+
+
+class SqliteStorage:
+    # One table per dataset holding the record as JSON plus indexed copies
+    # of the fields in INDEXED_FIELDS. A per-dataset version counter lets
+    # the parsed list be cached until some worker writes to it.
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._cache = {}
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute('PRAGMA journal_mode=WAL')
+        with conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS meta (dataset TEXT PRIMARY KEY, version INTEGER NOT NULL, '
+                         'rewritten INTEGER NOT NULL DEFAULT 0)')
+            if 'rewritten' not in [row[1] for row in conn.execute('PRAGMA table_info(meta)')]:
+                # Databases from before the column: count everything as rewritten
+                conn.execute('ALTER TABLE meta ADD COLUMN rewritten INTEGER NOT NULL DEFAULT 0')
+                conn.execute('UPDATE meta SET rewritten = version')
+            for name in DATASETS:
+                columns = ''.join(', {} TEXT'.format(field) for field in INDEXED_FIELDS.get(name, ()))
+                conn.execute('CREATE TABLE IF NOT EXISTS {} (id INTEGER PRIMARY KEY, data TEXT NOT NULL{})'.format(name, columns))
+                for field in INDEXED_FIELDS.get(name, ()):
+                    conn.execute('CREATE INDEX IF NOT EXISTS idx_{0}_{1} ON {0} ({1})'.format(name, field))
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _check(self, name):
+        if name not in DATASETS:
+            raise KeyError('Unknown dataset: {}'.format(name))
+
+    def _columns(self, name, record):
+        fields = INDEXED_FIELDS.get(name, ())
+        return fields, [record.get(field) for field in fields]
+
+    def _bump(self, conn, name, rewrite=True):
+        # Returns (version before, version after) for record_changed.
+        # ``rewritten`` is the version of the last write that wasn't an insert.
+        row = conn.execute('SELECT version FROM meta WHERE dataset = ?', (name,)).fetchone()
+        before = row[0] if row else None
+        after = (before or 0) + 1
+        conn.execute('INSERT INTO meta (dataset, version, rewritten) VALUES (?, ?, ?) '
+                     'ON CONFLICT(dataset) DO UPDATE SET version = excluded.version, '
+                     'rewritten = CASE WHEN ? THEN excluded.version ELSE rewritten END',
+                     (name, after, after if rewrite else 0, int(rewrite)))
+        return before, after
+
+    def _write(self, fn):
+        conn = self._conn()
+        if getattr(self._local, 'locked', False):
+            # Inside lock(): part of its transaction
+            return fn(conn)
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            result = fn(conn)
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return result
+
+    @contextmanager
+    def lock(self, name):
+        # Holds off other writers, in any worker, for a check-then-write
+        # sequence: one write transaction for the whole block, which the
+        # writes inside it join
+        self._check(name)
+        if getattr(self._local, 'locked', False):
+            yield
+            return
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        self._local.locked = True
+        try:
+            yield
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        finally:
+            self._local.locked = False
+
+    def exists(self, name):
+        return self.version(name) is not None
+
+    def version(self, name):
+        self._check(name)
+        row = self._conn().execute('SELECT version FROM meta WHERE dataset = ?', (name,)).fetchone()
+        return row[0] if row else None
+
+    def appended_since(self, name, version):
+        # True when every write since ``version`` was an insert, so the
+        # records added since are exactly those past the highest id then
+        self._check(name)
+        row = self._conn().execute('SELECT version, rewritten FROM meta WHERE dataset = ?', (name,)).fetchone()
+        return version is not None and row is not None and row[1] <= version <= row[0]
+
+    def all(self, name):
+        # Shared read-only list; do not mutate
+        version = self.version(name)
+        entry = self._cache.get(name)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        rows = self._conn().execute('SELECT data FROM {} ORDER BY id'.format(name))
+        data = [json.loads(row[0]) for row in rows]
+        self._cache[name] = (version, data)
+        return data
+
+    def get(self, name, record_id):
+        self._check(name)
+        row = self._conn().execute('SELECT data FROM {} WHERE id = ?'.format(name), (record_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find(self, name, **criteria):
+        self._check(name)
+        indexed = INDEXED_FIELDS.get(name, ())
+        if not criteria or not set(criteria) <= set(indexed):
+            return [dict(item) for item in self.all(name) if _matches(item, criteria)]
+        where = ' AND '.join('{} = ?'.format(field) for field in criteria)
+        rows = self._conn().execute('SELECT data FROM {} WHERE {} ORDER BY id'.format(name, where),
+                                    tuple(criteria.values()))
+        return [json.loads(row[0]) for row in rows]
+
+    def _expr(self, name, field):
+        # Indexed fields and id are real columns; anything else is read out
+        # of the JSON document.
+        if field == 'id' or field in INDEXED_FIELDS.get(name, ()):
+            return field
+        return "json_extract(data, '$.{}')".format(_check_field(field))
+
+    def _where(self, name, filters, ranges, search, search_fields):
+        clauses, params = [], []
+        for field, value in (filters or {}).items():
+            clauses.append('{} = ?'.format(self._expr(name, field)))
+            params.append(value)
+        for field, (low, high) in (ranges or {}).items():
+            expr = self._expr(name, field)
+            clauses.append('{} IS NOT NULL'.format(expr))
+            if low is not None:
+                clauses.append('{} >= ?'.format(expr))
+                params.append(low)
+            if high is not None:
+                clauses.append('{} <= ?'.format(expr))
+                params.append(high)
+        if search and search_fields:
+            clauses.append('(' + ' OR '.join("{} LIKE ? ESCAPE '\\'".format(self._expr(name, field))
+                                             for field in search_fields) + ')')
+            pattern = '%' + search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            params.extend([pattern] * len(search_fields))
+        return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), params
+
+    def query(self, name, filters=None, ranges=None, search=None, search_fields=(),
+              sort='id', descending=False, offset=0, limit=None):
+        self._check(name)
+        where, params = self._where(name, filters, ranges, search, search_fields)
+        conn = self._conn()
+        total = conn.execute('SELECT COUNT(*) FROM {}{}'.format(name, where), params).fetchone()[0]
+        order = '{} COLLATE NOCASE {}, id'.format(self._expr(name, sort), 'DESC' if descending else 'ASC')
+        rows = conn.execute('SELECT data FROM {}{} ORDER BY {} LIMIT ? OFFSET ?'.format(name, where, order),
+                            params + [limit if limit is not None else -1, offset])
+        return [json.loads(row[0]) for row in rows], total
+
+    def iter_query(self, name, filters=None, ranges=None, search=None, search_fields=()):
+        # Rows are fetched from the cursor as they are consumed. A separate
+        # connection keeps the read transaction (a consistent snapshot under
+        # WAL) open only for this iteration.
+        self._check(name)
+        where, params = self._where(name, filters, ranges, search, search_fields)
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            for row in conn.execute('SELECT data FROM {}{} ORDER BY id'.format(name, where), params):
+                yield json.loads(row[0])
+        finally:
+            conn.close()
+
+    def count_by(self, name, field):
+        self._check(name)
+        rows = self._conn().execute('SELECT {0}, COUNT(*) FROM {1} GROUP BY {0}'.format(self._expr(name, field), name))
+        return {value: count for value, count in rows}
+
+    def _insert(self, conn, name, record):
+        fields, values = self._columns(name, record)
+        placeholders = ', ?' * len(fields)
+        columns = ''.join(', ' + field for field in fields)
+        conn.execute('INSERT INTO {} (id, data{}) VALUES (?, ?{})'.format(name, columns, placeholders),
+                     [record['id'], json.dumps(record)] + values)
+
+    def insert(self, name, record):
+        self._check(name)
+
+        def do_insert(conn):
+            last_id = conn.execute('SELECT MAX(id) FROM {}'.format(name)).fetchone()[0] or 0
+            new_record = {'id': last_id + 1, **record}
+            self._insert(conn, name, new_record)
+            return new_record, self._bump(conn, name, rewrite=False)
+        new_record, version = self._write(do_insert)
+        record_changed.send(name, storage=self, old=None, new=dict(new_record), version=version)
+        return new_record
+
+    def update(self, name, record_id, changes):
+        self._check(name)
+
+        def do_update(conn):
+            row = conn.execute('SELECT data FROM {} WHERE id = ?'.format(name), (record_id,)).fetchone()
+            if row is None:
+                return None, None, None
+            old = json.loads(row[0])
+            record = dict(old, **changes)
+            fields, values = self._columns(name, record)
+            assignments = ''.join(', {} = ?'.format(field) for field in fields)
+            conn.execute('UPDATE {} SET data = ?{} WHERE id = ?'.format(name, assignments),
+                         [json.dumps(record)] + values + [record_id])
+            return old, record, self._bump(conn, name)
+        old, new, version = self._write(do_update)
+        if new is not None:
+            record_changed.send(name, storage=self, old=old, new=dict(new), version=version)
+        return new
+
+    def delete(self, name, record_id):
+        self._check(name)
+
+        def do_delete(conn):
+            row = conn.execute('SELECT data FROM {} WHERE id = ?'.format(name), (record_id,)).fetchone()
+            if row is None:
+                return None, None
+            conn.execute('DELETE FROM {} WHERE id = ?'.format(name), (record_id,))
+            return json.loads(row[0]), self._bump(conn, name)
+        old, version = self._write(do_delete)
+        if old is not None:
+            record_changed.send(name, storage=self, old=old, new=None, version=version)
+        return old is not None
+
+    def update_many(self, name, updates):
+        self._check(name)
+
+        def do_update(conn):
+            results, changed = dict.fromkeys(updates), []
+            for record_id, changes in updates.items():
+                row = conn.execute('SELECT data FROM {} WHERE id = ?'.format(name), (record_id,)).fetchone()
+                if row is None:
+                    continue
+                old = json.loads(row[0])
+                record = dict(old, **changes)
+                fields, values = self._columns(name, record)
+                assignments = ''.join(', {} = ?'.format(field) for field in fields)
+                conn.execute('UPDATE {} SET data = ?{} WHERE id = ?'.format(name, assignments),
+                             [json.dumps(record)] + values + [record_id])
+                results[record_id] = record
+                changed.append((old, dict(record)))
+            version = self._bump(conn, name) if changed else None
+            return results, changed, version
+        results, changed, version = self._write(do_update)
+        for old, new in changed:
+            record_changed.send(name, storage=self, old=old, new=new, version=version)
+        return results
+
+    def delete_many(self, name, record_ids):
+        self._check(name)
+
+        def do_delete(conn):
+            removed = []
+            for record_id in record_ids:
+                row = conn.execute('SELECT data FROM {} WHERE id = ?'.format(name), (record_id,)).fetchone()
+                if row is not None:
+                    conn.execute('DELETE FROM {} WHERE id = ?'.format(name), (record_id,))
+                    removed.append(json.loads(row[0]))
+            version = self._bump(conn, name) if removed else None
+            return removed, version
+        removed, version = self._write(do_delete)
+        for old in removed:
+            record_changed.send(name, storage=self, old=old, new=None, version=version)
+        deleted = {item['id'] for item in removed}
+        return {record_id: record_id in deleted for record_id in record_ids}
+
+    def replace_all(self, name, records):
+        self._check(name)
+
+        def do_replace(conn):
+            conn.execute('DELETE FROM {}'.format(name))
+            for record in records:
+                self._insert(conn, name, record)
+            self._bump(conn, name)
+        self._write(do_replace)
+
+
+def create_storage(config):
+    backend = config.get('STORAGE_BACKEND', 'json')
+    if backend == 'json':
+        return JsonStorage(config.get('DATA_DIR', 'data'))
+    if backend == 'sqlite':
+        return SqliteStorage(config.get('SQLITE_PATH') or os.path.join(config.get('DATA_DIR', 'data'), 'extremeli.db'))
+    raise ValueError('Unknown storage backend: {}'.format(backend))
+
+
+def init_storage(app):
+    storage = create_storage(app.config)
+    app.extensions['storage'] = storage
+    return storage
+
+
+def migrate_json_to_sqlite(data_dir, sqlite_path):
+    # One-shot copy of data/*.json (including any journaled records) into
+    # the SQLite backend. Existing rows in the target are replaced.
+    source = JsonStorage(data_dir)
+    target = SqliteStorage(sqlite_path)
+    counts = {}
+    for name in DATASETS:
+        if source.exists(name):
+            records = source.all(name)
+            target.replace_all(name, records)
+            counts[name] = len(records)
+    return counts
@@ -0,0 +1,38 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# app.py builds a module-level app at import; keep it off the real data/
+os.environ.setdefault('DATA_DIR', tempfile.mkdtemp(prefix='extremeli-tests-'))
+
+from app import create_app  # noqa: E402
+from signals import record_changed  # noqa: E402
+from storage import JsonStorage  # noqa: E402
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app({'DATA_DIR': str(tmp_path), 'TESTING': True})
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def other_worker(app, tmp_path):
+    # Writes as another worker process would make them: same files, but
+    # none of their record_changed signals reach this app's receivers
+    storage = JsonStorage(str(tmp_path))
+
+    def write(method, *args):
+        with record_changed.muted():
+            return getattr(storage, method)(*args)
+    return write
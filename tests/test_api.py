@@ -0,0 +1,92 @@
+import threading
+
+import pytest
+
+from storage import FEEDBACK
+
+AUTH = {'Authorization': 'Bearer test-token'}
+
+
+@pytest.fixture
+def api(app, client):
+    app.config['API_TOKEN'] = 'test-token'
+
+    def call(method, path, **kwargs):
+        headers = dict(AUTH, **kwargs.pop('headers', {}))
+        return client.open('/api/v1' + path, method=method, headers=headers, **kwargs)
+    return call
+
+
+def _feedback(api, n):
+    response = api('POST', '/feedback', json={'name': 'Guest {}'.format(n), 'email': 'guest@example.com',
+                                               'message': 'Message {}'.format(n)})
+    assert response.status_code == 201
+    return response.get_json()
+
+
+def test_list_is_revalidated_by_etag(api):
+    _feedback(api, 1)
+    first = api('GET', '/feedback')
+    assert first.status_code == 200 and first.headers['ETag']
+    assert api('GET', '/feedback', headers={'If-None-Match': first.headers['ETag']}).status_code == 304
+
+    _feedback(api, 2)
+    changed = api('GET', '/feedback', headers={'If-None-Match': first.headers['ETag']})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != first.headers['ETag']
+    assert len(changed.get_json()['data']) == 2
+
+
+def test_cursor_pages_cover_every_record_once(api):
+    ids = [_feedback(api, n)['id'] for n in range(5)]
+    seen, cursor, pages = [], None, 0
+    while True:
+        response = api('GET', '/feedback', query_string=dict({'limit': 2, 'fields': 'id'},
+                                                              **({'cursor': cursor} if cursor else {})))
+        body = response.get_json()
+        seen += [record['id'] for record in body['data']]
+        pages += 1
+        if not body['has_more']:
+            assert body['next_cursor'] is None and 'Link' not in response.headers
+            break
+        assert 'rel="next"' in response.headers['Link']
+        cursor = body['next_cursor']
+    assert seen == ids and pages == 3
+    assert api('GET', '/feedback', query_string={'cursor': 'garbage'}).status_code == 400
+
+
+def test_patch_and_delete_honour_if_match(api):
+    record = _feedback(api, 1)
+    etag = api('GET', '/feedback/{}'.format(record['id'])).headers['ETag']
+
+    response = api('PATCH', '/feedback/{}'.format(record['id']), json={'read': True}, headers={'If-Match': etag})
+    assert response.status_code == 200 and response.get_json()['read'] is True
+    # The ETag it was read with is now stale
+    assert api('PATCH', '/feedback/{}'.format(record['id']), json={'read': False},
+               headers={'If-Match': etag}).status_code == 412
+    assert api('DELETE', '/feedback/{}'.format(record['id']), headers={'If-Match': etag}).status_code == 412
+    assert api('DELETE', '/feedback/{}'.format(record['id']),
+               headers={'If-Match': response.headers['ETag']}).status_code == 204
+    assert api('PATCH', '/feedback/{}'.format(record['id']), json={'read': True}).status_code == 404
+
+
+def test_concurrent_patches_with_the_same_etag_let_one_through(app, api):
+    for n in range(5):
+        record = _feedback(api, n)
+        etag = api('GET', '/feedback/{}'.format(record['id'])).headers['ETag']
+        barrier = threading.Barrier(2)
+        statuses = []
+
+        def patch(message):
+            client = app.test_client()
+            barrier.wait()
+            statuses.append(client.patch('/api/v1/feedback/{}'.format(record['id']), json={'message': message},
+                                         headers=dict(AUTH, **{'If-Match': etag})).status_code)
+
+        threads = [threading.Thread(target=patch, args=(message,)) for message in ('first', 'second')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(statuses) == [200, 412]
+        assert app.extensions['storage'].get(FEEDBACK, record['id'])['message'] in ('first', 'second')
@@ -0,0 +1,63 @@
+from datetime import date
+
+import pytest
+
+from archive import Archive
+from storage import JsonStorage, SqliteStorage, BOOKINGS, FEEDBACK
+
+TODAY = date(2026, 6, 1)
+
+
+@pytest.fixture(params=['json', 'sqlite'])
+def storage(request, tmp_path):
+    if request.param == 'json':
+        return JsonStorage(str(tmp_path / 'data'))
+    return SqliteStorage(str(tmp_path / 'data.db'))
+
+
+def _booking(status, check_in, check_out, **fields):
+    return dict({'name': 'Guest', 'room_type': 'suite', 'status': status, 'check_in': check_in,
+                 'check_out': check_out, 'created_at': '2024-01-01 10:00:00',
+                 'updated_at': '2024-01-01 10:00:00'}, **fields)
+
+
+def test_archive_moves_closed_records_and_reads_them_back(storage, tmp_path):
+    storage.replace_all(BOOKINGS, [])
+    old = [storage.insert(BOOKINGS, _booking('confirmed', '2024-03-0{}'.format(day), '2024-03-1{}'.format(day)))
+           for day in range(1, 4)]
+    cancelled = storage.insert(BOOKINGS, _booking('cancelled', '2024-04-02', '2024-04-05'))
+    open_booking = storage.insert(BOOKINGS, _booking('pending', '2024-03-05', '2024-03-07'))
+    recent = storage.insert(BOOKINGS, _booking('confirmed', '2026-05-01', '2026-05-03'))
+    newest = storage.insert(BOOKINGS, _booking('confirmed', '2024-02-01', '2024-02-03'))
+    archive = Archive(str(tmp_path / 'archive'), storage)
+
+    assert archive.archive(BOOKINGS, TODAY, dry_run=True) == 4
+    assert archive.archive(BOOKINGS, TODAY) == 4
+
+    # The newest record stays live so its id is never handed out again
+    live = [record['id'] for record in storage.all(BOOKINGS)]
+    assert live == [open_booking['id'], recent['id'], newest['id']]
+    assert [month for month, _ in archive.segments(BOOKINGS)] == ['2024-04', '2024-03']
+    assert archive.manifest(BOOKINGS)['2024-03']['records'] == 3
+
+    records, total = archive.query(BOOKINGS)
+    assert total == 4
+    assert records == [cancelled] + old[::-1]
+    assert archive.query(BOOKINGS, months=['2024-03'], filters={'status': 'confirmed'}, limit=2) == (old[:0:-1], 3)
+
+    assert storage.insert(BOOKINGS, _booking('pending', '2026-07-01', '2026-07-02'))['id'] == newest['id'] + 1
+    assert archive.archive(BOOKINGS, TODAY) == 1
+    assert archive.query(BOOKINGS)[1] == 5
+
+
+def test_archive_run_is_idempotent_for_feedback(storage, tmp_path):
+    storage.replace_all(FEEDBACK, [])
+    read = storage.insert(FEEDBACK, {'name': 'A', 'message': 'old', 'read': True, 'date': '2024-01-10 09:00:00'})
+    storage.insert(FEEDBACK, {'name': 'B', 'message': 'unread', 'read': False, 'date': '2024-01-11 09:00:00'})
+    storage.insert(FEEDBACK, {'name': 'C', 'message': 'newest', 'read': True, 'date': '2024-01-12 09:00:00'})
+    archive = Archive(str(tmp_path / 'archive'), storage)
+
+    assert archive.run([FEEDBACK], TODAY) == {FEEDBACK: 1}
+    assert archive.run([FEEDBACK], TODAY) == {FEEDBACK: 0}
+    assert archive.query(FEEDBACK) == ([read], 1)
+    assert storage.get(FEEDBACK, read['id']) is None
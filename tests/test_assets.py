@@ -0,0 +1,11 @@
+def test_fingerprinted_assets_are_cached_by_browsers_and_cdns(app, client):
+    url = app.extensions['assets'].fingerprinted['css/styles.css']
+    response = client.get('/assets/' + url, headers={'Accept-Encoding': 'br, gzip'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'br'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    cache_control = response.cache_control
+    assert cache_control.public and cache_control.immutable
+    assert cache_control.max_age == cache_control.s_maxage == 31536000
+
+    assert client.get('/assets/css/styles.0000.css').status_code == 404
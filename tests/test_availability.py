@@ -0,0 +1,76 @@
+import threading
+from datetime import date, timedelta
+
+from storage import BOOKINGS
+
+CHECK_IN = date.today() + timedelta(days=40)
+CHECK_OUT = CHECK_IN + timedelta(days=2)
+
+
+def _book(client, n, room_type='suite'):
+    form = {'name': 'Guest {}'.format(n), 'email': 'guest{}@example.com'.format(n), 'phone': '0999 123 4567',
+            'room_type': room_type, 'check_in': CHECK_IN.isoformat(), 'check_out': CHECK_OUT.isoformat(),
+            'guests': '2'}
+    return client.post('/booking', data=form, environ_base={'REMOTE_ADDR': '10.1.0.{}'.format(n)})
+
+
+def _held(app):
+    return [booking for booking in app.extensions['storage'].all(BOOKINGS)
+            if booking['status'] in ('pending', 'confirmed')]
+
+
+def test_public_bookings_stop_at_the_inventory(app, client):
+    for n in range(5):
+        _book(client, n)
+    assert len(_held(app)) == 4
+    assert app.extensions['availability'].rooms_available('suite', CHECK_IN, CHECK_OUT) == 0
+    assert app.extensions['availability'].rooms_available('family', CHECK_IN, CHECK_OUT) == 6
+
+
+def test_concurrent_bookings_do_not_overbook(app):
+    threads = [threading.Thread(target=_book, args=(app.test_client(), n)) for n in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(_held(app)) == 4
+
+
+def test_reinstating_a_cancelled_booking_needs_a_free_room(app, client):
+    for n in range(4):
+        _book(client, n)
+    client.post('/admin/login', data={'username': 'admin', 'password': 'admin123'})
+    first = _held(app)[0]['id']
+    client.post('/admin/bookings/update_status/{}'.format(first), data={'status': 'cancelled'})
+    _book(client, 9)
+    assert len(_held(app)) == 4
+
+    response = client.post('/admin/bookings/update_status/{}'.format(first), data={'status': 'confirmed'},
+                           follow_redirects=True)
+    assert b'fully booked' in response.data
+    assert app.extensions['storage'].get(BOOKINGS, first)['status'] == 'cancelled'
+    assert len(_held(app)) == 4
+
+    client.post('/admin/bookings/update_status/{}'.format(first), data={'status': 'bogus'})
+    assert app.extensions['storage'].get(BOOKINGS, first)['status'] == 'cancelled'
+
+
+def test_index_follows_writes_it_did_not_see(app, other_worker, monkeypatch):
+    index = app.extensions['availability']
+    rebuilds = []
+    rebuild = index._rebuild
+    monkeypatch.setattr(index, '_rebuild', lambda: rebuilds.append(1) or rebuild())
+    assert index.rooms_available('suite', CHECK_IN, CHECK_OUT) == 4
+    assert len(rebuilds) == 1
+
+    # Another worker's bookings: only the new ones are read
+    stay = {'room_type': 'suite', 'check_in': CHECK_IN.isoformat(), 'check_out': CHECK_OUT.isoformat()}
+    first = other_worker('insert', BOOKINGS, dict(stay, name='Other', status='pending'))
+    other_worker('insert', BOOKINGS, dict(stay, name='Other', status='confirmed'))
+    assert index.rooms_available('suite', CHECK_IN, CHECK_OUT) == 2
+    assert len(rebuilds) == 1
+
+    # Its cancellation needs a rebuild
+    other_worker('update', BOOKINGS, first['id'], {'status': 'cancelled'})
+    assert index.rooms_available('suite', CHECK_IN, CHECK_OUT) == 3
+    assert len(rebuilds) == 2
@@ -0,0 +1,52 @@
+from datetime import date, timedelta
+
+from storage import BOOKINGS
+
+CHECK_IN = date.today() + timedelta(days=50)
+CHECK_OUT = CHECK_IN + timedelta(days=3)
+
+
+def _insert(app, status, n=1):
+    storage = app.extensions['storage']
+    return [storage.insert(BOOKINGS, {'name': 'Guest', 'email': 'guest@example.com', 'room_type': 'suite',
+                                      'check_in': CHECK_IN.isoformat(), 'check_out': CHECK_OUT.isoformat(),
+                                      'guests': 2, 'status': status})['id'] for _ in range(n)]
+
+
+def _login(client, username='admin', password='admin123'):
+    client.post('/admin/login', data={'username': username, 'password': password})
+
+
+def _bulk(client, action, ids):
+    response = client.post('/admin/bookings/bulk', json={'action': action, 'ids': ids})
+    assert response.status_code == 200
+    return {item['id']: item['result'] for item in response.get_json()['results']}
+
+
+def test_bulk_status_reports_each_id(app, client):
+    _login(client)
+    pending, confirmed = _insert(app, 'pending') + _insert(app, 'confirmed')
+    results = _bulk(client, 'confirmed', [pending, confirmed, 999, 'x'])
+    assert results == {pending: 'updated', confirmed: 'unchanged', 999: 'not_found', 'x': 'invalid'}
+    assert app.extensions['storage'].get(BOOKINGS, pending)['status'] == 'confirmed'
+
+
+def test_bulk_confirm_of_cancelled_bookings_stops_at_the_inventory(app, client):
+    _login(client)
+    _insert(app, 'confirmed', 3)
+    cancelled = _insert(app, 'cancelled', 3)
+    results = _bulk(client, 'confirmed', cancelled)
+    assert sorted(results.values()) == ['fully_booked', 'fully_booked', 'updated']
+    held = [b for b in app.extensions['storage'].all(BOOKINGS) if b['status'] != 'cancelled']
+    assert len(held) == 4
+    assert app.extensions['availability'].rooms_available('suite', CHECK_IN, CHECK_OUT) == 0
+
+
+def test_bulk_delete_is_admin_only(app, client):
+    ids = _insert(app, 'pending', 2)
+    _login(client, 'frontdesk', 'front123')
+    assert _bulk(client, 'delete', ids) == {item_id: 'forbidden' for item_id in ids}
+    client.get('/admin/logout')
+    _login(client)
+    assert _bulk(client, 'delete', ids) == {item_id: 'deleted' for item_id in ids}
+    assert app.extensions['storage'].all(BOOKINGS) == []
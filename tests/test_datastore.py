@@ -0,0 +1,101 @@
+import os
+import json
+import threading
+import multiprocessing
+
+import pytest
+
+import datastore
+from datastore import append_record, journal_path, read_data
+from storage import JsonStorage, SqliteStorage, BOOKINGS
+
+
+def _ids(records):
+    return [record['id'] for record in records]
+
+
+@pytest.fixture
+def bookings(tmp_path):
+    storage = JsonStorage(str(tmp_path))
+    storage.replace_all(BOOKINGS, [{'id': 1, 'name': 'A'}, {'id': 2, 'name': 'B'}])
+    for name in ('C', 'D', 'E'):
+        storage.insert(BOOKINGS, {'name': name})
+    return storage.path(BOOKINGS)
+
+
+def test_inserts_go_to_the_journal(bookings):
+    with open(bookings) as f:
+        assert _ids(json.load(f)) == [1, 2]
+    assert _ids(read_data(bookings)) == [1, 2, 3, 4, 5]
+
+
+def test_recover_after_compaction_interrupted_before_truncating_journal(bookings, tmp_path):
+    # Snapshot already rewritten with the journal folded in, journal not yet
+    # emptied, plus a temp file and a half-written line from the crash
+    datastore._write_atomic(bookings, read_data(bookings))
+    with open(bookings + '.crash.tmp', 'w') as f:
+        f.write('[')
+    with open(journal_path(bookings), 'ab') as f:
+        f.write(b'{"id": 6, "na')
+    datastore.invalidate()
+
+    storage = JsonStorage(str(tmp_path))
+    assert _ids(storage.all(BOOKINGS)) == [1, 2, 3, 4, 5]
+    assert not os.path.exists(bookings + '.crash.tmp')
+    assert os.path.getsize(journal_path(bookings)) == 0
+    assert storage.insert(BOOKINGS, {'name': 'F'})['id'] == 6
+
+
+def test_recover_after_compaction_interrupted_before_rename(bookings, tmp_path):
+    with open(bookings + '.crash.tmp', 'w') as f:
+        json.dump(read_data(bookings)[:3], f)
+    datastore.invalidate()
+
+    storage = JsonStorage(str(tmp_path))
+    assert _ids(storage.all(BOOKINGS)) == [1, 2, 3, 4, 5]
+    with open(bookings) as f:
+        assert _ids(json.load(f)) == [1, 2, 3, 4, 5]
+    assert storage.insert(BOOKINGS, {'name': 'F'})['id'] == 6
+
+
+def _append_many(filename, count):
+    datastore.enable_journal(filename)
+    for n in range(count):
+        append_record(filename, {'name': 'worker {}'.format(os.getpid()), 'n': n})
+
+
+def test_concurrent_inserts_get_distinct_ids(tmp_path):
+    filename = JsonStorage(str(tmp_path)).path(BOOKINGS)
+    context = multiprocessing.get_context('fork')
+    processes = [context.Process(target=_append_many, args=(filename, 25)) for _ in range(4)]
+    threads = [threading.Thread(target=_append_many, args=(filename, 25)) for _ in range(4)]
+    for worker in processes + threads:
+        worker.start()
+    for worker in processes + threads:
+        worker.join()
+    assert all(process.exitcode == 0 for process in processes)
+
+    datastore.invalidate()
+    assert sorted(_ids(read_data(filename))) == list(range(1, 201))
+
+
+@pytest.mark.parametrize('backend', ['json', 'sqlite'])
+def test_appended_since_is_false_after_anything_but_inserts(backend, tmp_path):
+    storage = JsonStorage(str(tmp_path)) if backend == 'json' else SqliteStorage(str(tmp_path / 'data.db'))
+    storage.replace_all(BOOKINGS, [{'id': 1, 'name': 'Ann'}])
+    version = storage.version(BOOKINGS)
+    assert storage.appended_since(BOOKINGS, version)
+    storage.insert(BOOKINGS, {'name': 'Ben'})
+    storage.insert(BOOKINGS, {'name': 'Cy'})
+    assert storage.appended_since(BOOKINGS, version)
+
+    later = storage.version(BOOKINGS)
+    storage.update(BOOKINGS, 2, {'name': 'Bea'})
+    assert not storage.appended_since(BOOKINGS, version)
+    assert not storage.appended_since(BOOKINGS, later)
+    latest = storage.version(BOOKINGS)
+    storage.insert(BOOKINGS, {'name': 'Dee'})
+    assert storage.appended_since(BOOKINGS, latest)
+    storage.delete(BOOKINGS, 1)
+    assert not storage.appended_since(BOOKINGS, latest)
+    assert not storage.appended_since(BOOKINGS, None)
@@ -0,0 +1,56 @@
+import json
+
+from storage import BOOKINGS, FEEDBACK
+
+
+def _login(client):
+    client.post('/admin/login', data={'username': 'admin', 'password': 'admin123'})
+
+
+def _poll(client, last_id=None, **params):
+    headers = {'Last-Event-ID': str(last_id)} if last_id is not None else {}
+    response = client.get('/admin/events', query_string=params, headers=headers)
+    assert response.status_code == 200 and response.mimetype == 'text/event-stream'
+    events, resume_id = [], None
+    for block in response.get_data(as_text=True).strip().split('\n\n'):
+        fields = dict(line.split(': ', 1) for line in block.split('\n'))
+        if 'data' in fields:
+            events.append((fields['event'], json.loads(fields['data'])))
+        elif 'id' in fields:
+            resume_id = int(fields['id'])
+    return events, resume_id
+
+
+def test_changes_are_streamed_in_order(app, client):
+    _login(client)
+    events, head = _poll(client)
+    assert events == []
+
+    storage = app.extensions['storage']
+    record = storage.insert(FEEDBACK, {'name': 'Ann', 'email': 'ann@example.com', 'message': 'Hi', 'read': False})
+    storage.update(FEEDBACK, record['id'], {'read': True})
+    storage.delete(FEEDBACK, record['id'])
+    events, resume_id = _poll(client, head)
+    assert events == [
+        ('feedback', {'action': 'created', 'record': {'id': record['id']}}),
+        ('feedback', {'action': 'updated', 'record': {'id': record['id'], 'read': True}}),
+        ('feedback', {'action': 'deleted', 'record': {'id': record['id']}}),
+    ]
+    assert _poll(client, resume_id) == ([], resume_id)
+    # Filtered to bookings, the same stretch has nothing
+    assert _poll(client, head, dataset=BOOKINGS)[0] == []
+
+
+def test_records_created_by_other_workers_are_streamed(app, client, other_worker):
+    _login(client)
+    _, head = _poll(client)
+    record = other_worker('insert', FEEDBACK, {'name': 'Ben', 'email': 'ben@example.com', 'message': 'Hello'})
+    events, _ = _poll(client, head)
+    assert events == [('feedback', {'action': 'created', 'record': {'id': record['id']}})]
+
+
+def test_events_need_a_login_and_a_valid_id(client):
+    assert client.get('/admin/events').status_code == 401
+    _login(client)
+    assert client.get('/admin/events', query_string={'last_event_id': 'x'}).status_code == 400
+    assert client.get('/admin/events', query_string={'dataset': 'users'}).status_code == 400
@@ -0,0 +1,47 @@
+from page_cache import PageCache
+from storage import BOOKINGS, FEATURES
+
+FEATURE = {'title': 'Sauna Deck', 'description': 'Cedar sauna by the lake', 'icon': 'fas fa-hot-tub', 'image': 'Deluxe_A.jpg'}
+
+
+def test_write_purges_dependent_pages_only(app, client):
+    cache = app.extensions['page_cache']
+    first = client.get('/')
+    assert first.status_code == 200 and b'Sauna Deck' not in first.data
+    client.get('/about')
+    assert cache._entries.keys() >= {'index', 'about'}
+
+    app.extensions['storage'].insert(FEATURES, FEATURE)
+    assert 'index' not in cache._entries and 'about' in cache._entries
+    refreshed = client.get('/')
+    assert b'Sauna Deck' in refreshed.data
+    assert refreshed.headers['ETag'] != first.headers['ETag']
+
+    # Datasets the page is not rendered from leave it alone
+    app.extensions['storage'].insert(BOOKINGS, {'name': 'Ann', 'email': 'ann@example.com'})
+    assert 'index' in cache._entries
+
+
+def test_page_revalidates_with_etag(client):
+    etag = client.get('/').headers['ETag']
+    response = client.get('/', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+
+
+def test_write_by_another_worker_refreshes_page(client, other_worker):
+    assert b'Sauna Deck' not in client.get('/').data
+    # No purge reaches this worker; the changed version still misses
+    other_worker('insert', FEATURES, FEATURE)
+    assert b'Sauna Deck' in client.get('/').data
+
+
+def test_purge_is_shared_through_store_dir(tmp_path):
+    mine = PageCache(store_dir=str(tmp_path / 'pages'))
+    theirs = PageCache(store_dir=str(tmp_path / 'pages'))
+    mine.set('about', '<p>old</p>', '[]')
+    assert theirs.get('about', '[]')['body'] == b'<p>old</p>'
+
+    theirs.purge('about')
+    assert mine.get('about', '[]') is None
+    theirs.set('about', '<p>new</p>', '[]')
+    assert mine.get('about', '[]')['body'] == b'<p>new</p>'
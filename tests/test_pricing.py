@@ -0,0 +1,76 @@
+from datetime import date, timedelta
+
+import pytest
+
+from pricing import RateTable
+from storage import BOOKINGS
+from validation import BookingValidator, ValidationError
+
+TODAY = date(2026, 12, 14)
+
+
+def test_quote_matches_the_nightly_rules():
+    table = RateTable()
+    # Fri 18 Dec to Mon 21 Dec: weekend, weekend, then a holiday Sunday
+    quote = table.quote('suite', date(2026, 12, 18), date(2026, 12, 21), TODAY)
+    assert quote['nights'] == 3
+    assert quote['total'] == 5200 + 5200 + round(4500 * 1.25)
+    assert quote['currency'] == 'PHP'
+
+    for offset, nights in ((0, 1), (3, 7), (100, 30), (700, 30)):
+        check_in = TODAY + timedelta(days=offset)
+        check_out = check_in + timedelta(days=nights)
+        expected = sum(table.nightly_rate('family', check_in + timedelta(days=n)) for n in range(nights))
+        assert table.quote('family', check_in, check_out, TODAY)['total'] == expected
+
+
+def test_quote_rejects_stays_outside_the_horizon():
+    table = RateTable(horizon_days=30)
+    with pytest.raises(ValueError):
+        table.quote('suite', TODAY - timedelta(days=1), TODAY + timedelta(days=1), TODAY)
+    with pytest.raises(ValueError):
+        table.quote('suite', TODAY + timedelta(days=29), TODAY + timedelta(days=31), TODAY)
+    with pytest.raises(ValueError):
+        table.quote('penthouse', TODAY, TODAY + timedelta(days=1), TODAY)
+
+
+def test_validator_normalizes_a_booking():
+    booking = BookingValidator().clean({
+        'name': '  Ana   Reyes ', 'email': ' Ana@Example.COM', 'phone': '+63 917 123 4567',
+        'room_type': 'family', 'check_in': '2026-12-20', 'check_out': '2026-12-23', 'guests': '5',
+        'special_requests': ' Crib,\nplease ',
+    }, TODAY)
+    assert booking == {'name': 'Ana Reyes', 'email': 'ana@example.com', 'phone': '+63 917 123 4567',
+                       'room_type': 'family', 'check_in': '2026-12-20', 'check_out': '2026-12-23',
+                       'guests': 5, 'special_requests': 'Crib,\nplease'}
+
+
+def test_validator_reports_every_problem_at_once():
+    with pytest.raises(ValidationError) as e:
+        BookingValidator(max_nights=7).clean({
+            'name': '', 'email': 'not-an-email', 'phone': 'call me', 'room_type': 'suite',
+            'check_in': '2026-12-01', 'check_out': '2027-01-30', 'guests': '3',
+        }, TODAY)
+    assert set(e.value.errors) == {'name', 'email', 'phone', 'check_in', 'check_out', 'guests'}
+    assert 'at most 2 guests' in e.value.errors['guests']
+
+    with pytest.raises(ValidationError) as e:
+        BookingValidator(max_nights=7).stay('2026-12-20', '2026-12-30', TODAY)
+    assert e.value.errors == {'check_out': 'Stays are limited to 7 nights.'}
+
+
+def test_submitted_booking_is_priced(app, client):
+    check_in = date.today() + timedelta(days=30)
+    check_out = check_in + timedelta(days=2)
+    response = client.post('/booking', data={
+        'name': 'Ana Reyes', 'email': 'ana@example.com', 'phone': '0999 123 4567', 'room_type': 'deluxe_a',
+        'check_in': check_in.isoformat(), 'check_out': check_out.isoformat(), 'guests': '2'})
+    assert response.status_code == 302
+    booking, = app.extensions['storage'].all(BOOKINGS)
+    quote = client.get('/api/quote', query_string={'room_type': 'deluxe_a', 'check_in': check_in.isoformat(),
+                                                   'check_out': check_out.isoformat()}).get_json()
+    assert booking['total_price'] == quote['total'] and booking['currency'] == 'PHP'
+    assert booking['guests'] == 2 and booking['status'] == 'pending'
+
+    rates = client.get('/api/rates')
+    assert client.get('/api/rates', headers={'If-None-Match': rates.headers['ETag']}).status_code == 304
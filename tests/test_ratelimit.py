@@ -0,0 +1,73 @@
+import pytest
+
+from ratelimit import FormGuard, MemoryBuckets, SqliteBuckets
+
+LIMITS = {'contact': {'ip': (2, 600), 'email': (3, 1200)}}
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def guard(request, tmp_path):
+    backend = MemoryBuckets() if request.param == 'memory' else SqliteBuckets(str(tmp_path / 'ratelimit.db'))
+    return FormGuard(backend, limits=LIMITS, duplicate_window=600)
+
+
+def _form(n=0, **fields):
+    return dict({'name': 'Ann', 'email': 'ann@example.com', 'message': 'Hello {}'.format(n)}, **fields)
+
+
+def test_honeypot_is_rejected_before_the_buckets(guard):
+    assert guard.check('contact', _form(website='http://spam.example'), '10.0.0.1') == 'honeypot'
+    assert guard.check('contact', _form(1), '10.0.0.1') is None
+    assert guard.check('contact', _form(2), '10.0.0.1') is None
+
+
+def test_duplicate_only_after_the_submission_is_remembered(guard):
+    form = _form()
+    assert guard.check('contact', form, '10.0.0.1') is None
+    # Not saved (say it failed validation): sending it again is not a duplicate
+    assert guard.check('contact', form, '10.0.0.2') is None
+    guard.remember('contact', form)
+    assert guard.check('contact', dict(form, message='  hello 0 '), '10.0.0.3') == 'duplicate'
+    assert guard.check('contact', _form(1, email='bob@example.com'), '10.0.0.4') is None
+
+
+def test_rate_limits_per_ip_and_per_email(guard):
+    assert guard.check('contact', _form(1), '10.0.0.1') is None
+    assert guard.check('contact', _form(2), '10.0.0.1') is None
+    wait = guard.check('contact', _form(3), '10.0.0.1')
+    assert isinstance(wait, int) and 0 < wait <= 600
+
+    # The email bucket (3) still had a token; the IP one didn't take it
+    assert guard.check('contact', _form(4), '10.0.0.2') is None
+    wait = guard.check('contact', _form(5), '10.0.0.3')
+    assert isinstance(wait, int) and 0 < wait <= 1200
+    assert guard.check('contact', _form(6, email='bob@example.com'), '10.0.0.3') is None
+
+
+def test_buckets_refill_over_time(tmp_path):
+    for backend in (MemoryBuckets(), SqliteBuckets(str(tmp_path / 'ratelimit.db'))):
+        buckets = [('contact:ip:10.0.0.1', 1, 60)]
+        assert backend.take(buckets, now=1000.0) == 0
+        assert backend.take(buckets, now=1030.0) == 31
+        assert backend.take(buckets, now=1060.0) == 0
+
+
+def _post_contact(client, n, forwarded_for):
+    return client.post('/contact', data=_form(n, email='guest{}@example.com'.format(n)),
+                       headers={'X-Forwarded-For': forwarded_for}, environ_base={'REMOTE_ADDR': '10.9.9.9'})
+
+
+def test_client_address_behind_a_trusted_proxy(tmp_path):
+    from app import create_app
+    limits = {'contact': {'ip': (1, 600)}}
+    direct = create_app({'DATA_DIR': str(tmp_path / 'direct'), 'TESTING': True, 'FORM_LIMITS': limits,
+                         'TRUSTED_PROXIES': 0}).test_client()
+    # Without a trusted proxy the header is ignored: everyone is the proxy's address
+    assert _post_contact(direct, 1, '203.0.113.1').status_code == 302
+    assert _post_contact(direct, 2, '203.0.113.2').status_code == 429
+
+    proxied = create_app({'DATA_DIR': str(tmp_path / 'proxied'), 'TESTING': True, 'FORM_LIMITS': limits,
+                          'TRUSTED_PROXIES': 1}).test_client()
+    assert _post_contact(proxied, 1, '203.0.113.1').status_code == 302
+    assert _post_contact(proxied, 2, '203.0.113.2').status_code == 302
+    assert _post_contact(proxied, 3, '198.51.100.7, 203.0.113.1').status_code == 429
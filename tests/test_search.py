@@ -0,0 +1,82 @@
+import pytest
+
+from admin import init_admin_services
+from storage import FEEDBACK
+
+
+@pytest.fixture
+def index(app):
+    init_admin_services(app)
+    return app.extensions['search']
+
+
+@pytest.fixture
+def rebuilds(index, monkeypatch):
+    calls = []
+    rebuild = index._rebuild
+    monkeypatch.setattr(index, '_rebuild', lambda name: calls.append(name) or rebuild(name))
+    return calls
+
+
+def _feedback(name, message='Lovely stay'):
+    return {'name': name, 'email': '{}@example.com'.format(name.lower()), 'message': message, 'read': False}
+
+
+def _found(index, text):
+    return [record_id for record_id, _ in index.search(FEEDBACK, text)[1]]
+
+
+def test_writes_in_this_worker_are_indexed(app, index):
+    storage = app.extensions['storage']
+    record = storage.insert(FEEDBACK, _feedback('Rosalind', 'The pool was great'))
+    assert _found(index, 'rosa pool') == [record['id']]
+    storage.update(FEEDBACK, record['id'], {'message': 'Breakfast was great'})
+    assert _found(index, 'pool') == []
+    assert _found(index, 'breakfast') == [record['id']]
+    storage.delete(FEEDBACK, record['id'])
+    assert _found(index, 'rosa') == []
+
+
+def test_inserts_from_other_workers_are_indexed_without_a_rebuild(app, index, rebuilds, other_worker):
+    storage = app.extensions['storage']
+    first = storage.insert(FEEDBACK, _feedback('Rosalind'))
+    assert _found(index, 'rosalind') == [first['id']]
+    rebuilds.clear()
+
+    added = [other_worker('insert', FEEDBACK, _feedback('Rosamund'))['id'] for _ in range(3)]
+    assert sorted(_found(index, 'rosa')) == [first['id']] + added
+    assert rebuilds == []
+    # Back in step: this worker's own writes apply again
+    latest = storage.insert(FEEDBACK, _feedback('Rosetta'))
+    assert _found(index, 'rosetta') == [latest['id']]
+    assert rebuilds == []
+
+
+def test_deletes_and_updates_it_missed_rebuild_the_index(app, index, rebuilds, other_worker):
+    storage = app.extensions['storage']
+    ids = [storage.insert(FEEDBACK, _feedback(name))['id'] for name in ('Rosalind', 'Rosamund')]
+    assert sorted(_found(index, 'rosa')) == ids
+    rebuilds.clear()
+
+    # The ids no longer line up
+    other_worker('delete', FEEDBACK, ids[0])
+    assert _found(index, 'rosa') == [ids[1]]
+    assert rebuilds == [FEEDBACK]
+
+    # Behind, then an update here: applying it alone would leave the index wrong
+    latest = other_worker('insert', FEEDBACK, _feedback('Rosaline'))
+    storage.update(FEEDBACK, ids[1], {'name': 'Margaret', 'email': 'margaret@example.com'})
+    assert _found(index, 'rosa') == [latest['id']]
+    assert _found(index, 'margaret') == [ids[1]]
+    assert rebuilds == [FEEDBACK, FEEDBACK]
+
+
+def test_updates_from_other_workers_rebuild_the_index(app, index, rebuilds, other_worker):
+    record = app.extensions['storage'].insert(FEEDBACK, _feedback('Rosalind'))
+    assert _found(index, 'rosalind') == [record['id']]
+    rebuilds.clear()
+
+    other_worker('update', FEEDBACK, record['id'], {'name': 'Margaret', 'email': 'margaret@example.com'})
+    assert _found(index, 'rosalind') == []
+    assert _found(index, 'margaret') == [record['id']]
+    assert rebuilds == [FEEDBACK]
@@ -0,0 +1,67 @@
+def _login(client, username, password):
+    return client.post('/admin/login', data={'username': username, 'password': password},
+                       environ_base={'REMOTE_ADDR': '10.0.0.1'})
+
+
+def _sid(client):
+    cookie = client.get_cookie('session')
+    return cookie.value if cookie else None
+
+
+def test_login_rotates_the_session_id(app, client):
+    assert _login(client, 'frontdesk', 'front123').status_code == 302
+    first = _sid(client)
+    assert first
+
+    assert _login(client, 'admin', 'admin123').status_code == 302
+    second = _sid(client)
+    assert second and second != first
+
+    # The id from before the login no longer opens a session
+    assert client.get('/admin').status_code == 200
+    other = app.test_client()
+    other.set_cookie('session', first)
+    response = other.get('/admin')
+    assert response.status_code == 302
+    assert '/admin/login' in response.headers['Location']
+
+
+def test_failed_login_keeps_no_session(client):
+    assert _login(client, 'admin', 'wrong').status_code == 200
+    assert _login(client, 'admin', 'admin123').status_code == 302
+    assert client.get('/admin').status_code == 200
+
+
+def test_logout_ends_the_session(app, client):
+    _login(client, 'admin', 'admin123')
+    sid = _sid(client)
+    client.get('/admin/logout')
+    assert _sid(client) != sid
+    assert client.get('/admin').status_code == 302
+
+    other = app.test_client()
+    other.set_cookie('session', sid)
+    assert other.get('/admin').status_code == 302
+
+
+def test_users_changed_by_another_worker_apply_to_open_sessions(app, client, other_worker):
+    from storage import USERS
+    _login(client, 'frontdesk', 'front123')
+    assert client.get('/admin').status_code == 200
+    sid = _sid(client)
+    users = app.extensions['storage'].all(USERS)
+    frontdesk = next(user for user in users if user['username'] == 'frontdesk')
+
+    # Promoted elsewhere: admin-only actions work without logging in again
+    other_worker('update', USERS, frontdesk['id'], {'role': 'admin'})
+    response = client.post('/admin/bookings/bulk', json={'action': 'delete', 'ids': [999]})
+    assert response.get_json()['results'] == [{'id': 999, 'result': 'not_found'}]
+
+    # Removed from users.json: the session ends
+    other_worker('replace_all', USERS, [user for user in users if user['id'] != frontdesk['id']])
+    response = client.get('/admin')
+    assert response.status_code == 302
+    assert '/admin/login' in response.headers['Location']
+    other = app.test_client()
+    other.set_cookie('session', sid)
+    assert other.get('/admin').status_code == 302
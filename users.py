@@ -0,0 +1,215 @@
+import re
+import hmac
+import time
+import sqlite3
+import threading
+from collections import deque
+
+from werkzeug.security import generate_password_hash, check_password_hash
+
+from storage import USERS
+
+# werkzeug method string; raise the iteration count as hardware gets
+# faster. Stored hashes made with a different method are upgraded on the
+# next successful login.
+DEFAULT_HASH_METHOD = 'pbkdf2:sha256:600000'
+
+# "<method>$<salt>$<hex digest>" as written by generate_password_hash
+HASH_PATTERN = re.compile(r'^(pbkdf2|scrypt):[^$]*\$[^$]+\$[0-9a-f]+$')
+
+DEFAULT_USERS = [
+    {
+        "id": 1,
+        "username": "admin",
+        "password": "admin123",
+        "role": "admin",
+        "name": "System Administrator"
+    },
+    {
+        "id": 2,
+        "username": "frontdesk",
+        "password": "front123",
+        "role": "front_office",
+        "name": "Front Office Staff"
+    }
+]
+
+
+def is_password_hash(value):
+    return isinstance(value, str) and HASH_PATTERN.match(value) is not None
+
+
+class LoginThrottled(Exception):
+    def __init__(self, retry_after):
+        super().__init__('Too many failed login attempts')
+        self.retry_after = retry_after
+
+
+class LoginThrottle:
+    # Failed logins per key in a sliding window. A key is locked out once
+    # it reaches its limit and unlocks as its oldest failure ages out.
+
+    def __init__(self, window=300, limits=None, max_keys=10000):
+        self.window = window
+        self.limits = dict(limits or {'ip': 20, 'user': 5})
+        self.max_keys = max_keys
+        self._failures = {}
+        self._lock = threading.Lock()
+
+    def _recent(self, key, now):
+        failures = self._failures.get(key)
+        if failures is None:
+            return None
+        while failures and failures[0] <= now - self.window:
+            failures.popleft()
+        if not failures:
+            del self._failures[key]
+            return None
+        return failures
+
+    def retry_after(self, keys):
+        # Seconds until every key is allowed again; 0 when none is locked
+        now = time.time()
+        wait = 0
+        with self._lock:
+            for key in keys:
+                failures = self._recent(key, now)
+                if failures is not None and len(failures) >= self.limits[key[0]]:
+                    wait = max(wait, failures[0] + self.window - now)
+        return int(wait + 0.999)
+
+    def failed(self, keys):
+        now = time.time()
+        with self._lock:
+            if len(self._failures) >= self.max_keys:
+                for key in list(self._failures):
+                    self._recent(key, now)
+            for key in keys:
+                self._failures.setdefault(key, deque()).append(now)
+
+    def reset(self, keys):
+        with self._lock:
+            for key in keys:
+                self._failures.pop(key, None)
+
+
+class UserStore:
+    # Staff accounts from the users dataset. Lookups go through username
+    # and id -> user dicts that are rebuilt only when the dataset's version
+    # changes. Password checks run in the request thread and take the full
+    # hash cost there: handing them to a pool and waiting on the result
+    # would hold the same thread (and, under sync workers, the whole
+    # worker) just as long. The login throttle is what bounds how many a
+    # client can make.
+
+    def __init__(self, storage, hash_method=DEFAULT_HASH_METHOD, throttle=None):
+        self.storage = storage
+        self.hash_method = hash_method
+        self.throttle = throttle or LoginThrottle()
+        self._lock = threading.Lock()
+        self._by_username = {}
+        self._by_id = {}
+        self._version = None
+        self._dummy_hash = None
+
+    def _index(self):
+        version = self.storage.version(USERS)
+        with self._lock:
+            if version != self._version:
+                users = self.storage.all(USERS)
+                self._by_username = {user['username']: user for user in users if user.get('username')}
+                self._by_id = {user['id']: user for user in users}
+                self._version = version
+            return self._by_username
+
+    def get(self, username):
+        user = self._index().get(username)
+        return dict(user) if user is not None else None
+
+    def get_by_id(self, user_id):
+        self._index()
+        user = self._by_id.get(user_id)
+        return dict(user) if user is not None else None
+
+    def hash_password(self, password):
+        return generate_password_hash(password, self.hash_method)
+
+    def _verify(self, stored, password):
+        if is_password_hash(stored):
+            return check_password_hash(stored, password)
+        if not stored:
+            check_password_hash(self._get_dummy_hash(), password)
+            return False
+        # Account created before hashing; authenticate() upgrades it
+        return hmac.compare_digest(stored.encode('utf-8'), password.encode('utf-8'))
+
+    def _get_dummy_hash(self):
+        # Unknown usernames are checked against this so they take as long
+        # as real ones and don't reveal which accounts exist.
+        if self._dummy_hash is None:
+            self._dummy_hash = self.hash_password('')
+        return self._dummy_hash
+
+    def authenticate(self, username, password, remote_addr=None):
+        # Returns the user for a correct username/password, None otherwise.
+        # Raises LoginThrottled while the IP or username is locked out.
+        username = (username or '').strip()
+        keys = [('user', username.lower())]
+        if remote_addr:
+            keys.append(('ip', remote_addr))
+        retry_after = self.throttle.retry_after(keys)
+        if retry_after:
+            raise LoginThrottled(retry_after)
+
+        user = self._index().get(username)
+        stored = user.get('password') if user is not None else None
+        if not self._verify(stored, password or ''):
+            self.throttle.failed(keys)
+            return None
+
+        self.throttle.reset(keys[:1])
+        if not is_password_hash(stored) or not stored.startswith(self.hash_method + '$'):
+            self._rehash(user, password)
+        return dict(user)
+
+    def _rehash(self, user, password):
+        try:
+            self.storage.update(USERS, user['id'], {'password': self.hash_password(password)})
+        except (OSError, sqlite3.Error):
+            # Read-only data directory (e.g. a serverless bundle); keep the
+            # old hash and try again on the next login.
+            pass
+
+    def set_password(self, user_id, password):
+        return self.storage.update(USERS, user_id, {'password': self.hash_password(password)})
+
+    def hash_all(self):
+        # Hash any passwords still stored in plaintext; returns how many.
+        # Outdated hashes can't be redone without the password and are
+        # upgraded on login instead.
+        changed = 0
+        for user in self.storage.all(USERS):
+            stored = user.get('password')
+            if stored and not is_password_hash(stored):
+                self.set_password(user['id'], stored)
+                changed += 1
+        return changed
+
+    def ensure_defaults(self):
+        if not self.storage.exists(USERS):
+            self.storage.replace_all(USERS, [dict(user, password=self.hash_password(user['password']))
+                                             for user in DEFAULT_USERS])
+
+
+def init_users(app, storage):
+    store = UserStore(
+        storage,
+        hash_method=app.config.get('PASSWORD_HASH_METHOD', DEFAULT_HASH_METHOD),
+        throttle=LoginThrottle(
+            window=app.config.get('LOGIN_THROTTLE_WINDOW', 300),
+            limits={'ip': app.config.get('LOGIN_MAX_FAILURES_PER_IP', 20),
+                    'user': app.config.get('LOGIN_MAX_FAILURES_PER_USER', 5)}
+        )
+    )
+    app.extensions['users'] = store
+    return store
@@ -0,0 +1,129 @@
+import re
+from datetime import date
+
+from availability import parse_date
+from pricing import BOOKING_HORIZON_DAYS
+
+# Most guests each room type sleeps (rooms.html); the booking form offers
+# up to 6. Override with app.config['ROOM_CAPACITY'].
+DEFAULT_CAPACITY = {
+    'deluxe_a': 2,
+    'deluxe_b': 2,
+    'suite': 2,
+    'family': 6,
+}
+
+MAX_NIGHTS = 30
+
+# Longest accepted value per text field
+FIELD_LIMITS = {'name': 100, 'email': 254, 'phone': 30, 'special_requests': 1000}
+
+EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+PHONE_PATTERN = re.compile(r'^\+?[0-9][0-9 ()./-]*$')
+
+
+class ValidationError(ValueError):
+    # errors maps field -> message, in form order
+    def __init__(self, errors):
+        super().__init__('; '.join(errors.values()))
+        self.errors = errors
+
+
+class BookingValidator:
+    # Turns the booking form's strings into a normalized booking: trimmed
+    # text, lower-case email, ISO dates and an integer guest count. Every
+    # problem is reported at once rather than one per submission.
+
+    def __init__(self, capacity=None, max_nights=MAX_NIGHTS, horizon_days=BOOKING_HORIZON_DAYS):
+        self.capacity = dict(capacity or DEFAULT_CAPACITY)
+        self.max_nights = max_nights
+        self.horizon_days = horizon_days
+
+    def stay(self, check_in, check_out, today=None, errors=None):
+        # (check_in, check_out) dates for a bookable stay; adds to errors,
+        # or raises ValidationError when no errors dict is passed
+        own = errors is None
+        errors = {} if own else errors
+        today = today or date.today()
+        start = parse_date(check_in)
+        end = parse_date(check_out)
+        if start is None:
+            errors['check_in'] = 'Check-in must be a date (YYYY-MM-DD).'
+        elif start < today:
+            errors['check_in'] = 'Check-in cannot be in the past.'
+        if end is None:
+            errors['check_out'] = 'Check-out must be a date (YYYY-MM-DD).'
+        elif start is not None and end <= start:
+            errors['check_out'] = 'Check-out must be after check-in.'
+        elif start is not None and (end - start).days > self.max_nights:
+            errors['check_out'] = 'Stays are limited to {} nights.'.format(self.max_nights)
+        elif (end - today).days > self.horizon_days:
+            errors['check_out'] = 'Bookings open up to {} days ahead.'.format(self.horizon_days)
+        if own and errors:
+            raise ValidationError(errors)
+        return start, end
+
+    def clean(self, form, today=None):
+        # Raises ValidationError listing every invalid field
+        errors = {}
+
+        def text(field, required=True, multiline=False):
+            value = (form.get(field) or '').strip()
+            if not multiline:
+                value = ' '.join(value.split())
+            if required and not value:
+                errors[field] = '{} is required.'.format(field.replace('_', ' ').capitalize())
+            elif len(value) > FIELD_LIMITS[field]:
+                errors[field] = '{} is too long (at most {} characters).'.format(
+                    field.replace('_', ' ').capitalize(), FIELD_LIMITS[field])
+            return value
+
+        name = text('name')
+        email = text('email').lower()
+        if 'email' not in errors and not EMAIL_PATTERN.match(email):
+            errors['email'] = 'Enter a valid email address.'
+        phone = text('phone')
+        digits = sum(char.isdigit() for char in phone)
+        if 'phone' not in errors and (not PHONE_PATTERN.match(phone) or not 7 <= digits <= 15):
+            errors['phone'] = 'Enter a valid phone number.'
+
+        room_type = form.get('room_type') or ''
+        if room_type not in self.capacity:
+            errors['room_type'] = 'Choose a room type.'
+
+        check_in, check_out = self.stay(form.get('check_in'), form.get('check_out'), today, errors)
+
+        guests = None
+        try:
+            guests = int(form.get('guests') or '')
+        except ValueError:
+            errors['guests'] = 'Choose the number of guests.'
+        if guests is not None:
+            if guests < 1:
+                errors['guests'] = 'Choose the number of guests.'
+            elif room_type in self.capacity and guests > self.capacity[room_type]:
+                errors['guests'] = 'This room sleeps at most {} guests.'.format(self.capacity[room_type])
+
+        special_requests = text('special_requests', required=False, multiline=True)
+        if errors:
+            raise ValidationError(errors)
+        return {
+            'name': name,
+            'email': email,
+            'phone': phone,
+            'room_type': room_type,
+            'check_in': check_in.isoformat(),
+            'check_out': check_out.isoformat(),
+            'guests': guests,
+            'special_requests': special_requests,
+        }
+
+
+def init_validation(app):
+    validator = BookingValidator(
+        app.config.get('ROOM_CAPACITY'),
+        app.config.get('MAX_NIGHTS', MAX_NIGHTS),
+        app.config.get('BOOKING_HORIZON_DAYS', BOOKING_HORIZON_DAYS)
+    )
+    app.extensions['booking_validator'] = validator
+    return validator